@@ -18,10 +18,12 @@ from modin.config.envvars import (
     AsvImplementation,
     AsyncReadMode,
     BenchmarkMode,
+    BroadcastSizeLimit,
     CIAWSAccessKeyID,
     CIAWSSecretAccessKey,
     CpuCount,
     DaskThreadsPerWorker,
+    DefaultToPandasAudit,
     DocModule,
     DynamicPartitioning,
     Engine,
@@ -36,21 +38,33 @@ from modin.config.envvars import (
     LogMemoryInterval,
     LogMode,
     Memory,
+    MetadataCacheDir,
+    MetadataCacheSize,
     MinColumnPartitionSize,
     MinPartitionSize,
     MinRowPartitionSize,
     ModinNumpy,
     NativeDataframeMode,
     NPartitions,
+    ParquetWriteSummaryMetadata,
     PersistentPickle,
     ProgressBar,
+    QuantileSketchSize,
     RangePartitioning,
     RayInitCustomResources,
     RayRedisAddress,
     RayRedisPassword,
     RayTaskCustomResources,
     ReadSqlEngine,
+    SpillDir,
+    SpillMemoryBudget,
+    SqlConnectionIdleTimeout,
+    SqlConnectionPoolSize,
+    SqlConnectionPrePing,
+    SqlWriteBatchSize,
+    SqlWriteStagingTable,
     StorageFormat,
+    StreamingReadPrefetch,
     TestDatasetSize,
     TestReadFromPostgres,
     TestReadFromSqlServer,
@@ -97,6 +111,19 @@ __all__ = [
     "RangePartitioning",
     "AsyncReadMode",
     "ReadSqlEngine",
+    "SqlConnectionPoolSize",
+    "SqlConnectionIdleTimeout",
+    "SqlConnectionPrePing",
+    "SqlWriteBatchSize",
+    "SqlWriteStagingTable",
+    "ParquetWriteSummaryMetadata",
+    "MetadataCacheDir",
+    "MetadataCacheSize",
+    "StreamingReadPrefetch",
+    "SpillMemoryBudget",
+    "SpillDir",
+    "QuantileSketchSize",
+    "BroadcastSizeLimit",
     "IsExperimental",
     "DynamicPartitioning",
     # For tests
@@ -110,6 +137,7 @@ __all__ = [
     "LogMode",
     "LogMemoryInterval",
     "LogFileSize",
+    "DefaultToPandasAudit",
     # Plugin settings
     "DocModule",
 ]
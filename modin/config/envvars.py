@@ -549,6 +549,22 @@ class LogMode(EnvironmentVariable, type=ExactStr):
         cls.put("disable")
 
 
+class DefaultToPandasAudit(EnvironmentVariable, type=ExactStr):
+    """
+    How to handle the operations defaulting to pandas.
+
+    "disable" warns on every fallback. The other modes record every fallback with
+    its call site, the size of the frame collected to the driver and the time spent,
+    see ``modin.utils.get_default_to_pandas_report``. "record" does it silently,
+    "log" and "warn" additionally log or warn once per call site, and "raise"
+    raises ``modin.utils.DefaultToPandasError`` instead of collecting the frame.
+    """
+
+    varname = "MODIN_DEFAULT_TO_PANDAS_AUDIT"
+    choices = ("disable", "record", "log", "warn", "raise")
+    default = "disable"
+
+
 class LogMemoryInterval(EnvironmentVariable, type=int):
     """Interval (in seconds) to profile memory utilization for logging."""
 
@@ -850,6 +866,257 @@ class AsyncReadMode(EnvironmentVariable, type=bool):
     default = False
 
 
+class StreamingReadPrefetch(EnvironmentVariable, type=int):
+    """
+    Number of blocks of a file read in the background by ``read_csv`` and ``read_fwf`` with ``chunksize`` or ``iterator``.
+
+    Only these blocks are kept in memory at a time.
+    """
+
+    varname = "MODIN_STREAMING_READ_PREFETCH"
+
+    @classmethod
+    def _get_default(cls) -> int:
+        """
+        Get default value of the config.
+
+        Returns
+        -------
+        int
+        """
+        return NPartitions.get()
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``StreamingReadPrefetch`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(f"Prefetch should be > 0, passed value {value}")
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``StreamingReadPrefetch`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        prefetch = super().get()
+        if prefetch <= 0:
+            raise ValueError(
+                f"`StreamingReadPrefetch` should be > 0; current value: {prefetch}"
+            )
+        return prefetch
+
+
+class MetadataCacheDir(EnvironmentVariable, type=ExactStr):
+    """
+    Directory of the on-disk cache of the file metadata computed by the readers.
+
+    When set, ``read_csv``, ``read_fwf`` and ``read_parquet`` store the metadata
+    they compute by scanning local files (chunk byte offsets, header and dtypes,
+    row-group row counts and statistics) and reuse it while the file keeps the
+    same size and modification time. The cache is disabled when not set.
+    """
+
+    varname = "MODIN_METADATA_CACHE_DIR"
+    default = None
+
+
+class MetadataCacheSize(EnvironmentVariable, type=int):
+    """Max size (in MBs) of the on-disk metadata cache, least recently used entries are evicted first."""
+
+    varname = "MODIN_METADATA_CACHE_SIZE"
+    default = 64
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``MetadataCacheSize`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(
+                f"Metadata cache size should be > 0 MB, passed value {value}"
+            )
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``MetadataCacheSize`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        cache_size = super().get()
+        if cache_size <= 0:
+            raise ValueError(
+                f"`MetadataCacheSize` should be > 0; current value: {cache_size}"
+            )
+        return cache_size
+
+
+class SpillMemoryBudget(EnvironmentVariable, type=int):
+    """
+    Memory budget (in MBs) of the partitions kept in memory, 0 means unlimited.
+
+    When the partitions produced by the partition manager take more memory than
+    the budget, the least recently used ones are written to ``SpillDir`` and
+    transparently read back when accessed.
+    """
+
+    varname = "MODIN_SPILL_MEMORY_BUDGET"
+    default = 0
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``SpillMemoryBudget`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Spill memory budget should be >= 0 MB, passed value {value}"
+            )
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``SpillMemoryBudget`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        budget = super().get()
+        if budget < 0:
+            raise ValueError(
+                f"`SpillMemoryBudget` should be >= 0; current value: {budget}"
+            )
+        return budget
+
+
+class SpillDir(EnvironmentVariable, type=ExactStr):
+    """
+    Directory the partitions are spilled to when ``SpillMemoryBudget`` is exceeded.
+
+    A temporary directory is used when not set. A partition may be read back on
+    another node than it was written on, so on a multi-node cluster the partitions
+    are only spilled if it's set to a directory shared by all the nodes.
+    """
+
+    varname = "MODIN_SPILL_DIR"
+    default = None
+
+
+class QuantileSketchSize(EnvironmentVariable, type=int):
+    """
+    Number of points of the per-partition sketches approximate quantiles are computed from.
+
+    0 (the default) means the quantiles are exact. A positive value makes ``quantile``,
+    ``median`` and ``describe`` answer from the merged sketches, the rank of every
+    returned value being off by at most about ``2 * number of rows / size``.
+    """
+
+    varname = "MODIN_QUANTILE_SKETCH_SIZE"
+    default = 0
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``QuantileSketchSize`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value < 0:
+            raise ValueError(f"Sketch size should be >= 0, passed value {value}")
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``QuantileSketchSize`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        size = super().get()
+        if size < 0:
+            raise ValueError(
+                f"`QuantileSketchSize` should be >= 0; current value: {size}"
+            )
+        return size
+
+
+class BroadcastSizeLimit(EnvironmentVariable, type=int):
+    """
+    Size (in MBs) up to which a frame is broadcast to every partition of another one.
+
+    Operations joining two frames, like ``isin`` with a Modin ``values``, collect
+    the smaller frame and pass it to each partition of the other one if its estimated
+    size doesn't exceed the limit. Otherwise, both frames are shuffled by the hashes
+    of the keys so that every bucket is joined separately.
+    """
+
+    varname = "MODIN_BROADCAST_SIZE_LIMIT"
+    default = 64
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``BroadcastSizeLimit`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value < 0:
+            raise ValueError(
+                f"Broadcast size limit should be >= 0 MB, passed value {value}"
+            )
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``BroadcastSizeLimit`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        limit = super().get()
+        if limit < 0:
+            raise ValueError(
+                f"`BroadcastSizeLimit` should be >= 0; current value: {limit}"
+            )
+        return limit
+
+
 class ReadSqlEngine(EnvironmentVariable, type=str):
     """Engine to run `read_sql`."""
 
@@ -858,6 +1125,163 @@ class ReadSqlEngine(EnvironmentVariable, type=str):
     choices = ("Pandas", "Connectorx")
 
 
+class SqlConnectionPoolSize(EnvironmentVariable, type=int):
+    """
+    Number of connections to a database kept open by every process reading or writing SQL.
+
+    Tasks of a process that need more connections at a time wait for one to be released.
+    """
+
+    varname = "MODIN_SQL_CONNECTION_POOL_SIZE"
+    default = 5
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``SqlConnectionPoolSize`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(f"Pool size should be > 0, passed value {value}")
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``SqlConnectionPoolSize`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        size = super().get()
+        if size <= 0:
+            raise ValueError(
+                f"`SqlConnectionPoolSize` should be > 0; current value: {size}"
+            )
+        return size
+
+
+class SqlConnectionIdleTimeout(EnvironmentVariable, type=int):
+    """
+    Number of seconds after which unused SQL connections are closed.
+
+    The connections of a database are all closed when none of them was taken for that
+    long, and a connection opened earlier than that is reopened before being taken.
+    """
+
+    varname = "MODIN_SQL_CONNECTION_IDLE_TIMEOUT"
+    default = 300
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``SqlConnectionIdleTimeout`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(f"Idle timeout should be > 0 s, passed value {value}")
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``SqlConnectionIdleTimeout`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        timeout = super().get()
+        if timeout <= 0:
+            raise ValueError(
+                f"`SqlConnectionIdleTimeout` should be > 0; current value: {timeout}"
+            )
+        return timeout
+
+
+class SqlConnectionPrePing(EnvironmentVariable, type=bool):
+    """Whether to test SQL connections taken from the pool for liveness and reconnect if needed."""
+
+    varname = "MODIN_SQL_CONNECTION_PRE_PING"
+    default = False
+
+
+class SqlWriteBatchSize(EnvironmentVariable, type=int):
+    """
+    Number of rows every partition sends to the database at once in ``to_sql`` without ``chunksize``.
+
+    Rows are loaded with ``COPY FROM STDIN`` for PostgreSQL with psycopg2 and with
+    a batched ``INSERT`` for other databases.
+    """
+
+    varname = "MODIN_SQL_WRITE_BATCH_SIZE"
+    default = 10000
+
+    @classmethod
+    def put(cls, value: int) -> None:
+        """
+        Set ``SqlWriteBatchSize`` with extra checks.
+
+        Parameters
+        ----------
+        value : int
+            Config value to set.
+        """
+        if value <= 0:
+            raise ValueError(f"Batch size should be > 0, passed value {value}")
+        super().put(value)
+
+    @classmethod
+    def get(cls) -> int:
+        """
+        Get ``SqlWriteBatchSize`` with extra checks.
+
+        Returns
+        -------
+        int
+        """
+        size = super().get()
+        if size <= 0:
+            raise ValueError(
+                f"`SqlWriteBatchSize` should be > 0; current value: {size}"
+            )
+        return size
+
+
+class SqlWriteStagingTable(EnvironmentVariable, type=bool):
+    """
+    Whether ``to_sql`` loads the rows into a staging table and swaps it with the target table.
+
+    The target table then changes in one transaction once all the partitions are written,
+    and is left untouched if some partition fails.
+    """
+
+    varname = "MODIN_SQL_WRITE_STAGING_TABLE"
+    default = False
+
+
+class ParquetWriteSummaryMetadata(EnvironmentVariable, type=bool):
+    """
+    Whether ``to_parquet`` without ``partition_cols`` writes the ``_metadata`` summary files.
+
+    The ``_metadata`` and ``_common_metadata`` files hold the footers of all the files of
+    the dataset, so ``read_parquet`` doesn't have to read each of them. Partitioned writes
+    always produce the summary, plain writes only leave the data files by default.
+    """
+
+    varname = "MODIN_PARQUET_WRITE_SUMMARY_METADATA"
+    default = False
+
+
 class LazyExecution(EnvironmentVariable, type=str):
     """
     Lazy execution mode.
@@ -19,6 +19,7 @@ from .groupby import GroupByReduce
 from .map import Map
 from .operator import Operator
 from .reduce import Reduce
+from .scan import Scan
 from .tree_reduce import TreeReduce
 
 __all__ = [
@@ -27,6 +28,7 @@ __all__ = [
     "TreeReduce",
     "Reduce",
     "Fold",
+    "Scan",
     "Binary",
     "GroupByReduce",
 ]
@@ -21,7 +21,7 @@ from .default import DefaultMethod
 from .groupby import GroupByDefault, SeriesGroupByDefault
 from .list import ListDefault
 from .resample import ResampleDefault
-from .rolling import ExpandingDefault, RollingDefault
+from .rolling import EwmDefault, ExpandingDefault, RollingDefault
 from .series import SeriesDefault
 from .str import StrDefault
 from .struct import StructDefault
@@ -35,6 +35,7 @@ __all__ = [
     "ResampleDefault",
     "RollingDefault",
     "ExpandingDefault",
+    "EwmDefault",
     "DefaultMethod",
     "CatDefault",
     "GroupByDefault",
@@ -132,3 +132,67 @@ class ExpandingDefault(DefaultMethod):
             fn_name=func.__name__,
             **kwargs
         )
+
+
+class EwmDefault(DefaultMethod):
+    """Builder for default-to-pandas aggregation on an exponentially weighted window functions."""
+
+    OBJECT_TYPE = "ExponentialMovingWindow"
+
+    @classmethod
+    def _build_ewm(cls, func, squeeze_self):
+        """
+        Build function that creates an exponentially weighted window and executes `func` on it.
+
+        Parameters
+        ----------
+        func : callable
+            Function to execute on an exponentially weighted window.
+        squeeze_self : bool
+            Whether or not to squeeze frame before executing the window function.
+
+        Returns
+        -------
+        callable
+            Function that takes pandas DataFrame and applies `func` on an exponentially
+            weighted window.
+        """
+
+        def fn(df, ewm_kwargs, *args, **kwargs):
+            """Create exponentially weighted window for the passed frame and execute specified `func` on it."""
+            if squeeze_self:
+                df = df.squeeze(axis=1)
+            roller = df.ewm(**ewm_kwargs)
+
+            if type(func) is property:
+                return func.fget(roller)
+
+            return func(roller, *args, **kwargs)
+
+        return fn
+
+    @classmethod
+    def register(cls, func, squeeze_self=False, **kwargs):
+        """
+        Build function that do fallback to pandas to apply `func` on an exponentially weighted window.
+
+        Parameters
+        ----------
+        func : callable
+            Function to execute on an exponentially weighted window.
+        squeeze_self : bool, default: False
+            Whether or not to squeeze frame before executing the window function.
+        **kwargs : kwargs
+            Additional arguments that will be passed to function builder.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and defaults to pandas to apply aggregation
+            `func` on an exponentially weighted window.
+        """
+        return super().register(
+            cls._build_ewm(func, squeeze_self=squeeze_self),
+            fn_name=func.__name__,
+            **kwargs
+        )
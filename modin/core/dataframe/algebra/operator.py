@@ -15,12 +15,71 @@
 
 from __future__ import annotations
 
+from functools import wraps
 from typing import Callable, Optional
 
+from modin.logging import Profiler
+
+
+def _profiled(caller: Callable, operator: str, func: Callable) -> Callable:
+    """
+    Wrap a function built by an operator to record its calls with the active profiler.
+
+    Parameters
+    ----------
+    caller : callable
+        Function built by ``Operator.register``.
+    operator : str
+        Name of the operator.
+    func : callable
+        Source function the operator was built with.
+
+    Returns
+    -------
+    callable
+    """
+    func_name = func if isinstance(func, str) else getattr(func, "__name__", None)
+    span_name = f"{operator}({func_name or type(func).__name__})"
+
+    @wraps(caller)
+    def run(*args, **kwargs):
+        profiler = Profiler.active
+        if profiler is None:
+            return caller(*args, **kwargs)
+        with profiler.span(span_name, "OPERATOR"):
+            return caller(*args, **kwargs)
+
+    run._modin_operator = operator
+    return run
+
 
 class Operator(object):
     """Interface for building operators that can execute in parallel across partitions."""
 
+    def __init_subclass__(cls, **kwargs: dict) -> None:
+        """
+        Make the functions built by ``register`` of the subclass report to the profiler.
+
+        Parameters
+        ----------
+        **kwargs : dict
+        """
+        super().__init_subclass__(**kwargs)
+        register = vars(cls).get("register")
+        if not isinstance(register, classmethod):
+            return
+        register = register.__func__
+
+        @wraps(register)
+        def register_profiled(klass, func, *args, **kwargs):
+            caller = register(klass, func, *args, **kwargs)
+            # ``register`` of a parent class has already wrapped the function
+            if getattr(caller, "_modin_operator", None) is not None:
+                return caller
+            return _profiled(caller, klass.__name__, func)
+
+        cls.register = classmethod(register_profiled)
+
     def __init__(self) -> None:
         raise ValueError(
             "Please use {}.register instead of the constructor".format(
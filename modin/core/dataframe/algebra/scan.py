@@ -0,0 +1,105 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses builder class for Scan operator."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .operator import Operator
+
+if TYPE_CHECKING:
+    import pandas
+
+    from modin.core.storage_formats.pandas.query_compiler import PandasQueryCompiler
+
+
+class Scan(Operator):
+    """Builder class for Scan functions."""
+
+    @classmethod
+    def register(
+        cls,
+        carry_function: Callable[..., pandas.DataFrame],
+        combine_function: Callable[..., pandas.DataFrame],
+        fixup_function: Callable[..., pandas.DataFrame],
+    ) -> Callable[..., PandasQueryCompiler]:
+        """
+        Build Scan operator that computes a prefix scan along rows/columns in parallel.
+
+        The scan is computed in three steps: every partition computes the carry of its
+        part of the axis, the carries are combined into the prefix preceding every
+        partition, and every partition computes its part of the scan from the prefix.
+        The first and the last steps are computed for all the partitions in parallel.
+
+        Parameters
+        ----------
+        carry_function : callable(pandas.DataFrame, *args, **kwargs) -> pandas.DataFrame
+            Function computing the carry of a partition, the state the scan of the
+            following partitions depends on.
+        combine_function : callable(pandas.DataFrame, pandas.DataFrame, *args, **kwargs) -> pandas.DataFrame
+            Function combining the prefix preceding a partition with the carry of the
+            partition into the prefix following it. It must be associative.
+        fixup_function : callable(pandas.DataFrame, pandas.DataFrame or None, *args, **kwargs) -> pandas.DataFrame
+            Function computing the scan of a partition from the prefix preceding it,
+            None for the first partition. It must preserve the shape of the partition.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes Scan function.
+        """
+
+        def caller(
+            query_compiler: PandasQueryCompiler,
+            scan_axis: Optional[int] = None,
+            *args: tuple,
+            dtypes=None,
+            **kwargs: dict,
+        ) -> PandasQueryCompiler:
+            """
+            Execute Scan function against passed query compiler.
+
+            Parameters
+            ----------
+            query_compiler : PandasQueryCompiler
+                The query compiler to execute the function on.
+            scan_axis : int, optional
+                0 or None means scan along the rows, 1 means scan along the columns.
+            *args : tuple
+                Additional arguments passed to the functions.
+            dtypes : pandas.Series or str, optional
+                The data types of the result.
+            **kwargs : dict
+                Additional keyword arguments passed to the functions.
+
+            Returns
+            -------
+            PandasQueryCompiler
+                A new query compiler representing the result of executing the
+                function.
+            """
+            return query_compiler.__constructor__(
+                query_compiler._modin_frame.scan(
+                    cls.validate_axis(scan_axis),
+                    lambda df: carry_function(df, *args, **kwargs),
+                    lambda prefix, carry: combine_function(
+                        prefix, carry, *args, **kwargs
+                    ),
+                    lambda df, prefix=None: fixup_function(df, prefix, *args, **kwargs),
+                    dtypes=dtypes,
+                )
+            )
+
+        return caller
@@ -23,7 +23,16 @@ from __future__ import annotations
 import datetime
 import re
 from functools import cached_property
-from typing import TYPE_CHECKING, Callable, Dict, Hashable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas
@@ -42,6 +51,8 @@ from modin.config import (
 from modin.core.dataframe.base.dataframe.dataframe import ModinDataframe
 from modin.core.dataframe.base.dataframe.utils import Axis, JoinType, is_trivial_index
 from modin.core.dataframe.pandas.dataframe.utils import (
+    ShuffleHashFunctions,
+    ShufflePositionalFunctions,
     ShuffleSortFunctions,
     add_missing_categories_to_groupby,
     lazy_metadata_decorator,
@@ -113,6 +124,8 @@ class PandasDataframe(
 
     _partition_mgr_cls: PandasDataframePartitionManager
     _query_compiler_cls = PandasQueryCompiler
+    # Rough size of a boxed Python object along with the pointer to it
+    _object_nbytes = 64
     # These properties flag whether or not we are deferring the metadata synchronization
     _deferred_index: bool = False
     _deferred_column: bool = False
@@ -264,6 +277,26 @@ class PandasDataframe(
             _len = sum(self.row_lengths)
         return _len
 
+    def _estimate_nbytes(self) -> int:
+        """
+        Estimate the size of the data of the frame from its metadata.
+
+        Returns
+        -------
+        int
+            The number of bytes, values of the types without a fixed size
+            are counted as ``_object_nbytes`` bytes each.
+        """
+        row_size = sum(
+            (
+                self._object_nbytes
+                if is_object_dtype(dtype) or not isinstance(dtype, np.dtype)
+                else dtype.itemsize
+            )
+            for dtype in self.dtypes
+        )
+        return len(self) * row_size
+
     @property
     def column_widths(self):
         """
@@ -2372,6 +2405,166 @@ class PandasDataframe(
             pandas_backend=self._pandas_backend,
         )
 
+    @lazy_metadata_decorator(apply_axis="both")
+    def map_with_halo(
+        self,
+        func: Callable,
+        halo_sizes: Union[Tuple[int, int], List[Tuple[int, int]]],
+        dtypes: Optional[str] = None,
+        func_args=None,
+        func_kwargs=None,
+    ) -> PandasDataframe:
+        """
+        Perform a function that maps across row partitions extended with the boundary rows of their neighbours.
+
+        Parameters
+        ----------
+        func : callable(pandas.DataFrame, *args, **kwargs) -> pandas.DataFrame
+            The function to apply. It must preserve the number of rows of the passed frame.
+        halo_sizes : (int, int) or list of (int, int)
+            The number of rows preceding and following a row partition that ``func``
+            requires to compute the partition. Either one pair for every row
+            partition or a list of pairs, one per row partition.
+        dtypes : dtypes of the result, optional
+            The data types for the result. This is an optimization
+            because there are functions that always result in a particular data
+            type, and this allows us to avoid (re)computing it.
+        func_args : iterable, optional
+            Positional arguments for the 'func' callable.
+        func_kwargs : dict, optional
+            Keyword arguments for the 'func' callable.
+
+        Returns
+        -------
+        PandasDataframe
+            A new dataframe with the same partitioning and labels.
+        """
+        row_lengths = self.row_lengths
+        if isinstance(halo_sizes, tuple):
+            halo_sizes = [halo_sizes] * len(row_lengths)
+        new_partitions = self._partition_mgr_cls.map_partitions_with_halo(
+            self._partitions,
+            func,
+            row_lengths,
+            halo_sizes,
+            func_args=func_args,
+            func_kwargs=func_kwargs,
+        )
+        if isinstance(dtypes, str) and dtypes == "copy":
+            dtypes = self.copy_dtypes_cache()
+        return self.__constructor__(
+            new_partitions,
+            self.copy_index_cache(copy_lengths=True),
+            self.copy_columns_cache(copy_lengths=True),
+            row_lengths,
+            self._column_widths_cache,
+            dtypes=dtypes,
+            pandas_backend=self._pandas_backend,
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def scan(
+        self,
+        axis: Union[int, Axis],
+        carry_func: Callable,
+        combine_func: Callable,
+        fixup_func: Callable,
+        dtypes: Optional[str] = None,
+    ) -> PandasDataframe:
+        """
+        Perform a prefix scan along an entire axis without concatenating the partitions along it.
+
+        Parameters
+        ----------
+        axis : int or modin.core.dataframe.base.utils.Axis
+            The axis to scan along.
+        carry_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function computing the carry of a partition.
+        combine_func : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            Function combining the prefix preceding a partition with its carry.
+        fixup_func : callable(pandas.DataFrame, prefix=None) -> pandas.DataFrame
+            Function computing the scan of a partition from the prefix preceding it.
+            It must preserve the shape of the partition.
+        dtypes : pandas.Series or str, optional
+            The data types for the result. "copy" means the result has the same
+            data types as this dataframe.
+
+        Returns
+        -------
+        PandasDataframe
+            A new dataframe with the same partitioning and labels.
+        """
+        axis = Axis(axis)
+        new_partitions = self._partition_mgr_cls.scan_partitions(
+            axis.value, self._partitions, carry_func, combine_func, fixup_func
+        )
+        if isinstance(dtypes, str) and dtypes == "copy":
+            dtypes = self.copy_dtypes_cache()
+        return self.__constructor__(
+            new_partitions,
+            self.copy_index_cache(copy_lengths=True),
+            self.copy_columns_cache(copy_lengths=True),
+            self._row_lengths_cache,
+            self._column_widths_cache,
+            dtypes=dtypes,
+            pandas_backend=self._pandas_backend,
+        )
+
+    @lazy_metadata_decorator(apply_axis="both")
+    def matmul(
+        self,
+        other: PandasDataframe,
+        new_index: pandas.Index,
+        new_columns: pandas.Index,
+        transpose_self: bool = False,
+    ) -> PandasDataframe:
+        """
+        Compute the matrix product of this dataframe and `other` block-wise.
+
+        The operands are multiplied positionally, the caller is responsible
+        for aligning the labels along the contraction axis.
+
+        Parameters
+        ----------
+        other : PandasDataframe
+            The right operand.
+        new_index : pandas.Index
+            Index of the result.
+        new_columns : pandas.Index
+            Columns of the result.
+        transpose_self : bool, default: False
+            Whether to multiply by the transposed dataframe.
+
+        Returns
+        -------
+        PandasDataframe
+            A new dataframe holding the product.
+        """
+        self_dtype = find_common_type(self.dtypes.values)
+        other_dtype = find_common_type(other.dtypes.values)
+        new_partitions = self._partition_mgr_cls.matmul_partitions(
+            self._partitions,
+            other._partitions,
+            self.row_lengths if transpose_self else self.column_widths,
+            other.row_lengths,
+            transpose_left=transpose_self,
+            left_dtype=self_dtype,
+            right_dtype=other_dtype,
+        )
+        result = self.__constructor__(
+            new_partitions,
+            new_index,
+            new_columns,
+            self.column_widths if transpose_self else self.row_lengths,
+            other.column_widths,
+            dtypes=pandas.Series(
+                np.result_type(self_dtype, other_dtype), index=new_columns
+            ),
+            pandas_backend=self._pandas_backend,
+        )
+        result.synchronize_labels()
+        return result
+
     def infer_objects(self) -> PandasDataframe:
         """
         Attempt to infer better dtypes for object columns.
@@ -2545,6 +2738,7 @@ class PandasDataframe(
         data_key_columns=None,
         level=None,
         shuffle_func_cls=ShuffleSortFunctions,
+        reduce_func=None,
         **kwargs,
     ):
         """
@@ -2571,6 +2765,11 @@ class PandasDataframe(
         shuffle_func_cls : cls, default: ShuffleSortFunctions
             A class implementing ``modin.core.dataframe.pandas.utils.ShuffleFunctions`` to be used
             as a shuffle function.
+        reduce_func : callable(pandas.DataFrame) -> pandas.DataFrame, optional
+            Function to combine the results of `func`. If specified, the rows of the keys taking more
+            than a partition are split across several partitions (see ``ShuffleSortFunctions.hot_keys``),
+            the results of `func` for the parts of such keys are concatenated to the result of the range
+            the key falls into and passed to `reduce_func`.
         **kwargs : dict
             Additional arguments to forward to the range builder function.
 
@@ -2674,6 +2873,8 @@ class PandasDataframe(
         else:
             new_partitions = grouper._partitions
 
+        if reduce_func is not None:
+            kwargs["salt_hot_keys"] = True
         shuffling_functions = shuffle_func_cls(
             grouper,
             key_columns,
@@ -2701,6 +2902,24 @@ class PandasDataframe(
             shuffling_functions,
             func,
         )
+        hot_keys = getattr(shuffling_functions, "hot_keys", None)
+        if hot_keys:
+            num_ranges = len(new_partitions) - sum(
+                len(bins) for _, bins in hot_keys.values()
+            )
+            range_parts = [[part] for part in new_partitions[:num_ranges, 0]]
+            for range_bin, bins in hot_keys.values():
+                range_parts[range_bin].extend(new_partitions[list(bins), 0])
+            new_partitions = np.array(
+                [
+                    [
+                        grouper._partition_mgr_cls._column_partitions_class(
+                            parts, full_axis=False
+                        ).apply(reduce_func)
+                    ]
+                    for parts in range_parts
+                ]
+            )
 
         result = grouper.__constructor__(new_partitions)
         if preserve_columns:
@@ -2711,6 +2930,236 @@ class PandasDataframe(
                 result._set_axis_lengths_cache([len(grouper.columns)], axis=1)
         return result
 
+    def _apply_func_to_hash_partitioning(
+        self,
+        func,
+        key_columns=None,
+        new_columns=None,
+        dtypes=None,
+        other=None,
+    ):
+        """
+        Reshuffle data so it would be hash partitioned, apply the passed function to each bucket and put the results back in place.
+
+        Parameters
+        ----------
+        func : callable(pandas.DataFrame[, pandas.DataFrame]) -> pandas.DataFrame
+            Function to apply against the buckets. The function receives the rows of
+            a bucket in their original order and must return a frame with the same number
+            of rows keeping the index of the passed frame. If `other` is specified,
+            the function also receives the rows of `other` from the same bucket.
+        key_columns : list of hashables, optional
+            Columns to compute the hashes of. If not specified, all the columns are used.
+        new_columns : pandas.Index, optional
+            Column labels of the result.
+        dtypes : pandas.Series, optional
+            Dtypes of the result.
+        other : PandasDataframe, optional
+            Frame to shuffle to the same buckets, it must have `key_columns`
+            of the types hashing equal keys to equal values.
+
+        Returns
+        -------
+        PandasDataframe
+            A new dataframe that has the same index and row partitioning as `self`.
+
+        Notes
+        -----
+        The rows are labeled with their positions before the shuffle, so after applying
+        `func` they are shuffled back to their original row partitions using these positions.
+        This way no worker ever has to hold more than a bucket or a row partition of the frame.
+        """
+        row_lengths = self.row_lengths
+        if len(row_lengths) == 1 and other is None:
+            return self.apply_full_axis(
+                axis=1,
+                func=func,
+                new_index=self.copy_index_cache(),
+                new_columns=new_columns,
+                dtypes=dtypes,
+            )
+
+        def apply_to_bucket(df, *other_bucket):  # pragma: no cover
+            return func(df.sort_index(), *other_bucket)
+
+        # don't want to inherit over-partitioning so doing this 'min' check,
+        # a single bucket would make the rows be processed partition-wise
+        num_buckets = max(min(len(row_lengths), NPartitions.get()), 2)
+        bucket_partitions = self._partition_mgr_cls.shuffle_partitions(
+            self._get_positional_partitions(row_lengths),
+            0,
+            ShuffleHashFunctions(self, key_columns, True, num_buckets),
+            apply_to_bucket,
+            right_partitions=None if other is None else other._partitions,
+        )
+        return self._shuffle_back_to_positions(
+            bucket_partitions, row_lengths, new_columns, dtypes
+        )
+
+    def _apply_scan_to_range_partitioning(
+        self,
+        key_column,
+        carry_func,
+        combine_func,
+        fixup_func,
+        ascending=True,
+        new_columns=None,
+        dtypes=None,
+        **kwargs,
+    ):
+        """
+        Reshuffle data so it would be range partitioned, prefix-scan the ranges in their order and put the results back in place.
+
+        Parameters
+        ----------
+        key_column : hashable
+            Column to build the range partitioning for.
+        carry_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function computing the carry of a range.
+        combine_func : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            Function combining the prefix preceding a range with its carry.
+        fixup_func : callable(pandas.DataFrame, prefix=None) -> pandas.DataFrame
+            Function computing the result for the rows of a range from the prefix preceding it,
+            None for the first range. The function receives the rows of a range in their
+            original order and must return a frame with the same number of rows keeping
+            the index of the passed frame.
+        ascending : bool, default: True
+            Whether the ranges should be in ascending or descending order.
+        new_columns : pandas.Index, optional
+            Column labels of the result.
+        dtypes : pandas.Series, optional
+            Dtypes of the result.
+        **kwargs : dict
+            Additional arguments to forward to the range builder function.
+
+        Returns
+        -------
+        PandasDataframe
+            A new dataframe that has the same index and row partitioning as `self`.
+
+        Notes
+        -----
+        Equal values of `key_column` always get to the same range, so `fixup_func` sees
+        all the rows tied with each other. The rows with missing values get to the first
+        or to the last range, depending on the ``na_position`` keyword argument.
+        """
+        row_lengths = self.row_lengths
+        length = sum(row_lengths)
+        num_ranges = min(len(row_lengths), NPartitions.get()) if length else 1
+        # the values are sampled with the probability of 'num_ranges / length * ln(num_ranges * length)',
+        # see 'ShuffleSortFunctions.pick_samples_for_quantiles', so the small frames get fewer ranges
+        while num_ranges > 1 and num_ranges * np.log(num_ranges * length) >= length:
+            num_ranges -= 1
+        if num_ranges < 2:
+            return self.apply_full_axis(
+                axis=0,
+                func=fixup_func,
+                new_index=self.copy_index_cache(),
+                new_columns=new_columns,
+                dtypes=dtypes,
+            )
+
+        key_index = self.columns.get_indexer_for([key_column])
+        range_partitions = self._partition_mgr_cls.shuffle_partitions(
+            self._get_positional_partitions(row_lengths),
+            np.unique(np.digitize(key_index, np.cumsum(self.column_widths))),
+            ShuffleSortFunctions(self, [key_column], ascending, num_ranges, **kwargs),
+            lambda df: df.sort_index(),
+        )
+        range_partitions = self._partition_mgr_cls.scan_partitions(
+            0, range_partitions, carry_func, combine_func, fixup_func
+        )
+        return self._shuffle_back_to_positions(
+            range_partitions, row_lengths, new_columns, dtypes
+        )
+
+    def _get_positional_partitions(self, row_lengths):
+        """
+        Label the rows of the partitions with their positions.
+
+        Parameters
+        ----------
+        row_lengths : list of ints
+            The lengths of the row partitions.
+
+        Returns
+        -------
+        np.ndarray
+            A NumPy array with the partitions labeled with the positions.
+        """
+        cum_row_lengths = np.cumsum([0] + row_lengths)
+
+        def set_positional_index(df, partition_idx):  # pragma: no cover
+            return df.set_axis(
+                pandas.RangeIndex(
+                    cum_row_lengths[partition_idx], cum_row_lengths[partition_idx + 1]
+                ),
+                axis=0,
+            )
+
+        return self._partition_mgr_cls.lazy_map_partitions(
+            self._partitions, set_positional_index, enumerate_partitions=True
+        )
+
+    def _shuffle_back_to_positions(
+        self, partitions, row_lengths, new_columns=None, dtypes=None
+    ):
+        """
+        Shuffle the rows labeled with their positions back to the row partitions of `self`.
+
+        Parameters
+        ----------
+        partitions : np.ndarray
+            The partitions holding the rows labeled with positions.
+        row_lengths : list of ints
+            The lengths of the row partitions of `self`.
+        new_columns : pandas.Index, optional
+            Column labels of the result.
+        dtypes : pandas.Series, optional
+            Dtypes of the result.
+
+        Returns
+        -------
+        PandasDataframe
+            A new dataframe that has the same index and row partitioning as `self`.
+        """
+        if len(row_lengths) == 1:
+            # shuffling to a single partition would keep the buckets apart, so concatenating them here
+            new_partitions = np.array(
+                [
+                    [
+                        self._partition_mgr_cls._column_partitions_class(
+                            partitions[:, 0], full_axis=False
+                        ).apply(lambda df: df.sort_index())
+                    ]
+                ]
+            )
+        else:
+            new_partitions = self._partition_mgr_cls.shuffle_partitions(
+                partitions,
+                0,
+                ShufflePositionalFunctions(
+                    self, None, True, len(row_lengths), lengths=row_lengths
+                ),
+                lambda df: df.sort_index(),
+            )
+        result = self.__constructor__(
+            new_partitions,
+            index=self.copy_index_cache(),
+            columns=new_columns,
+            row_lengths=row_lengths,
+            column_widths=(
+                [len(new_columns)]
+                if ModinIndex.is_materialized_index(new_columns)
+                else None
+            ),
+            dtypes=dtypes,
+            pandas_backend=self._pandas_backend,
+        )
+        # the partitions are labeled with positions, restoring the actual labels
+        result.synchronize_labels(axis=0)
+        return result
+
     @lazy_metadata_decorator(apply_axis="both")
     def sort_by(
         self,
@@ -4132,6 +4581,218 @@ class PandasDataframe(
             pandas_backend=self._pandas_backend,
         )
 
+    def _apply_func_to_hash_partitioning_broadcast(
+        self,
+        right,
+        func,
+        key,
+        new_columns=None,
+        new_dtypes: Optional[Union[ModinDtypes, pandas.Series]] = None,
+    ):
+        """
+        Apply `func` against two dataframes using hash-partitioning implementation.
+
+        The method splits both dataframes into buckets by the hashes of their keys,
+        so the rows with equal keys always get to the same bucket, after that, it applies
+        `func` to every bucket of `self` along with the same bucket of `right`. The rows
+        of the results are then shuffled by their positional labels back to the row
+        partitions of `self` they came from, so they follow the order of `self`.
+
+        Parameters
+        ----------
+        right : PandasDataframe
+        func : callable(left : pandas.DataFrame, right : pandas.DataFrame) -> pandas.DataFrame
+            Function to apply against the buckets. The rows of `left` are labeled with
+            their positions in `self`, the rows of both buckets keep their original order.
+            The rows of the result of `func` must be labeled with the positions too.
+        key : list of labels
+            Columns to compute the hashes of. Must present in both dataframes and be of
+            the types hashing equal values alike, see ``ShuffleHashFunctions.are_hashed_alike``.
+        new_columns : pandas.Index, optional
+            Column values to write to the result's cache.
+        new_dtypes : pandas.Series or ModinDtypes, optional
+            Dtype values to write to the result's cache.
+
+        Returns
+        -------
+        PandasDataframe
+        """
+        row_lengths = self.row_lengths
+        # a single bucket would make the partitions be processed pairwise
+        num_buckets = max(
+            min(max(len(row_lengths), len(right._partitions)), NPartitions.get()), 2
+        )
+        bucket_partitions = self._partition_mgr_cls.shuffle_partitions(
+            self._get_positional_partitions(row_lengths),
+            0,
+            ShuffleHashFunctions(self, key, True, num_buckets),
+            func,
+            right_partitions=right._partitions,
+        )
+
+        def sort_by_positions(df):  # pragma: no cover
+            # the rows sharing a position come from a single bucket in their order
+            return df.sort_index(kind="stable")
+
+        # the positions are known in advance, so unlike range-partitioning
+        # the buckets are put back in order without sampling
+        if len(row_lengths) == 1:
+            new_partitions = np.array(
+                [
+                    [
+                        self._partition_mgr_cls._column_partitions_class(
+                            bucket_partitions[:, 0], full_axis=False
+                        ).apply(sort_by_positions)
+                    ]
+                ]
+            )
+        else:
+            new_partitions = self._partition_mgr_cls.shuffle_partitions(
+                bucket_partitions,
+                0,
+                ShufflePositionalFunctions(
+                    self, None, True, len(row_lengths), lengths=row_lengths
+                ),
+                sort_by_positions,
+            )
+        return self.__constructor__(
+            new_partitions,
+            columns=new_columns,
+            dtypes=new_dtypes,
+            pandas_backend=self._pandas_backend,
+        )
+
+    def _get_sorted_key_bounds(self, key):
+        """
+        Get the first and the last values of the `key` column in every row partition.
+
+        Parameters
+        ----------
+        key : label
+            Column the frame is sorted by.
+
+        Returns
+        -------
+        list of tuples or None
+            The bounds of every row partition, ``None`` for the empty partitions.
+
+        Raises
+        ------
+        NotImplementedError
+            If the frame is not sorted by `key` or `key` holds missing values.
+        """
+
+        def get_bounds(df):  # pragma: no cover
+            keys = df.iloc[:, 0]
+            if len(keys) == 0:
+                return pandas.DataFrame([[None, None, True]])
+            return pandas.DataFrame(
+                [
+                    [
+                        keys.iloc[0],
+                        keys.iloc[-1],
+                        not keys.hasnans and keys.is_monotonic_increasing,
+                    ]
+                ]
+            )
+
+        key_frame = self.take_2d_labels_or_positional(col_labels=[key])
+        stats = self._partition_mgr_cls.get_objects_from_partitions(
+            [part.apply(get_bounds) for part in key_frame._partitions[:, 0]]
+        )
+        bounds = []
+        previous_upper = None
+        for df, length in zip(stats, key_frame.row_lengths):
+            if length == 0:
+                bounds.append(None)
+                continue
+            lower, upper, is_sorted = df.iloc[0]
+            if not is_sorted or (previous_upper is not None and lower < previous_upper):
+                raise NotImplementedError(
+                    f"The frame is not sorted by {key!r} or it holds missing values."
+                )
+            bounds.append((lower, upper))
+            previous_upper = upper
+        return bounds
+
+    def _apply_func_to_sorted_ranges_broadcast(
+        self, right, func, split_func, key, right_key, new_columns=None
+    ):
+        """
+        Apply `func` against two dataframes sorted by their keys without shuffling `self`.
+
+        Every row partition of `self` spans a closed range of the `key` values. Each row
+        partition of `right` is split by `split_func` into one piece per such range, after
+        that, `func` is applied to every row partition of `self` along with the pieces of
+        `right` sent to its range.
+
+        Parameters
+        ----------
+        right : PandasDataframe
+        func : callable(left : pandas.DataFrame, right : pandas.DataFrame) -> pandas.DataFrame
+            Function to apply against the ranges. The pieces of `right` are concatenated
+            in the order of the row partitions of `right`.
+        split_func : callable(df : pandas.DataFrame, bounds : list of tuples) -> list of pandas.DataFrame
+            Function to split a row partition of `right` into a piece per range of `bounds`,
+            the ranges are given by the first and the last keys of `self` row partitions.
+        key : label
+            Column `self` is sorted by.
+        right_key : label
+            Column `right` is sorted by.
+        new_columns : pandas.Index, optional
+            Column values to write to the result's cache.
+
+        Returns
+        -------
+        PandasDataframe
+
+        Raises
+        ------
+        NotImplementedError
+            If one of the dataframes is not sorted by its key or the key holds missing values.
+        """
+        bounds = self._get_sorted_key_bounds(key)
+        right._get_sorted_key_bounds(right_key)
+        row_parts = [
+            row_part
+            for row_part, bound in zip(self._partitions, bounds)
+            if bound is not None
+        ]
+        bounds = [bound for bound in bounds if bound is not None]
+        # splitting into a single piece makes some engines return a bare object instead of a list
+        num_splits = max(len(bounds), 2)
+
+        def split(df):  # pragma: no cover
+            pieces = split_func(df, bounds)
+            return pieces + [df.iloc[:0]] * (num_splits - len(pieces))
+
+        right_pieces = np.array(
+            [
+                row_part.split(split, num_splits=num_splits, extract_metadata=False)
+                for row_part in self._partition_mgr_cls.row_partitions(
+                    right._partitions
+                )
+            ]
+        ).T
+        row_partition_class = self._partition_mgr_cls._row_partition_class
+        new_partitions = np.array(
+            [
+                row_partition_class(list(row_part), full_axis=False).apply(
+                    func,
+                    other_axis_partition=[
+                        row_partition_class([piece], full_axis=False)
+                        for piece in pieces
+                    ],
+                )
+                for row_part, pieces in zip(row_parts, right_pieces)
+            ]
+        )
+        return self.__constructor__(
+            new_partitions,
+            columns=new_columns,
+            pandas_backend=self._pandas_backend,
+        )
+
     @lazy_metadata_decorator(apply_axis="both")
     def groupby(
         self,
@@ -4144,6 +4805,7 @@ class PandasDataframe(
         align_result_columns: bool = False,
         series_groupby: bool = False,
         add_missing_cats: bool = False,
+        reduce_operator: Optional[Callable] = None,
         **kwargs: dict,
     ) -> PandasDataframe:
         """
@@ -4183,6 +4845,11 @@ class PandasDataframe(
             Whether to convert a one-column DataFrame to a Series before performing groupby.
         add_missing_cats : bool, default: False
             Whether to add missing categories from `by` columns to the result.
+        reduce_operator : callable(pandas.core.groupby.DataFrameGroupBy) -> pandas.DataFrame, optional
+            The operation combining the results of `operator` computed for the parts of a group,
+            for example, ``lambda grp: grp.sum()`` for the count aggregation. If specified and the
+            grouping is done on a single column, the groups taking more than a partition are split
+            across several partitions.
         **kwargs : dict
             Additional arguments to pass to the ``df.groupby`` method (besides the 'by' argument).
 
@@ -4316,12 +4983,42 @@ class PandasDataframe(
             grouper_key_columns = internal_by
             data, data_key_columns = None, None
 
+        if (
+            reduce_operator is not None
+            and level is None
+            and len(by_positions) == 1
+            and kwargs.get("as_index", True)
+            and not add_missing_cats
+            and not align_result_columns
+        ):
+            sort = kwargs.get("sort", True)
+
+            def reduce_func(df):  # pragma: no cover
+                # the results of the split groups are the only duplicated labels
+                is_split = df.index.duplicated(keep="first")
+                if is_split.any():
+                    is_split = df.index.isin(df.index[is_split])
+                    df = pandas.concat(
+                        [
+                            df[~is_split],
+                            reduce_operator(df[is_split].groupby(level=0, sort=False)),
+                        ]
+                    )
+                    # the ranges are ordered by the key, so put the combined groups
+                    # back to their place in the range
+                    return df.sort_index()
+                return df.sort_index() if sort else df
+
+        else:
+            reduce_func = None
+
         result = grouper._apply_func_to_range_partitioning(
             key_columns=grouper_key_columns,
             func=apply_func,
             data=data,
             data_key_columns=data_key_columns,
             level=level,
+            reduce_func=reduce_func,
         )
         # no need aligning columns if there's only one row partition
         if add_missing_cats or align_result_columns and result._partitions.shape[0] > 1:
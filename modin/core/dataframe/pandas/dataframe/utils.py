@@ -14,6 +14,8 @@
 """Collection of algebra utility functions, used to shuffle data across partitions."""
 
 import abc
+import datetime
+import numbers as numbers_abc
 from collections import namedtuple
 from typing import TYPE_CHECKING, Callable, Optional, Union
 
@@ -22,6 +24,7 @@ import pandas
 from pandas._libs.tslibs import to_offset
 from pandas.core.dtypes.common import is_list_like, is_numeric_dtype
 from pandas.core.resample import _get_timestamp_range_edges
+from pandas.core.util.hashing import hash_array
 
 from modin.error_message import ErrorMessage
 from modin.utils import _inherit_docstrings
@@ -128,8 +131,17 @@ class ShuffleSortFunctions(ShuffleFunctions):
         Whether to include the right limit in range-partitioning.
             True:  bins[i - 1] < x <= bins[i]
             False: bins[i - 1] <= x < bins[i]
+    salt_hot_keys : bool, default: False
+        Whether to split the rows of the keys taking more than a partition in the samples
+        across several extra bins. Only applies to a single key column sorted in ascending order.
     **kwargs : dict
         Additional keyword arguments.
+
+    Attributes
+    ----------
+    hot_keys : dict
+        The keys split across several bins by the preceding call of the ``.pivot_fn()``, maps every
+        such key to a tuple of the bin its range falls into and the range of the extra bins holding it.
     """
 
     def __init__(
@@ -140,6 +152,7 @@ class ShuffleSortFunctions(ShuffleFunctions):
         ideal_num_new_partitions: int,
         level: Optional[list[Union[str, int]]] = None,
         closed_on_right: bool = False,
+        salt_hot_keys: bool = False,
         **kwargs: dict,
     ):
         self.frame_len = len(modin_frame)
@@ -150,6 +163,14 @@ class ShuffleSortFunctions(ShuffleFunctions):
         self.level = level
         self.columns_info = None
         self.closed_on_right = closed_on_right
+        self.salt_hot_keys = (
+            salt_hot_keys
+            and level is None
+            and len(self.columns) == 1
+            and ascending is True
+            and kwargs.get("key", None) is None
+        )
+        self.hot_keys = {}
 
     def sample_fn(self, partition: pandas.DataFrame) -> pandas.DataFrame:
         if self.level is not None:
@@ -172,13 +193,32 @@ class ShuffleSortFunctions(ShuffleFunctions):
             if num_pivots < 2 and len(columns_info):
                 break
             column_val = samples[col]
+            if column_val.notna().any():
+                # the rows with missing keys are split out separately, so they mustn't affect the pivots
+                column_val = column_val.dropna()
             cols.append(col)
             is_numeric = is_numeric_dtype(column_val.dtype)
 
-            # When we are not sorting numbers, we need our quantiles to not do arithmetic on the values
-            method = "linear" if is_numeric else "inverted_cdf"
-            pivots = self.pick_pivots_from_samples_for_sort(
-                column_val, num_pivots, method, key
+            if self.salt_hot_keys:
+                column_val, num_pivots = self._extract_hot_keys(column_val, num_pivots)
+            # When we are not sorting numbers, we need our quantiles to not do arithmetic on the values.
+            # Interpolating between infinite samples gives NaN pivots and booleans can't be subtracted,
+            # so the pivots of such keys are picked among the samples too
+            method = (
+                "linear"
+                if is_numeric
+                and column_val.dtype.kind in "iuf"
+                and np.isfinite(
+                    column_val.to_numpy(dtype=np.float64, na_value=np.nan)
+                ).all()
+                else "inverted_cdf"
+            )
+            pivots = (
+                self.pick_pivots_from_samples_for_sort(
+                    column_val, num_pivots, method, key
+                )
+                if len(column_val)
+                else np.array([])
             )
             columns_info.append(
                 ColumnInfo(
@@ -189,8 +229,60 @@ class ShuffleSortFunctions(ShuffleFunctions):
             )
             number_of_groups *= len(pivots) + 1
         self.columns_info = columns_info
+
+        # the extra bins of the hot keys go after the bins of the ranges
+        for hot_key, num_splits in self.hot_keys.items():
+            pivots = columns_info[0].pivots
+            range_bin = (
+                np.digitize([hot_key], pivots, right=self.closed_on_right)[0]
+                if columns_info[0].is_numeric
+                else np.searchsorted(
+                    pivots, [hot_key], side="left" if self.closed_on_right else "right"
+                )[0]
+            )
+            self.hot_keys[hot_key] = (
+                range_bin,
+                range(number_of_groups, number_of_groups + num_splits),
+            )
+            number_of_groups += num_splits
         return number_of_groups
 
+    def _extract_hot_keys(
+        self, samples: pandas.Series, num_partitions: int
+    ) -> "tuple[pandas.Series, int]":
+        """
+        Find the keys taking more than a partition in the samples and remove them from the samples.
+
+        The found keys are saved to ``self.hot_keys`` along with the number of bins to split each one into.
+
+        Parameters
+        ----------
+        samples : pandas.Series
+            The samples of the key column.
+        num_partitions : int
+            The ideal number of new partitions.
+
+        Returns
+        -------
+        samples : pandas.Series
+            The samples of the rest of the keys.
+        num_partitions : int
+            The number of partitions left for the rest of the keys.
+        """
+        if len(samples) == 0 or num_partitions < 2:
+            return samples, num_partitions
+        shares = samples.value_counts(normalize=True)
+        shares = shares[shares > 1 / num_partitions]
+        num_splits = np.minimum(
+            np.ceil(shares.to_numpy() * num_partitions).astype(int), num_partitions
+        )
+        self.hot_keys = dict(zip(shares.index, num_splits))
+        if len(self.hot_keys) == 0:
+            return samples, num_partitions
+        return samples[~samples.isin(shares.index)], max(
+            num_partitions - num_splits.sum(), 1
+        )
+
     def split_fn(
         self,
         partition: pandas.DataFrame,
@@ -199,14 +291,33 @@ class ShuffleSortFunctions(ShuffleFunctions):
             failure_condition=self.columns_info is None,
             extra_log="The 'split_fn' doesn't have proper metadata, the probable reason is that it was called before 'pivot_fn'",
         )
-        return self.split_partitions_using_pivots_for_sort(
-            partition,
-            self.columns_info,
-            self.ascending,
-            keys_are_index_levels=self.level is not None,
-            closed_on_right=self.closed_on_right,
-            **self.kwargs,
+        if len(self.hot_keys) == 0:
+            return self.split_partitions_using_pivots_for_sort(
+                partition,
+                self.columns_info,
+                self.ascending,
+                keys_are_index_levels=self.level is not None,
+                closed_on_right=self.closed_on_right,
+                **self.kwargs,
+            )
+        keys = partition[self.columns[0]]
+        is_hot = keys.isin(list(self.hot_keys))
+        groups = list(
+            self.split_partitions_using_pivots_for_sort(
+                partition[~is_hot],
+                self.columns_info,
+                self.ascending,
+                closed_on_right=self.closed_on_right,
+                **self.kwargs,
+            )
         )
+        for hot_key, (_, bins) in self.hot_keys.items():
+            hot_rows = partition[keys == hot_key]
+            groups.extend(
+                hot_rows.iloc[positions]
+                for positions in np.array_split(np.arange(len(hot_rows)), len(bins))
+            )
+        return tuple(groups)
 
     @staticmethod
     def _find_quantiles(
@@ -505,6 +616,237 @@ class ShuffleSortFunctions(ShuffleFunctions):
         return index_data
 
 
+def _split_by_codes(
+    df: pandas.DataFrame, codes: np.ndarray, num_splits: int
+) -> "tuple[pandas.DataFrame, ...]":
+    """
+    Split the given dataframe into `num_splits` parts according to the split codes of its rows.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    codes : np.ndarray
+        An array of ints in ``[0, num_splits)`` range holding the split number of each row.
+    num_splits : int
+
+    Returns
+    -------
+    tuple of pandas.DataFrames
+        The splits, the rows within each split preserve their relative order.
+    """
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(num_splits + 1), side="left")
+    return tuple(df.iloc[order[bounds[i] : bounds[i + 1]]] for i in range(num_splits))
+
+
+@_inherit_docstrings(ShuffleFunctions)
+class ShuffleHashFunctions(ShuffleFunctions):
+    """
+    Perform the splitting stage for the hash-partitioning building.
+
+    Each row is assigned to a bucket by the hash of its key values, so the rows with
+    equal keys always end up in the same bucket. Unlike the range-partitioning,
+    hash-partitioning doesn't require data sampling to pick pivots.
+
+    Parameters
+    ----------
+    modin_frame : PandasDataframe
+        The frame to build the hash-partitioning for.
+    columns : str, list of strings or None
+        The column/columns to use as a key. If None, use all the columns.
+    ascending : bool
+        Serves the compatibility purpose. Does not affect the result.
+    ideal_num_new_partitions : int
+        The number of buckets to build.
+    **kwargs : dict
+        Additional keyword arguments.
+    """
+
+    def __init__(
+        self,
+        modin_frame: "PandasDataframe",
+        columns: Optional[Union[str, list]],
+        ascending: bool,
+        ideal_num_new_partitions: int,
+        **kwargs: dict,
+    ):
+        self.columns = (
+            columns if columns is None or is_list_like(columns) else [columns]
+        )
+        self.num_buckets = ideal_num_new_partitions
+
+    def sample_fn(self, partition: pandas.DataFrame) -> pandas.DataFrame:
+        # buckets don't depend on the data distribution, so there's nothing to sample
+        return partition.iloc[:0, :0]
+
+    def pivot_fn(self, samples: "list[pandas.DataFrame]") -> int:
+        return self.num_buckets
+
+    def split_fn(self, partition: pandas.DataFrame) -> "tuple[pandas.DataFrame, ...]":
+        key_data = partition if self.columns is None else partition[self.columns]
+        codes = self.hash_rows(key_data) % np.uint64(self.num_buckets)
+        return _split_by_codes(partition, codes.astype(np.int64), self.num_buckets)
+
+    @staticmethod
+    def hash_rows(df: pandas.DataFrame) -> np.ndarray:
+        """
+        Compute hashes of the rows of the given dataframe.
+
+        The rows that pandas considers equal when searching for duplicates are guaranteed
+        to get equal hashes, whatever partition they come from.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        np.ndarray
+            An array of ``np.uint64`` hashes.
+        """
+        result = np.zeros(len(df), dtype=np.uint64)
+        for i in range(len(df.columns)):
+            column = df.iloc[:, i]
+            if column.dtype == object:
+                hashes = ShuffleHashFunctions._hash_objects(column.to_numpy())
+            else:
+                if column.dtype.kind in "iufb":
+                    # the same values may be stored with different types in different
+                    # partitions, adding zero is required to get the same hash for '0.0' and '-0.0'
+                    column = column.astype(np.float64) + 0.0
+                hashes = pandas.util.hash_pandas_object(column, index=False).to_numpy()
+                # missing values are hashed the same way as in object columns
+                hashes[column.isna().to_numpy()] = 0
+            # combining hashes of the columns the same way 'pandas.util.hash_array' does
+            result = result * np.uint64(1000003) ^ hashes
+        return result
+
+    @staticmethod
+    def _hash_objects(values: np.ndarray) -> np.ndarray:
+        """
+        Compute hashes of the objects that don't depend on the process computing them.
+
+        The built-in ``hash`` can't be used since string hashes are salted per process.
+        pandas treats objects of different types as equal if they are compared equal
+        (``1 == 1.0 == True``), so numbers are hashed as floats and dates as the strings
+        of their pandas counterparts. Objects of other types get the same hash as missing
+        values, since equal ones aren't guaranteed to have a common representation.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Array of objects.
+
+        Returns
+        -------
+        np.ndarray
+            An array of ``np.uint64`` hashes.
+        """
+        as_float = np.full(len(values), np.nan)
+        is_float = np.zeros(len(values), dtype=bool)
+        as_str = np.empty(len(values), dtype=object)
+        is_str = np.zeros(len(values), dtype=bool)
+        for i, value in enumerate(values):
+            if isinstance(value, (str, bytes)):
+                as_str[i], is_str[i] = value, True
+            elif isinstance(value, (datetime.datetime, np.datetime64)):
+                value = pandas.Timestamp(value)
+                if value is not pandas.NaT:
+                    if value.tz is not None:
+                        value = value.tz_convert("UTC")
+                    as_str[i], is_str[i] = str(value), True
+            elif isinstance(value, (datetime.timedelta, np.timedelta64)):
+                value = pandas.Timedelta(value)
+                if value is not pandas.NaT:
+                    as_str[i], is_str[i] = str(value), True
+            elif isinstance(value, numbers_abc.Number):
+                # complex numbers are only equal to floats without the imaginary part
+                if isinstance(value, numbers_abc.Complex) and value.imag == 0:
+                    value = value.real
+                try:
+                    as_float[i] = float(value)
+                except TypeError:
+                    continue
+                is_float[i] = not np.isnan(as_float[i])
+        result = np.zeros(len(values), dtype=np.uint64)
+        if is_float.any():
+            # adding zero is required to get the same hash for '0.0' and '-0.0'
+            result[is_float] = hash_array(as_float[is_float] + 0.0)
+        if is_str.any():
+            result[is_str] = hash_array(as_str[is_str], categorize=False)
+        return result
+
+    @staticmethod
+    def are_hashed_alike(dtype: np.dtype, other_dtype: np.dtype) -> bool:
+        """
+        Check whether the equal values of the given types are guaranteed to get equal hashes.
+
+        Parameters
+        ----------
+        dtype : np.dtype
+        other_dtype : np.dtype
+
+        Returns
+        -------
+        bool
+        """
+        if dtype.kind in "iuf" and other_dtype.kind in "iuf":
+            return True
+        if dtype == object or other_dtype == object:
+            # objects are only hashed alike with objects, as their hashes are computed
+            # from normalized values (see ``_hash_objects``)
+            return dtype == object and other_dtype == object
+        # values of the other types are hashed as is, so the types must match exactly
+        return dtype == other_dtype
+
+
+@_inherit_docstrings(ShuffleFunctions)
+class ShufflePositionalFunctions(ShuffleFunctions):
+    """
+    Perform the splitting stage for building partitions of the specified lengths.
+
+    The rows to shuffle must be labeled with their positions in the resulting frame
+    (have a positional index), so each row goes back to the partition it belongs to.
+
+    Parameters
+    ----------
+    modin_frame : PandasDataframe
+        The frame to build the partitioning for.
+    columns : str, list of strings or None
+        Serves the compatibility purpose. Does not affect the result.
+    ascending : bool
+        Serves the compatibility purpose. Does not affect the result.
+    ideal_num_new_partitions : int
+        Serves the compatibility purpose. Does not affect the result.
+    lengths : list of ints
+        The lengths of the partitions to build.
+    **kwargs : dict
+        Additional keyword arguments.
+    """
+
+    def __init__(
+        self,
+        modin_frame: "PandasDataframe",
+        columns: Optional[Union[str, list]],
+        ascending: bool,
+        ideal_num_new_partitions: int,
+        lengths: "list[int]",
+        **kwargs: dict,
+    ):
+        self.bounds = np.cumsum(lengths)
+
+    def sample_fn(self, partition: pandas.DataFrame) -> pandas.DataFrame:
+        # the partitioning is known in advance, so there's nothing to sample
+        return partition.iloc[:0, :0]
+
+    def pivot_fn(self, samples: "list[pandas.DataFrame]") -> int:
+        return len(self.bounds)
+
+    def split_fn(self, partition: pandas.DataFrame) -> "tuple[pandas.DataFrame, ...]":
+        codes = np.searchsorted(self.bounds, partition.index, side="right")
+        return _split_by_codes(partition, codes, len(self.bounds))
+
+
 @_inherit_docstrings(ShuffleSortFunctions)
 class ShuffleResample(ShuffleSortFunctions):
     def __init__(
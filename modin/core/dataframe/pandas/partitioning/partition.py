@@ -24,6 +24,12 @@ from functools import cached_property
 import pandas
 from pandas.api.types import is_scalar
 
+from modin.core.dataframe.pandas.partitioning.spill import (
+    PartitionSpillManager,
+    SpillFile,
+    compute_memory_usage,
+    write_spilled,
+)
 from modin.core.storage_formats.pandas.utils import length_fn_pandas, width_fn_pandas
 from modin.logging import ClassLogger, get_logger
 from modin.logging.config import LogLevel
@@ -42,7 +48,11 @@ class PandasDataframePartition(
     _length_cache = None
     _width_cache = None
     _identity_cache = None
-    _data = None
+    _data_obj = None
+    # handle of the file the data is spilled to, see ``PartitionSpillManager``
+    _spill_file = None
+    _spill_size = None
+    _spill_tracked = False
     execution_wrapper = None
 
     # these variables are intentionally initialized at runtime
@@ -96,6 +106,58 @@ class PandasDataframePartition(
         self._is_debug(log) and log.debug(f"EXIT::Partition.get::{self._identity}")
         return result
 
+    @property
+    def _data_ref(self):  # noqa: GL08
+        if self._spill_file is not None:
+            self._unspill()
+        return self._data_obj
+
+    @_data_ref.setter
+    def _data_ref(self, value):  # noqa: GL08
+        self._data_obj = value
+
+    @property
+    def _data(self):  # noqa: GL08
+        data = self._data_ref
+        if self._spill_tracked:
+            PartitionSpillManager.touch(self)
+        return data
+
+    @_data.setter
+    def _data(self, value):  # noqa: GL08
+        self._data_obj = value
+
+    def _spill_size_ref(self):
+        """
+        Compute the number of bytes taken by the object wrapped by this partition.
+
+        Returns
+        -------
+        int or its Future
+        """
+        return self.apply(compute_memory_usage)._data
+
+    def _spill(self, path):
+        """
+        Write the object wrapped by this partition to disk and release it.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write.
+        """
+        self.drain_call_queue()
+        ref = self.execution_wrapper.deploy(
+            func=write_spilled, f_args=(self._data_ref, path)
+        )
+        self._spill_file = SpillFile(path, ref, self.execution_wrapper)
+        self._data_obj = None
+
+    def _unspill(self):
+        """Read the object wrapped by this partition back from disk."""
+        spill_file, self._spill_file = self._spill_file, None
+        self._data_obj = spill_file.load()
+
     @property
     def list_of_blocks(self):
         """
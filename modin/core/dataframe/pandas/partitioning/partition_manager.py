@@ -38,6 +38,7 @@ from modin.config import (
     PersistentPickle,
     ProgressBar,
 )
+from modin.core.dataframe.pandas.partitioning.spill import PartitionSpillManager
 from modin.core.dataframe.pandas.utils import create_pandas_df_from_partitions
 from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.error_message import ErrorMessage
@@ -92,6 +93,37 @@ def wait_computations_if_benchmark_mode(func):
     return wait
 
 
+def track_partitions_for_spilling(func):
+    """
+    Hand the partitions produced by `func` to ``PartitionSpillManager``.
+
+    The partitions are spilled to disk when they take more memory than ``SpillMemoryBudget``.
+
+    Parameters
+    ----------
+    func : callable
+        A partition manager method producing partitions.
+
+    Returns
+    -------
+    callable
+        Wrapped function tracking the partitions it produces.
+
+    Notes
+    -----
+    `func` should return NumPy array with partitions.
+    """
+
+    @wraps(func)
+    def track(cls, *args, **kwargs):
+        """Track the produced partitions."""
+        result = func(cls, *args, **kwargs)
+        PartitionSpillManager.track(result[0] if isinstance(result, tuple) else result)
+        return result
+
+    return track
+
+
 class PandasDataframePartitionManager(
     ClassLogger, ABC, modin_layer="PARTITION-MANAGER", log_level=LogLevel.DEBUG
 ):
@@ -358,6 +390,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def broadcast_apply_select_indices(
         cls,
         axis,
@@ -440,6 +473,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def base_broadcast_apply(cls, axis, apply_func, left, right):
         """
         Broadcast the `right` partitions to `left` and apply `apply_func` function.
@@ -495,6 +529,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def broadcast_axis_partitions(
         cls,
         axis,
@@ -612,6 +647,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def base_map_partitions(
         cls,
         partitions,
@@ -655,6 +691,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def broadcast_apply(
         cls,
         axis,
@@ -705,6 +742,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def map_partitions(
         cls,
         partitions,
@@ -770,6 +808,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def lazy_map_partitions(
         cls,
         partitions,
@@ -935,6 +974,292 @@ class PandasDataframePartitionManager(
 
         return result
 
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
+    def map_partitions_with_halo(
+        cls,
+        partitions,
+        map_func,
+        row_lengths,
+        halo_sizes,
+        func_args=None,
+        func_kwargs=None,
+    ):
+        """
+        Apply `map_func` to every partition extended with the boundary rows of its row-neighbours.
+
+        Parameters
+        ----------
+        partitions : NumPy 2D array
+            Partitions of Modin Frame.
+        map_func : callable(pandas.DataFrame, *args, **kwargs) -> pandas.DataFrame
+            Function to apply. It's called on a frame consisting of the halo rows
+            preceding the partition, the partition itself and the halo rows following it,
+            and must return a frame with the same number of rows.
+        row_lengths : list of ints
+            Row lengths of `partitions`.
+        halo_sizes : list of (int, int)
+            The number of rows preceding and following each row partition that
+            have to be passed to `map_func` along with the partition itself.
+        func_args : iterable, optional
+            Positional arguments for the 'map_func'.
+        func_kwargs : dict, optional
+            Keyword arguments for the 'map_func'.
+
+        Returns
+        -------
+        NumPy array
+            An array of partitions with the same partitioning as `partitions`.
+
+        Notes
+        -----
+        The halo rows are extracted from the neighbouring partitions and only they are
+        moved to the task computing the partition, so the partitioning stays untouched
+        and no partition ever has to hold the full axis. The halo may span several
+        neighbouring partitions if it's longer than the partitions themselves.
+        """
+        func_args = tuple() if func_args is None else func_args
+        func_kwargs = dict() if func_kwargs is None else func_kwargs
+
+        def halo_func(df, *halo, num_before):  # pragma: no cover
+            before = halo[:num_before]
+            after = halo[num_before:]
+            num_rows_before = sum(len(part) for part in before)
+            df_len = len(df)
+            if len(halo):
+                df = pandas.concat([*before, df, *after], copy=False)
+                # to reduce peak memory consumption
+                del halo, before, after
+            result = map_func(df, *func_args, **func_kwargs)
+            return result.iloc[num_rows_before : num_rows_before + df_len]
+
+        def take_rows(df, num_rows, from_end):  # pragma: no cover
+            return df.iloc[-num_rows:] if from_end else df.iloc[:num_rows]
+
+        preprocessed_halo_func = cls.preprocess_func(halo_func)
+        preprocessed_take_rows = cls.preprocess_func(take_rows)
+
+        def get_halo_parts(row_idx, num_rows, step):
+            """Get a list of ``(row_idx, num_rows)`` pairs to build a halo of `num_rows` length."""
+            result = []
+            row_idx += step
+            while num_rows > 0 and 0 <= row_idx < len(row_lengths):
+                rows_to_take = min(num_rows, row_lengths[row_idx])
+                if rows_to_take > 0:
+                    result.append((row_idx, rows_to_take))
+                num_rows -= rows_to_take
+                row_idx += step
+            return result[::-1] if step < 0 else result
+
+        # halo blocks are shared between the partitions that need them, the cache
+        # guarantees that the boundary rows of each block are extracted only once
+        halo_cache = {}
+
+        def get_halo_blocks(halo_parts, col_idx, from_end):
+            blocks = []
+            for row_idx, num_rows in halo_parts:
+                key = (row_idx, col_idx, num_rows, from_end)
+                if key not in halo_cache:
+                    part = partitions[row_idx][col_idx]
+                    if num_rows < row_lengths[row_idx]:
+                        part = part.apply(
+                            preprocessed_take_rows, num_rows, from_end=from_end
+                        )
+                    halo_cache[key] = part.list_of_blocks
+                blocks.extend(halo_cache[key])
+            return blocks
+
+        result = np.empty(partitions.shape, dtype=object)
+        for row_idx, (num_before, num_after) in enumerate(halo_sizes):
+            parts_before = get_halo_parts(row_idx, num_before, step=-1)
+            parts_after = get_halo_parts(row_idx, num_after, step=1)
+            for col_idx, part in enumerate(partitions[row_idx]):
+                blocks_before = get_halo_blocks(parts_before, col_idx, from_end=True)
+                blocks_after = get_halo_blocks(parts_after, col_idx, from_end=False)
+                result[row_idx, col_idx] = part.apply(
+                    preprocessed_halo_func,
+                    *blocks_before,
+                    *blocks_after,
+                    num_before=len(blocks_before),
+                )
+        return result
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
+    def scan_partitions(cls, axis, partitions, carry_func, combine_func, fixup_func):
+        """
+        Compute a prefix scan along the `axis` without building full-axis partitions.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            Axis to scan along: 0 means along the rows and 1 along the columns.
+        partitions : NumPy 2D array
+            Partitions of Modin Frame.
+        carry_func : callable(pandas.DataFrame) -> pandas.DataFrame
+            Function computing the carry of a partition.
+        combine_func : callable(pandas.DataFrame, pandas.DataFrame) -> pandas.DataFrame
+            Function combining the prefix preceding a partition with its carry.
+        fixup_func : callable(pandas.DataFrame, prefix=None) -> pandas.DataFrame
+            Function computing the scan of a partition from the prefix preceding it.
+
+        Returns
+        -------
+        NumPy array
+            An array of partitions with the same partitioning as `partitions`.
+
+        Notes
+        -----
+        The carries of the partitions and then the partitions of the result are computed
+        in parallel, only the combination of the carries, which are small, is chained
+        along the axis.
+        """
+        carry_func = cls.preprocess_func(carry_func)
+        combine_func = cls.preprocess_func(combine_func)
+        fixup_func = cls.preprocess_func(fixup_func)
+
+        # make the scanned axis the first one
+        if axis == 1:
+            partitions = partitions.T
+        result = np.empty(partitions.shape, dtype=object)
+        for col_idx in range(partitions.shape[1]):
+            prefix = None
+            for row_idx in range(partitions.shape[0]):
+                part = partitions[row_idx][col_idx]
+                if prefix is None:
+                    result[row_idx, col_idx] = part.apply(fixup_func)
+                else:
+                    result[row_idx, col_idx] = part.apply(
+                        fixup_func, *prefix.list_of_blocks
+                    )
+                if row_idx == partitions.shape[0] - 1:
+                    break
+                carry = part.apply(carry_func)
+                prefix = (
+                    carry
+                    if prefix is None
+                    else prefix.apply(combine_func, *carry.list_of_blocks)
+                )
+        return result.T if axis == 1 else result
+
+    @classmethod
+    @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
+    def matmul_partitions(
+        cls,
+        left,
+        right,
+        left_lengths,
+        right_lengths,
+        transpose_left=False,
+        left_dtype=None,
+        right_dtype=None,
+    ):
+        """
+        Compute a matrix product of two partitioned matrices block-wise.
+
+        Parameters
+        ----------
+        left : NumPy 2D array
+            Partitions of the left operand.
+        right : NumPy 2D array
+            Partitions of the right operand.
+        left_lengths : list of ints
+            Lengths of the `left` partitions along the contraction axis, i.e. column widths
+            of `left`, or its row lengths if `transpose_left` is True.
+        right_lengths : list of ints
+            Row lengths of `right`.
+        transpose_left : bool, default: False
+            Whether to multiply by the transposed `left` matrix.
+        left_dtype : numpy.dtype, optional
+            Data type to convert the `left` blocks to before multiplying.
+        right_dtype : numpy.dtype, optional
+            Data type to convert the `right` blocks to before multiplying.
+
+        Returns
+        -------
+        NumPy array
+            Partitions of the product. The result has the same partitioning as
+            the rows of `left` (columns if `transpose_left` is True) and as the columns
+            of `right`, its blocks are labeled positionally.
+
+        Notes
+        -----
+        The contraction axis is split by the union of the partition boundaries of both
+        operands, so the partitions are never repartitioned. Each pair of blocks
+        sharing a piece of the contraction axis is multiplied in a separate task,
+        and the partial products of each result block are summed up pairwise in
+        a tree-like manner. Neither operand is ever collected as a whole.
+        """
+        if transpose_left:
+            left = left.T
+        if sum(left_lengths) != sum(right_lengths):
+            raise ValueError(
+                f"Matrices are not aligned: {sum(left_lengths)} vs {sum(right_lengths)}"
+            )
+
+        def multiply(
+            left_block, right_block, left_slice, right_slice, transpose_left
+        ):  # pragma: no cover
+            if transpose_left:
+                lhs = left_block.iloc[left_slice].to_numpy(dtype=left_dtype).T
+            else:
+                lhs = left_block.iloc[:, left_slice].to_numpy(dtype=left_dtype)
+            rhs = right_block.iloc[right_slice].to_numpy(dtype=right_dtype)
+            return pandas.DataFrame(lhs @ rhs)
+
+        def add(first, second):  # pragma: no cover
+            return first + second
+
+        preprocessed_multiply = cls.preprocess_func(multiply)
+        preprocessed_add = cls.preprocess_func(add)
+
+        # split the contraction axis by the boundaries of both operands, so each
+        # piece belongs to exactly one block of `left` and one block of `right`
+        left_bounds = np.cumsum([0] + list(left_lengths))
+        right_bounds = np.cumsum([0] + list(right_lengths))
+        bounds = np.unique(np.concatenate([left_bounds, right_bounds]))
+        pieces = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            left_idx = np.searchsorted(left_bounds, start, side="right") - 1
+            right_idx = np.searchsorted(right_bounds, start, side="right") - 1
+            pieces.append(
+                (
+                    left_idx,
+                    slice(start - left_bounds[left_idx], stop - left_bounds[left_idx]),
+                    right_idx,
+                    slice(
+                        start - right_bounds[right_idx], stop - right_bounds[right_idx]
+                    ),
+                )
+            )
+
+        result = np.empty((left.shape[0], right.shape[1]), dtype=object)
+        for row_idx in range(left.shape[0]):
+            for col_idx in range(right.shape[1]):
+                partials = [
+                    left[row_idx][left_idx].apply(
+                        preprocessed_multiply,
+                        *right[right_idx][col_idx].list_of_blocks,
+                        left_slice=left_slice,
+                        right_slice=right_slice,
+                        transpose_left=transpose_left,
+                    )
+                    for left_idx, left_slice, right_idx, right_slice in pieces
+                ]
+                while len(partials) > 1:
+                    reduced = [
+                        first.apply(preprocessed_add, *second.list_of_blocks)
+                        for first, second in zip(partials[::2], partials[1::2])
+                    ]
+                    if len(partials) % 2:
+                        reduced.append(partials[-1])
+                    partials = reduced
+                result[row_idx, col_idx] = partials[0]
+        return result
+
     @classmethod
     def concat(cls, axis, left_parts, right_parts):
         """
@@ -1063,6 +1388,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def from_pandas(cls, df, return_dims=False):
         """
         Return the partitions from pandas.DataFrame.
@@ -1370,6 +1696,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def apply_func_to_select_indices(
         cls, axis, partitions, func, indices, keep_remaining=False
     ):
@@ -1492,6 +1819,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def apply_func_to_select_indices_along_full_axis(
         cls, axis, partitions, func, indices, keep_remaining=False
     ):
@@ -1611,6 +1939,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def apply_func_to_indices_both_axis(
         cls,
         partitions,
@@ -1718,6 +2047,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def n_ary_operation(cls, left, func, right: list):
         r"""
         Apply an n-ary operation to multiple ``PandasDataframe`` objects.
@@ -1930,6 +2260,7 @@ class PandasDataframePartitionManager(
 
     @classmethod
     @wait_computations_if_benchmark_mode
+    @track_partitions_for_spilling
     def shuffle_partitions(
         cls,
         partitions,
@@ -0,0 +1,495 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses `PartitionSpillManager` class, that spills partitions to disk under a memory budget."""
+
+from __future__ import annotations
+
+import atexit
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import pandas
+
+from modin.config import SpillDir, SpillMemoryBudget
+from modin.error_message import ErrorMessage
+from modin.logging import get_logger
+
+if TYPE_CHECKING:
+    from .partition import PandasDataframePartition
+
+# magic bytes starting an Arrow IPC file
+_ARROW_MAGIC = b"ARROW1"
+
+
+def _is_arrow_compatible(df: Any) -> bool:
+    """
+    Check whether `df` can go through Arrow IPC and come back unchanged.
+
+    Parameters
+    ----------
+    df : Any
+
+    Returns
+    -------
+    bool
+    """
+    if not isinstance(df, pandas.DataFrame):
+        return False
+    columns = df.columns
+    if isinstance(columns, pandas.MultiIndex) or not columns.is_unique:
+        return False
+    if not all(isinstance(col, str) for col in columns):
+        return False
+    index = df.index
+    if isinstance(index, pandas.MultiIndex) or not (
+        isinstance(index, pandas.RangeIndex)
+        or (isinstance(index.dtype, np.dtype) and index.dtype.kind in "biufmM")
+    ):
+        return False
+    return all(
+        isinstance(dtype, np.dtype) and dtype.kind in "biufmM" for dtype in df.dtypes
+    )
+
+
+def write_spilled(df: Any, path: str) -> str:
+    """
+    Write `df` to `path`.
+
+    Frames of primitive types are written as Arrow IPC files, other objects are pickled.
+
+    Parameters
+    ----------
+    df : Any
+        Object to write.
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    str
+        `path`.
+    """
+    # the directory is created on the node the partition is written on
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if _is_arrow_compatible(df):
+        try:
+            import pyarrow
+        except ImportError:
+            pass
+        else:
+            table = pyarrow.Table.from_pandas(df)
+            with pyarrow.OSFile(path, "wb") as sink:
+                with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            return path
+    with open(path, "wb") as sink:
+        pickle.dump(df, sink, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def read_spilled(path: str) -> Any:
+    """
+    Read the object written by ``write_spilled`` and remove the file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    Any
+    """
+    with open(path, "rb") as source:
+        is_arrow = source.read(len(_ARROW_MAGIC)) == _ARROW_MAGIC
+        source.seek(0)
+        if is_arrow:
+            import pyarrow
+
+            result = pyarrow.ipc.open_file(source.read()).read_all().to_pandas()
+        else:
+            result = pickle.load(source)
+    os.remove(path)
+    return result
+
+
+def compute_memory_usage(df: Any) -> int:
+    """
+    Get the number of bytes taken by `df`.
+
+    Parameters
+    ----------
+    df : Any
+
+    Returns
+    -------
+    int
+    """
+    if isinstance(df, pandas.DataFrame):
+        return int(df.memory_usage(index=True, deep=False).sum())
+    if isinstance(df, pandas.Series):
+        return int(df.memory_usage(index=True, deep=False))
+    return 0
+
+
+def _remove_file(path: str):
+    """
+    Remove the file at `path` if it still exists.
+
+    Parameters
+    ----------
+    path : str
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _release_spill_file(execution_wrapper, path: str, refs: list):
+    """
+    Remove the file of a destroyed ``SpillFile``.
+
+    Parameters
+    ----------
+    execution_wrapper : type
+        Engine wrapper the file was written and read with.
+    path : str
+        Path of the file.
+    refs : list
+        The results of the write and the read of the file or references to them.
+    """
+    if any(execution_wrapper.is_future(ref) for ref in refs):
+        # the tasks may still be running, the file is removed after them
+        PartitionSpillManager._orphans.append((execution_wrapper, path, refs))
+    else:
+        _remove_file(path)
+
+
+class SpillFile:
+    """
+    Handle of the file a partition is spilled to.
+
+    The partitions copied from the spilled one share the handle, so the file is
+    read at most once, and it is removed when the last of them is destroyed.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    ref : object
+        The result of ``write_spilled`` or a reference to it.
+    execution_wrapper : type
+        Engine wrapper the file is written with.
+    """
+
+    def __init__(self, path: str, ref: Any, execution_wrapper):
+        self.path = path
+        self.ref = ref
+        self._execution_wrapper = execution_wrapper
+        self._refs = [ref]
+        self._data = None
+        finalizer = weakref.finalize(
+            self, _release_spill_file, execution_wrapper, path, self._refs
+        )
+        # the directory is removed at exit anyway
+        finalizer.atexit = False
+
+    def load(self) -> Any:
+        """
+        Read the spilled data back, only once.
+
+        Returns
+        -------
+        object
+            The data or a reference to it.
+        """
+        if self._data is None:
+            self._data = self._execution_wrapper.deploy(
+                func=read_spilled, f_args=(self.ref,)
+            )
+            self._refs.append(self._data)
+        return self._data
+
+
+class PartitionSpillManager:
+    """
+    Keeper of the memory taken by the partitions, spilling them to disk over ``SpillMemoryBudget``.
+
+    The partitions produced by the ``PandasDataframePartitionManager`` methods are
+    tracked in least recently used order. Their sizes are computed asynchronously
+    and taken into account at a later call of the partition manager, once computed,
+    when the least recently used partitions are written to ``SpillDir`` until the rest
+    fits the budget. A spilled partition reads its data back when accessed.
+
+    A partition may be read back on another node than it was written on, so on a
+    multi-node cluster the partitions are only spilled if ``SpillDir`` is set to a
+    directory shared by all the nodes.
+    """
+
+    _lock = threading.RLock()
+    # id of the partition -> (weak reference to the partition, size or reference to it)
+    _entries: "OrderedDict[int, list]" = OrderedDict()
+    _used = 0
+    # keys of the entries whose partitions were destroyed, dropped under the lock
+    _dead: list = []
+    _evicting = False
+    # files of the destroyed handles waiting for their tasks to complete
+    _orphans: list = []
+    _spill_dir: Optional[str] = None
+    _spilled_count = 0
+    _num_nodes: Optional[int] = None
+
+    @classmethod
+    def _get_spill_dir(cls) -> str:
+        """
+        Get the directory of the current session.
+
+        The directory is created by the tasks writing the partitions, on their nodes.
+
+        Returns
+        -------
+        str
+        """
+        if cls._spill_dir is None:
+            base_dir = SpillDir.get() or tempfile.gettempdir()
+            cls._spill_dir = os.path.join(base_dir, f"modin-spill-{uuid.uuid4().hex}")
+            atexit.register(shutil.rmtree, cls._spill_dir, ignore_errors=True)
+        return cls._spill_dir
+
+    @classmethod
+    def _can_spill(cls, execution_wrapper) -> bool:
+        """
+        Check whether the partitions of the cluster can be spilled.
+
+        Parameters
+        ----------
+        execution_wrapper : type
+            Engine wrapper the partitions are computed with.
+
+        Returns
+        -------
+        bool
+        """
+        if SpillDir.get() is not None:
+            return True
+        if cls._num_nodes is None:
+            cls._num_nodes = execution_wrapper.num_nodes()
+            if cls._num_nodes > 1:
+                ErrorMessage.single_warning(
+                    "The partitions are not spilled on a multi-node cluster unless "
+                    + "`SpillDir` is set to a directory shared by all the nodes."
+                )
+        return cls._num_nodes <= 1
+
+    @classmethod
+    def _remove_orphans(cls):
+        """Remove the files of the destroyed handles once their tasks are completed."""
+        while cls._orphans:
+            execution_wrapper, path, refs = cls._orphans.pop()
+            execution_wrapper.wait(
+                [ref for ref in refs if execution_wrapper.is_future(ref)]
+            )
+            _remove_file(path)
+
+    @classmethod
+    def _drop_dead(cls):
+        """Forget the entries of the destroyed partitions."""
+        while cls._dead:
+            key, ref = cls._dead.pop()
+            entry = cls._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del cls._entries[key]
+                if isinstance(entry[1], int):
+                    cls._used -= entry[1]
+
+    @classmethod
+    def _add(cls, partition: PandasDataframePartition, size: Any):
+        """
+        Start tracking a partition kept in memory.
+
+        Parameters
+        ----------
+        partition : PandasDataframePartition
+        size : int or reference to it
+        """
+        key = id(partition)
+        ref = weakref.ref(partition, lambda ref: cls._dead.append((key, ref)))
+        cls._entries[key] = [ref, size]
+        if isinstance(size, int):
+            cls._used += size
+            partition._spill_size = size
+
+    @classmethod
+    def _resolve_sizes(cls, wait: bool = False):
+        """
+        Materialize the sizes of the tracked partitions that are still references.
+
+        Parameters
+        ----------
+        wait : bool, default: False
+            Whether to wait for the sizes being computed, otherwise only the computed
+            ones are materialized.
+        """
+        pending = [
+            entry for entry in cls._entries.values() if not isinstance(entry[1], int)
+        ]
+        if not pending:
+            return
+        partition = next(
+            (part for part in (entry[0]() for entry in pending) if part is not None),
+            None,
+        )
+        if partition is None:
+            return
+        execution_wrapper = partition.execution_wrapper
+        if not wait:
+            ready = execution_wrapper.ready([entry[1] for entry in pending])
+            pending = [entry for entry, is_ready in zip(pending, ready) if is_ready]
+            if not pending:
+                return
+        sizes = execution_wrapper.materialize([entry[1] for entry in pending])
+        for entry, size in zip(pending, sizes):
+            entry[1] = int(size)
+            cls._used += entry[1]
+            part = entry[0]()
+            if part is not None:
+                part._spill_size = entry[1]
+
+    @classmethod
+    def _evict(cls, resolve: bool = True):
+        """
+        Spill the least recently used partitions until the others fit the budget.
+
+        Parameters
+        ----------
+        resolve : bool, default: True
+            Whether to take the sizes computed by now into account, otherwise
+            only the known ones are.
+        """
+        budget = SpillMemoryBudget.get() * 2**20
+        cls._drop_dead()
+        cls._remove_orphans()
+        if budget == 0 or cls._evicting:
+            return
+        cls._evicting = True
+        try:
+            if resolve:
+                cls._resolve_sizes()
+            for key in list(cls._entries):
+                if cls._used <= budget:
+                    break
+                ref, size = cls._entries[key]
+                if not isinstance(size, int):
+                    continue
+                del cls._entries[key]
+                cls._used -= size
+                partition = ref()
+                if partition is None:
+                    continue
+                path = os.path.join(cls._get_spill_dir(), f"{uuid.uuid4().hex}.spill")
+                partition._spill(path)
+                cls._spilled_count += 1
+                get_logger().debug(f"SPILL::Partition::{size} bytes to {path}")
+        finally:
+            cls._evicting = False
+
+    @classmethod
+    def track(cls, partitions):
+        """
+        Track the partitions produced by a partition manager call.
+
+        Parameters
+        ----------
+        partitions : np.ndarray
+            The partitions produced.
+        """
+        if SpillMemoryBudget.get() == 0:
+            return
+        partitions = [
+            partition
+            for partition in partitions.flatten()
+            if not getattr(partition, "_spill_tracked", True)
+        ]
+        if not partitions or not cls._can_spill(partitions[0].execution_wrapper):
+            return
+        with cls._lock:
+            # the sizes of the partitions produced by the previous calls are taken
+            # as they get computed, the new ones are kept computing in the background
+            cls._evict()
+            for partition in partitions:
+                partition._spill_tracked = True
+                cls._add(partition, partition._spill_size_ref())
+            cls._evict(resolve=False)
+
+    @classmethod
+    def touch(cls, partition: PandasDataframePartition):
+        """
+        Mark the partition as the most recently used one.
+
+        A spilled partition that was read back is tracked again.
+
+        Parameters
+        ----------
+        partition : PandasDataframePartition
+        """
+        with cls._lock:
+            key = id(partition)
+            entry = cls._entries.get(key)
+            if entry is not None and entry[0]() is partition:
+                cls._entries.move_to_end(key)
+            elif not cls._evicting and partition._spill_size is not None:
+                cls._add(partition, partition._spill_size)
+                cls._evict()
+
+    @classmethod
+    def memory_usage(cls) -> int:
+        """
+        Get the number of bytes taken by the tracked partitions kept in memory.
+
+        The sizes being computed are waited for, and the partitions over the budget
+        are spilled first.
+
+        Returns
+        -------
+        int
+        """
+        with cls._lock:
+            cls._drop_dead()
+            cls._remove_orphans()
+            cls._resolve_sizes(wait=True)
+            cls._evict()
+            return cls._used
+
+    @classmethod
+    def reset(cls):
+        """Stop tracking the partitions, the spilled ones are still read back on access."""
+        with cls._lock:
+            for ref, _ in cls._entries.values():
+                partition = ref()
+                if partition is not None:
+                    partition._spill_tracked = False
+            cls._entries.clear()
+            cls._dead.clear()
+            cls._remove_orphans()
+            cls._used = 0
+            cls._spilled_count = 0
@@ -19,6 +19,14 @@ import pandas
 from dask.distributed import wait
 from distributed import Future
 from distributed.client import default_client
+from distributed.comm import get_address_host
+
+from modin.logging.profiler import (
+    profile_deploy,
+    profile_materialize,
+    profile_put,
+    profile_wait,
+)
 
 
 def _deploy_dask_func(func, *args, return_pandas_df=None, **kwargs):  # pragma: no cover
@@ -51,6 +59,7 @@ class DaskWrapper:
     """The class responsible for execution of remote operations."""
 
     @classmethod
+    @profile_deploy(lambda future, callback: future.add_done_callback(callback))
     def deploy(
         cls,
         func,
@@ -123,6 +132,34 @@ class DaskWrapper:
         return isinstance(item, Future)
 
     @classmethod
+    def ready(cls, obj_ids):
+        """
+        Check which of the objects are computed already, without waiting for them.
+
+        Parameters
+        ----------
+        obj_ids : list
+
+        Returns
+        -------
+        list of bool
+        """
+        return [not isinstance(obj, Future) or obj.done() for obj in obj_ids]
+
+    @classmethod
+    def num_nodes(cls):
+        """
+        Get the number of nodes the workers of the cluster run on.
+
+        Returns
+        -------
+        int
+        """
+        workers = default_client().scheduler_info()["workers"]
+        return len({get_address_host(address) for address in workers})
+
+    @classmethod
+    @profile_materialize
     def materialize(cls, future):
         """
         Materialize data matching `future` object.
@@ -141,6 +178,7 @@ class DaskWrapper:
         return client.gather(future)
 
     @classmethod
+    @profile_put
     def put(cls, data, **kwargs):
         """
         Put data into distributed memory.
@@ -168,6 +206,7 @@ class DaskWrapper:
         return client.scatter(data, **kwargs)
 
     @classmethod
+    @profile_wait
     def wait(cls, obj_ids, num_returns=None):
         """
         Wait on the objects without materializing them (blocking operation).
@@ -96,6 +96,7 @@ class PandasOnDaskIO(BaseIO):
     read_feather = __make_read(PandasFeatherParser, FeatherDispatcher)
     read_sql = __make_read(PandasSQLParser, SQLDispatcher)
     to_sql = __make_write(SQLDispatcher)
+    to_csv = __make_write(CSVDispatcher)
     read_excel = __make_read(PandasExcelParser, ExcelDispatcher)
 
     # experimental methods that don't exist in pandas
@@ -13,11 +13,14 @@
 
 """Modin's functionality related to Python execution engine."""
 
+from modin.logging.profiler import profile_deploy
+
 
 class PythonWrapper:
     """Python engine wrapper serving for the compatibility purpose with other engines."""
 
     @classmethod
+    @profile_deploy()
     def deploy(cls, func, f_args=None, f_kwargs=None, num_returns=1):
         """
         Run the passed function.
@@ -57,6 +60,36 @@ class PythonWrapper:
         """
         return False
 
+    @classmethod
+    def ready(cls, obj_ids):
+        """
+        Check which of the objects are computed already.
+
+        The method only serves for the compatibility purpose, all the objects
+        are computed eagerly.
+
+        Parameters
+        ----------
+        obj_ids : list
+
+        Returns
+        -------
+        list of bool
+        """
+        return [True] * len(obj_ids)
+
+    @classmethod
+    def num_nodes(cls):
+        """
+        Get the number of nodes of the cluster.
+
+        Returns
+        -------
+        int
+            Always return 1.
+        """
+        return 1
+
     @classmethod
     def materialize(cls, obj_id):
         """
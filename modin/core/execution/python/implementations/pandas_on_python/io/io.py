@@ -13,10 +13,14 @@
 
 """Module for housing IO classes with pandas storage format and Python engine."""
 
+from modin.core.execution.python.common import PythonWrapper
 from modin.core.execution.python.implementations.pandas_on_python.dataframe.dataframe import (
     PandasOnPythonDataframe,
 )
-from modin.core.io import BaseIO
+from modin.core.execution.python.implementations.pandas_on_python.partitioning import (
+    PandasOnPythonDataframePartition,
+)
+from modin.core.io import BaseIO, CSVDispatcher
 from modin.core.storage_formats.pandas.query_compiler import PandasQueryCompiler
 
 
@@ -28,4 +32,19 @@ class PandasOnPythonIO(BaseIO):
     """
 
     frame_cls = PandasOnPythonDataframe
+    frame_partition_cls = PandasOnPythonDataframePartition
     query_compiler_cls = PandasQueryCompiler
+    build_args = dict(
+        frame_cls=PandasOnPythonDataframe,
+        frame_partition_cls=PandasOnPythonDataframePartition,
+        query_compiler_cls=PandasQueryCompiler,
+        base_io=BaseIO,
+    )
+
+    def __make_write(*classes, build_args=build_args):
+        # used to reduce code duplication
+        return type("", (PythonWrapper, *classes), build_args).write
+
+    to_csv = __make_write(CSVDispatcher)
+
+    del __make_write  # to not pollute class namespace
@@ -17,6 +17,7 @@ import warnings
 
 from modin.core.dataframe.pandas.partitioning.partition import PandasDataframePartition
 from modin.core.execution.python.common import PythonWrapper
+from modin.logging.profiler import profile_deploy
 
 
 class PandasOnPythonDataframePartition(PandasDataframePartition):
@@ -73,6 +74,7 @@ class PandasOnPythonDataframePartition(PandasDataframePartition):
         self.drain_call_queue()
         return self._data.copy() if hasattr(self._data, "copy") else self._data
 
+    @profile_deploy()
     def apply(self, func, *args, **kwargs):
         """
         Apply a function to the object wrapped by this partition.
@@ -33,7 +33,9 @@ from ray._private.services import get_node_ip_address
 
 from modin.config import RayTaskCustomResources
 from modin.core.execution.ray.common import MaterializationHook, RayWrapper
-from modin.logging import get_logger
+from modin.core.execution.ray.common.engine_wrapper import _watch_ray_task
+from modin.logging import Profiler, get_logger
+from modin.logging.profiler import profile_deploy
 
 ObjectRefType = Union[ray.ObjectRef, None]
 ObjectRefOrListType = Union[ObjectRefType, List[ObjectRefType]]
@@ -158,6 +160,8 @@ class DeferredExecution:
             result, length, width, ip = remote_exec_func.options(
                 resources=RayTaskCustomResources.get()
             ).remote(self.func, self.data, *self.args, **self.kwargs)
+            if (profiler := Profiler.active) is not None:
+                profiler.record_task(lambda callback: _watch_ray_task(result, callback))
             meta = MetaList([length, width, ip])
             self._set_result(result, meta, 0)
             return result, meta, 0
@@ -416,6 +420,7 @@ class DeferredExecution:
         out_append(_Tag.END)
 
     @staticmethod
+    @profile_deploy(_watch_ray_task)
     def _remote_exec_chain(num_returns: int, *args: Tuple) -> List[Any]:
         """
         Execute the deconstructed chain in a worker process.
@@ -27,6 +27,26 @@ import ray
 
 from modin.config import RayTaskCustomResources
 from modin.error_message import ErrorMessage
+from modin.logging.profiler import (
+    profile_deploy,
+    profile_materialize,
+    profile_put,
+    profile_wait,
+)
+
+
+def _watch_ray_task(object_ref, callback):
+    """
+    Register a callback to be called once the task returning `object_ref` completes.
+
+    Parameters
+    ----------
+    object_ref : ray.ObjectRef
+        Reference to a result of the task.
+    callback : callable
+        Function to call.
+    """
+    object_ref.future().add_done_callback(callback)
 
 
 @ray.remote
@@ -62,6 +82,7 @@ class RayWrapper:
     _func_cache = {}
 
     @classmethod
+    @profile_deploy(_watch_ray_task)
     def deploy(
         cls, func, f_args=None, f_kwargs=None, return_pandas_df=None, num_returns=1
     ):
@@ -110,6 +131,39 @@ class RayWrapper:
         return isinstance(item, ObjectRefTypes)
 
     @classmethod
+    def ready(cls, obj_ids):
+        """
+        Check which of the objects are computed already, without waiting for them.
+
+        Parameters
+        ----------
+        obj_ids : list
+
+        Returns
+        -------
+        list of bool
+        """
+        refs = [
+            obj.pre_materialize() if isinstance(obj, MaterializationHook) else obj
+            for obj in obj_ids
+        ]
+        ids = list({ref for ref in refs if isinstance(ref, ray.ObjectRef)})
+        done = set(ray.wait(ids, num_returns=len(ids), timeout=0)[0]) if ids else ()
+        return [not isinstance(ref, ray.ObjectRef) or ref in done for ref in refs]
+
+    @classmethod
+    def num_nodes(cls):
+        """
+        Get the number of alive nodes of the cluster.
+
+        Returns
+        -------
+        int
+        """
+        return sum(node["Alive"] for node in ray.nodes())
+
+    @classmethod
+    @profile_materialize
     def materialize(cls, obj_id):
         """
         Get the value of object from the Plasma store.
@@ -179,6 +233,7 @@ class RayWrapper:
         return result
 
     @classmethod
+    @profile_put
     def put(cls, data, **kwargs):
         """
         Store an object in the object store.
@@ -211,6 +266,7 @@ class RayWrapper:
         return ray.put(data, **kwargs)
 
     @classmethod
+    @profile_wait
     def wait(cls, obj_ids, num_returns=None):
         """
         Wait on the objects without materializing them (blocking operation).
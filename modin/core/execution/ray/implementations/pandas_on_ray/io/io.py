@@ -96,6 +96,7 @@ class PandasOnRayIO(RayIO):
     read_feather = __make_read(PandasFeatherParser, FeatherDispatcher)
     read_sql = __make_read(PandasSQLParser, SQLDispatcher)
     to_sql = __make_write(SQLDispatcher)
+    _to_csv_at_offsets = __make_write(CSVDispatcher)
     read_excel = __make_read(PandasExcelParser, ExcelDispatcher)
 
     # experimental methods that don't exist in pandas
@@ -138,48 +139,13 @@ class PandasOnRayIO(RayIO):
     del __make_read  # to not pollute class namespace
     del __make_write  # to not pollute class namespace
 
-    @staticmethod
-    def _to_csv_check_support(kwargs):
-        """
-        Check if parallel version of ``to_csv`` could be used.
-
-        Parameters
-        ----------
-        kwargs : dict
-            Keyword arguments passed to ``.to_csv()``.
-
-        Returns
-        -------
-        bool
-            Whether parallel version of ``to_csv`` is applicable.
-        """
-        path_or_buf = kwargs["path_or_buf"]
-        compression = kwargs["compression"]
-        if not isinstance(path_or_buf, str):
-            return False
-        # case when the pointer is placed at the beginning of the file.
-        if "r" in kwargs["mode"] and "+" in kwargs["mode"]:
-            return False
-        # encodings with BOM don't support;
-        # instead of one mark in result bytes we will have them by the number of partitions
-        # so we should fallback in pandas for `utf-16`, `utf-32` with all aliases, in instance
-        # (`utf_32_be`, `utf_16_le` and so on)
-        if kwargs["encoding"] is not None:
-            encoding = kwargs["encoding"].lower()
-            if "u" in encoding or "utf" in encoding:
-                if "16" in encoding or "32" in encoding:
-                    return False
-        if compression is None or not compression == "infer":
-            return False
-        if any((path_or_buf.endswith(ext) for ext in [".gz", ".bz2", ".zip", ".xz"])):
-            return False
-        return True
-
     @classmethod
     def to_csv(cls, qc, **kwargs):
         """
         Write records stored in the `qc` to a CSV file.
 
+        Local files are written by ``CSVDispatcher.write`` at precomputed offsets.
+
         Parameters
         ----------
         qc : BaseQueryCompiler
@@ -188,9 +154,13 @@ class PandasOnRayIO(RayIO):
             Parameters for ``pandas.to_csv(**kwargs)``.
         """
         kwargs["path_or_buf"] = stringify_path(kwargs["path_or_buf"])
-        if not cls._to_csv_check_support(kwargs):
+        if not CSVDispatcher._to_csv_check_support(kwargs):
             return RayIO.to_csv(qc, **kwargs)
+        if CSVDispatcher._is_local_path(kwargs["path_or_buf"]):
+            return cls._to_csv_at_offsets(qc, **kwargs)
 
+        # remote targets can't be written at arbitrary offsets,
+        # so the chunks are appended to the file one after another
         signals = SignalActor.options(resources=RayTaskCustomResources.get()).remote(
             len(qc._modin_frame._partitions) + 1
         )
@@ -20,6 +20,7 @@ import ray
 
 from modin.config import LazyExecution, RayTaskCustomResources
 from modin.core.dataframe.pandas.partitioning.partition import PandasDataframePartition
+from modin.core.dataframe.pandas.partitioning.spill import PartitionSpillManager
 from modin.core.execution.ray.common import MaterializationHook, RayWrapper
 from modin.core.execution.ray.common.deferred_execution import (
     DeferredExecution,
@@ -93,8 +94,8 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
     @disable_logging
     def __del__(self):
         """Unsubscribe from DeferredExecution."""
-        if isinstance(self._data_ref, DeferredExecution):
-            self._data_ref.unsubscribe()
+        if isinstance(self._data_obj, DeferredExecution):
+            self._data_obj.unsubscribe()
 
     def apply(self, func: Union[Callable, ray.ObjectRef], *args, **kwargs):
         """
@@ -327,6 +328,8 @@ class PandasOnRayDataframePartition(PandasDataframePartition):
     @property
     def _data(self) -> ray.ObjectRef:  # noqa: GL08
         self.drain_call_queue()
+        if self._spill_tracked:
+            PartitionSpillManager.touch(self)
         return self._data_ref
 
     @property
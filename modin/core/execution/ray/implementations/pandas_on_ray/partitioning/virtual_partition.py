@@ -22,6 +22,8 @@ from modin.core.dataframe.pandas.partitioning.axis_partition import (
     PandasDataframeAxisPartition,
 )
 from modin.core.execution.ray.common import RayWrapper
+from modin.core.execution.ray.common.engine_wrapper import _watch_ray_task
+from modin.logging.profiler import profile_deploy
 from modin.utils import _inherit_docstrings
 
 from .partition import PandasOnRayDataframePartition
@@ -99,6 +101,7 @@ class PandasOnRayDataframeVirtualPartition(PandasDataframeAxisPartition):
 
     @classmethod
     @_inherit_docstrings(PandasDataframeAxisPartition.deploy_splitting_func)
+    @profile_deploy(_watch_ray_task)
     def deploy_splitting_func(
         cls,
         axis,
@@ -129,6 +132,7 @@ class PandasOnRayDataframeVirtualPartition(PandasDataframeAxisPartition):
         )
 
     @classmethod
+    @profile_deploy(_watch_ray_task)
     def deploy_axis_func(
         cls,
         axis,
@@ -199,6 +203,7 @@ class PandasOnRayDataframeVirtualPartition(PandasDataframeAxisPartition):
         )
 
     @classmethod
+    @profile_deploy(_watch_ray_task)
     def deploy_func_between_two_axis_partitions(
         cls,
         axis,
@@ -22,6 +22,8 @@ import asyncio
 import pandas
 import unidist
 
+from modin.logging.profiler import profile_materialize, profile_put, profile_wait
+
 
 @unidist.remote
 def _deploy_unidist_func(
@@ -104,6 +106,36 @@ class UnidistWrapper:
         return unidist.is_object_ref(item)
 
     @classmethod
+    def ready(cls, obj_ids):
+        """
+        Check which of the objects are computed already.
+
+        Unidist can't check the objects without waiting for them, so all of them
+        are reported as computed and the caller waits for them when materializing.
+
+        Parameters
+        ----------
+        obj_ids : list
+
+        Returns
+        -------
+        list of bool
+        """
+        return [True] * len(obj_ids)
+
+    @classmethod
+    def num_nodes(cls):
+        """
+        Get the number of nodes of the cluster.
+
+        Returns
+        -------
+        int
+        """
+        return len(unidist.cluster_resources())
+
+    @classmethod
+    @profile_materialize
     def materialize(cls, obj_id):
         """
         Get the value of object from the object store.
@@ -121,6 +153,7 @@ class UnidistWrapper:
         return unidist.get(obj_id)
 
     @classmethod
+    @profile_put
     def put(cls, data, **kwargs):
         """
         Put data into the object store.
@@ -140,6 +173,7 @@ class UnidistWrapper:
         return unidist.put(data)
 
     @classmethod
+    @profile_wait
     def wait(cls, obj_ids, num_returns=None):
         """
         Wait on the objects without materializing them (blocking operation).
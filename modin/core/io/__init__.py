@@ -18,6 +18,7 @@ from .column_stores.hdf_dispatcher import HDFDispatcher
 from .column_stores.parquet_dispatcher import ParquetDispatcher
 from .file_dispatcher import FileDispatcher
 from .io import BaseIO
+from .metadata_cache import FileMetadataCache
 from .sql.sql_dispatcher import SQLDispatcher
 from .text.csv_dispatcher import CSVDispatcher
 from .text.excel_dispatcher import ExcelDispatcher
@@ -31,6 +32,7 @@ __all__ = [
     "FWFDispatcher",
     "JSONDispatcher",
     "FileDispatcher",
+    "FileMetadataCache",
     "TextFileDispatcher",
     "ParquetDispatcher",
     "HDFDispatcher",
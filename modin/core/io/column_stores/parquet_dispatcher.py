@@ -19,19 +19,28 @@ import functools
 import json
 import os
 import re
+import uuid
 from typing import TYPE_CHECKING
+from urllib.parse import quote
 
 import fsspec
 import numpy as np
 import pandas
 import pandas._libs.lib as lib
 from fsspec.core import url_to_fs
+from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractBufferedFile
 from packaging import version
 from pandas.io.common import stringify_path
 
-from modin.config import MinColumnPartitionSize, MinRowPartitionSize, NPartitions
+from modin.config import (
+    MinColumnPartitionSize,
+    MinRowPartitionSize,
+    NPartitions,
+    ParquetWriteSummaryMetadata,
+)
 from modin.core.io.column_stores.column_store_dispatcher import ColumnStoreDispatcher
+from modin.core.io.metadata_cache import FileMetadataCache
 from modin.error_message import ErrorMessage
 from modin.utils import _inherit_docstrings
 
@@ -93,6 +102,67 @@ class ColumnStoreDataset:
     @functools.cached_property
     def row_groups_per_file(self):
         """Return a list with the number of row groups per file."""
+        return [len(self.row_group_metadata(file)) for file in self.files]
+
+    def row_group_metadata(self, file):
+        """
+        Get the row counts and the column statistics of the row groups of a file.
+
+        The metadata of local files is kept in ``FileMetadataCache``, so the footer
+        of a file that has not been changed is only read once. Files listed in the
+        ``_metadata`` summary of the dataset don't have their footers read at all.
+
+        Parameters
+        ----------
+        file : str or file-like object
+            A file of the dataset.
+
+        Returns
+        -------
+        list of dict
+            Number of rows (``"num_rows"``) and a mapping from the column names to their
+            minimum, maximum and null count (``"statistics"``) for each row group.
+        """
+        summary = self.summary_row_group_metadata
+        if summary is not None and file in summary:
+            return summary[file]
+        local_path = None
+        if isinstance(file, str) and isinstance(self.fs, LocalFileSystem):
+            local_path = self.fs._strip_protocol(file)
+        metadata = FileMetadataCache.get("parquet", local_path, self.engine)
+        if metadata is None:
+            with self.fs.open(file) as f:
+                metadata = self._read_row_group_metadata(f)
+            FileMetadataCache.put("parquet", local_path, metadata, self.engine)
+        return metadata
+
+    @functools.cached_property
+    def summary_row_group_metadata(self):
+        """
+        Return the row group metadata of the files listed in the ``_metadata`` summary file.
+
+        Returns
+        -------
+        dict or None
+            Mapping from the formatted file paths to their row group metadata (see
+            ``row_group_metadata``) or None if the dataset has no summary file or
+            the summary doesn't match the files of the dataset.
+        """
+        return None
+
+    def _read_row_group_metadata(self, f):
+        """
+        Read the row counts and the column statistics of the row groups of a file.
+
+        Parameters
+        ----------
+        f : file-like object
+            Opened file of the dataset.
+
+        Returns
+        -------
+        list of dict
+        """
         raise NotImplementedError
 
     @property
@@ -195,18 +265,87 @@ class PyArrowDataset(ColumnStoreDataset):
     def engine(self):
         return "pyarrow"
 
-    @functools.cached_property
-    def row_groups_per_file(self):
+    @staticmethod
+    def _describe_row_group(row_group):
+        """
+        Get the row count and the column statistics of a row group.
+
+        Parameters
+        ----------
+        row_group : pyarrow.parquet.RowGroupMetaData
+
+        Returns
+        -------
+        dict
+        """
+        statistics = {}
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            stats = column.statistics
+            if stats is not None and stats.has_min_max:
+                statistics[column.path_in_schema] = (
+                    stats.min,
+                    stats.max,
+                    stats.null_count if stats.has_null_count else None,
+                )
+        return {"num_rows": row_group.num_rows, "statistics": statistics}
+
+    def _read_row_group_metadata(self, f):
         from pyarrow.parquet import ParquetFile
 
-        row_groups_per_file = []
-        # Count up the total number of row groups across all files and
-        # keep track of row groups per file to use later.
-        for file in self.files:
-            with self.fs.open(file) as f:
-                row_groups = ParquetFile(f).num_row_groups
-                row_groups_per_file.append(row_groups)
-        return row_groups_per_file
+        file_metadata = ParquetFile(f).metadata
+        return [
+            self._describe_row_group(file_metadata.row_group(i))
+            for i in range(file_metadata.num_row_groups)
+        ]
+
+    @functools.cached_property
+    def summary_row_group_metadata(self):
+        from pyarrow.parquet import read_metadata
+
+        if not isinstance(self.fs_path, str):
+            return None
+        root = self.fs_path.rstrip("/")
+        summary_path = f"{root}/_metadata"
+        if not self.fs.isfile(summary_path):
+            return None
+        summary_mtime = self.fs.info(summary_path).get("mtime")
+        with self.fs.open(summary_path) as f:
+            file_metadata = read_metadata(f)
+        row_groups = {}
+        # the end of the last column chunk of each file
+        data_ends = {}
+        for i in range(file_metadata.num_row_groups):
+            row_group = file_metadata.row_group(i)
+            if row_group.num_columns == 0:
+                return None
+            path = row_group.column(0).file_path
+            row_groups.setdefault(path, []).append(self._describe_row_group(row_group))
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                start = (
+                    column.dictionary_page_offset
+                    if column.has_dictionary_page
+                    else column.data_page_offset
+                )
+                data_ends[path] = max(
+                    data_ends.get(path, 0), start + column.total_compressed_size
+                )
+        files = self._get_files([f"{root}/{path}" for path in row_groups])
+        # the summary may be left by another writer or describe files rewritten since,
+        # it is only trusted if it lists the files of the dataset and none of them has
+        # been truncated or modified after it
+        if sorted(files) != sorted(self.files):
+            return None
+        for path in row_groups:
+            info = self.fs.info(f"{root}/{path}")
+            if info["size"] < data_ends[path] or (
+                summary_mtime is not None
+                and info.get("mtime") is not None
+                and info["mtime"] > summary_mtime
+            ):
+                return None
+        return dict(zip(files, row_groups.values()))
 
     @functools.cached_property
     def files(self):
@@ -245,18 +384,27 @@ class FastParquetDataset(ColumnStoreDataset):
     def engine(self):
         return "fastparquet"
 
-    @functools.cached_property
-    def row_groups_per_file(self):
+    def _read_row_group_metadata(self, f):
         from fastparquet import ParquetFile
 
-        row_groups_per_file = []
-        # Count up the total number of row groups across all files and
-        # keep track of row groups per file to use later.
-        for file in self.files:
-            with self.fs.open(file) as f:
-                row_groups = ParquetFile(f).info["row_groups"]
-                row_groups_per_file.append(row_groups)
-        return row_groups_per_file
+        parquet_file = ParquetFile(f)
+        stats = parquet_file.statistics
+        min_values, max_values = stats.get("min", {}), stats.get("max", {})
+        null_counts = stats.get("null_count", {})
+        row_groups = []
+        for i, row_group in enumerate(parquet_file.row_groups):
+            statistics = {}
+            for column in min_values:
+                min_value, max_value = min_values[column][i], max_values[column][i]
+                if min_value is not None and max_value is not None:
+                    null_count = (
+                        null_counts[column][i] if column in null_counts else None
+                    )
+                    statistics[column] = (min_value, max_value, null_count)
+            row_groups.append(
+                {"num_rows": row_group.num_rows, "statistics": statistics}
+            )
+        return row_groups
 
     @functools.cached_property
     def files(self):
@@ -346,9 +494,86 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         else:
             raise ValueError("engine must be one of 'pyarrow', 'fastparquet'")
 
+    @staticmethod
+    def _predicate_may_match(statistics, column, op, value) -> bool:
+        """
+        Check whether a row group may contain rows satisfying a filter predicate.
+
+        Parameters
+        ----------
+        statistics : dict
+            Minimum, maximum and null count of the columns of the row group.
+        column : str
+            Column of the predicate.
+        op : str
+            Comparison operator of the predicate.
+        value : object
+            Value to compare with.
+
+        Returns
+        -------
+        bool
+            False if the statistics prove that no row satisfies the predicate.
+        """
+        if column not in statistics:
+            return True
+        min_value, max_value, null_count = statistics[column]
+        try:
+            if op in ("=", "=="):
+                return bool(min_value <= value <= max_value)
+            if op == "!=":
+                return not bool(min_value == max_value == value)
+            if op == "<":
+                return bool(min_value < value)
+            if op == "<=":
+                return bool(min_value <= value)
+            if op == ">":
+                return bool(max_value > value)
+            if op == ">=":
+                return bool(max_value >= value)
+            if op == "in":
+                return any(bool(min_value <= v <= max_value) for v in value)
+            if op == "not in":
+                # null values are not in any list
+                return null_count != 0 or not (
+                    bool(min_value == max_value) and any(v == min_value for v in value)
+                )
+        except (TypeError, ValueError):
+            # the statistics are not comparable with the value (e.g. because of
+            # a different type), so nothing can be proven
+            pass
+        return True
+
+    @classmethod
+    def _row_group_may_match(cls, statistics, filters) -> bool:
+        """
+        Check whether a row group may contain rows satisfying the filters.
+
+        Parameters
+        ----------
+        statistics : dict
+            Minimum, maximum and null count of the columns of the row group.
+        filters : list
+            Filters in disjunctive normal form, as accepted by ``read_parquet``.
+
+        Returns
+        -------
+        bool
+            False if the statistics prove that no row satisfies the filters.
+        """
+        if not isinstance(filters[0][0], (list, tuple)):
+            filters = [filters]
+        return any(
+            all(
+                cls._predicate_may_match(statistics, *predicate)
+                for predicate in conjunction
+            )
+            for conjunction in filters
+        )
+
     @classmethod
     def _determine_partitioning(
-        cls, dataset: ColumnStoreDataset
+        cls, dataset: ColumnStoreDataset, filters=None
     ) -> "list[list[ParquetFileToRead]]":
         """
         Determine which partition will read certain files/row groups of the dataset.
@@ -356,6 +581,9 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         Parameters
         ----------
         dataset : ColumnStoreDataset
+        filters : list, optional
+            Filters to be used in reading the dataset. The row groups whose
+            statistics prove that they have no matching rows are not read.
 
         Returns
         -------
@@ -366,7 +594,26 @@ class ParquetDispatcher(ColumnStoreDispatcher):
 
         parquet_files = dataset.files
         row_groups_per_file = dataset.row_groups_per_file
-        num_row_groups = sum(row_groups_per_file)
+        # (file index, row group index) of every row group to read
+        row_groups = [
+            (file_idx, row_group_idx)
+            for file_idx, num_row_groups in enumerate(row_groups_per_file)
+            for row_group_idx in range(num_row_groups)
+        ]
+        if filters and isinstance(filters, list) and len(row_groups) > 0:
+            # get the metadata of each file once rather than for each of its row groups
+            file_metadata = [dataset.row_group_metadata(file) for file in parquet_files]
+            pruned_row_groups = [
+                (file_idx, row_group_idx)
+                for file_idx, row_group_idx in row_groups
+                if cls._row_group_may_match(
+                    file_metadata[file_idx][row_group_idx]["statistics"], filters
+                )
+            ]
+            # keep a single row group if none matches, so that the workers still
+            # build an empty frame with the right schema
+            row_groups = pruned_row_groups or row_groups[:1]
+        num_row_groups = len(row_groups)
 
         if num_row_groups == 0:
             return []
@@ -381,33 +628,32 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         part_sizes = [part_size] * (num_splits - reminder) + [part_size + 1] * reminder
 
         partition_files = []
-        file_idx = 0
-        row_group_idx = 0
-        row_groups_left_in_current_file = row_groups_per_file[file_idx]
+        start = 0
         # this is used for sanity check at the end, verifying that we indeed added all of the row groups
         total_row_groups_added = 0
         for size in part_sizes:
-            row_groups_taken = 0
             part_files = []
-            while row_groups_taken != size:
-                if row_groups_left_in_current_file < 1:
-                    file_idx += 1
-                    row_group_idx = 0
-                    row_groups_left_in_current_file = row_groups_per_file[file_idx]
-
-                to_take = min(size - row_groups_taken, row_groups_left_in_current_file)
-                part_files.append(
-                    ParquetFileToRead(
-                        parquet_files[file_idx],
-                        row_group_start=row_group_idx,
-                        row_group_end=row_group_idx + to_take,
+            prev_file_idx = None
+            for file_idx, row_group_idx in row_groups[start : start + size]:
+                # consecutive row groups of a file are read together
+                if (
+                    file_idx == prev_file_idx
+                    and part_files[-1].row_group_end == row_group_idx
+                ):
+                    part_files[-1] = part_files[-1]._replace(
+                        row_group_end=row_group_idx + 1
                     )
-                )
-                row_groups_left_in_current_file -= to_take
-                row_groups_taken += to_take
-                row_group_idx += to_take
-
-            total_row_groups_added += row_groups_taken
+                else:
+                    part_files.append(
+                        ParquetFileToRead(
+                            parquet_files[file_idx],
+                            row_group_start=row_group_idx,
+                            row_group_end=row_group_idx + 1,
+                        )
+                    )
+                prev_file_idx = file_idx
+                total_row_groups_added += 1
+            start += size
             partition_files.append(part_files)
 
         sanity_check = (
@@ -759,7 +1005,7 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         storage_options = kwargs.pop("storage_options", {}) or {}
         filters = kwargs.get("filters", None)
 
-        partition_files = cls._determine_partitioning(dataset)
+        partition_files = cls._determine_partitioning(dataset, filters)
         col_partitions, column_widths = cls.build_columns(
             columns,
             num_row_parts=len(partition_files),
@@ -908,6 +1154,173 @@ class ParquetDispatcher(ColumnStoreDispatcher):
             dataset, columns, index_columns, dtype_backend=dtype_backend, **kwargs
         )
 
+    @staticmethod
+    def _is_pyarrow_engine(engine):
+        """
+        Check if `engine` resolves to PyArrow the same way as in ``pandas.to_parquet``.
+
+        Parameters
+        ----------
+        engine : {"auto", "pyarrow", "fastparquet"}
+            Parquet library to use.
+
+        Returns
+        -------
+        bool
+        """
+        if engine == "auto":
+            engine = pandas.get_option("io.parquet.engine")
+        if engine == "auto":
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError:
+                return False
+            return True
+        return engine == "pyarrow"
+
+    @staticmethod
+    def _write_summary_metadata(fs, url, file_metadata):
+        """
+        Write the ``_common_metadata`` and ``_metadata`` summary files of a dataset.
+
+        Summary files of a previous write are removed, so they never describe stale files.
+        If the files of the dataset have different schemas, no summary is written.
+
+        Parameters
+        ----------
+        fs : fsspec.AbstractFileSystem
+            Filesystem of the dataset.
+        url : str
+            Root directory of the dataset.
+        file_metadata : list of pyarrow.parquet.FileMetaData
+            Footers of the written files with their paths relative to `url`,
+            empty if the files were written by another engine.
+        """
+        for name in ("_common_metadata", "_metadata"):
+            if fs.exists(f"{url}/{name}"):
+                fs.rm(f"{url}/{name}")
+        if len(file_metadata) == 0:
+            return
+
+        from pyarrow.parquet import write_metadata
+
+        schema = file_metadata[0].schema.to_arrow_schema()
+        summary = file_metadata[0]
+        try:
+            for metadata in file_metadata[1:]:
+                summary.append_row_groups(metadata)
+        except RuntimeError:
+            # the schemas of the files differ, for example, if a column of some
+            # chunk consists of nulls only
+            return
+        with fs.open(f"{url}/_common_metadata", "wb") as f:
+            write_metadata(schema, f)
+        with fs.open(f"{url}/_metadata", "wb") as f:
+            summary.write_metadata_file(f)
+
+    @classmethod
+    def _write_partitioned(cls, qc, fs, url, **kwargs):
+        """
+        Write a ``DataFrame`` as a hive-partitioned parquet dataset.
+
+        The rows are hash-partitioned by the values of `partition_cols`, so all
+        rows of a key are written by a single task into at most
+        ``ceil(rows / max_rows_per_file)`` files of its ``col=value`` directory.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run `to_parquet` on.
+        fs : fsspec.AbstractFileSystem
+            Filesystem of the dataset.
+        url : str
+            Root directory of the dataset.
+        **kwargs : dict
+            Parameters for `pandas.to_parquet(**kwargs)`.
+
+        Returns
+        -------
+        list of pyarrow.parquet.FileMetaData
+            Footers of the written files with their paths relative to `url`.
+        """
+        from modin.core.dataframe.pandas.dataframe.utils import ShuffleHashFunctions
+
+        partition_cols = kwargs.pop("partition_cols")
+        if isinstance(partition_cols, str):
+            partition_cols = [partition_cols]
+        partition_cols = list(partition_cols)
+        max_rows_per_file = kwargs.pop("max_rows_per_file", None)
+        max_rows_per_group = kwargs.pop("max_rows_per_group", None)
+        kwargs.pop("min_rows_per_group", None)
+        if max_rows_per_group is not None:
+            kwargs.setdefault("row_group_size", max_rows_per_group)
+        output_path = kwargs.pop("path")
+        # a default index is dropped like in ``pandas.to_parquet`` with ``index=None``,
+        # the row positions within the partitions don't match the original ones anyway
+        drop_index = kwargs["index"] is None and isinstance(
+            qc._modin_frame.index, pandas.RangeIndex
+        )
+
+        def format_value(value):  # pragma: no cover
+            if pandas.isna(value):
+                return "__HIVE_DEFAULT_PARTITION__"
+            if isinstance(value, (bool, np.bool_)):
+                # pyarrow spells the booleans in lower case
+                return str(value).lower()
+            return quote(str(value), safe="")
+
+        def func(df):  # pragma: no cover
+            """
+            Write the rows of every key of `partition_cols` to its directory.
+
+            Parameters
+            ----------
+            df : pandas.DataFrame
+                A range of rows holding all the rows of its keys.
+
+            Returns
+            -------
+            pandas.DataFrame
+                Footers of the written files.
+            """
+            file_metadata = []
+            for key, group in df.groupby(
+                partition_cols, sort=False, dropna=False, observed=True
+            ):
+                if not isinstance(key, tuple):
+                    key = (key,)
+                directory = "/".join(
+                    f"{col}={format_value(value)}"
+                    for col, value in zip(partition_cols, key)
+                )
+                fs.mkdirs(f"{url}/{directory}", exist_ok=True)
+                group = group.drop(columns=partition_cols)
+                if drop_index:
+                    group = group.reset_index(drop=True)
+                rows_per_file = max_rows_per_file or len(group)
+                for start in range(0, len(group), rows_per_file):
+                    file_path = f"{directory}/part-{uuid.uuid4().hex}.parquet"
+                    metadata_collector = []
+                    group.iloc[start : start + rows_per_file].to_parquet(
+                        f"{output_path}/{file_path}",
+                        metadata_collector=metadata_collector,
+                        **kwargs,
+                    )
+                    metadata_collector[0].set_file_path(file_path)
+                    file_metadata.append(metadata_collector[0])
+            return pandas.DataFrame({"metadata": file_metadata}, dtype=object)
+
+        # Ensure that the metadata is synchronized
+        qc._modin_frame._propagate_index_objs(axis=None)
+        # hashing needs neither samples nor pivots, which small frames and
+        # keys that can't be interpolated, like booleans, fail to provide
+        result = qc._modin_frame._apply_func_to_range_partitioning(
+            key_columns=partition_cols,
+            func=func,
+            shuffle_func_cls=ShuffleHashFunctions,
+        )
+        return list(result.to_pandas()["metadata"])
+
     @classmethod
     def write(cls, qc, **kwargs):
         """
@@ -924,9 +1337,20 @@ class ParquetDispatcher(ColumnStoreDispatcher):
         output_path = kwargs["path"]
         if not isinstance(output_path, str):
             return cls.base_io.to_parquet(qc, **kwargs)
+        is_pyarrow = cls._is_pyarrow_engine(kwargs["engine"])
+        if kwargs.get("partition_cols") and (
+            not is_pyarrow or len(qc._modin_frame.index) == 0
+        ):
+            return cls.base_io.to_parquet(qc, **kwargs)
+        collect_metadata = is_pyarrow and ParquetWriteSummaryMetadata.get()
         client_kwargs = (kwargs.get("storage_options") or {}).get("client_kwargs", {})
         fs, url = fsspec.core.url_to_fs(output_path, client_kwargs=client_kwargs)
         fs.mkdirs(url, exist_ok=True)
+        if kwargs.get("partition_cols"):
+            cls._write_summary_metadata(
+                fs, url, cls._write_partitioned(qc, fs, url, **kwargs)
+            )
+            return
 
         def func(df, **kw):  # pragma: no cover
             """
@@ -942,21 +1366,31 @@ class ParquetDispatcher(ColumnStoreDispatcher):
             """
             compression = kwargs["compression"]
             partition_idx = kw["partition_idx"]
-            kwargs["path"] = (
-                f"{output_path}/part-{partition_idx:04d}.{compression}.parquet"
-            )
-            df.to_parquet(**kwargs)
-            return pandas.DataFrame()
+            file_path = f"part-{partition_idx:04d}.{compression}.parquet"
+            kwargs["path"] = f"{output_path}/{file_path}"
+            if not collect_metadata:
+                df.to_parquet(**kwargs)
+                return pandas.DataFrame({"metadata": []}, dtype=object)
+            metadata_collector = []
+            df.to_parquet(metadata_collector=metadata_collector, **kwargs)
+            metadata_collector[0].set_file_path(file_path)
+            return pandas.DataFrame({"metadata": metadata_collector}, dtype=object)
 
         # Ensure that the metadata is synchronized
         qc._modin_frame._propagate_index_objs(axis=None)
-        result = qc._modin_frame._partition_mgr_cls.map_axis_partitions(
+        partition_mgr_cls = qc._modin_frame._partition_mgr_cls
+        result = partition_mgr_cls.map_axis_partitions(
             axis=1,
             partitions=qc._modin_frame._partitions,
             map_func=func,
-            keep_partitioning=True,
+            keep_partitioning=False,
+            num_splits=1,
             lengths=None,
             enumerate_partitions=True,
         )
-        # pending completion
-        cls.materialize([part.list_of_blocks[0] for row in result for part in row])
+        file_metadata = [
+            metadata
+            for df in partition_mgr_cls.get_objects_from_partitions(result[:, 0])
+            for metadata in df["metadata"]
+        ]
+        cls._write_summary_metadata(fs, url, file_metadata)
@@ -520,8 +520,9 @@ class BaseIO:
         dtype=None,
     ):  # noqa: PR01
         ErrorMessage.default_to_pandas("`read_sql`")
+        pooled_connection = None
         if isinstance(con, ModinDatabaseConnection):
-            con = con.get_connection()
+            con = pooled_connection = con.get_connection()
         result = pandas.read_sql(
             sql,
             con,
@@ -536,6 +537,9 @@ class BaseIO:
         )
 
         if isinstance(result, (pandas.DataFrame, pandas.Series)):
+            if pooled_connection is not None:
+                # the chunks of an iterator are still to be fetched with the connection
+                pooled_connection.close()
             return cls.from_pandas(result)
         return (cls.from_pandas(df) for df in result)
 
@@ -678,7 +682,7 @@ class BaseIO:
         """
         ErrorMessage.default_to_pandas("`to_sql`")
         df = qc.to_pandas()
-        df.to_sql(
+        return df.to_sql(
             name=name,
             con=con,
             schema=schema,
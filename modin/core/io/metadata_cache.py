@@ -0,0 +1,289 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses `FileMetadataCache` class.
+
+`FileMetadataCache` is an on-disk cache of the metadata that the readers compute by
+scanning the source files, so that reading the same files again skips the scans.
+"""
+
+import enum
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Optional
+
+from modin.config import MetadataCacheDir, MetadataCacheSize
+from modin.logging import ClassLogger
+from modin.logging.config import LogLevel
+
+_ENTRY_SUFFIX = ".pkl"
+# Parameters of these types have a stable ``repr`` that can be used as a part of the key.
+_PLAIN_TYPES = (type(None), bool, int, float, complex, str, bytes, type, enum.Enum)
+
+
+def _is_plain(value) -> bool:
+    """
+    Check whether `value` is built of the types with a stable ``repr`` only.
+
+    Parameters
+    ----------
+    value : object
+        Value to check.
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_plain(k) and _is_plain(v) for k, v in value.items())
+    return False
+
+
+class FileMetadataCache(ClassLogger, modin_layer="CORE-IO", log_level=LogLevel.DEBUG):
+    """
+    On-disk LRU cache of the metadata of local files.
+
+    An entry is addressed by the kind of the metadata, the absolute path of the file
+    and the parameters the metadata was computed with, and it remembers the size and
+    the modification time of the file. An entry of a file that has been changed since
+    is dropped on lookup. When the entries take more than ``MetadataCacheSize`` MBs,
+    the least recently used ones are evicted.
+
+    The cache is enabled by setting ``MetadataCacheDir``.
+    """
+
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Check whether the cache is enabled.
+
+        Returns
+        -------
+        bool
+        """
+        return MetadataCacheDir.get() is not None
+
+    @classmethod
+    def _fingerprint(cls, path) -> Optional[tuple]:
+        """
+        Get the absolute path, the size and the modification time of a local file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file.
+
+        Returns
+        -------
+        tuple or None
+            None if `path` is not a path to a local file.
+        """
+        if not isinstance(path, str) or "://" in path:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def _entry_path(cls, kind: str, path: str, params) -> str:
+        """
+        Get the path to the file storing an entry.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the metadata.
+        path : str
+            Absolute path to the source file.
+        params : object
+            Parameters the metadata depends on.
+
+        Returns
+        -------
+        str
+        """
+        digest = hashlib.sha256(repr((kind, path, params)).encode()).hexdigest()
+        return os.path.join(MetadataCacheDir.get(), digest + _ENTRY_SUFFIX)
+
+    @classmethod
+    def get(cls, kind: str, path, params=None) -> Optional[Any]:
+        """
+        Look up the metadata of a file.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the metadata.
+        path : str
+            Path to the file.
+        params : object, optional
+            Parameters the metadata depends on.
+
+        Returns
+        -------
+        object or None
+            Cached metadata, or None if there is no valid entry or the cache is disabled.
+        """
+        if not cls.is_enabled() or not _is_plain(params):
+            return None
+        fingerprint = cls._fingerprint(path)
+        if fingerprint is None:
+            return None
+        entry_path = cls._entry_path(kind, fingerprint[0], params)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            cls.misses += 1
+            return None
+        if entry["fingerprint"] != fingerprint:
+            # the file has been changed since the entry was stored
+            cls._remove(entry_path)
+            cls.misses += 1
+            return None
+        try:
+            # the modification time of the entry orders the entries for eviction
+            os.utime(entry_path)
+        except OSError:
+            pass
+        cls.hits += 1
+        return entry["value"]
+
+    @classmethod
+    def put(cls, kind: str, path, value, params=None) -> None:
+        """
+        Store the metadata of a file.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of the metadata.
+        path : str
+            Path to the file.
+        value : object
+            Metadata to store, has to be picklable.
+        params : object, optional
+            Parameters the metadata depends on.
+        """
+        if not cls.is_enabled() or not _is_plain(params):
+            return
+        fingerprint = cls._fingerprint(path)
+        if fingerprint is None:
+            return
+        cache_dir = MetadataCacheDir.get()
+        os.makedirs(cache_dir, exist_ok=True)
+        entry_path = cls._entry_path(kind, fingerprint[0], params)
+        # write to a temporary file first so that concurrent readers never
+        # see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"fingerprint": fingerprint, "value": value}, f)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            cls._remove(tmp_path)
+            raise
+        cls._evict()
+
+    @classmethod
+    def _entries(cls) -> list:
+        """
+        List the stored entries.
+
+        Returns
+        -------
+        list of (int, int, str)
+            Modification time, size and path of every entry.
+        """
+        cache_dir = MetadataCacheDir.get()
+        entries = []
+        try:
+            with os.scandir(cache_dir) as it:
+                for item in it:
+                    if not item.name.endswith(_ENTRY_SUFFIX):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+        except OSError:
+            pass
+        return entries
+
+    @classmethod
+    def _evict(cls) -> None:
+        """Remove the least recently used entries until the cache fits its size limit."""
+        budget = MetadataCacheSize.get() * 1024 * 1024
+        entries = sorted(cls._entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in entries:
+            if total_size <= budget:
+                break
+            cls._remove(entry_path)
+            total_size -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """
+        Remove a file ignoring the errors.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            Numbers of hits and misses of the current process, number of entries
+            and their total size in bytes.
+        """
+        entries = cls._entries() if cls.is_enabled() else []
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove all the entries and reset the counters."""
+        if cls.is_enabled():
+            for _, _, entry_path in cls._entries():
+                cls._remove(entry_path)
+        cls.hits = 0
+        cls.misses = 0
@@ -19,19 +19,49 @@ inherits util functions for handling files from `FileDispatcher` class and can b
 used as base class for dipatchers of SQL queries.
 """
 
+import io
 import math
+import re
+import time
+import uuid
 
 import numpy as np
 import pandas
 
-from modin.config import NPartitions, ReadSqlEngine
+from modin.config import (
+    NPartitions,
+    ReadSqlEngine,
+    SqlWriteBatchSize,
+    SqlWriteStagingTable,
+)
 from modin.core.io.file_dispatcher import FileDispatcher
 from modin.db_conn import ModinDatabaseConnection
+from modin.logging import get_logger
 
 
 class SQLDispatcher(FileDispatcher):
     """Class handles utils for reading SQL queries or database tables."""
 
+    # queries that give all the columns of a single table, so its primary key is available
+    _table_query_regex = re.compile(
+        r"\s*SELECT\s+\*\s+FROM\s+([A-Za-z_][\w.]*)(?:\s+WHERE\s(.*))?\s*",
+        flags=re.IGNORECASE | re.DOTALL,
+    )
+    # clauses after ``WHERE`` that order, limit, group or combine the rows, so the
+    # result of the query isn't the union of its key ranges read in the key order
+    _trailing_clause_regex = re.compile(
+        r"\b(?:ORDER\s+BY|LIMIT|OFFSET|FETCH|GROUP\s+BY|HAVING|WINDOW|UNION"
+        r"|INTERSECT|EXCEPT|FOR)\b",
+        flags=re.IGNORECASE,
+    )
+    # string literals, quoted identifiers and comments, whose contents aren't clauses
+    _quoted_regex = re.compile(
+        r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|\[[^\]]*\]|--[^\n]*|/\*.*?\*/",
+        flags=re.DOTALL,
+    )
+    # innermost parenthesized groups, e.g. subqueries
+    _parenthesized_regex = re.compile(r"\([^()]*\)")
+
     @classmethod
     def _is_supported_sqlalchemy_object(cls, obj):  # noqa: GL08
         supported = None
@@ -44,7 +74,94 @@ class SQLDispatcher(FileDispatcher):
         return supported
 
     @classmethod
-    def _read(cls, sql, con, index_col=None, **kwargs):
+    def _has_trailing_clause(cls, condition):
+        """
+        Check whether a ``WHERE`` clause is followed by clauses changing its rows.
+
+        Parameters
+        ----------
+        condition : str or None
+            Text of the query after ``WHERE``.
+
+        Returns
+        -------
+        bool
+        """
+        if condition is None:
+            return False
+        condition = cls._quoted_regex.sub(" ", condition)
+        # only the clauses outside of parentheses apply to the whole query
+        while True:
+            unwrapped = cls._parenthesized_regex.sub(" ", condition)
+            if unwrapped == condition:
+                break
+            condition = unwrapped
+        return cls._trailing_clause_regex.search(condition) is not None
+
+    @classmethod
+    def _get_key_range_queries(
+        cls, sql, con, connection, partition_column, num_partitions, params
+    ):
+        """
+        Get queries reading `sql` by ranges of an ordered key.
+
+        The key is `partition_column` if passed, otherwise the single-column primary key
+        of the table that `sql` selects from. Range bounds are the quantiles of the key
+        fetched with one query, so the database doesn't scan and skip the leading rows
+        of every partition as it does for ``LIMIT/OFFSET``.
+
+        Parameters
+        ----------
+        sql : str
+            SQL query to be executed.
+        con : ModinDatabaseConnection
+            Connection to the database.
+        connection : Any
+            Open database connection to fetch the bounds with.
+        partition_column : str or None
+            Column to partition `sql` by.
+        num_partitions : int
+            The maximum number of partitions.
+        params : list, tuple or dict, optional
+            Parameters of `sql`.
+
+        Returns
+        -------
+        list of str or None
+            Queries of the partitions, or None if `sql` has no usable key.
+        """
+        if partition_column is None:
+            if not isinstance(sql, str):
+                return None
+            match = cls._table_query_regex.fullmatch(sql)
+            if match is None or cls._has_trailing_clause(match.group(2)):
+                return None
+            try:
+                partition_column = con.primary_key_column(match.group(1), connection)
+            except Exception:
+                # some databases or drivers can't be inspected for constraints
+                connection.rollback()
+                return None
+            if partition_column is None:
+                return None
+        try:
+            bounds = pandas.read_sql(
+                con.key_bounds_query(sql, partition_column, num_partitions),
+                connection,
+                params=params,
+            ).squeeze(axis=1)
+        except Exception:
+            # e.g. the database has no window functions, ``LIMIT/OFFSET`` still works
+            connection.rollback()
+            return None
+        # duplicated keys could make adjacent ranges start at the same value;
+        # lower bound of the first range is not needed since it also takes null keys
+        return con.key_range_queries(
+            sql, partition_column, bounds.drop_duplicates().iloc[1:].tolist()
+        )
+
+    @classmethod
+    def _read(cls, sql, con, index_col=None, partition_column=None, **kwargs):
         """
         Read a SQL query or database table into a query compiler.
 
@@ -56,6 +173,9 @@ class SQLDispatcher(FileDispatcher):
             Connection object to database.
         index_col : str or list of str, optional
             Column(s) to set as index(MultiIndex).
+        partition_column : str, optional
+            Column to split the query into ranges by. The primary key of the table
+            is used if not passed and the query selects all columns of one table.
         **kwargs : dict
             Parameters to pass into `pandas.read_sql` function.
 
@@ -63,6 +183,10 @@ class SQLDispatcher(FileDispatcher):
         -------
         BaseQueryCompiler
             Query compiler with imported data for further processing.
+
+        Notes
+        -----
+        Without a key to split the query by, partitions are read with ``LIMIT/OFFSET``.
         """
         if isinstance(con, str):
             con = ModinDatabaseConnection("sqlalchemy", con)
@@ -85,22 +209,39 @@ class SQLDispatcher(FileDispatcher):
                 + "https://modin.readthedocs.io/en/latest/supported_apis/io_supported.html#connecting-to-a-database-for-read-sql",
                 **kwargs,
             )
-        row_count_query = con.row_count_query(sql)
-        connection_for_pandas = con.get_connection()
-        colum_names_query = con.column_names_query(sql)
-        row_cnt = pandas.read_sql(row_count_query, connection_for_pandas).squeeze()
-        cols_names_df = pandas.read_sql(
-            colum_names_query, connection_for_pandas, index_col=index_col
-        )
-        cols_names = cols_names_df.columns
         num_partitions = NPartitions.get()
-        partition_ids = [None] * num_partitions
-        index_ids = [None] * num_partitions
-        dtypes_ids = [None] * num_partitions
-        limit = math.ceil(row_cnt / num_partitions)
-        for part in range(num_partitions):
-            offset = part * limit
-            query = con.partition_query(sql, limit, offset)
+        connection_for_pandas = con.get_connection()
+        try:
+            colum_names_query = con.column_names_query(sql)
+            cols_names_df = pandas.read_sql(
+                colum_names_query, connection_for_pandas, index_col=index_col
+            )
+            cols_names = cols_names_df.columns
+            queries = cls._get_key_range_queries(
+                sql,
+                con,
+                connection_for_pandas,
+                partition_column,
+                num_partitions,
+                kwargs.get("params"),
+            )
+            if queries is None:
+                row_count_query = con.row_count_query(sql)
+                row_cnt = pandas.read_sql(
+                    row_count_query, connection_for_pandas
+                ).squeeze()
+                limit = math.ceil(row_cnt / num_partitions)
+                queries = [
+                    con.partition_query(sql, limit, part * limit)
+                    for part in range(num_partitions)
+                ]
+        finally:
+            # the connection goes back to the pool before the partitions take theirs
+            connection_for_pandas.close()
+        partition_ids = [None] * len(queries)
+        index_ids = [None] * len(queries)
+        dtypes_ids = [None] * len(queries)
+        for part, query in enumerate(queries):
             *partition_ids[part], index_ids[part], dtypes_ids[part] = cls.deploy(
                 func=cls.parse,
                 f_kwargs={
@@ -128,6 +269,49 @@ class SQLDispatcher(FileDispatcher):
         new_frame.synchronize_labels(axis=0)
         return cls.query_compiler_cls(new_frame)
 
+    @classmethod
+    def _swap_staging_table(cls, connection, staging, name, schema, if_exists, columns):
+        """
+        Move the rows of the `staging` table to the `name` table and drop `staging`.
+
+        Parameters
+        ----------
+        connection : sqlalchemy.engine.Connection
+            Connection in a transaction to run the statements with.
+        staging : str
+            Name of the staging table.
+        name : str
+            Name of the target table.
+        schema : str or None
+            Schema of both tables.
+        if_exists : {"fail", "replace", "append"}
+            How the rows of an existing target table are handled.
+        columns : list of str
+            Columns of the staging table.
+        """
+        import sqlalchemy as sa
+
+        quote = connection.dialect.identifier_preparer.quote
+        prefix = f"{quote(schema)}." if schema is not None else ""
+        target_exists = sa.inspect(connection).has_table(name, schema=schema)
+        if target_exists and if_exists == "append":
+            # the columns of an existing table may be in a different order
+            columns = ", ".join(quote(str(column)) for column in columns)
+            connection.exec_driver_sql(
+                f"INSERT INTO {prefix}{quote(name)} ({columns})"
+                + f" SELECT {columns} FROM {prefix}{quote(staging)}"
+            )
+            connection.exec_driver_sql(f"DROP TABLE {prefix}{quote(staging)}")
+            return
+        if target_exists:
+            connection.exec_driver_sql(f"DROP TABLE {prefix}{quote(name)}")
+        if connection.dialect.name == "mssql":
+            connection.exec_driver_sql(f"EXEC sp_rename '{prefix}{staging}', '{name}'")
+        else:
+            connection.exec_driver_sql(
+                f"ALTER TABLE {prefix}{quote(staging)} RENAME TO {quote(name)}"
+            )
+
     @classmethod
     def write(cls, qc, **kwargs):
         """
@@ -139,15 +323,26 @@ class SQLDispatcher(FileDispatcher):
             The query compiler of the Modin dataframe that we want to run ``to_sql`` on.
         **kwargs : dict
             Parameters for ``pandas.to_sql(**kwargs)``.
+
+        Returns
+        -------
+        int
+            Number of written rows.
+
+        Notes
+        -----
+        Without the ``method`` parameter, the rows are loaded with ``COPY FROM STDIN`` for
+        PostgreSQL with psycopg2 and with batched ``INSERT`` statements otherwise. Rows
+        count and throughput of every partition are logged with the Modin logger.
         """
         # we first insert an empty DF in order to create the full table in the database
         # This also helps to validate the input against pandas
         # we would like to_sql() to complete only when all rows have been inserted into the database
-        # since the mapping operation is non-blocking, each partition will return an empty DF
-        # so at the end, the blocking operation will be this empty DF to_pandas
+        # since the mapping operation is non-blocking, each partition will return
+        # the statistics of its load, so at the end, the blocking operation is gathering them
 
         if not isinstance(
-            kwargs["con"], str
+            kwargs["con"], (str, ModinDatabaseConnection)
         ) and not cls._is_supported_sqlalchemy_object(kwargs["con"]):
             return cls.base_io.to_sql(qc, **kwargs)
 
@@ -159,8 +354,40 @@ class SQLDispatcher(FileDispatcher):
                 hide_password=False
             )
 
+        # the workers take connections from their pools instead of connecting
+        # to the database for every partition
+        con = kwargs.pop("con")
+        if isinstance(con, str):
+            con = ModinDatabaseConnection("sqlalchemy", con)
+        # pandas needs SQLAlchemy connections, which are also made for psycopg2 connections
+        engine = con._get_engine()
+        connect = engine.connect
+
+        if kwargs["chunksize"] is None:
+            kwargs["chunksize"] = SqlWriteBatchSize.get()
+        if (
+            kwargs["method"] is None
+            and engine.dialect.name == "postgresql"
+            and engine.dialect.driver == "psycopg2"
+        ):
+            kwargs["method"] = _copy_from_stdin
+
+        name, if_exists = kwargs["name"], kwargs["if_exists"]
+        staging = None
+        if SqlWriteStagingTable.get():
+            import sqlalchemy as sa
+
+            with connect() as connection:
+                if if_exists == "fail" and sa.inspect(connection).has_table(
+                    name, schema=kwargs["schema"]
+                ):
+                    raise ValueError(f"Table '{name}' already exists.")
+            staging = f"{name}_modin_staging_{uuid.uuid4().hex[:8]}"
+            kwargs["name"], kwargs["if_exists"] = staging, "fail"
+
         empty_df = qc.getitem_row_array([0]).to_pandas().head(0)
-        empty_df.to_sql(**kwargs)
+        with connect() as connection:
+            empty_df.to_sql(con=connection, **kwargs)
         # so each partition will append its respective DF
         kwargs["if_exists"] = "append"
         columns = qc.columns
@@ -169,18 +396,126 @@ class SQLDispatcher(FileDispatcher):
             """
             Override column names in the wrapped dataframe and convert it to SQL.
 
-            Notes
-            -----
-            This function returns an empty ``pandas.DataFrame`` because ``apply_full_axis``
-            expects a Frame object as a result of operation (and ``to_sql`` has no dataframe result).
+            Returns
+            -------
+            pandas.DataFrame
+                Single row frame with the number of written rows and the time spent.
             """
+            start = time.perf_counter()
             df.columns = columns
-            df.to_sql(**kwargs)
-            return pandas.DataFrame()
+            # the engine can't be pickled, so the worker takes its own one
+            with con._get_engine().connect() as connection:
+                df.to_sql(con=connection, **kwargs)
+            return pandas.DataFrame(
+                {"rows": [len(df)], "seconds": [time.perf_counter() - start]}
+            )
 
         # Ensure that the metadata is synchronized
         qc._modin_frame._propagate_index_objs(axis=None)
-        result = qc._modin_frame.apply_full_axis(1, func, new_index=[], new_columns=[])
-        cls.materialize(
-            [part.list_of_blocks[0] for row in result._partitions for part in row]
+        partition_mgr_cls = qc._modin_frame._partition_mgr_cls
+        try:
+            result = partition_mgr_cls.map_axis_partitions(
+                axis=1,
+                partitions=qc._modin_frame._partitions,
+                map_func=func,
+                keep_partitioning=False,
+                num_splits=1,
+                lengths=None,
+            )
+            stats = pandas.concat(
+                partition_mgr_cls.get_objects_from_partitions(result[:, 0]),
+                ignore_index=True,
+            )
+            if staging is not None:
+                with connect() as connection, connection.begin():
+                    cls._swap_staging_table(
+                        connection,
+                        staging,
+                        name,
+                        kwargs["schema"],
+                        if_exists,
+                        columns,
+                    )
+        except BaseException:
+            if staging is not None:
+                import sqlalchemy as sa
+
+                with connect() as connection, connection.begin():
+                    sa.Table(staging, sa.MetaData(), schema=kwargs["schema"]).drop(
+                        connection, checkfirst=True
+                    )
+            raise
+
+        logger = get_logger()
+        for i, (rows, seconds) in enumerate(
+            stats[["rows", "seconds"]].itertuples(index=False)
+        ):
+            logger.info(
+                f"to_sql: partition {i} wrote {rows} rows in {seconds:.3f} s "
+                + f"({rows / max(seconds, 1e-9):.0f} rows/s)"
+            )
+        return int(stats["rows"].sum())
+
+
+def _copy_text_value(value):
+    """
+    Format a value for the text format of PostgreSQL ``COPY``.
+
+    Parameters
+    ----------
+    value : Any
+        The value to format.
+
+    Returns
+    -------
+    str
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # the hex format of ``bytea`` with its backslash escaped for ``COPY``
+        return "\\\\x" + bytes(value).hex()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_from_stdin(table, conn, keys, data_iter):
+    """
+    Insert rows into a PostgreSQL table with ``COPY FROM STDIN``.
+
+    This is the ``method`` callable of ``pandas.DataFrame.to_sql``.
+
+    Parameters
+    ----------
+    table : pandas.io.sql.SQLTable
+        The table to insert the rows into.
+    conn : sqlalchemy.engine.Connection
+        Connection using the psycopg2 driver.
+    keys : list of str
+        Column names.
+    data_iter : iterable
+        Iterable over the rows to insert.
+
+    Returns
+    -------
+    int
+        Number of inserted rows.
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    name = quote(table.name)
+    if table.schema is not None:
+        name = f"{quote(table.schema)}.{name}"
+    buffer = io.StringIO()
+    for row in data_iter:
+        buffer.write("\t".join(map(_copy_text_value, row)) + "\n")
+    buffer.seek(0)
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {name} ({', '.join(map(quote, keys))}) FROM STDIN", buffer
         )
+        return cursor.rowcount
@@ -11,10 +11,172 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Module houses `CSVDispatcher` class, that is used for reading `.csv` files."""
+"""Module houses `CSVDispatcher` class, that is used for reading and writing `.csv` files."""
+
+import codecs
+import io
+
+import numpy as np
+import pandas
+from pandas.io.common import is_fsspec_url, is_url, stringify_path
 
 from modin.core.io.text.text_file_dispatcher import TextFileDispatcher
 
 
 class CSVDispatcher(TextFileDispatcher):
-    """Class handles utils for reading `.csv` files."""
+    """Class handles utils for reading and writing `.csv` files."""
+
+    @staticmethod
+    def _to_csv_check_support(kwargs):
+        """
+        Check if parallel version of ``to_csv`` could be used.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments passed to ``.to_csv()``.
+
+        Returns
+        -------
+        bool
+            Whether parallel version of ``to_csv`` is applicable.
+        """
+        path_or_buf = kwargs["path_or_buf"]
+        compression = kwargs["compression"]
+        if not isinstance(path_or_buf, str):
+            return False
+        # case when the pointer is placed at the beginning of the file.
+        if "r" in kwargs["mode"] and "+" in kwargs["mode"]:
+            return False
+        # encodings with BOM don't support;
+        # instead of one mark in result bytes we will have them by the number of partitions
+        # so we should fallback in pandas for `utf-16`, `utf-32` with all aliases, in instance
+        # (`utf_32_be`, `utf_16_le` and so on)
+        if kwargs["encoding"] is not None:
+            encoding = kwargs["encoding"].lower()
+            if "u" in encoding or "utf" in encoding:
+                if "16" in encoding or "32" in encoding:
+                    return False
+        if compression is None or not compression == "infer":
+            return False
+        if any((path_or_buf.endswith(ext) for ext in [".gz", ".bz2", ".zip", ".xz"])):
+            return False
+        return True
+
+    @staticmethod
+    def _is_local_path(path):
+        """
+        Check if `path` points to a local file, so the file could be written at arbitrary offsets.
+
+        Parameters
+        ----------
+        path : str
+            Path to check.
+
+        Returns
+        -------
+        bool
+        """
+        return not (is_url(path) or is_fsspec_url(path))
+
+    @classmethod
+    def write(cls, qc, **kwargs):
+        """
+        Write records stored in the `qc` to a CSV file.
+
+        The row partitions are encoded in parallel, then the byte lengths of the chunks are
+        turned into their offsets in the file and the chunks are written concurrently.
+
+        Parameters
+        ----------
+        qc : BaseQueryCompiler
+            The query compiler of the Modin dataframe that we want to run ``to_csv`` on.
+        **kwargs : dict
+            Parameters for ``pandas.to_csv(**kwargs)``.
+        """
+        kwargs["path_or_buf"] = stringify_path(kwargs["path_or_buf"])
+        if (
+            not cls._to_csv_check_support(kwargs)
+            or not cls._is_local_path(kwargs["path_or_buf"])
+            or len(qc._modin_frame._partitions) == 0
+        ):
+            return cls.base_io.to_csv(qc, **kwargs)
+
+        path = kwargs["path_or_buf"]
+        mode = kwargs["mode"].replace("t", "").replace("b", "") + "b"
+        encoding = kwargs["encoding"] or "utf-8"
+        errors = kwargs["errors"] or "strict"
+        # open the file as pandas would do, so it's truncated, created or appended to
+        with open(path, mode) as f:
+            start = f.tell()
+
+        def encode(df, **kw):  # pragma: no cover
+            """
+            Dump a chunk of rows as csv and encode it.
+
+            Parameters
+            ----------
+            df : pandas.DataFrame
+                A chunk of rows to write to a CSV file.
+            **kw : dict
+                Extra argument `partition_idx` serving as chunk index.
+
+            Returns
+            -------
+            pandas.DataFrame
+                Single cell frame holding the encoded bytes.
+            """
+            partition_idx = kw["partition_idx"]
+            csv_kwargs = kwargs.copy()
+            csv_kwargs.pop("storage_options", None)
+            if partition_idx != 0:
+                # It is enough to write the header for the first partition
+                csv_kwargs["header"] = False
+            csv_kwargs["mode"] = "w"
+            csv_kwargs["path_or_buf"] = io.StringIO()
+            df.to_csv(**csv_kwargs)
+            encoder = codecs.getincrementalencoder(encoding)(errors)
+            if partition_idx != 0 or start != 0:
+                # the byte order mark is written only at the beginning of the file
+                encoder.setstate(0)
+            return pandas.DataFrame(
+                [[encoder.encode(csv_kwargs["path_or_buf"].getvalue(), final=True)]]
+            )
+
+        def get_length(df):  # pragma: no cover
+            return pandas.DataFrame([[len(df.iat[0, 0])]])
+
+        def write_at(df, offset):  # pragma: no cover
+            with open(path, "r+b") as f:
+                f.seek(offset)
+                f.write(df.iat[0, 0])
+            return pandas.DataFrame()
+
+        # Ensure that the metadata is synchronized
+        qc._modin_frame._propagate_index_objs(axis=None)
+        partition_mgr_cls = qc._modin_frame._partition_mgr_cls
+        chunks = partition_mgr_cls.map_axis_partitions(
+            axis=1,
+            partitions=qc._modin_frame._partitions,
+            map_func=encode,
+            keep_partitioning=False,
+            num_splits=1,
+            lengths=None,
+            enumerate_partitions=True,
+        )[:, 0]
+        lengths = [
+            df.iat[0, 0]
+            for df in partition_mgr_cls.get_objects_from_partitions(
+                [chunk.apply(get_length) for chunk in chunks]
+            )
+        ]
+        offsets = start + np.cumsum([0] + lengths[:-1])
+        with open(path, "r+b") as f:
+            f.truncate(start + sum(lengths))
+        # the chunks don't overlap, so they are written without waiting on each other
+        partition_mgr_cls.wait_partitions(
+            [
+                chunk.apply(write_at, offset=int(offset))
+                for chunk, offset in zip(chunks, offsets)
+            ]
+        )
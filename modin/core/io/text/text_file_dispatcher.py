@@ -17,6 +17,7 @@ Module houses `TextFileDispatcher` class.
 `TextFileDispatcher` contains utils for text formats files, inherits util functions for
 files from `FileDispatcher` class and can be used as base class for dipatchers of SQL queries.
 """
+
 import codecs
 import io
 import os
@@ -30,8 +31,10 @@ import pandas._libs.lib as lib
 from pandas.core.dtypes.common import is_list_like
 from pandas.io.common import stringify_path
 
-from modin.config import MinColumnPartitionSize, NPartitions
+from modin.config import MinColumnPartitionSize, NPartitions, StreamingReadPrefetch
 from modin.core.io.file_dispatcher import FileDispatcher, OpenFile
+from modin.core.io.metadata_cache import FileMetadataCache
+from modin.core.io.text.text_file_reader import TextFileChunkReader
 from modin.core.io.text.utils import CustomNewlineIterator
 from modin.core.storage_formats.pandas.utils import compute_chunksize
 from modin.utils import _inherit_docstrings
@@ -43,6 +46,9 @@ IndexColType = Union[int, str, bool, Sequence[int], Sequence[str], None]
 class TextFileDispatcher(FileDispatcher):
     """Class handles utils for reading text formats files."""
 
+    # approximate size in bytes of the blocks read by a task when reading by chunks
+    streaming_block_size = 64 * 1024 * 1024
+
     @classmethod
     def get_path_or_buffer(cls, filepath_or_buffer):
         """
@@ -686,12 +692,6 @@ class TextFileDispatcher(FileDispatcher):
         elif not cls.pathlib_or_pypath(filepath_or_buffer):
             return (False, cls.BUFFER_UNSUPPORTED_MSG)
 
-        if read_kwargs["chunksize"] is not None:
-            return (False, "`chunksize` parameter is not supported")
-
-        if read_kwargs.get("iterator"):
-            return (False, "`iterator==True` parameter is not supported")
-
         if read_kwargs.get("dialect") is not None:
             return (False, "`dialect` parameter is not supported")
 
@@ -985,74 +985,48 @@ class TextFileDispatcher(FileDispatcher):
         return new_query_compiler
 
     @classmethod
-    def _read(cls, filepath_or_buffer, **kwargs):
+    def _scan_file(
+        cls,
+        filepath_or_buffer,
+        kwargs,
+        compression_infered,
+        header_size,
+        pre_reading,
+        skiprows_partitioning,
+        should_handle_skiprows,
+    ):
         """
-        Read data from `filepath_or_buffer` according to `kwargs` parameters.
-
-        Used in `read_csv` and `read_fwf` Modin implementations.
+        Scan the file to split it into chunks and to get the metadata of its columns.
 
         Parameters
         ----------
         filepath_or_buffer : str, path object or file-like object
-            `filepath_or_buffer` parameter of read functions.
-        **kwargs : dict
+            Verified `filepath_or_buffer` parameter of read functions.
+        kwargs : dict
             Parameters of read functions.
+        compression_infered : str
+            Inferred compression of the file.
+        header_size : int
+            Number of rows that are occupied by the header.
+        pre_reading : int
+            Number of rows between header and skipped rows, that should be read.
+        skiprows_partitioning : int
+            Number of rows that should be skipped while partitioning the file.
+        should_handle_skiprows : bool
+            Whether the skipped rows are handled after reading.
 
         Returns
         -------
-        new_query_compiler : BaseQueryCompiler
-            Query compiler with imported data for further processing.
+        list
+            Start and end bytes of every chunk.
+        pandas.DataFrame
+            Dataframe from which metadata can be retrieved.
         """
-        filepath_or_buffer = stringify_path(filepath_or_buffer)
-        filepath_or_buffer_md = (
-            cls.get_path(filepath_or_buffer)
-            if isinstance(filepath_or_buffer, str)
-            else cls.get_path_or_buffer(filepath_or_buffer)
-        )
-        compression_infered = cls.infer_compression(
-            filepath_or_buffer, kwargs["compression"]
-        )
-        # Getting frequently used kwargs;
-        # They should be defined in higher level
-        names = kwargs["names"]
         index_col = kwargs["index_col"]
         encoding = kwargs["encoding"]
         skiprows = kwargs["skiprows"]
-        header = kwargs["header"]
-        # Define header size for further skipping (Header can be skipped because header
-        # information will be obtained further from empty_df, so no need to handle it
-        # by workers)
-        header_size = cls._define_header_size(
-            header,
-            names,
-        )
-        (
-            skiprows_md,
-            pre_reading,
-            skiprows_partitioning,
-        ) = cls._manage_skiprows_parameter(skiprows, header_size)
-        should_handle_skiprows = skiprows_md is not None and not isinstance(
-            skiprows_md, int
-        )
-
-        (use_modin_impl, fallback_reason) = cls.check_parameters_support(
-            filepath_or_buffer_md,
-            kwargs,
-            skiprows_md,
-            header_size,
-        )
-        if not use_modin_impl:
-            return cls.single_worker_read(
-                filepath_or_buffer,
-                kwargs,
-                reason=fallback_reason,
-            )
-
-        is_quoting = kwargs["quoting"] != QUOTE_NONE
         usecols = kwargs["usecols"]
-        use_inferred_column_names = cls._uses_inferred_column_names(
-            names, skiprows, kwargs["skipfooter"], usecols
-        )
+        is_quoting = kwargs["quoting"] != QUOTE_NONE
 
         # Computing metadata simultaneously with skipping rows allows us to not
         # do extra work and improve performance for certain cases, as otherwise,
@@ -1070,13 +1044,9 @@ class TextFileDispatcher(FileDispatcher):
             get_metadata_kw["engine"] = "c"
         if not can_compute_metadata_while_skipping_rows:
             pd_df_metadata = cls.read_callback(
-                filepath_or_buffer_md,
+                filepath_or_buffer,
                 **get_metadata_kw,
             )
-            column_names = pd_df_metadata.columns
-            column_widths, num_splits = cls._define_metadata(
-                pd_df_metadata, column_names
-            )
             get_metadata_kw = None
         else:
             get_metadata_kw = dict(get_metadata_kw, skiprows=None)
@@ -1091,7 +1061,7 @@ class TextFileDispatcher(FileDispatcher):
             get_metadata_kw.pop("compression", None)
 
         with OpenFile(
-            filepath_or_buffer_md,
+            filepath_or_buffer,
             "rb",
             compression_infered,
             **(kwargs.get("storage_options", None) or {}),
@@ -1118,7 +1088,37 @@ class TextFileDispatcher(FileDispatcher):
             )
             if can_compute_metadata_while_skipping_rows:
                 pd_df_metadata = pd_df_metadata_temp
+        return splits, pd_df_metadata
+
+    @classmethod
+    def _get_partition_kwargs(
+        cls,
+        kwargs,
+        pd_df_metadata,
+        header_size,
+        use_inferred_column_names,
+        compression_infered,
+    ):
+        """
+        Get the parameters of the tasks reading the partitions.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Parameters of read functions.
+        pd_df_metadata : pandas.DataFrame
+            Dataframe from which metadata can be retrieved.
+        header_size : int
+            Number of rows that are occupied by the header.
+        use_inferred_column_names : bool
+            Whether the column names inferred from the header are passed to the tasks.
+        compression_infered : str
+            Inferred compression of the file.
 
+        Returns
+        -------
+        dict
+        """
         # compute dtypes if possible
         common_dtypes = None
         if kwargs["dtype"] is None:
@@ -1127,20 +1127,306 @@ class TextFileDispatcher(FileDispatcher):
             for col, dtype in pd_df_metadata.dtypes.to_dict().items():
                 if dtype in most_common_dtype:
                     common_dtypes[col] = dtype
-        column_names = pd_df_metadata.columns
-        column_widths, num_splits = cls._define_metadata(pd_df_metadata, column_names)
         # kwargs that will be passed to the workers
-        partition_kwargs = dict(
+        return dict(
             kwargs,
             header_size=0 if use_inferred_column_names else header_size,
-            names=column_names if use_inferred_column_names else names,
-            header="infer" if use_inferred_column_names else header,
+            names=(
+                pd_df_metadata.columns if use_inferred_column_names else kwargs["names"]
+            ),
+            header="infer" if use_inferred_column_names else kwargs["header"],
             skipfooter=0,
             skiprows=None,
             nrows=None,
+            chunksize=None,
+            iterator=False,
             compression=compression_infered,
             common_dtypes=common_dtypes,
         )
+
+    @classmethod
+    def _iter_blocks(
+        cls,
+        filepath_or_buffer,
+        kwargs,
+        compression_infered,
+        header_size,
+        skiprows_partitioning,
+    ):
+        """
+        Split the file into blocks of about ``cls.streaming_block_size`` bytes lazily.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str, path object or file-like object
+            Verified `filepath_or_buffer` parameter of read functions.
+        kwargs : dict
+            Parameters of read functions.
+        compression_infered : str
+            Inferred compression of the file.
+        header_size : int
+            Number of rows that are occupied by the header.
+        skiprows_partitioning : int
+            Number of rows that should be skipped before the header.
+
+        Yields
+        ------
+        tuple of (int, int)
+            Start and end bytes of a block.
+        """
+        encoding = kwargs["encoding"]
+        is_quoting = kwargs["quoting"] != QUOTE_NONE
+        with OpenFile(
+            filepath_or_buffer,
+            "rb",
+            compression_infered,
+            **(kwargs.get("storage_options", None) or {}),
+        ) as f:
+            old_pos = f.tell()
+            fio = io.TextIOWrapper(f, encoding=encoding, newline="")
+            newline, quotechar = cls.compute_newline(
+                fio, encoding, kwargs.get("quotechar", '"')
+            )
+            f.seek(old_pos)
+
+            rows_skipper = cls.rows_skipper_builder(
+                f, quotechar, is_quoting=is_quoting, encoding=encoding, newline=newline
+            )
+            rows_skipper(skiprows_partitioning)
+            rows_skipper(header_size)
+            file_size = cls.file_size(f)
+            start = f.tell()
+            while f.tell() < file_size:
+                outside_quotes = cls.offset(
+                    f,
+                    offset_size=cls.streaming_block_size,
+                    quotechar=quotechar,
+                    is_quoting=is_quoting,
+                    encoding=encoding,
+                    newline=newline,
+                )
+                if is_quoting and not outside_quotes:
+                    warnings.warn("File has mismatched quotes")
+                end = f.tell()
+                yield start, end
+                # the consumer may have been suspended for a while, so don't
+                # rely on the file position being kept
+                f.seek(end)
+                start = end
+
+    @classmethod
+    def _read_chunks(
+        cls,
+        filepath_or_buffer,
+        kwargs,
+        compression_infered,
+        header_size,
+        skiprows_partitioning,
+        use_inferred_column_names,
+    ):
+        """
+        Read the file chunk by chunk, as `read_*` functions do with `chunksize` or `iterator`.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str, path object or file-like object
+            Verified `filepath_or_buffer` parameter of read functions.
+        kwargs : dict
+            Parameters of read functions.
+        compression_infered : str
+            Inferred compression of the file.
+        header_size : int
+            Number of rows that are occupied by the header.
+        skiprows_partitioning : int
+            Number of rows that should be skipped before the header.
+        use_inferred_column_names : bool
+            Whether the column names inferred from the header are passed to the tasks.
+
+        Returns
+        -------
+        TextFileChunkReader
+            Iterator over the chunks of the file.
+        """
+        index_col = kwargs["index_col"]
+        get_metadata_kw = dict(
+            kwargs, nrows=1, skipfooter=0, chunksize=None, iterator=False
+        )
+        if get_metadata_kw.get("engine", None) == "pyarrow":
+            get_metadata_kw["engine"] = "c"
+        pd_df_metadata = cls.read_callback(filepath_or_buffer, **get_metadata_kw)
+        column_names = pd_df_metadata.columns
+        column_widths, num_splits = cls._define_metadata(pd_df_metadata, column_names)
+        partition_kwargs = cls._get_partition_kwargs(
+            kwargs,
+            pd_df_metadata,
+            header_size=header_size,
+            use_inferred_column_names=use_inferred_column_names,
+            compression_infered=compression_infered,
+        )
+        filepath_or_buffer_ref = cls.put(filepath_or_buffer)
+        kwargs_ref = cls.put(partition_kwargs)
+
+        def read_block(split):
+            partition_ids, index_ids, dtypes_ids = cls._launch_tasks(
+                [split],
+                filepath_or_buffer_ref,
+                kwargs_ref,
+                num_splits=num_splits,
+            )
+            return cls._get_new_qc(
+                partition_ids=partition_ids,
+                index_ids=index_ids,
+                dtypes_ids=dtypes_ids,
+                index_col=index_col,
+                index_name=pd_df_metadata.index.name,
+                column_widths=column_widths,
+                column_names=column_names,
+                header_size=header_size,
+                parse_dates=kwargs["parse_dates"],
+            )
+
+        return TextFileChunkReader(
+            cls._iter_blocks(
+                filepath_or_buffer,
+                kwargs,
+                compression_infered=compression_infered,
+                header_size=header_size,
+                skiprows_partitioning=skiprows_partitioning,
+            ),
+            read_block,
+            chunksize=kwargs["chunksize"],
+            nrows=kwargs["nrows"],
+            prefetch=StreamingReadPrefetch.get(),
+            range_index=index_col is None or index_col is False,
+        )
+
+    @classmethod
+    def _read(cls, filepath_or_buffer, **kwargs):
+        """
+        Read data from `filepath_or_buffer` according to `kwargs` parameters.
+
+        Used in `read_csv` and `read_fwf` Modin implementations.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str, path object or file-like object
+            `filepath_or_buffer` parameter of read functions.
+        **kwargs : dict
+            Parameters of read functions.
+
+        Returns
+        -------
+        new_query_compiler : BaseQueryCompiler
+            Query compiler with imported data for further processing.
+        """
+        filepath_or_buffer = stringify_path(filepath_or_buffer)
+        filepath_or_buffer_md = (
+            cls.get_path(filepath_or_buffer)
+            if isinstance(filepath_or_buffer, str)
+            else cls.get_path_or_buffer(filepath_or_buffer)
+        )
+        compression_infered = cls.infer_compression(
+            filepath_or_buffer, kwargs["compression"]
+        )
+        # Getting frequently used kwargs;
+        # They should be defined in higher level
+        names = kwargs["names"]
+        index_col = kwargs["index_col"]
+        skiprows = kwargs["skiprows"]
+        header = kwargs["header"]
+        # Define header size for further skipping (Header can be skipped because header
+        # information will be obtained further from empty_df, so no need to handle it
+        # by workers)
+        header_size = cls._define_header_size(
+            header,
+            names,
+        )
+        (
+            skiprows_md,
+            pre_reading,
+            skiprows_partitioning,
+        ) = cls._manage_skiprows_parameter(skiprows, header_size)
+        should_handle_skiprows = skiprows_md is not None and not isinstance(
+            skiprows_md, int
+        )
+
+        use_modin_impl, fallback_reason = cls.check_parameters_support(
+            filepath_or_buffer_md,
+            kwargs,
+            skiprows_md,
+            header_size,
+        )
+        if not use_modin_impl:
+            return cls.single_worker_read(
+                filepath_or_buffer,
+                kwargs,
+                reason=fallback_reason,
+            )
+
+        usecols = kwargs["usecols"]
+        use_inferred_column_names = cls._uses_inferred_column_names(
+            names, skiprows, kwargs["skipfooter"], usecols
+        )
+
+        if kwargs["chunksize"] is not None or kwargs.get("iterator"):
+            if should_handle_skiprows or pre_reading or kwargs["skipfooter"]:
+                fallback_reason = (
+                    "`chunksize` or `iterator` with `skiprows` that are not "
+                    + "the first rows or with `skipfooter`"
+                )
+            elif compression_infered is not None:
+                # every task would have to decompress the file from its beginning
+                fallback_reason = "`chunksize` or `iterator` with a compressed file"
+            if fallback_reason is not None:
+                return cls.single_worker_read(
+                    filepath_or_buffer,
+                    kwargs,
+                    reason=fallback_reason,
+                )
+            return cls._read_chunks(
+                filepath_or_buffer_md,
+                kwargs,
+                compression_infered=compression_infered,
+                header_size=header_size,
+                skiprows_partitioning=skiprows_partitioning,
+                use_inferred_column_names=use_inferred_column_names,
+            )
+
+        # Scanning the file only depends on its contents and the reading parameters,
+        # so the results can be reused for as long as the file stays the same.
+        cache_params = (kwargs, NPartitions.get())
+        cached = FileMetadataCache.get(
+            cls.__name__, filepath_or_buffer_md, cache_params
+        )
+        if cached is not None:
+            splits, pd_df_metadata = cached
+        else:
+            splits, pd_df_metadata = cls._scan_file(
+                filepath_or_buffer_md,
+                kwargs,
+                compression_infered=compression_infered,
+                header_size=header_size,
+                pre_reading=pre_reading,
+                skiprows_partitioning=skiprows_partitioning,
+                should_handle_skiprows=should_handle_skiprows,
+            )
+            # only the header and the dtypes of the metadata frame are used
+            FileMetadataCache.put(
+                cls.__name__,
+                filepath_or_buffer_md,
+                (splits, pd_df_metadata.iloc[:0]),
+                cache_params,
+            )
+
+        column_names = pd_df_metadata.columns
+        column_widths, num_splits = cls._define_metadata(pd_df_metadata, column_names)
+        partition_kwargs = cls._get_partition_kwargs(
+            kwargs,
+            pd_df_metadata,
+            header_size=header_size,
+            use_inferred_column_names=use_inferred_column_names,
+            compression_infered=compression_infered,
+        )
         # this is done mostly for performance; see PR#5678 for details
         filepath_or_buffer_md_ref = cls.put(filepath_or_buffer_md)
         kwargs_ref = cls.put(partition_kwargs)
@@ -0,0 +1,170 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses `TextFileChunkReader` class, that reads text files chunk by chunk."""
+
+from collections import deque
+from typing import Callable, Iterator, Optional, Tuple
+
+import pandas
+
+
+class TextFileChunkReader:
+    """
+    Iterator over the chunks of a text file, the Modin counterpart of ``pandas.io.parsers.TextFileReader``.
+
+    The file is split into byte blocks ending at line boundaries, and every block is
+    read by a separate task on the engine. The blocks following the current one are
+    read in the background, at most `prefetch` of them at a time, so that only the
+    blocks of this window are kept in memory whatever the size of the file.
+
+    Parameters
+    ----------
+    splits : iterator of (int, int)
+        Start and end bytes of the blocks, produced lazily.
+    read_split : callable(tuple) -> BaseQueryCompiler
+        Function launching the read of a block.
+    chunksize : int, optional
+        Number of rows in a chunk returned by iteration.
+    nrows : int, optional
+        Number of rows to read in total.
+    prefetch : int, default: 1
+        Maximum number of blocks being read in the background.
+    range_index : bool, default: True
+        Whether the chunks get a ``RangeIndex`` continuing the previous chunk.
+    """
+
+    def __init__(
+        self,
+        splits: Iterator[Tuple[int, int]],
+        read_split: Callable,
+        chunksize: Optional[int] = None,
+        nrows: Optional[int] = None,
+        prefetch: int = 1,
+        range_index: bool = True,
+    ):
+        self._splits = splits
+        self._read_split = read_split
+        self.chunksize = chunksize
+        self.nrows = nrows
+        self._prefetch = max(1, prefetch)
+        self._range_index = range_index
+        # query compilers of the blocks being read in the background, in file order
+        self._pending = deque()
+        # query compiler with the rows of the last block that are not returned yet
+        self._buffer = None
+        self._splits_exhausted = False
+        self._currow = 0
+        self._fill()
+
+    def _fill(self):
+        """Launch reading of the next blocks until the prefetch window is full."""
+        while not self._splits_exhausted and len(self._pending) < self._prefetch:
+            try:
+                split = next(self._splits)
+            except StopIteration:
+                self._splits_exhausted = True
+            else:
+                self._pending.append(self._read_split(split))
+
+    def read(self, nrows: Optional[int] = None):
+        """
+        Read the next `nrows` rows.
+
+        Parameters
+        ----------
+        nrows : int, optional
+            Number of rows to read. If not specified, read all the remaining rows.
+
+        Returns
+        -------
+        BaseQueryCompiler
+
+        Raises
+        ------
+        StopIteration
+            If there are no rows left.
+        """
+        if self.nrows is not None:
+            nrows = (
+                self.nrows - self._currow
+                if nrows is None
+                else min(nrows, self.nrows - self._currow)
+            )
+        parts = [] if self._buffer is None else [self._buffer]
+        num_rows = 0 if self._buffer is None else len(self._buffer.index)
+        self._buffer = None
+        while (nrows is None or num_rows < nrows) and len(self._pending) > 0:
+            part = self._pending.popleft()
+            # keep the window full while waiting for the block
+            self._fill()
+            num_rows += len(part.index)
+            # the dtypes come from the same task as the index, so it is not waited
+            # any longer here, while lazy dtypes can't be concatenated
+            part.dtypes
+            parts.append(part)
+
+        if num_rows == 0 or nrows == 0:
+            raise StopIteration
+        result = parts[0].concat(0, parts[1:]) if len(parts) > 1 else parts[0]
+        if nrows is not None and num_rows > nrows:
+            positions = pandas.RangeIndex(num_rows)
+            self._buffer = result.take_2d_positional(index=positions[nrows:])
+            result = result.take_2d_positional(index=positions[:nrows])
+            num_rows = nrows
+        if self._range_index:
+            result.index = pandas.RangeIndex(self._currow, self._currow + num_rows)
+        self._currow += num_rows
+        return result
+
+    def get_chunk(self, size: Optional[int] = None):
+        """
+        Read the next chunk.
+
+        Parameters
+        ----------
+        size : int, optional
+            Number of rows to read. If not specified, `chunksize` is used.
+
+        Returns
+        -------
+        BaseQueryCompiler
+        """
+        if size is None:
+            size = self.chunksize
+        return self.read(size)
+
+    def __iter__(self):  # noqa: GL08
+        return self
+
+    def __next__(self):  # noqa: GL08
+        try:
+            return self.get_chunk()
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        """Stop reading the file and release the blocks read in advance."""
+        self._pending.clear()
+        self._buffer = None
+        self._splits_exhausted = True
+        close_splits = getattr(self._splits, "close", None)
+        if close_splits is not None:
+            close_splits()
+
+    def __enter__(self):  # noqa: GL08
+        return self
+
+    def __exit__(self, *args):  # noqa: GL08
+        self.close()
@@ -601,6 +601,8 @@ def doc_window_method(
         window_args_name = "rolling_kwargs"
     elif win_type == "expanding window":
         window_args_name = "expanding_args"
+    elif win_type == "exponentially weighted window":
+        window_args_name = "ewm_kwargs"
     else:
         window_args_name = "window_kwargs"
 
@@ -35,6 +35,7 @@ from modin.core.dataframe.algebra.default2pandas import (
     CatDefault,
     DataFrameDefault,
     DateTimeDefault,
+    EwmDefault,
     ExpandingDefault,
     GroupByDefault,
     ListDefault,
@@ -45,7 +46,7 @@ from modin.core.dataframe.algebra.default2pandas import (
     StrDefault,
     StructDefault,
 )
-from modin.error_message import ErrorMessage
+from modin.error_message import ErrorMessage, FallbackAudit
 from modin.logging import ClassLogger
 from modin.logging.config import LogLevel
 from modin.utils import MODIN_UNNAMED_SERIES_LABEL, try_cast_to_pandas
@@ -188,20 +189,23 @@ class BaseQueryCompiler(
         BaseQueryCompiler
             The result of the `pandas_op`, converted back to ``BaseQueryCompiler``.
         """
-        op_name = getattr(pandas_op, "__name__", str(pandas_op))
-        ErrorMessage.default_to_pandas(op_name)
-        args = try_cast_to_pandas(args)
-        kwargs = try_cast_to_pandas(kwargs)
-
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=FutureWarning)
-            result = pandas_op(try_cast_to_pandas(self), *args, **kwargs)
-        if isinstance(result, (tuple, list)):
-            if "Series.tolist" in pandas_op.__name__:
-                # fast path: no need to iterate over the result from `tolist` function
-                return result
-            return [self.__wrap_in_qc(obj) for obj in result]
-        return self.__wrap_in_qc(result)
+        with FallbackAudit.track():
+            op_name = getattr(pandas_op, "__name__", str(pandas_op))
+            ErrorMessage.default_to_pandas(op_name)
+            args = try_cast_to_pandas(args)
+            kwargs = try_cast_to_pandas(kwargs)
+
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=FutureWarning)
+                pandas_self = try_cast_to_pandas(self)
+                FallbackAudit.collected(pandas_self)
+                result = pandas_op(pandas_self, *args, **kwargs)
+            if isinstance(result, (tuple, list)):
+                if "Series.tolist" in pandas_op.__name__:
+                    # fast path: no need to iterate over the result from `tolist` function
+                    return result
+                return [self.__wrap_in_qc(obj) for obj in result]
+            return self.__wrap_in_qc(result)
 
     # Abstract Methods and Fields: Must implement in children classes
     # In some cases, there you may be able to use the same implementation for
@@ -1179,6 +1183,8 @@ class BaseQueryCompiler(
                 direction=direction,
             )
 
+        # the keys are gathered to the driver to be matched by pandas
+        ErrorMessage.default_to_pandas("`merge_asof`")
         if left_on is None:
             left_column = self.index
         else:
@@ -6651,6 +6657,170 @@ class BaseQueryCompiler(
 
     # End of Expanding methods
 
+    # Begin Exponentially weighted window methods
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="the result of passed functions",
+        action="apply specified functions",
+        refer_to="aggregate",
+        win_type="exponentially weighted window",
+        params="""
+        func : str, dict, callable(pandas.Series) -> scalar, or list of such
+        *args : iterable
+        **kwargs : dict""",
+        build_rules="udf_aggregation",
+    )
+    def ewm_aggregate(self, fold_axis, ewm_kwargs, func, *args, **kwargs):
+        return EwmDefault.register(
+            pandas.core.window.ewm.ExponentialMovingWindow.aggregate
+        )(self, ewm_kwargs, func, *args, **kwargs)
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="mean",
+        refer_to="mean",
+        win_type="exponentially weighted window",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def ewm_mean(self, fold_axis, ewm_kwargs, *args, **kwargs):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.mean)(
+            self, ewm_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="sum",
+        refer_to="sum",
+        win_type="exponentially weighted window",
+        params="""
+        *args : iterable
+        **kwargs : dict""",
+    )
+    def ewm_sum(self, fold_axis, ewm_kwargs, *args, **kwargs):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.sum)(
+            self, ewm_kwargs, *args, **kwargs
+        )
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="variance",
+        refer_to="var",
+        win_type="exponentially weighted window",
+        params="""
+        bias : bool, default: False
+        numeric_only : bool, default: False""",
+    )
+    def ewm_var(self, fold_axis, ewm_kwargs, bias=False, numeric_only=False):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.var)(
+            self, ewm_kwargs, bias=bias, numeric_only=numeric_only
+        )
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="standard deviation",
+        refer_to="std",
+        win_type="exponentially weighted window",
+        params="""
+        bias : bool, default: False
+        numeric_only : bool, default: False""",
+    )
+    def ewm_std(self, fold_axis, ewm_kwargs, bias=False, numeric_only=False):
+        return EwmDefault.register(pandas.core.window.ewm.ExponentialMovingWindow.std)(
+            self, ewm_kwargs, bias=bias, numeric_only=numeric_only
+        )
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="sample covariance",
+        refer_to="cov",
+        win_type="exponentially weighted window",
+        params="""
+        squeeze_self : bool
+        squeeze_other : bool
+        other : BaseQueryCompiler, default: None
+        pairwise : bool | None, default: None
+        bias : bool, default: False
+        numeric_only : bool, default: False""",
+    )
+    def ewm_cov(
+        self,
+        fold_axis,
+        ewm_kwargs,
+        squeeze_self,
+        squeeze_other,
+        other=None,
+        pairwise=None,
+        bias=False,
+        numeric_only=False,
+    ):
+        other_for_default = (
+            other
+            if other is None
+            else (
+                other.to_pandas().squeeze(axis=1)
+                if squeeze_other
+                else other.to_pandas()
+            )
+        )
+        return EwmDefault.register(
+            pandas.core.window.ewm.ExponentialMovingWindow.cov,
+            squeeze_self=squeeze_self,
+        )(
+            self,
+            ewm_kwargs,
+            other=other_for_default,
+            pairwise=pairwise,
+            bias=bias,
+            numeric_only=numeric_only,
+        )
+
+    @doc_utils.doc_window_method(
+        window_cls_name="ExponentialMovingWindow",
+        result="sample correlation",
+        refer_to="corr",
+        win_type="exponentially weighted window",
+        params="""
+        squeeze_self : bool
+        squeeze_other : bool
+        other : BaseQueryCompiler, default: None
+        pairwise : bool | None, default: None
+        numeric_only : bool, default: False""",
+    )
+    def ewm_corr(
+        self,
+        fold_axis,
+        ewm_kwargs,
+        squeeze_self,
+        squeeze_other,
+        other=None,
+        pairwise=None,
+        numeric_only=False,
+    ):
+        other_for_default = (
+            other
+            if other is None
+            else (
+                other.to_pandas().squeeze(axis=1)
+                if squeeze_other
+                else other.to_pandas()
+            )
+        )
+        return EwmDefault.register(
+            pandas.core.window.ewm.ExponentialMovingWindow.corr,
+            squeeze_self=squeeze_self,
+        )(
+            self,
+            ewm_kwargs,
+            other=other_for_default,
+            pairwise=pairwise,
+            numeric_only=numeric_only,
+        )
+
+    # End of Exponentially weighted window methods
+
     # Window methods
 
     @doc_utils.doc_window_method(
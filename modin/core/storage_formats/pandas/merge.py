@@ -17,13 +17,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 import pandas
 from pandas.core.dtypes.common import is_list_like
 from pandas.errors import MergeError
 
-from modin.config import MinRowPartitionSize, NPartitions
+from modin.config import BroadcastSizeLimit, MinRowPartitionSize, NPartitions
 from modin.core.dataframe.base.dataframe.utils import join_columns
+from modin.core.dataframe.pandas.dataframe.utils import ShuffleHashFunctions
 from modin.core.dataframe.pandas.metadata import ModinDtypes
+from modin.logging import get_logger
 
 from .utils import merge_partitioning
 
@@ -100,6 +103,158 @@ class MergeImpl:
             # the index unconditionally
         ).reset_index(drop=True)
 
+    # Column holding the positions of the rows which order the result of hash-partitioning merge
+    _position_column = "__merge_position__"
+
+    @classmethod
+    def choose_strategy(
+        cls, left: PandasQueryCompiler, right: PandasQueryCompiler, kwargs: dict
+    ) -> str:
+        """
+        Choose the implementation of merge from the size estimates of the frames.
+
+        The frame which rows don't define the order of the result is broadcast to every
+        partition of the other one if it fits ``BroadcastSizeLimit``. Otherwise, both
+        frames are hash-partitioned by the keys to merge on.
+
+        Parameters
+        ----------
+        left : PandasQueryCompiler
+        right : PandasQueryCompiler
+        kwargs : dict
+            Keyword arguments for ``pandas.merge()`` function.
+
+        Returns
+        -------
+        str
+            Either "row_axis" or "hash_partitioning".
+        """
+        broadcast_side = left if kwargs.get("how", "inner") == "right" else right
+        nbytes = broadcast_side._modin_frame._estimate_nbytes()
+        limit = BroadcastSizeLimit.get() * 2**20
+        strategy = "row_axis" if nbytes <= limit else "hash_partitioning"
+        get_logger().info(
+            f"Merging frames of {len(left._modin_frame)} and {len(right._modin_frame)} rows "
+            + f"using {strategy} implementation: the frame to broadcast takes about {nbytes} "
+            + f"bytes, the broadcast size limit is {limit} bytes."
+        )
+        return strategy
+
+    @classmethod
+    def hash_partitioning_merge(
+        cls, left: PandasQueryCompiler, right: PandasQueryCompiler, kwargs: dict
+    ) -> PandasQueryCompiler:
+        """
+        Execute merge using hash-partitioning implementation.
+
+        Both frames are split into buckets by the hashes of the keys, the buckets holding
+        the same keys are merged in parallel. The rows are then put in the order of the
+        frame which keys pandas preserves the order of.
+
+        Parameters
+        ----------
+        left : PandasQueryCompiler
+        right : PandasQueryCompiler
+        kwargs : dict
+            Keyword arguments for ``pandas.merge()`` function.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+        how = kwargs.get("how", "inner")
+        if (
+            kwargs.get("left_index", False)
+            or kwargs.get("right_index", False)
+            or kwargs.get("left_on", None) is not None
+            or kwargs.get("right_on", None) is not None
+            or how not in ("left", "inner", "right")
+        ):
+            raise NotImplementedError(
+                f"The passed parameters are not yet supported by hash-partitioning merge: {kwargs=}"
+            )
+        if (
+            left._modin_frame._partitions.size == 0
+            or right._modin_frame._partitions.size == 0
+        ):
+            raise NotImplementedError(
+                "Merging empty frames is not supported by hash-partitioning merge."
+            )
+        if left.columns.nlevels > 1 or right.columns.nlevels > 1:
+            raise NotImplementedError(
+                "Merging frames with MultiIndex columns is not yet supported by hash-partitioning merge."
+            )
+        if (
+            cls._position_column in left.columns
+            or cls._position_column in right.columns
+        ):
+            raise NotImplementedError(
+                f"Merging frames having {cls._position_column!r} column is not supported by hash-partitioning merge."
+            )
+
+        on = kwargs.get("on", None)
+        if on is None:
+            on = [col for col in left.columns if col in right.columns]
+        elif not is_list_like(on):
+            on = [on]
+        else:
+            on = list(on)
+        if len(on) == 0 or any(
+            col not in left.columns or col not in right.columns for col in on
+        ):
+            raise NotImplementedError(
+                "Merging on an index level is not yet supported by hash-partitioning merge."
+            )
+        if not all(
+            ShuffleHashFunctions.are_hashed_alike(left_dtype, right_dtype)
+            for left_dtype, right_dtype in zip(left.dtypes[on], right.dtypes[on])
+        ):
+            raise NotImplementedError(
+                "Merging on keys of differently hashed types is not supported by hash-partitioning merge."
+            )
+
+        if kwargs.get("indicator", False):
+            new_columns, new_dtypes = None, None
+        else:
+            new_columns, new_dtypes = cls._compute_result_metadata(
+                left,
+                right,
+                on,
+                left_on=None,
+                right_on=None,
+                suffixes=kwargs.get("suffixes", ("_x", "_y")),
+            )
+        sort = kwargs.get("sort", False)
+        kwargs = {**kwargs, "sort": False}
+        position = cls._position_column
+        # pandas preserves the order of the keys of the right frame for the right merge
+        # and of the left frame otherwise, so the rows of this frame are labeled with positions
+        reverted = how == "right"
+
+        def func(ordered, other):  # pragma: no cover
+            ordered = ordered.assign(**{position: np.asarray(ordered.index)})
+            if reverted:
+                df = pandas.merge(other, ordered, **kwargs)
+            else:
+                df = pandas.merge(ordered, other, **kwargs)
+            return df.set_index(position).rename_axis(None)
+
+        ordered, other = (right, left) if reverted else (left, right)
+        new_modin_frame = (
+            ordered._modin_frame._apply_func_to_hash_partitioning_broadcast(
+                other._modin_frame,
+                func=func,
+                key=on,
+                new_columns=new_columns,
+                new_dtypes=new_dtypes,
+            )
+        )
+        result = left.__constructor__(new_modin_frame)
+        if sort:
+            # the rows with equal keys have to keep their order
+            result = result.sort_rows_by_column_values(on, kind="stable")
+        return result.reset_index(drop=True)
+
     @classmethod
     def row_axis_merge(
         cls, left: PandasQueryCompiler, right: PandasQueryCompiler, kwargs: dict
@@ -251,6 +406,115 @@ class MergeImpl:
         else:
             return left.default_to_pandas(pandas.DataFrame.merge, right, **kwargs)
 
+    @classmethod
+    def range_aligned_merge_asof(
+        cls, left: PandasQueryCompiler, right: PandasQueryCompiler, kwargs: dict
+    ) -> PandasQueryCompiler:
+        """
+        Execute merge_asof by aligning the sorted rows of `right` to the ranges of `left` row partitions.
+
+        Every row partition of `left` covers a closed range of the `on` values. It gets the rows
+        of `right` falling into its range along with the rows of `right` that may be matched from
+        outside of the range: the last preceding row (for the backward and nearest directions) and
+        the first following row (for the forward and nearest directions) of every `by` group.
+        The ranges are merged in parallel and keep the order of `left`.
+
+        Parameters
+        ----------
+        left : PandasQueryCompiler
+        right : PandasQueryCompiler
+        kwargs : dict
+            Keyword arguments for ``pandas.merge_asof()`` function.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+        left_on, right_on = kwargs["left_on"], kwargs["right_on"]
+        left_by, right_by = kwargs["left_by"], kwargs["right_by"]
+        direction = kwargs["direction"]
+        if (
+            kwargs["left_index"]
+            or kwargs["right_index"]
+            or left_on is None
+            or right_on is None
+        ):
+            raise NotImplementedError(
+                "Merging on the index is not yet supported by range-aligned merge_asof."
+            )
+        if (
+            left._modin_frame._partitions.size == 0
+            or right._modin_frame._partitions.size == 0
+            or len(left.index) == 0
+            or len(right.index) == 0
+        ):
+            raise NotImplementedError(
+                "Merging empty frames is not supported by range-aligned merge_asof."
+            )
+        if not left.columns.is_unique or not right.columns.is_unique:
+            raise NotImplementedError(
+                "Merging frames with duplicated columns is not supported by range-aligned merge_asof."
+            )
+        keys = [(left_on, left.columns), (right_on, right.columns)]
+        for by, columns in ((left_by, left.columns), (right_by, right.columns)):
+            if by is not None:
+                keys.extend(
+                    (col, columns) for col in (by if is_list_like(by) else [by])
+                )
+        if any(is_list_like(col) or col not in columns for col, columns in keys):
+            raise NotImplementedError(
+                "Merging on index levels is not yet supported by range-aligned merge_asof."
+            )
+
+        # pandas validates the keys and the tolerance and computes the result columns
+        # for the empty frames the same way it does for the data
+        new_columns = pandas.merge_asof(
+            pandas.DataFrame(
+                {col: pandas.Series(dtype=dtype) for col, dtype in left.dtypes.items()}
+            ),
+            pandas.DataFrame(
+                {col: pandas.Series(dtype=dtype) for col, dtype in right.dtypes.items()}
+            ),
+            **kwargs,
+        ).columns
+
+        def group(df):  # pragma: no cover
+            return (
+                df
+                if right_by is None
+                else df.groupby(right_by, sort=False, dropna=False)
+            )
+
+        def split_func(df, bounds):  # pragma: no cover
+            on = df[right_on]
+            pieces = []
+            for lower, upper in bounds:
+                start = on.searchsorted(lower, side="left")
+                stop = on.searchsorted(upper, side="right")
+                piece = [df.iloc[start:stop]]
+                if direction != "forward":
+                    piece.insert(0, group(df.iloc[:start]).tail(1))
+                if direction != "backward":
+                    piece.append(group(df.iloc[stop:]).head(1))
+                pieces.append(pandas.concat(piece, copy=False))
+            return pieces
+
+        def func(left, right):  # pragma: no cover
+            # the pieces of the row partitions of `right` overlap in the key values,
+            # the stable sort keeps the order of the rows with equal keys
+            right = right.sort_values(right_on, kind="stable")
+            return pandas.merge_asof(left, right, **kwargs)
+
+        new_modin_frame = left._modin_frame._apply_func_to_sorted_ranges_broadcast(
+            right._modin_frame,
+            func=func,
+            split_func=split_func,
+            key=left_on,
+            right_key=right_on,
+            new_columns=new_columns,
+        )
+        return left.__constructor__(new_modin_frame).reset_index(drop=True)
+
     @classmethod
     def _compute_result_metadata(
         cls,
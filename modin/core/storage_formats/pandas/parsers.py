@@ -708,18 +708,17 @@ class PandasParquetParser(PandasParser):
                 from pyarrow.parquet import filters_to_expression
 
                 parquet_format = ds.ParquetFileFormat()
-                fragment = parquet_format.make_fragment(
-                    f,
-                    row_groups=range(
-                        row_group_start,
-                        row_group_end,
-                    ),
-                )
+                # A fragment doesn't necessarily keep the order of its row groups,
+                # so every row group gets its own fragment.
+                fragments = [
+                    parquet_format.make_fragment(f, row_groups=[row_group])
+                    for row_group in range(row_group_start, row_group_end)
+                ]
                 dataset = ds.FileSystemDataset(
-                    [fragment],
-                    schema=fragment.physical_schema,
+                    fragments,
+                    schema=fragments[0].physical_schema,
                     format=parquet_format,
-                    filesystem=fragment.filesystem,
+                    filesystem=fragments[0].filesystem,
                 )
 
                 # This lower-level API doesn't have the ability to automatically handle pandas metadata
@@ -901,18 +900,25 @@ read_sql_engine : str
                 )
 
         num_splits = kwargs.pop("num_splits", None)
+        pooled_connection = None
         if isinstance(con, ModinDatabaseConnection):
-            con = con.get_string() if enable_cx else con.get_connection()
+            if enable_cx:
+                con = con.get_string()
+            else:
+                con = pooled_connection = con.get_connection()
 
-        if num_splits is None:
+        try:
             if enable_cx:
-                return cx.read_sql(con, sql, index_col=index_col)
-            return pandas.read_sql(sql, con, index_col=index_col, **kwargs)
+                df = cx.read_sql(con, sql, index_col=index_col)
+            else:
+                df = pandas.read_sql(sql, con, index_col=index_col, **kwargs)
+        finally:
+            if pooled_connection is not None:
+                # return the connection to the pool of the worker
+                pooled_connection.close()
 
-        if enable_cx:
-            df = cx.read_sql(con, sql, index_col=index_col)
-        else:
-            df = pandas.read_sql(sql, con, index_col=index_col, **kwargs)
+        if num_splits is None:
+            return df
         if index_col is None:
             index = len(df)
         else:
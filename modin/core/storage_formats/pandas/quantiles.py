@@ -0,0 +1,692 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Contains implementations for distributed quantiles."""
+
+from __future__ import annotations
+
+from functools import reduce
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas
+
+from modin.config import QuantileSketchSize
+
+if TYPE_CHECKING:
+    from modin.core.storage_formats.pandas.query_compiler import PandasQueryCompiler
+
+
+class QuantileSketch:
+    """
+    Mergeable summary of the sorted non-NaN values of a column.
+
+    The sketch keeps some of the values of the column together with the bounds of
+    their ranks: ``lower[i]`` is not greater than the number of values less than
+    ``values[i]`` and ``upper[i]`` is not less than the number of values less than
+    or equal to ``values[i]``. The minimum and the maximum are always kept.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The kept values, sorted and unique.
+    lower : np.ndarray
+        The lower bounds of the ranks of the values.
+    upper : np.ndarray
+        The upper bounds of the ranks of the values.
+    count : int
+        The number of non-NaN values of the column.
+    nan_count : int
+        The number of NaN values of the column.
+    """
+
+    __slots__ = ("values", "lower", "upper", "count", "nan_count")
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        count: int,
+        nan_count: int,
+    ):
+        self.values = values
+        self.lower = lower
+        self.upper = upper
+        self.count = count
+        self.nan_count = nan_count
+
+    @classmethod
+    def from_values(cls, values: np.ndarray, size: int) -> QuantileSketch:
+        """
+        Build the sketch of a column, the ranks of the kept values are exact.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of the column.
+        size : int
+            The maximum number of values to keep.
+
+        Returns
+        -------
+        QuantileSketch
+        """
+        nan_mask = pandas.isna(values)
+        nan_count = int(nan_mask.sum())
+        if nan_count:
+            values = values[~nan_mask]
+        values = np.sort(values)
+        count = len(values)
+        if count > size:
+            points = np.unique(
+                values[np.linspace(0, count - 1, size).round().astype(np.int64)]
+            )
+        else:
+            points = np.unique(values)
+        return cls(
+            points,
+            np.searchsorted(values, points, side="left"),
+            np.searchsorted(values, points, side="right"),
+            count,
+            nan_count,
+        )
+
+    def rank_bounds(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the bounds of the ranks the passed values would have in the column.
+
+        Parameters
+        ----------
+        points : np.ndarray
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The lower bounds of the number of values less than the points and
+            the upper bounds of the number of values less than or equal to them.
+        """
+        left = np.searchsorted(self.values, points, side="left")
+        right = np.searchsorted(self.values, points, side="right")
+        # a kept value less than the point is counted together with the ones before it,
+        # the ones greater than the point bound the number of values up to the point
+        lower = np.concatenate([[-1], self.lower])[left] + 1
+        upper = np.concatenate([self.upper, [self.count + 1]])[right] - 1
+        equal = right > left
+        lower[equal] = np.maximum(lower[equal], self.lower[left[equal]])
+        upper[equal] = np.minimum(upper[equal], self.upper[left[equal]])
+        return lower, upper
+
+    def merge(self, other: QuantileSketch, size: int) -> QuantileSketch:
+        """
+        Build the sketch of the concatenation of the columns summarized by the sketches.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+        size : int
+            The maximum number of values to keep.
+
+        Returns
+        -------
+        QuantileSketch
+        """
+        points = np.unique(np.concatenate([self.values, other.values]))
+        self_lower, self_upper = self.rank_bounds(points)
+        other_lower, other_upper = other.rank_bounds(points)
+        # the bounds of the greater values can't be tighter than the ones of the less values
+        lower = np.maximum.accumulate(self_lower + other_lower)
+        upper = np.minimum.accumulate((self_upper + other_upper)[::-1])[::-1]
+        return QuantileSketch(
+            points,
+            lower,
+            upper,
+            self.count + other.count,
+            self.nan_count + other.nan_count,
+        ).compact(size)
+
+    def compact(self, size: int) -> QuantileSketch:
+        """
+        Keep at most about `size` values evenly spread over the ranks.
+
+        Parameters
+        ----------
+        size : int
+
+        Returns
+        -------
+        QuantileSketch
+        """
+        if len(self.values) <= size:
+            return self
+        targets = np.linspace(0, self.count - 1, size)
+        kept = np.unique(
+            np.concatenate(
+                [
+                    [0, len(self.values) - 1],
+                    np.minimum(
+                        np.searchsorted(self.upper, targets, side="right"),
+                        len(self.values) - 1,
+                    ),
+                ]
+            )
+        )
+        return QuantileSketch(
+            self.values[kept],
+            self.lower[kept],
+            self.upper[kept],
+            self.count,
+            self.nan_count,
+        )
+
+    def bracket(self, rank: int) -> Tuple[Optional[object], Optional[object]]:
+        """
+        Get the kept values the value at `rank` is guaranteed to be between.
+
+        Parameters
+        ----------
+        rank : int
+            Zero-based position of the value in the sorted column.
+
+        Returns
+        -------
+        tuple
+            The lower and the upper bounds, None when the value is not bounded.
+        """
+        low = np.searchsorted(self.upper, rank + 1, side="right") - 1
+        high = np.searchsorted(self.lower, rank, side="left")
+        return (
+            self.values[low] if low >= 0 else None,
+            self.values[high] if high < len(self.values) else None,
+        )
+
+    def estimate(self, rank: int) -> Tuple[object, int]:
+        """
+        Get the kept value whose rank is the closest to `rank`.
+
+        Parameters
+        ----------
+        rank : int
+            Zero-based position of the value in the sorted column.
+
+        Returns
+        -------
+        tuple
+            The value and the upper bound of the difference between its rank and `rank`.
+        """
+        errors = np.maximum(np.abs(rank - self.lower), np.abs(self.upper - 1 - rank))
+        best = np.argmin(errors)
+        return self.values[best], int(errors[best])
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Interpolate between `a` and `b` the same way ``numpy.percentile`` does.
+
+    Parameters
+    ----------
+    a : np.ndarray
+    b : np.ndarray
+    t : np.ndarray
+
+    Returns
+    -------
+    np.ndarray
+    """
+    with np.errstate(invalid="ignore"):
+        diff_b_a = np.subtract(b, a)
+        result = np.asanyarray(np.add(a, diff_b_a * t))
+        np.subtract(
+            b,
+            diff_b_a * (1 - t),
+            out=result,
+            where=t >= 0.5,
+            casting="unsafe",
+            dtype=type(result.dtype),
+        )
+    return result
+
+
+def _map_to_series(func, df: pandas.DataFrame) -> pandas.Series:
+    """
+    Apply `func` to the values of every column of `df`.
+
+    Parameters
+    ----------
+    func : callable(label, np.ndarray) -> object
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.Series
+        The results of `func` stored as objects.
+    """
+    result = np.empty(len(df.columns), dtype=object)
+    for i, label in enumerate(df.columns):
+        result[i] = func(label, df.iloc[:, i].to_numpy())
+    return pandas.Series(result, index=df.columns, dtype=object)
+
+
+def _reduce_to_series(func, df: pandas.DataFrame) -> pandas.Series:
+    """
+    Reduce the objects of every column of `df` with `func`.
+
+    Parameters
+    ----------
+    func : callable(object, object) -> object
+    df : pandas.DataFrame
+
+    Returns
+    -------
+    pandas.Series
+    """
+    result = np.empty(len(df.columns), dtype=object)
+    for i in range(len(df.columns)):
+        result[i] = reduce(func, df.iloc[:, i])
+    return pandas.Series(result, index=df.columns, dtype=object)
+
+
+class QuantileImpl:
+    """
+    Provide implementations for quantiles computed over the row partitions.
+
+    Every row partition summarizes its columns with a ``QuantileSketch``, the sketches
+    are merged with a tree reduction. With ``QuantileSketchSize`` set the quantiles are
+    answered from the merged sketches, otherwise the sketches bound the values at the
+    ranks of interest and the second pass only gathers the values between the bounds.
+    """
+
+    # the number of values kept by the sketches of the exact quantiles
+    _exact_sketch_size = 1024
+    # the interpolation methods the quantiles can be computed with, the other ones
+    # of ``numpy.percentile`` are left to pandas
+    interpolations = ("linear", "lower", "higher", "midpoint", "nearest")
+
+    @classmethod
+    def can_apply(cls, query_compiler: PandasQueryCompiler) -> bool:
+        """
+        Check whether the quantiles of the frame can be computed over the row partitions.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+
+        Returns
+        -------
+        bool
+        """
+        modin_frame = query_compiler._modin_frame
+        if QuantileSketchSize.get() == 0 and modin_frame._partitions.shape[0] < 2:
+            # a single row partition is computed in place anyway
+            return False
+        if (
+            len(query_compiler.columns) == 0
+            or not query_compiler.columns.is_unique
+            or len(query_compiler.index) == 0
+        ):
+            return False
+        return all(
+            isinstance(dtype, np.dtype) and (dtype.kind in "iu" or dtype == np.float64)
+            for dtype in query_compiler.dtypes
+        )
+
+    @classmethod
+    def _build_sketches(
+        cls, query_compiler: PandasQueryCompiler, size: int
+    ) -> pandas.Series:
+        """
+        Build the sketches of the columns.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        size : int
+            The maximum number of values kept by the sketches.
+
+        Returns
+        -------
+        pandas.Series
+            The sketches indexed by the column labels.
+        """
+        sketches = query_compiler._modin_frame.tree_reduce(
+            0,
+            lambda df: _map_to_series(
+                lambda label, values: QuantileSketch.from_values(values, size), df
+            ),
+            lambda df: _reduce_to_series(
+                lambda left, right: left.merge(right, size), df
+            ),
+            dtypes="object",
+        )
+        return query_compiler.__constructor__(sketches).to_pandas().iloc[0]
+
+    @classmethod
+    def _gather(
+        cls,
+        query_compiler: PandasQueryCompiler,
+        brackets: Dict[Hashable, List[Tuple[Optional[object], Optional[object]]]],
+    ) -> pandas.Series:
+        """
+        Gather the values of every column between each pair of its bounds.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        brackets : dict
+            The lower and the upper bounds for the column labels, None means unbounded.
+
+        Returns
+        -------
+        pandas.Series
+            A list for every column with a tuple per its bracket: the number of values
+            less than the lower bound, the number of values equal to it, the sorted
+            values between the bounds and the number of values equal to the upper bound.
+        """
+
+        def gather(label, values):
+            result = []
+            for low, high in brackets.get(label, []):
+                mask = ~pandas.isna(values)
+                less = equal_low = equal_high = 0
+                if low is not None:
+                    less = int((values < low).sum())
+                    equal_low = int((values == low).sum())
+                    mask &= values > low
+                if high is not None:
+                    if high != low:
+                        equal_high = int((values == high).sum())
+                    mask &= values < high
+                result.append((less, equal_low, values[mask], equal_high))
+            return result
+
+        def combine(left, right):
+            return [
+                (
+                    left_less + right_less,
+                    left_low + right_low,
+                    np.concatenate([left_values, right_values]),
+                    left_high + right_high,
+                )
+                for (left_less, left_low, left_values, left_high), (
+                    right_less,
+                    right_low,
+                    right_values,
+                    right_high,
+                ) in zip(left, right)
+            ]
+
+        gathered = query_compiler._modin_frame.tree_reduce(
+            0,
+            lambda df: _map_to_series(gather, df),
+            lambda df: _reduce_to_series(combine, df),
+            dtypes="object",
+        )
+        return query_compiler.__constructor__(gathered).to_pandas().iloc[0]
+
+    @classmethod
+    def _select(
+        cls,
+        query_compiler: PandasQueryCompiler,
+        ranks: Dict[Hashable, np.ndarray],
+        sketches: pandas.Series,
+    ) -> Dict[Hashable, np.ndarray]:
+        """
+        Get the values at the passed ranks of the sorted non-NaN values of every column.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        ranks : dict
+            Zero-based ranks for every column label, the ranks must exist.
+        sketches : pandas.Series
+            The sketches of the columns.
+
+        Returns
+        -------
+        dict
+            The values for every column label.
+        """
+        if QuantileSketchSize.get() > 0:
+            return {
+                label: np.array(
+                    [sketches[label].estimate(rank)[0] for rank in column_ranks],
+                    dtype=sketches[label].values.dtype,
+                )
+                for label, column_ranks in ranks.items()
+            }
+
+        if not ranks:
+            return {}
+        brackets = {
+            label: [sketches[label].bracket(rank) for rank in column_ranks]
+            for label, column_ranks in ranks.items()
+        }
+        gathered = cls._gather(query_compiler, brackets)
+        result = {}
+        for label, column_ranks in ranks.items():
+            values = []
+            for rank, (low, high), (less, equal_low, between, equal_high) in zip(
+                column_ranks, brackets[label], gathered[label]
+            ):
+                position = rank - less
+                if position < equal_low:
+                    values.append(low)
+                    continue
+                position -= equal_low
+                if position < len(between):
+                    values.append(np.partition(between, position)[position])
+                else:
+                    assert position - len(between) < equal_high
+                    values.append(high)
+            result[label] = np.array(values, dtype=sketches[label].values.dtype)
+        return result
+
+    @classmethod
+    def _quantiles(
+        cls,
+        query_compiler: PandasQueryCompiler,
+        q: np.ndarray,
+        interpolation: str,
+        sketches: pandas.Series,
+    ) -> Dict[Hashable, np.ndarray]:
+        """
+        Compute the quantiles of every column the way ``numpy.percentile`` does.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        q : np.ndarray
+            The quantiles to compute.
+        interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}
+        sketches : pandas.Series
+            The sketches of the columns.
+
+        Returns
+        -------
+        dict
+            The quantiles for every column label, NaN for the columns with no values.
+        """
+        # ``pandas`` passes percents to ``numpy.percentile`` that divides them back
+        q = np.true_divide(np.asarray(q, dtype=np.float64) * 100.0, 100)
+        ranks = {}
+        for label in query_compiler.columns:
+            count = sketches[label].count
+            if count == 0:
+                continue
+            index = (count - 1) * q
+            previous = np.floor(index).astype(np.int64)
+            ranks[label] = np.concatenate(
+                [previous, np.minimum(previous + 1, count - 1)]
+            )
+        values = cls._select(query_compiler, ranks, sketches)
+
+        result = {}
+        for label in query_compiler.columns:
+            if label not in values:
+                result[label] = np.full(len(q), np.nan)
+                continue
+            count = sketches[label].count
+            index = (count - 1) * q
+            previous_values, next_values = np.split(values[label], 2)
+            gamma = index - np.floor(index)
+            if interpolation == "linear":
+                column = _lerp(previous_values, next_values, gamma)
+            elif interpolation == "lower":
+                column = previous_values
+            elif interpolation == "higher":
+                column = np.where(gamma > 0, next_values, previous_values)
+            elif interpolation == "nearest":
+                column = np.where(
+                    np.around(index) > np.floor(index), next_values, previous_values
+                )
+            else:
+                # "midpoint", the method is validated by ``quantile``
+                column = _lerp(
+                    previous_values, next_values, np.where(gamma > 0, 0.5, 0.0)
+                )
+            result[label] = column
+        return result
+
+    @classmethod
+    def quantile(
+        cls, query_compiler: PandasQueryCompiler, q: np.ndarray, interpolation: str
+    ) -> pandas.DataFrame:
+        """
+        Compute the quantiles of the columns.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        q : np.ndarray
+            The quantiles to compute.
+        interpolation : {"linear", "lower", "higher", "midpoint", "nearest"}
+
+        Returns
+        -------
+        pandas.DataFrame
+            The frame indexed by `q`.
+        """
+        if interpolation not in cls.interpolations:
+            raise ValueError(
+                f"{interpolation!r} is not a valid method. Use one of: {cls.interpolations}"
+            )
+        sketches = cls._build_sketches(query_compiler, cls._get_sketch_size())
+        values = cls._quantiles(query_compiler, q, interpolation, sketches)
+        keep_dtype = interpolation in ("lower", "higher", "nearest")
+        return pandas.DataFrame(
+            {
+                i: (
+                    values[label].astype(dtype)
+                    if keep_dtype and dtype.kind in "iu"
+                    else values[label].astype(np.float64)
+                )
+                for i, (label, dtype) in enumerate(query_compiler.dtypes.items())
+            },
+            index=pandas.Index(q),
+        ).set_axis(query_compiler.columns, axis=1)
+
+    @classmethod
+    def median(
+        cls, query_compiler: PandasQueryCompiler, skipna: bool = True
+    ) -> pandas.Series:
+        """
+        Compute the medians of the columns.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        skipna : bool, default: True
+            Whether to exclude NaN values, otherwise the columns with them get NaN.
+
+        Returns
+        -------
+        pandas.Series
+        """
+        sketches = cls._build_sketches(query_compiler, cls._get_sketch_size())
+        ranks = {
+            label: np.array(
+                [(sketch.count - 1) // 2, sketch.count // 2], dtype=np.int64
+            )
+            for label, sketch in sketches.items()
+            if sketch.count > 0 and (skipna or sketch.nan_count == 0)
+        }
+        values = cls._select(query_compiler, ranks, sketches)
+        return pandas.Series(
+            [
+                (values[label].astype(np.float64).mean() if label in values else np.nan)
+                for label in query_compiler.columns
+            ],
+            index=query_compiler.columns,
+            dtype=np.float64,
+        )
+
+    @classmethod
+    def describe(
+        cls,
+        query_compiler: PandasQueryCompiler,
+        percentiles: np.ndarray,
+        new_index: pandas.Index,
+    ) -> pandas.DataFrame:
+        """
+        Describe the numeric columns.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        percentiles : np.ndarray
+            The percentiles to include.
+        new_index : pandas.Index
+            The index of the result.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        sketches = cls._build_sketches(query_compiler, cls._get_sketch_size())
+        quantiles = cls._quantiles(query_compiler, percentiles, "linear", sketches)
+        # ``pandas`` sums the integers as floats, so do the partitions
+        means = (
+            query_compiler.astype(np.float64)
+            .mean(axis=0, skipna=True, numeric_only=False)
+            .to_pandas()
+        )
+        stds = query_compiler.std(
+            axis=0, skipna=True, ddof=1, numeric_only=False
+        ).to_pandas()
+        columns = {}
+        for i, label in enumerate(query_compiler.columns):
+            sketch = sketches[label]
+            bounds = (
+                sketch.values[[0, -1]] if sketch.count > 0 else np.array([np.nan] * 2)
+            )
+            columns[i] = np.concatenate(
+                [
+                    [sketch.count, means.iloc[0, i], stds.iloc[0, i], bounds[0]],
+                    quantiles[label],
+                    [bounds[1]],
+                ]
+            ).astype(np.float64)
+        return pandas.DataFrame(columns, index=new_index).set_axis(
+            query_compiler.columns, axis=1
+        )
+
+    @classmethod
+    def _get_sketch_size(cls) -> int:
+        """
+        Get the number of values the sketches keep.
+
+        Returns
+        -------
+        int
+        """
+        return QuantileSketchSize.get() or cls._exact_sketch_size
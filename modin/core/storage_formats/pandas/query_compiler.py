@@ -30,6 +30,7 @@ from typing import TYPE_CHECKING, Hashable, List, Optional
 import numpy as np
 import pandas
 from pandas._libs import lib
+from pandas._typing import IndexLabel, Suffixes
 from pandas.api.types import is_scalar
 from pandas.core.apply import reconstruct_func
 from pandas.core.common import is_bool_indexer
@@ -45,7 +46,7 @@ from pandas.core.indexes.api import ensure_index_from_sequences
 from pandas.core.indexing import check_bool_indexer
 from pandas.errors import DataError
 
-from modin.config import CpuCount, RangePartitioning
+from modin.config import BroadcastSizeLimit, CpuCount, RangePartitioning
 from modin.core.dataframe.algebra import (
     Binary,
     Fold,
@@ -59,6 +60,7 @@ from modin.core.dataframe.algebra.default2pandas.groupby import (
     GroupByDefault,
     SeriesGroupByDefault,
 )
+from modin.core.dataframe.pandas.dataframe.utils import ShuffleHashFunctions
 from modin.core.dataframe.pandas.metadata import (
     DtypesDescriptor,
     ModinDtypes,
@@ -80,7 +82,9 @@ from modin.utils import (
 from .aggregations import CorrCovBuilder
 from .groupby import GroupbyReduceImpl, PivotTableImpl
 from .merge import MergeImpl
+from .quantiles import QuantileImpl
 from .utils import get_group_names, merge_partitioning
+from .window import CumulativeImpl, EwmImpl, ExpandingImpl, RollingImpl
 
 if TYPE_CHECKING:
     from modin.core.dataframe.pandas.dataframe.dataframe import PandasDataframe
@@ -583,8 +587,53 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
                     + "\nFalling back to a row-axis implementation."
                 )
                 get_logger().info(message)
+        elif MergeImpl.choose_strategy(self, right, kwargs) == "hash_partitioning":
+            try:
+                return MergeImpl.hash_partitioning_merge(self, right, kwargs)
+            except NotImplementedError as e:
+                message = (
+                    f"Can't use hash-partitioning merge implementation because of: {e}"
+                    + "\nFalling back to a row-axis implementation."
+                )
+                get_logger().info(message)
         return MergeImpl.row_axis_merge(self, right, kwargs)
 
+    def merge_asof(
+        self,
+        right: PandasQueryCompiler,
+        left_on: Optional[IndexLabel] = None,
+        right_on: Optional[IndexLabel] = None,
+        left_index: bool = False,
+        right_index: bool = False,
+        left_by=None,
+        right_by=None,
+        suffixes: Suffixes = ("_x", "_y"),
+        tolerance=None,
+        allow_exact_matches: bool = True,
+        direction: str = "backward",
+    ):
+        kwargs = {
+            "left_on": left_on,
+            "right_on": right_on,
+            "left_index": left_index,
+            "right_index": right_index,
+            "left_by": left_by,
+            "right_by": right_by,
+            "suffixes": suffixes,
+            "tolerance": tolerance,
+            "allow_exact_matches": allow_exact_matches,
+            "direction": direction,
+        }
+        try:
+            return MergeImpl.range_aligned_merge_asof(self, right, kwargs)
+        except NotImplementedError as e:
+            message = (
+                f"Can't use range-aligned merge_asof implementation because of: {e}"
+                + "\nFalling back to the implementation gathering the keys."
+            )
+            get_logger().info(message)
+        return super().merge_asof(right, **kwargs)
+
     def join(self, right: PandasQueryCompiler, **kwargs) -> PandasQueryCompiler:
         on = kwargs.get("on", None)
         how = kwargs.get("how", "left")
@@ -1023,6 +1072,16 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
     def median(self, axis, **kwargs):
         if axis is None:
             return self.default_to_pandas(pandas.DataFrame.median, axis=axis, **kwargs)
+        if (
+            axis == 0
+            and set(kwargs).issubset({"skipna", "numeric_only"})
+            and QuantileImpl.can_apply(self)
+        ):
+            result = QuantileImpl.median(self, skipna=kwargs.get("skipna", True))
+            return self.from_pandas(
+                result.to_frame(MODIN_UNNAMED_SERIES_LABEL).T,
+                data_cls=type(self._modin_frame),
+            )
         return Reduce.register(pandas.DataFrame.median)(self, axis=axis, **kwargs)
 
     def nunique(self, axis=0, dropna=True):
@@ -1075,7 +1134,23 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
     var = Reduce.register(pandas.DataFrame.var)
     sum_min_count = Reduce.register(pandas.DataFrame.sum)
     prod_min_count = Reduce.register(pandas.DataFrame.prod)
-    quantile_for_single_value = Reduce.register(pandas.DataFrame.quantile)
+
+    def quantile_for_single_value(self, **kwargs):
+        if (
+            kwargs.get("axis", 0) == 0
+            and kwargs.get("method", "single") == "single"
+            and kwargs.get("interpolation", "linear") in QuantileImpl.interpolations
+            and QuantileImpl.can_apply(self)
+        ):
+            result = QuantileImpl.quantile(
+                self,
+                np.array([kwargs["q"]]),
+                kwargs.get("interpolation", "linear"),
+            )
+            result = result.astype(find_common_type(list(result.dtypes)))
+            result.index = [MODIN_UNNAMED_SERIES_LABEL]
+            return self.from_pandas(result, data_cls=type(self._modin_frame))
+        return Reduce.register(pandas.DataFrame.quantile)(self, **kwargs)
 
     def to_datetime(self, *args, **kwargs):
         if len(self.columns) == 1:
@@ -1391,33 +1466,13 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         )
         return self.__constructor__(new_modin_frame)
 
-    expanding_sum = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).sum(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_sum = ExpandingImpl.build_qc_method("sum")
 
-    expanding_min = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).min(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_min = ExpandingImpl.build_qc_method("min")
 
-    expanding_max = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).max(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_max = ExpandingImpl.build_qc_method("max")
 
-    expanding_mean = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).mean(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_mean = ExpandingImpl.build_qc_method("mean")
 
     expanding_median = Fold.register(
         lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
@@ -1426,26 +1481,11 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         shape_preserved=True,
     )
 
-    expanding_var = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).var(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_var = ExpandingImpl.build_qc_method("var")
 
-    expanding_std = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).std(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_std = ExpandingImpl.build_qc_method("std")
 
-    expanding_count = Fold.register(
-        lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
-            df.expanding(*expanding_args).count(*args, **kwargs)
-        ),
-        shape_preserved=True,
-    )
+    expanding_count = ExpandingImpl.build_qc_method("count")
 
     def expanding_cov(
         self,
@@ -1584,18 +1624,40 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         shape_preserved=True,
     )
 
-    window_mean = Fold.register(
+    def ewm_aggregate(self, axis, ewm_kwargs, func, *args, **kwargs):
+        new_modin_frame = self._modin_frame.apply_full_axis(
+            axis,
+            lambda df: pandas.DataFrame(
+                df.ewm(**ewm_kwargs).aggregate(func=func, *args, **kwargs)
+            ),
+            new_index=self.index,
+        )
+        return self.__constructor__(new_modin_frame)
+
+    ewm_mean = EwmImpl.build_qc_method("mean")
+
+    ewm_sum = EwmImpl.build_qc_method("sum")
+
+    ewm_var = EwmImpl.build_qc_method("var")
+
+    ewm_std = EwmImpl.build_qc_method("std")
+
+    ewm_cov = EwmImpl.build_pairwise_qc_method("cov")
+
+    ewm_corr = EwmImpl.build_pairwise_qc_method("corr")
+
+    window_mean = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).mean(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    window_sum = Fold.register(
+    window_sum = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).sum(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
+    # pandas computes weighted variance with an online algorithm, which results
+    # depend on the preceding windows, so it can't be computed row-partition-wise
     window_var = Fold.register(
         lambda df, rolling_kwargs, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).var(ddof=ddof, *args, **kwargs)
@@ -1608,73 +1670,62 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         ),
         shape_preserved=True,
     )
-    rolling_count = Fold.register(
+    rolling_count = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).count()
         ),
-        shape_preserved=True,
     )
-    rolling_sum = Fold.register(
+    rolling_sum = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).sum(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_sem = Fold.register(
+    rolling_sem = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).sem(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_mean = Fold.register(
+    rolling_mean = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).mean(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_median = Fold.register(
+    rolling_median = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).median(**kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_var = Fold.register(
+    rolling_var = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).var(ddof=ddof, *args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_std = Fold.register(
+    rolling_std = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).std(ddof=ddof, *args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_min = Fold.register(
+    rolling_min = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).min(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_max = Fold.register(
+    rolling_max = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, *args, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).max(*args, **kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_skew = Fold.register(
+    rolling_skew = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).skew(**kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_kurt = Fold.register(
+    rolling_kurt = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).kurt(**kwargs)
         ),
-        shape_preserved=True,
     )
-    rolling_apply = Fold.register(
+    rolling_apply = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, func, raw, engine, engine_kwargs, args, kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).apply(
                 func=func,
@@ -1685,17 +1736,15 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
                 kwargs=kwargs,
             ),
         ),
-        shape_preserved=True,
     )
-    rolling_quantile = Fold.register(
+    rolling_quantile = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, q, interpolation, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).quantile(
                 q=q, interpolation=interpolation, **kwargs
             ),
         ),
-        shape_preserved=True,
     )
-    rolling_rank = Fold.register(
+    rolling_rank = RollingImpl.build_qc_method(
         lambda df, rolling_kwargs, method, ascending, pct, numeric_only, **kwargs: pandas.DataFrame(
             df.rolling(**rolling_kwargs).rank(
                 method=method,
@@ -1705,7 +1754,6 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
                 **kwargs,
             ),
         ),
-        shape_preserved=True,
     )
 
     def rolling_corr(self, axis, rolling_kwargs, other, pairwise, *args, **kwargs):
@@ -1926,15 +1974,18 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
     def isin(self, values, ignore_indices=False):
         shape_hint = self._shape_hint
         if isinstance(values, type(self)):
-            # HACK: if we don't cast to pandas, then the execution engine will try to
-            # propagate the distributed Series to workers and most likely would have
-            # some performance problems.
-            # TODO: A better way of doing so could be passing this `values` as a query compiler
-            # and broadcast accordingly.
-            values = values.to_pandas()
-            if ignore_indices:
-                # Pandas logic is that it ignores indexing if 'values' is a 1D object
-                values = values.squeeze(axis=1)
+            if ignore_indices and shape_hint == "column":
+                if self._can_semi_join(values):
+                    return self._isin_semi_join(values)
+                values = self._collect_unique_values(values)
+            else:
+                # HACK: if we don't cast to pandas, then the execution engine will try to
+                # propagate the distributed Series to workers and most likely would have
+                # some performance problems.
+                values = values.to_pandas()
+                if ignore_indices:
+                    # Pandas logic is that it ignores indexing if 'values' is a 1D object
+                    values = values.squeeze(axis=1)
 
         def isin_func(df, values):
             if shape_hint == "column":
@@ -1950,6 +2001,85 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
             self, values
         )
 
+    def _can_semi_join(self, values):
+        """
+        Check whether ``isin`` of `values` should shuffle both frames instead of broadcasting `values`.
+
+        Parameters
+        ----------
+        values : PandasQueryCompiler
+            Single-column query compiler holding the values to look up.
+
+        Returns
+        -------
+        bool
+        """
+        if values._modin_frame._estimate_nbytes() <= BroadcastSizeLimit.get() * 2**20:
+            return False
+        # the buckets of both frames are built by different workers, which is only correct
+        # for the types which equal values get equal hashes whatever process computes them
+        return ShuffleHashFunctions.are_hashed_alike(
+            self.dtypes.iloc[0], values.dtypes.iloc[0]
+        )
+
+    def _isin_semi_join(self, values):
+        """
+        Check whether the elements of a single-column `self` are in `values` by shuffling both frames.
+
+        The rows of both frames are split into buckets by the hashes of their values,
+        so every bucket of `self` only has to be looked up in the same bucket of `values`.
+
+        Parameters
+        ----------
+        values : PandasQueryCompiler
+            Single-column query compiler holding the values to look up.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+
+        def isin_bucket(df, values):  # pragma: no cover
+            return df.iloc[:, 0].isin(values.iloc[:, 0]).to_frame(df.columns[0])
+
+        new_modin_frame = self._modin_frame._apply_func_to_hash_partitioning(
+            isin_bucket,
+            new_columns=self._modin_frame.copy_columns_cache(),
+            dtypes=pandas.Series([np.dtype(bool)], index=self.columns),
+            other=values._modin_frame,
+        )
+        return self.__constructor__(new_modin_frame, shape_hint="column")
+
+    @staticmethod
+    def _collect_unique_values(values):
+        """
+        Collect the distinct values of a single-column query compiler.
+
+        The values are deduplicated in every partition in parallel, so that only
+        the distinct ones have to be transferred and broadcast to the workers.
+
+        Parameters
+        ----------
+        values : PandasQueryCompiler
+
+        Returns
+        -------
+        np.ndarray or pandas.api.extensions.ExtensionArray
+        """
+        frame = values._modin_frame
+        if frame._partitions.size == 0:
+            return values.to_pandas().squeeze(axis=1)
+        parts = frame._partition_mgr_cls.base_map_partitions(
+            frame._partitions, lambda df: df.drop_duplicates()
+        )
+        return (
+            pandas.concat(
+                frame._partition_mgr_cls.get_objects_from_partitions(parts.flatten())
+            )
+            .iloc[:, 0]
+            .unique()
+        )
+
     abs = Map.register(pandas.DataFrame.abs, dtypes="copy")
     map = Map.register(pandas.DataFrame.map)
     conj = Map.register(lambda df, *args, **kwargs: pandas.DataFrame(np.conj(df)))
@@ -2310,6 +2440,11 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
             .describe(percentiles, include="all")
         )
         new_index = empty_df.index
+        if QuantileImpl.can_apply(self):
+            return self.from_pandas(
+                QuantileImpl.describe(self, percentiles, new_index),
+                data_cls=type(self._modin_frame),
+            )
 
         def describe_builder(df, internal_indices=[]):  # pragma: no cover
             """Apply `describe` function to the subset of columns in a single partition."""
@@ -2343,15 +2478,135 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
     # that is being operated on. This means that we have to put all of that
     # data in the same place.
 
-    cummax = Fold.register(pandas.DataFrame.cummax, shape_preserved=True)
-    cummin = Fold.register(pandas.DataFrame.cummin, shape_preserved=True)
-    cumsum = Fold.register(pandas.DataFrame.cumsum, shape_preserved=True)
-    cumprod = Fold.register(pandas.DataFrame.cumprod, shape_preserved=True)
+    cummax = CumulativeImpl.build_qc_method("max")
+    cummin = CumulativeImpl.build_qc_method("min")
+    cumsum = CumulativeImpl.build_qc_method("sum")
+    cumprod = CumulativeImpl.build_qc_method("prod")
     _diff = Fold.register(pandas.DataFrame.diff, shape_preserved=True)
 
+    def _get_shift_halo_sizes(self, periods, freq=None):
+        """
+        Compute the number of neighbouring rows each row partition needs to be shifted by `periods`.
+
+        Parameters
+        ----------
+        periods : int
+            The number of periods to shift by.
+        freq : DateOffset, timedelta or str, optional
+            The frequency the row labels are shifted with. If specified, the rows
+            are aligned with the ones they're shifted to by the labels.
+
+        Returns
+        -------
+        list of (int, int) or None
+            The number of rows preceding and following each row partition that have to be
+            borrowed from the neighbouring partitions. None if the rows can't be aligned by
+            the labels row-partition-wise.
+        """
+        row_lengths = self._modin_frame.row_lengths
+        if freq is None:
+            # the halo is capped by the number of available rows when building
+            # partitions, so there's no need to compute it for each partition
+            return [(max(periods, 0), max(-periods, 0))] * len(row_lengths)
+        index = self.index
+        if (
+            not isinstance(index, (pandas.DatetimeIndex, pandas.TimedeltaIndex))
+            or not index.is_monotonic_increasing
+            or not index.is_unique
+        ):
+            return None
+        # pandas validates the frequency and shifts the labels, the empty frames
+        # aren't shifted so a series is used
+        shifted = pandas.Series(index=index, dtype="float64").shift(periods, freq=freq)
+        shifted = shifted.index
+        ends = np.cumsum(row_lengths)
+        starts = ends - np.array(row_lengths)
+        halo_sizes = []
+        for start, end in zip(starts, ends):
+            if start == end:
+                halo_sizes.append((0, 0))
+                continue
+            # the rows shifted to the labels of the partition
+            first = shifted.searchsorted(index[start], side="left")
+            last = shifted.searchsorted(index[end - 1], side="right")
+            halo_sizes.append((int(max(start - first, 0)), int(max(last - end, 0))))
+        return halo_sizes
+
     def diff(self, axis, periods):
+        if axis == 0:
+            return self.__constructor__(
+                self._modin_frame.map_with_halo(
+                    pandas.DataFrame.diff,
+                    self._get_shift_halo_sizes(periods),
+                    func_kwargs={"periods": periods},
+                )
+            )
         return self._diff(fold_axis=axis, axis=axis, periods=periods)
 
+    def shift(self, periods, freq, axis, fill_value):
+        if is_list_like(periods):
+            # every period gives its own shifted copy of the columns
+            return super().shift(periods, freq, axis, fill_value)
+        if freq is not None:
+            # only the labels are shifted, pandas validates the frequency
+            labels = pandas.Series(index=self.get_axis(axis), dtype="float64").shift(
+                periods, freq=freq
+            )
+            result = self.copy()
+            if axis == 0:
+                result.index = labels.index
+            else:
+                result.columns = labels.index
+            return result
+        if axis != 0:
+            return super().shift(periods, freq, axis, fill_value)
+        return self.__constructor__(
+            self._modin_frame.map_with_halo(
+                pandas.DataFrame.shift,
+                self._get_shift_halo_sizes(periods),
+                func_kwargs={"periods": periods, "fill_value": fill_value},
+            )
+        )
+
+    def pct_change(self, periods=1, fill_method=None, limit=None, freq=None, **kwargs):
+        axis = pandas.DataFrame._get_axis_number(kwargs.pop("axis", 0))
+        halo_sizes = None
+        if axis == 0 and len(kwargs) == 0:
+            if freq == "infer":
+                # resolve the frequency of the whole index rather than of the partitions
+                freq = (
+                    getattr(self.index, "freq", None)
+                    or getattr(self.index, "inferred_freq", None)
+                    or freq
+                )
+            halo_sizes = self._get_shift_halo_sizes(periods, freq)
+        if halo_sizes is None:
+            return super().pct_change(
+                periods=periods,
+                fill_method=fill_method,
+                limit=limit,
+                freq=freq,
+                axis=axis,
+                **kwargs,
+            )
+        data = self
+        if fill_method is not None:
+            fill = "bfill" if fill_method in ("bfill", "backfill") else "ffill"
+            data = self.__constructor__(
+                self._modin_frame.fold(
+                    0,
+                    lambda df: getattr(df, fill)(limit=limit),
+                    shape_preserved=True,
+                )
+            )
+        return self.__constructor__(
+            data._modin_frame.map_with_halo(
+                pandas.DataFrame.pct_change,
+                halo_sizes,
+                func_kwargs={"periods": periods, "fill_method": None, "freq": freq},
+            )
+        )
+
     def clip(self, lower, upper, **kwargs):
         if isinstance(lower, BaseQueryCompiler):
             lower = lower.to_pandas().squeeze(1)
@@ -2462,6 +2717,9 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
 
     def dot(self, other, squeeze_self=None, squeeze_other=None):
         if isinstance(other, PandasQueryCompiler):
+            result = self._blocked_dot(other, squeeze_self, squeeze_other)
+            if result is not None:
+                return result
             other = (
                 other.to_pandas().squeeze(axis=1)
                 if squeeze_other
@@ -2519,6 +2777,86 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         )
         return self.__constructor__(new_modin_frame)
 
+    def _blocked_dot(self, other, squeeze_self, squeeze_other):
+        """
+        Compute matrix multiplication of two query compilers block-wise.
+
+        Parameters
+        ----------
+        other : PandasQueryCompiler
+            The right operand.
+        squeeze_self : bool
+            Whether `self` is a Series (a single column) to be treated as a row vector.
+        squeeze_other : bool
+            Whether `other` is a Series (a single column).
+
+        Returns
+        -------
+        PandasQueryCompiler or None
+            The product, or None if the operands can't be multiplied block-wise
+            and the right operand has to be broadcast to the partitions of `self`.
+        """
+        # only plain numeric matrices can be multiplied block-wise and then summed up,
+        # the partial products of other types may differ from the product as a whole
+        if not all(
+            isinstance(dtype, np.dtype) and dtype.kind in "iufc"
+            for dtype in [*self.dtypes, *other.dtypes]
+        ):
+            return None
+        if squeeze_self:
+            # a series multiplied by a frame: the result is the transposed product
+            # of the frame and the series, so the frame becomes the left operand
+            left, right = other, self
+            contraction_labels, other_labels = other.index, self.index
+        else:
+            left, right = self, other
+            contraction_labels, other_labels = self.columns, other.index
+        if (
+            len(contraction_labels) == 0
+            or not contraction_labels.is_unique
+            or not other_labels.is_unique
+        ):
+            return None
+        if not contraction_labels.equals(other_labels):
+            # reindexing would fill the labels missing from either side with NaN
+            if len(contraction_labels) != len(other_labels) or not (
+                contraction_labels.isin(other_labels).all()
+            ):
+                raise ValueError("matrices are not aligned")
+            right = right.reindex(axis=0, labels=contraction_labels)
+
+        num_cols = len(other.columns)
+        if squeeze_self:
+            new_index = (
+                pandas.Index([MODIN_UNNAMED_SERIES_LABEL])
+                if num_cols == 1
+                else other.columns
+            )
+            new_columns = (
+                pandas.Index([MODIN_UNNAMED_SERIES_LABEL])
+                if num_cols == 1
+                else self.columns
+            )
+        else:
+            new_index = (
+                pandas.Index([MODIN_UNNAMED_SERIES_LABEL])
+                if len(self.columns) == 1 and len(self.index) == 1 and num_cols == 1
+                else self.index
+            )
+            new_columns = (
+                pandas.Index([MODIN_UNNAMED_SERIES_LABEL])
+                if squeeze_other or (num_cols == 1 and len(self.columns) > 1)
+                else other.columns
+            )
+        return self.__constructor__(
+            left._modin_frame.matmul(
+                right._modin_frame,
+                new_index,
+                new_columns,
+                transpose_self=bool(squeeze_self),
+            )
+        )
+
     def _nsort(self, n, columns=None, keep="first", sort_type="nsmallest"):
         """
         Return first N rows of the data sorted in the specified order.
@@ -2733,6 +3071,19 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         numeric_only = kwargs.get("numeric_only", True)
         assert isinstance(q, (pandas.Series, np.ndarray, pandas.Index, list, tuple))
 
+        if (
+            axis == 0
+            and kwargs.get("method", "single") == "single"
+            and kwargs.get("interpolation", "linear") in QuantileImpl.interpolations
+            and QuantileImpl.can_apply(self)
+        ):
+            return self.from_pandas(
+                QuantileImpl.quantile(
+                    self, np.asarray(q), kwargs.get("interpolation", "linear")
+                ),
+                data_cls=type(self._modin_frame),
+            )
+
         if numeric_only:
             new_columns = self._modin_frame.numeric_columns()
         else:
@@ -2774,9 +3125,104 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         result = self.__constructor__(new_modin_frame)
         return result.transpose() if axis == 1 else result
 
+    def _range_partitioning_rank(
+        self, method="average", na_option="keep", ascending=True, pct=False
+    ):
+        """
+        Compute numerical data ranks along the rows using range-partitioning.
+
+        Every column is range-partitioned by its values, the ranges are ranked
+        locally and shifted by the number of the values ranked before them.
+
+        Parameters
+        ----------
+        method : {"average", "min", "max", "first", "dense"}, default: "average"
+        na_option : {"keep", "top", "bottom"}, default: "keep"
+        ascending : bool, default: True
+        pct : bool, default: False
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+
+        def carry(df):  # pragma: no cover
+            if method == "dense":
+                count = df.nunique(dropna=na_option == "keep")
+            else:
+                count = df.count() if na_option == "keep" else len(df)
+            return pandas.DataFrame([[count]], columns=df.columns, dtype=np.float64)
+
+        def fixup(df, prefix=None):  # pragma: no cover
+            ranks = df.rank(method=method, na_option=na_option, ascending=ascending)
+            return ranks if prefix is None else ranks + prefix.iloc[0, 0]
+
+        columns = []
+        for i in range(len(self.columns)):
+            column = self._modin_frame.take_2d_labels_or_positional(col_positions=[i])
+            ranks = column._apply_scan_to_range_partitioning(
+                column.columns[0],
+                carry,
+                lambda prefix, carry: prefix + carry,
+                fixup,
+                ascending=ascending,
+                new_columns=column.copy_columns_cache(),
+                dtypes=pandas.Series([np.float64], index=column.columns),
+                # the NaNs are ranked together with the values of a range at the edge
+                na_position="first" if na_option == "top" else "last",
+            )
+            columns.append(ranks)
+        result = self.__constructor__(
+            columns[0]
+            if len(columns) == 1
+            else columns[0].concat(1, columns[1:], how="left", sort=False)
+        )
+        if pct:
+            # the number of the values ranked or the highest dense rank
+            denominators = (
+                (result.max(axis=0) if method == "dense" else result.count(axis=0))
+                .to_pandas()
+                .iloc[0]
+            )
+            result = result.__constructor__(
+                result._modin_frame.map(
+                    lambda df: df / denominators[df.columns], dtypes="copy"
+                )
+            )
+        return result
+
     def rank(self, **kwargs):
         axis = kwargs.get("axis", 0)
         numeric_only = True if axis else kwargs.get("numeric_only", False)
+        if RangePartitioning.get() and len(self.columns) > 0:
+            unsupported_message = ""
+            if axis != 0:
+                unsupported_message += (
+                    "Range-partitioning 'rank()' is only supported for 'axis=0'.\n"
+                )
+            if not self.columns.is_unique:
+                unsupported_message += "Range-partitioning 'rank()' is only supported for unique column labels.\n"
+            if not all(
+                isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+                for dtype in self.dtypes
+            ):
+                unsupported_message += "Range-partitioning 'rank()' is only supported for integer and float columns.\n"
+
+            if len(unsupported_message) == 0:
+                return self._range_partitioning_rank(
+                    **{
+                        key: value
+                        for key, value in kwargs.items()
+                        if key in ("method", "na_option", "ascending", "pct")
+                    }
+                )
+            message = (
+                f"Can't use range-partitioning implementation for 'rank' because:\n{unsupported_message}"
+                + "Falling back to a full-axis implementation."
+            )
+            get_logger().info(message)
+            ErrorMessage.warn(message)
+
         new_modin_frame = self._modin_frame.apply_full_axis(
             axis,
             lambda df: df.rank(**kwargs),
@@ -2798,6 +3244,8 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         kwargs["inplace"] = False
 
         if level is not None or self.has_multiindex(axis=axis):
+            if self._can_sort_index_by_levels(axis, level, kwargs):
+                return self._sort_index_by_levels(axis, level, sort_remaining, **kwargs)
             return self.default_to_pandas(
                 pandas.DataFrame.sort_index,
                 axis=axis,
@@ -2830,6 +3278,129 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
         )
         return self.__constructor__(new_modin_frame)
 
+    def _can_sort_index_by_levels(self, axis, level, kwargs):
+        """
+        Check whether ``sort_index`` by the index levels can be executed without defaulting to pandas.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            Axis to sort.
+        level : int, label, list of ints or labels, or None
+            Levels to sort by, None means all the levels.
+        kwargs : dict
+            Other arguments of ``sort_index``.
+
+        Returns
+        -------
+        bool
+        """
+        if kwargs.get("key") is not None:
+            return False
+        if axis == 0 and (len(self.columns) == 0 or len(self.index) == 0):
+            return False
+        if axis == 0:
+            if level is None:
+                first_level = 0
+            elif is_list_like(level):
+                first_level = level[0] if len(level) else None
+            else:
+                first_level = level
+            if first_level is not None:
+                try:
+                    first_level_dtype = self.index.get_level_values(first_level).dtype
+                except (KeyError, IndexError):
+                    # let pandas raise the error for the unknown level
+                    return False
+                # the ranges are cut by the label values while a categorical level
+                # is sorted by the order of its categories, so let pandas sort it
+                if isinstance(first_level_dtype, pandas.CategoricalDtype):
+                    return False
+        ascending = kwargs.get("ascending", True)
+        if is_list_like(ascending):
+            num_levels = (
+                self.get_axis(axis).nlevels
+                if level is None
+                else len(level) if is_list_like(level) else 1
+            )
+            # let pandas raise the error for the mismatched flags
+            return len(ascending) == num_levels
+        return True
+
+    def _sort_index_by_levels(self, axis, level, sort_remaining, **kwargs):
+        """
+        Sort the labels along the `axis` by the index levels.
+
+        The columns are reordered by the positions the column labels get after sorting.
+        The rows are range-partitioned by the first level to sort by, the ranges
+        are then sorted in parallel by all the levels.
+
+        Parameters
+        ----------
+        axis : {0, 1}
+            Axis to sort.
+        level : int, label, list of ints or labels, or None
+            Levels to sort by, None means all the levels.
+        sort_remaining : bool
+            Whether to sort by the other levels after the specified ones.
+        **kwargs : dict
+            Other arguments of ``sort_index``.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+        kwargs.pop("key", None)
+        ignore_index = kwargs.pop("ignore_index", False)
+        ascending = kwargs.pop("ascending", True)
+        if ascending is None:
+            ascending = False
+        labels = self.get_axis(axis)
+        if level is None:
+            levels = list(range(labels.nlevels))
+        else:
+            levels = [
+                labels._get_level_number(lvl)
+                for lvl in (level if is_list_like(level) else [level])
+            ]
+
+        if axis:
+            order = pandas.Series(np.arange(len(labels)), index=labels).sort_index(
+                level=level,
+                ascending=ascending,
+                sort_remaining=sort_remaining,
+                **kwargs,
+            )
+            result = self.__constructor__(
+                self._modin_frame.take_2d_labels_or_positional(
+                    col_positions=order.to_numpy()
+                )
+            )
+            if ignore_index:
+                result.columns = pandas.RangeIndex(len(labels))
+            return result
+
+        def sort_function(df):  # pragma: no cover
+            return df.sort_index(
+                level=level,
+                ascending=ascending,
+                sort_remaining=sort_remaining,
+                **kwargs,
+            )
+
+        new_modin_frame = self._modin_frame._apply_func_to_range_partitioning(
+            key_columns=None,
+            func=sort_function,
+            ascending=ascending[0] if is_list_like(ascending) else ascending,
+            preserve_columns=True,
+            level=levels[:1],
+            na_position=kwargs.get("na_position", "last"),
+        )
+        new_modin_frame.set_dtypes_cache(self._modin_frame.copy_dtypes_cache())
+        if ignore_index:
+            new_modin_frame.index = pandas.RangeIndex(len(labels))
+        return self.__constructor__(new_modin_frame)
+
     def melt(
         self,
         id_vars=None,
@@ -3282,13 +3853,14 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
             )
         else:
             hashed_modin_frame = self._modin_frame
-        new_modin_frame = hashed_modin_frame.apply_full_axis(
-            axis=0,
-            func=_compute_duplicated,
-            new_index=self._modin_frame.copy_index_cache(),
-            new_columns=[MODIN_UNNAMED_SERIES_LABEL],
-            dtypes=np.bool_,
-            keep_partitioning=True,
+        # the rows are shuffled into buckets by their hashes, so the duplicates of a row
+        # always end up in the same bucket and the buckets can be processed in parallel
+        new_modin_frame = hashed_modin_frame._apply_func_to_hash_partitioning(
+            _compute_duplicated,
+            new_columns=pandas.Index([MODIN_UNNAMED_SERIES_LABEL]),
+            dtypes=pandas.Series(
+                [np.dtype(np.bool_)], index=[MODIN_UNNAMED_SERIES_LABEL]
+            ),
         )
         return self.__constructor__(new_modin_frame, shape_hint="column")
 
@@ -3895,6 +4467,19 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
             drop=drop,
         )
 
+    # Aggregations which results for the parts of a group combine into the result
+    # for the whole group, mapped to the aggregations doing the combining
+    _groupby_partial_reducers = {
+        "all": "all",
+        "any": "any",
+        "count": "sum",
+        "max": "max",
+        "min": "min",
+        "prod": "prod",
+        "size": "sum",
+        "sum": "sum",
+    }
+
     @_inherit_docstrings(BaseQueryCompiler.groupby_agg)
     def _groupby_shuffle(
         self,
@@ -4015,6 +4600,26 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
 
             return result
 
+        reducer = None
+        if (
+            how == "axis_wise"
+            and isinstance(original_agg_func, str)
+            and original_agg_func in self._groupby_partial_reducers
+            and len(agg_args) == 0
+            and agg_kwargs.get("min_count", 0) <= 0
+            and agg_kwargs.get("skipna", True)
+            and set(agg_kwargs).issubset({"numeric_only", "min_count", "skipna"})
+            # the parts of a group are not concatenated in order, so the sum of strings can't be split
+            and not (
+                original_agg_func == "sum"
+                and not all(is_numeric_dtype(dtype) for dtype in obj.dtypes)
+            )
+        ):
+            reducer = self._groupby_partial_reducers[original_agg_func]
+
+        def reduce_operator(grp):
+            return getattr(grp, reducer)()
+
         result = obj._modin_frame.groupby(
             axis=axis,
             internal_by=internal_by,
@@ -4030,6 +4635,7 @@ class PandasQueryCompiler(BaseQueryCompiler, QueryCompilerCaster):
             # row partitions
             align_result_columns=how == "group_wise",
             add_missing_cats=add_missing_cats,
+            reduce_operator=None if reducer is None else reduce_operator,
             **groupby_kwargs,
         )
         result_qc: PandasQueryCompiler = self.__constructor__(result)
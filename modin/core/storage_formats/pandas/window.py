@@ -0,0 +1,1243 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Contains implementations for window functions."""
+
+from __future__ import annotations
+
+import warnings
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas
+from pandas._libs.tslibs import BaseOffset
+from pandas.api.types import is_integer
+from pandas.tseries.frequencies import to_offset
+
+from modin.core.dataframe.algebra import Fold, Scan
+from modin.utils import MODIN_UNNAMED_SERIES_LABEL
+
+if TYPE_CHECKING:
+    from modin.core.storage_formats.pandas.query_compiler import PandasQueryCompiler
+
+
+class RollingImpl:
+    """Provide row-parallel implementations for rolling window functions."""
+
+    @classmethod
+    def get_halo_sizes(
+        cls,
+        query_compiler: PandasQueryCompiler,
+        fold_axis: int,
+        rolling_kwargs: dict,
+        func_kwargs: dict,
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Compute the number of neighbouring rows each row partition needs to compute a rolling window.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        fold_axis : int
+            The axis to compute the window along.
+        rolling_kwargs : dict
+            Keyword arguments for ``pandas.DataFrame.rolling()`` function.
+        func_kwargs : dict
+            Keyword arguments for the window aggregation.
+
+        Returns
+        -------
+        list of (int, int) or None
+            The number of rows preceding and following each row partition that have to be
+            borrowed from the neighbouring partitions. None if the window can't be computed
+            row-partition-wise and has to be computed over the full columns instead.
+        """
+        if (
+            Fold.validate_axis(fold_axis) != 0
+            or rolling_kwargs.get("on", None) is not None
+            or rolling_kwargs.get("method", "single") != "single"
+            or rolling_kwargs.get("step", None) not in (None, 1)
+            # numeric-only aggregations may change the shape of the partitions
+            or func_kwargs.get("numeric_only", False)
+        ):
+            return None
+
+        window = rolling_kwargs.get("window", None)
+        center = rolling_kwargs.get("center", False)
+        row_lengths = query_compiler._modin_frame.row_lengths
+
+        if is_integer(window):
+            if window < 0:
+                return None
+            # windows closed from the left include one extra row
+            halo = (
+                window
+                if rolling_kwargs.get("closed", None) in ("left", "both")
+                else max(window - 1, 0)
+            )
+            # the halo is capped by the number of available rows when building
+            # partitions, so there's no need to compute it for each partition
+            return [(halo, halo if center else 0)] * len(row_lengths)
+
+        if not isinstance(window, (str, BaseOffset, timedelta)):
+            # custom window indexers are not supported
+            return None
+
+        index = query_compiler.index
+        if (
+            not isinstance(index, (pandas.DatetimeIndex, pandas.TimedeltaIndex))
+            or not index.is_monotonic_increasing
+        ):
+            return None
+        try:
+            offset = pandas.Timedelta(to_offset(window))
+        except (TypeError, ValueError):
+            # non-fixed frequencies are not supported by pandas as well, falling back
+            # to the full-column implementation that will raise a proper error
+            return None
+
+        ends = np.cumsum(row_lengths)
+        starts = ends - np.array(row_lengths)
+        halo_sizes = []
+        for start, end in zip(starts, ends):
+            if start == end:
+                halo_sizes.append((0, 0))
+                continue
+            before = start - index.searchsorted(index[start] - offset, side="left")
+            after = (
+                index.searchsorted(index[end - 1] + offset, side="right") - end
+                if center
+                else 0
+            )
+            halo_sizes.append((int(before), int(after)))
+        return halo_sizes
+
+    @classmethod
+    def build_qc_method(
+        cls, rolling_function: Callable[..., pandas.DataFrame]
+    ) -> Callable[..., PandasQueryCompiler]:
+        """
+        Build a query compiler method computing the specified rolling function.
+
+        The built method computes every row partition in parallel, borrowing a halo of
+        the trailing (and leading for centered windows) rows required to compute
+        the windows from the neighbouring row partitions. If the window can't be
+        computed this way, the function is computed over the full columns.
+
+        Parameters
+        ----------
+        rolling_function : callable(pandas.DataFrame, rolling_kwargs, *args, **kwargs) -> pandas.DataFrame
+            The rolling function to compute.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes the rolling function.
+        """
+        fold_method = Fold.register(rolling_function, shape_preserved=True)
+
+        def method(query_compiler, fold_axis, rolling_kwargs, *args, **kwargs):
+            halo_sizes = cls.get_halo_sizes(
+                query_compiler, fold_axis, rolling_kwargs, kwargs
+            )
+            if halo_sizes is None:
+                return fold_method(
+                    query_compiler, fold_axis, rolling_kwargs, *args, **kwargs
+                )
+            return query_compiler.__constructor__(
+                query_compiler._modin_frame.map_with_halo(
+                    rolling_function,
+                    halo_sizes,
+                    func_args=(rolling_kwargs, *args),
+                    func_kwargs=kwargs,
+                )
+            )
+
+        return method
+
+
+class CumulativeImpl:
+    """Provide partition-parallel implementations for cumulative functions."""
+
+    # kinds of the data types the functions are computed in parallel for, bools
+    # are excluded since their sum and product change the data type
+    _supported_kinds = {"sum": "iufm", "prod": "iuf", "max": "iufmM", "min": "iufmM"}
+
+    @classmethod
+    def build_qc_method(cls, name: str) -> Callable[..., PandasQueryCompiler]:
+        """
+        Build a query compiler method computing the specified cumulative function.
+
+        The carry of a row partition is the aggregation of its rows (e.g. the sum for
+        ``cumsum``), the prefix preceding a row partition is the aggregation of the carries
+        of the previous partitions, and the partition is scanned with the prefix
+        prepended to it, so the result is exactly the one of pandas. Non-numeric
+        columns and scans along the columns are computed over the full axis instead.
+
+        Parameters
+        ----------
+        name : {"sum", "prod", "max", "min"}
+            The name of the aggregation the cumulative function is based on.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes the cumulative function.
+        """
+        scan_name = f"cum{name}"
+        fold_method = Fold.register(
+            getattr(pandas.DataFrame, scan_name), shape_preserved=True
+        )
+
+        def carry(df, skipna=True):  # pragma: no cover
+            return df.agg([name], skipna=skipna)
+
+        def combine(prefix, carry, skipna=True):  # pragma: no cover
+            return pandas.concat([prefix, carry], copy=False).agg([name], skipna=skipna)
+
+        def fixup(df, prefix, skipna=True):  # pragma: no cover
+            if prefix is None:
+                return getattr(df, scan_name)(skipna=skipna)
+            result = getattr(pandas.concat([prefix, df], copy=False), scan_name)(
+                skipna=skipna
+            )
+            return result.iloc[1:]
+
+        scan_method = Scan.register(carry, combine, fixup)
+
+        def method(query_compiler, fold_axis, axis=0, skipna=True, **kwargs):
+            if Fold.validate_axis(fold_axis) != 0 or len(kwargs) > 0:
+                return fold_method(
+                    query_compiler, fold_axis, axis=axis, skipna=skipna, **kwargs
+                )
+            supported_kinds = cls._supported_kinds[name]
+            if not all(
+                isinstance(dtype, np.dtype) and dtype.kind in supported_kinds
+                for dtype in query_compiler.dtypes
+            ):
+                return fold_method(query_compiler, fold_axis, axis=axis, skipna=skipna)
+            return scan_method(query_compiler, 0, dtypes="copy", skipna=skipna)
+
+        return method
+
+
+class ExpandingImpl:
+    """Provide partition-parallel implementations for expanding window functions."""
+
+    # rows of the carry frames
+    _stats = ("rows", "count", "sum", "mean", "m2", "min", "max")
+
+    @classmethod
+    def _compute_stats(
+        cls, df: pandas.DataFrame
+    ) -> pandas.DataFrame:  # pragma: no cover
+        """
+        Compute the statistics of every column the expanding functions depend on.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+            Frame with a row per statistic and a column per column of `df`.
+        """
+        values = df.to_numpy(dtype="float64", na_value=np.nan)
+        with np.errstate(all="ignore"), warnings.catch_warnings():
+            # the statistics of the all-NaN columns are NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            count = (~np.isnan(values)).sum(axis=0)
+            mean = np.nanmean(values, axis=0)
+            m2 = np.nanvar(values, axis=0) * count
+            stats = np.vstack(
+                [
+                    np.full(values.shape[1], len(values)),
+                    count,
+                    np.nansum(values, axis=0),
+                    np.nan_to_num(mean),
+                    np.nan_to_num(m2),
+                    np.nanmin(values, axis=0, initial=np.inf, where=~np.isnan(values)),
+                    np.nanmax(values, axis=0, initial=-np.inf, where=~np.isnan(values)),
+                ]
+            )
+        # the extremes of the all-NaN columns are unknown
+        stats[5:][np.isinf(stats[5:]) & (count == 0)] = np.nan
+        return pandas.DataFrame(stats, index=cls._stats)
+
+    @classmethod
+    def _combine_stats(
+        cls, first: pandas.DataFrame, second: pandas.DataFrame
+    ) -> pandas.DataFrame:  # pragma: no cover
+        """
+        Combine the statistics of two consecutive parts of the columns.
+
+        Parameters
+        ----------
+        first : pandas.DataFrame
+        second : pandas.DataFrame
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        rows_a, count_a, sum_a, mean_a, m2_a, min_a, max_a = first.to_numpy()
+        rows_b, count_b, sum_b, mean_b, m2_b, min_b, max_b = second.to_numpy()
+        count = count_a + count_b
+        with np.errstate(all="ignore"):
+            delta = mean_b - mean_a
+            # Chan's formula for the sum of squared deviations of the union
+            mean = np.nan_to_num(mean_a + delta * count_b / count)
+            m2 = np.nan_to_num(m2_a + m2_b + delta**2 * count_a * count_b / count)
+        stats = np.vstack(
+            [
+                rows_a + rows_b,
+                count,
+                sum_a + sum_b,
+                mean,
+                m2,
+                np.fmin(min_a, min_b),
+                np.fmax(max_a, max_b),
+            ]
+        )
+        return pandas.DataFrame(stats, index=cls._stats)
+
+    @classmethod
+    def _compute_with_prefix(
+        cls,
+        df: pandas.DataFrame,
+        prefix: pandas.DataFrame,
+        name: str,
+        min_periods: int,
+        ddof: int = 1,
+    ) -> pandas.DataFrame:  # pragma: no cover
+        """
+        Compute the expanding function over `df` preceded by the rows summarized by `prefix`.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+        prefix : pandas.DataFrame
+            The statistics of the preceding rows.
+        name : str
+            The name of the expanding function.
+        min_periods : int
+            Minimum number of observations required to have a value.
+        ddof : int, default: 1
+            Delta degrees of freedom of the variance.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        rows_a, count_a, sum_a, mean_a, m2_a, min_a, max_a = prefix.to_numpy()
+        values = df.to_numpy(dtype="float64", na_value=np.nan)
+        valid = ~np.isnan(values)
+        count_b = np.cumsum(valid, axis=0)
+        count = count_a + count_b
+        with np.errstate(all="ignore"):
+            if name == "count":
+                result = count.astype("float64")
+                rows = rows_a + np.arange(1, len(values) + 1)[:, None]
+                result[rows < min_periods] = np.nan
+                return pandas.DataFrame(result, index=df.index, columns=df.columns)
+            if name == "min":
+                result = np.fmin(min_a, np.fmin.accumulate(values, axis=0))
+            elif name == "max":
+                result = np.fmax(max_a, np.fmax.accumulate(values, axis=0))
+            elif name in ("sum", "mean"):
+                result = sum_a + np.cumsum(np.where(valid, values, 0), axis=0)
+                if name == "mean":
+                    result = result / count
+            else:
+                local = pandas.DataFrame(values).expanding(min_periods=1)
+                mean_b = np.nan_to_num(local.mean().to_numpy())
+                m2_b = np.nan_to_num(local.var(ddof=0).to_numpy()) * count_b
+                delta = mean_b - mean_a
+                m2 = m2_a + m2_b + delta**2 * count_a * count_b / count
+                result = np.clip(m2, 0, None) / (count - ddof)
+                result[count - ddof <= 0] = np.nan
+                if name == "std":
+                    result = np.sqrt(result)
+        result[(count < min_periods) | (count == 0) & (name != "sum")] = np.nan
+        return pandas.DataFrame(result, index=df.index, columns=df.columns)
+
+    @classmethod
+    def build_qc_method(cls, name: str) -> Callable[..., PandasQueryCompiler]:
+        """
+        Build a query compiler method computing the specified expanding function.
+
+        The carry of a row partition holds the count, the sum, the mean, the sum of squared
+        deviations and the extremes of its columns, and the carries are combined into the
+        statistics of the rows preceding every row partition, so the partitions are computed
+        in parallel. Other columns than the numeric ones, the windows along the columns,
+        the "table" method and the numba engine are computed over the full axis instead.
+
+        Parameters
+        ----------
+        name : {"sum", "mean", "var", "std", "min", "max", "count"}
+            The name of the expanding function.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes the expanding function.
+        """
+        fold_method = Fold.register(
+            lambda df, expanding_args, *args, **kwargs: pandas.DataFrame(
+                getattr(df.expanding(*expanding_args), name)(*args, **kwargs)
+            ),
+            shape_preserved=True,
+        )
+
+        def fixup(df, prefix, min_periods, **kwargs):  # pragma: no cover
+            if prefix is None:
+                return pandas.DataFrame(
+                    getattr(df.expanding(min_periods), name)(**kwargs)
+                )
+            return cls._compute_with_prefix(
+                df, prefix, name, min_periods, ddof=kwargs.get("ddof", 1)
+            )
+
+        scan_method = Scan.register(
+            lambda df, *args, **kwargs: cls._compute_stats(df),
+            lambda prefix, carry, *args, **kwargs: cls._combine_stats(prefix, carry),
+            fixup,
+        )
+
+        def method(query_compiler, fold_axis, expanding_args, *args, **kwargs):
+            min_periods, axis, window_method = expanding_args
+            if (
+                Fold.validate_axis(fold_axis) != 0
+                or window_method != "single"
+                or len(args) > 0
+                or kwargs.get("engine", None) not in (None, "cython")
+                or not is_integer(min_periods)
+                or not all(
+                    isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+                    for dtype in query_compiler.dtypes
+                )
+            ):
+                return fold_method(
+                    query_compiler, fold_axis, expanding_args, *args, **kwargs
+                )
+            return scan_method(query_compiler, 0, min_periods, **kwargs)
+
+        return method
+
+
+class EwmImpl:
+    """Provide partition-parallel implementations for exponentially weighted window functions."""
+
+    # rows of the carry frames, the statistics are kept for pairs of columns
+    _stats = (
+        "rows",
+        "nobs",
+        "wsum",
+        "wsum2",
+        "mean_x",
+        "mean_y",
+        "cov",
+        "first_x",
+        "first_y",
+        "first_decay",
+        "decay",
+        "first_applies",
+    )
+    # the weights decayed by more than ``exp(-_negligible_decay)`` relative to the others
+    # don't change the results in float64
+    _negligible_decay = 45.0
+    # the largest decay the weights are rescaled by within a chunk of rows
+    _chunk_decay = 32.0
+
+    @staticmethod
+    def _get_pairs(
+        name: str, ncols: int
+    ) -> Tuple[np.ndarray, np.ndarray]:  # pragma: no cover
+        """
+        Get the pairs of columns the statistics are computed for.
+
+        Parameters
+        ----------
+        name : str
+            The name of the window function.
+        ncols : int
+            The number of columns of the partition.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The positions of the first and of the second columns of the pairs.
+        """
+        if name in ("cov", "corr"):
+            # the frame holds the column and the other column if any
+            other = 1 if ncols > 1 else 0
+            if name == "cov":
+                return np.array([0]), np.array([other])
+            # the correlation is normalized by the variances of the columns
+            return np.array([0, 0, other]), np.array([other, 0, other])
+        return np.arange(ncols), np.arange(ncols)
+
+    @classmethod
+    def _prepare(cls, df: pandas.DataFrame, params: dict) -> tuple:  # pragma: no cover
+        """
+        Extract the pairs of columns, the observations and the decays of the partition.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+        params : dict
+            The parameters of the window.
+
+        Returns
+        -------
+        tuple
+            The values of the pairs, the observations, the decays applied at every row
+            with the one of the first row unset, and the times of the rows if any.
+        """
+        values = df.to_numpy(dtype="float64", na_value=np.nan)
+        first, second = cls._get_pairs(params["name"], values.shape[1])
+        x, y = values[:, first], values[:, second]
+        obs = ~np.isnan(x) & ~np.isnan(y)
+        if params["name"] == "corr":
+            # pandas masks the values missing in any of the columns
+            obs &= obs.all(axis=1, keepdims=True)
+        steps = np.ones(len(df))
+        times = None
+        if params["halflife"] is not None:
+            # the same arithmetic as in ``pandas.core.window.ewm._calculate_deltas``
+            halflife = pandas.Timedelta(params["halflife"]).as_unit(df.index.unit)
+            times = np.asarray(df.index.asi8, dtype=np.float64)
+            steps[1:] = np.diff(times) / float(halflife._value)
+        decays = params["decay"] * steps[:, None] * (obs | (not params["ignore_na"]))
+        if len(decays) > 0:
+            decays[0] = 0
+        return x, y, obs, decays, times
+
+    @classmethod
+    def _get_gap(
+        cls, prefix: pandas.DataFrame, times: Optional[np.ndarray], params: dict
+    ) -> float:  # pragma: no cover
+        """
+        Get the decay between the last row of the prefix and the first row of a partition.
+
+        Parameters
+        ----------
+        prefix : pandas.DataFrame
+        times : np.ndarray, optional
+            The times of the partition rows.
+        params : dict
+            The parameters of the window.
+
+        Returns
+        -------
+        float
+        """
+        if times is None:
+            return params["decay"]
+        halflife = pandas.Timedelta(params["halflife"]).as_unit(params["unit"])
+        return (
+            params["decay"]
+            * (times[0] - prefix.attrs["last_time"])
+            / float(halflife._value)
+        )
+
+    @classmethod
+    def _run(
+        cls,
+        x: np.ndarray,
+        y: np.ndarray,
+        obs: np.ndarray,
+        decays: np.ndarray,
+        weights: np.ndarray,
+        state: tuple,
+    ) -> tuple:  # pragma: no cover
+        """
+        Compute the exponentially weighted moments of the pairs at every row.
+
+        The rows are processed in chunks the weights are rescaled within, so that
+        the moments of a chunk are computed with cumulative sums.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The values of the first columns of the pairs.
+        y : np.ndarray
+            The values of the second columns of the pairs.
+        obs : np.ndarray
+            Whether the values of the pairs are observed.
+        decays : np.ndarray
+            The logarithm of the decay applied to the weights at every row.
+        weights : np.ndarray
+            The weights of the observations, zero for the other rows.
+        state : tuple of np.ndarray
+            The sum of the weights, the sum of the squared weights, the weighted means
+            and the weighted sum of the deviation products preceding the first row.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            The moments at every row, with the same meaning as `state`.
+        """
+        nrows, npairs = x.shape
+        results = [np.empty((nrows, npairs)) for _ in range(len(state))]
+        wsum, wsum2, mean_x, mean_y, cov = state
+        bounds = np.cumsum(decays.max(axis=1, initial=0))
+        cols = np.arange(npairs)
+        start = 0
+        while start < nrows:
+            stop = max(
+                np.searchsorted(bounds, bounds[start] + cls._chunk_decay, side="right"),
+                start + 1,
+            )
+            chunk_obs = obs[start:stop]
+            decay = np.cumsum(decays[start:stop], axis=0)
+            rel_decay = decay - decay[0]
+            scale = np.exp(rel_decay)
+            shrink = np.exp(-rel_decay)
+            prev_decay = np.exp(-decay)
+            chunk_weights = weights[start:stop] * scale
+            # the values are centered around the current means to keep the sums small
+            first = np.argmax(chunk_obs, axis=0)
+            has_obs = chunk_obs.any(axis=0)
+            has_weight = wsum > 0
+            shift_x = np.where(
+                has_weight, mean_x, np.where(has_obs, x[start + first, cols], 0)
+            )
+            shift_y = np.where(
+                has_weight, mean_y, np.where(has_obs, y[start + first, cols], 0)
+            )
+            dx = np.where(chunk_obs, x[start:stop] - shift_x, 0)
+            dy = np.where(chunk_obs, y[start:stop] - shift_y, 0)
+            new_wsum = prev_decay * wsum + shrink * np.cumsum(chunk_weights, axis=0)
+            new_wsum2 = prev_decay**2 * wsum2 + shrink**2 * np.cumsum(
+                weights[start:stop] ** 2 * scale**2, axis=0
+            )
+            sum_x = shrink * np.cumsum(chunk_weights * dx, axis=0)
+            sum_y = shrink * np.cumsum(chunk_weights * dy, axis=0)
+            sum_xy = prev_decay * cov + shrink * np.cumsum(
+                chunk_weights * dx * dy, axis=0
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                new_mean_x = shift_x + sum_x / new_wsum
+                new_mean_y = shift_y + sum_y / new_wsum
+                new_cov = np.where(new_wsum > 0, sum_xy - sum_x * sum_y / new_wsum, 0)
+            # the means only change at the observations
+            last_obs = np.maximum.accumulate(
+                np.where(chunk_obs, np.arange(stop - start)[:, None], -1), axis=0
+            )
+            new_mean_x = np.where(
+                last_obs >= 0, new_mean_x[last_obs.clip(0), cols], mean_x
+            )
+            new_mean_y = np.where(
+                last_obs >= 0, new_mean_y[last_obs.clip(0), cols], mean_y
+            )
+            chunk_results = (new_wsum, new_wsum2, new_mean_x, new_mean_y, new_cov)
+            for result, chunk_result in zip(results, chunk_results):
+                result[start:stop] = chunk_result
+            wsum, wsum2, mean_x, mean_y, cov = (
+                chunk_result[-1] for chunk_result in chunk_results
+            )
+            start = stop
+        return tuple(results)
+
+    @staticmethod
+    def _finalize(
+        name: str,
+        bias: bool,
+        moments: tuple,
+        nobs: np.ndarray,
+        min_periods: int,
+    ) -> np.ndarray:  # pragma: no cover
+        """
+        Compute the results of the window function from the moments of the pairs.
+
+        Parameters
+        ----------
+        name : str
+            The name of the window function.
+        bias : bool
+            Whether the variance is biased.
+        moments : tuple of np.ndarray
+            The moments of the pairs as returned by ``_run``.
+        nobs : np.ndarray
+            The number of observations of the pairs.
+        min_periods : int
+            Minimum number of observations required to have a value.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        wsum, wsum2, mean_x, _, cov = moments
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if name == "mean":
+                result = mean_x.copy()
+            elif name == "sum":
+                result = wsum * mean_x
+            else:
+                result = cov / wsum
+                if name == "corr":
+                    result[nobs < min_periods] = np.nan
+                    variance = np.clip(result[:, 1:2] * result[:, 2:3], 0, None)
+                    return result[:, :1] / np.sqrt(variance)
+                if name in ("var", "std"):
+                    result = np.clip(result, 0, None)
+                if not bias:
+                    numerator = wsum**2
+                    denominator = numerator - wsum2
+                    # a single observation has no unbiased variance, while the rounding
+                    # of the rescaled weights may keep the denominator positive
+                    result = np.where(
+                        (denominator > 0) & (nobs > 1),
+                        numerator / denominator * result,
+                        np.nan,
+                    )
+                if name == "std":
+                    result = np.sqrt(result)
+        result[nobs < min_periods] = np.nan
+        return result
+
+    @classmethod
+    def _compute_standalone(
+        cls, df: pandas.DataFrame, params: dict, min_periods: int
+    ) -> np.ndarray:  # pragma: no cover
+        """
+        Compute the window function over `df` with pandas.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+        params : dict
+            The parameters of the window.
+        min_periods : int
+            Minimum number of observations required to have a value.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        ewm_kwargs = {
+            "com": params["com"],
+            "min_periods": min_periods,
+            "adjust": params["adjust"],
+            "ignore_na": params["ignore_na"],
+        }
+        if params["halflife"] is not None:
+            ewm_kwargs.update(halflife=params["halflife"], times=df.index)
+        name = params["name"]
+        if name in ("cov", "corr"):
+            window = df.iloc[:, 0].ewm(**ewm_kwargs)
+            other = df.iloc[:, -1]
+            if name == "cov":
+                result = window.cov(other, bias=params["bias"])
+            else:
+                result = window.corr(other)
+            return result.to_numpy(dtype="float64")[:, None]
+        window = df.ewm(**ewm_kwargs)
+        if name in ("var", "std"):
+            result = getattr(window, name)(bias=params["bias"])
+        else:
+            result = getattr(window, name)()
+        return result.to_numpy(dtype="float64")
+
+    @classmethod
+    def _carry(
+        cls, df: pandas.DataFrame, params: dict
+    ) -> pandas.DataFrame:  # pragma: no cover
+        """
+        Compute the moments of the pairs at the last row of the partition.
+
+        The observations that are negligible compared to the last two ones are skipped,
+        and all of them are weighted as if they were not the first observation of the
+        column, the first one is corrected when the partitions are fixed up.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+        params : dict
+            The parameters of the window.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        x, y, obs, decays, times = cls._prepare(df, params)
+        nrows, npairs = x.shape
+        cols = np.arange(npairs)
+        nobs = obs.sum(axis=0)
+        has_obs = nobs > 0
+        cum_decay = np.cumsum(decays, axis=0)
+        start = nrows
+        threshold = cls._negligible_decay + np.log(nrows + 1) - np.log(params["base"])
+        for col in cols:
+            obs_rows = np.flatnonzero(obs[:, col])
+            if len(obs_rows) < 2:
+                start = 0
+                break
+            # the rows decayed by `threshold` at the last but one observation
+            start = min(
+                start,
+                np.searchsorted(
+                    cum_decay[:, col],
+                    cum_decay[obs_rows[-2], col] - threshold,
+                    side="right",
+                ),
+            )
+        moments = (np.zeros(npairs), np.zeros(npairs)) + (np.full(npairs, np.nan),) * 2
+        moments += (np.zeros(npairs),)
+        if start < nrows:
+            moments = cls._run(
+                x[start:],
+                y[start:],
+                obs[start:],
+                decays[start:],
+                obs[start:] * params["base"],
+                moments,
+            )
+            moments = tuple(moment[-1] for moment in moments)
+        first = np.argmax(obs, axis=0)
+        stats = np.vstack(
+            [
+                np.full(npairs, nrows),
+                nobs,
+                *moments,
+                np.where(has_obs, x[first, cols], np.nan),
+                np.where(has_obs, y[first, cols], np.nan),
+                cum_decay[-1] - cum_decay[first, cols] if nrows else np.zeros(npairs),
+                cum_decay[-1] if nrows else np.zeros(npairs),
+                obs[0] | (not params["ignore_na"]) if nrows else np.zeros(npairs),
+            ]
+        )
+        result = pandas.DataFrame(stats, index=cls._stats)
+        if times is not None and nrows:
+            result.attrs = {"first_time": times[0], "last_time": times[-1]}
+        return result
+
+    @classmethod
+    def _combine(
+        cls, prefix: pandas.DataFrame, carry: pandas.DataFrame, params: dict
+    ) -> pandas.DataFrame:  # pragma: no cover
+        """
+        Combine the moments of two consecutive parts of the pairs.
+
+        Parameters
+        ----------
+        prefix : pandas.DataFrame
+        carry : pandas.DataFrame
+        params : dict
+            The parameters of the window.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        if carry.loc["rows"].iloc[0] == 0:
+            return prefix
+        if prefix.loc["rows"].iloc[0] == 0:
+            return carry
+        a, b = prefix.to_numpy(), carry.to_numpy()
+        rows_a, nobs_a, wsum_a, wsum2_a, mean_xa, mean_ya, cov_a = a[:7]
+        first_xa, first_ya, first_decay_a, decay_a, first_applies_a = a[7:]
+        rows_b, nobs_b, wsum_b, wsum2_b, mean_xb, mean_yb, cov_b = b[:7]
+        first_xb, first_yb, first_decay_b, decay_b, first_applies_b = b[7:]
+        times = None if not carry.attrs else np.array([carry.attrs["first_time"]])
+        # the decay of the prefix weights through the carry rows
+        decay = decay_b + first_applies_b * cls._get_gap(prefix, times, params)
+        factor = np.exp(-decay)
+        has_a, has_b = nobs_a > 0, nobs_b > 0
+        wsum_a = wsum_a * factor
+        wsum = wsum_a + wsum_b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(wsum > 0, wsum_b / wsum, 1)
+            both = has_a & has_b
+            mean_x = np.where(
+                both,
+                mean_xa + (mean_xb - mean_xa) * ratio,
+                np.where(has_a, mean_xa, mean_xb),
+            )
+            mean_y = np.where(
+                both,
+                mean_ya + (mean_yb - mean_ya) * ratio,
+                np.where(has_a, mean_ya, mean_yb),
+            )
+            cov = cov_a * factor + cov_b
+            cov += np.where(
+                both, (mean_xb - mean_xa) * (mean_yb - mean_ya) * wsum_a * ratio, 0
+            )
+        stats = np.vstack(
+            [
+                rows_a + rows_b,
+                nobs_a + nobs_b,
+                wsum,
+                wsum2_a * factor**2 + wsum2_b,
+                mean_x,
+                mean_y,
+                cov,
+                np.where(has_a, first_xa, first_xb),
+                np.where(has_a, first_ya, first_yb),
+                np.where(has_a, first_decay_a + decay, first_decay_b),
+                decay_a + decay,
+                first_applies_a,
+            ]
+        )
+        result = pandas.DataFrame(stats, index=cls._stats)
+        if prefix.attrs:
+            result.attrs = {
+                "first_time": prefix.attrs["first_time"],
+                "last_time": carry.attrs["last_time"],
+            }
+        return result
+
+    @classmethod
+    def _fixup(
+        cls, df: pandas.DataFrame, prefix: Optional[pandas.DataFrame], params: dict
+    ) -> pandas.DataFrame:  # pragma: no cover
+        """
+        Compute the window function over the partition preceded by the rows summarized by `prefix`.
+
+        The rows the prefix weights are negligible at are computed with pandas.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+        prefix : pandas.DataFrame, optional
+            The moments of the preceding rows.
+        params : dict
+            The parameters of the window.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        name, min_periods = params["name"], params["min_periods"]
+        if prefix is None or prefix.loc["rows"].iloc[0] == 0 or len(df) == 0:
+            result = cls._compute_standalone(df, params, min_periods)
+        else:
+            x, y, obs, decays, times = cls._prepare(df, params)
+            nrows, npairs = x.shape
+            alpha, base = 1 / (1 + params["com"]), params["base"]
+            stats = prefix.to_numpy()
+            nobs0, wsum, wsum2, mean_x, mean_y, cov = stats[1:7]
+            first_x, first_y, first_decay = stats[7:10]
+            has_prefix = nobs0 > 0
+            weights = obs * base
+            if not params["adjust"]:
+                # the first observation of the column weighs 1 instead of alpha
+                first_weight = np.where(has_prefix, np.exp(-first_decay), 0)
+                extra = (1 - alpha) * first_weight
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = np.where(has_prefix, extra / (wsum + extra), 0)
+                delta_x = np.where(has_prefix, first_x - mean_x, 0)
+                delta_y = np.where(has_prefix, first_y - mean_y, 0)
+                cov = cov + delta_x * delta_y * wsum * ratio
+                mean_x = mean_x + delta_x * ratio
+                mean_y = mean_y + delta_y * ratio
+                wsum = wsum + extra
+                wsum2 = wsum2 + first_weight**2 * (1 - alpha**2)
+                first_rows = np.argmax(obs, axis=0)
+                fresh = ~has_prefix & obs.any(axis=0)
+                weights[first_rows[fresh], np.flatnonzero(fresh)] = 1
+            if nrows:
+                decays[0] = (obs[0] | (not params["ignore_na"])) * cls._get_gap(
+                    prefix, times, params
+                )
+            cum_decay = np.cumsum(decays, axis=0)
+            nobs = nobs0 + np.cumsum(obs, axis=0)
+            # the rows after the prefix weights get negligible compared to the weights
+            # of two observations of the partition are computed with pandas
+            threshold = cls._negligible_decay + np.log(np.maximum(wsum / base, 1))
+            head = 0
+            for col in np.flatnonzero(has_prefix):
+                obs_rows = np.flatnonzero(obs[:, col])
+                negligible = cum_decay[obs_rows, col] >= threshold[col]
+                if not params["adjust"] and len(obs_rows):
+                    negligible &= cum_decay[obs_rows, col] - cum_decay[
+                        obs_rows[0], col
+                    ] >= cls._negligible_decay - np.log(alpha)
+                if not negligible.any() or np.argmax(negligible) + 1 >= len(obs_rows):
+                    head = nrows
+                    break
+                head = max(head, obs_rows[np.argmax(negligible) + 1])
+            result = np.empty((nrows, 1 if name in ("cov", "corr") else npairs))
+            if head > 0:
+                moments = cls._run(
+                    x[:head],
+                    y[:head],
+                    obs[:head],
+                    decays[:head],
+                    weights[:head],
+                    (wsum, wsum2, mean_x, mean_y, cov),
+                )
+                result[:head] = cls._finalize(
+                    name, params["bias"], moments, nobs[:head], min_periods
+                )
+            if head < nrows:
+                standalone = cls._compute_standalone(df, params, 1)[head:]
+                if name == "corr":
+                    standalone[nobs[head:, :1] < min_periods] = np.nan
+                else:
+                    standalone[nobs[head:] < min_periods] = np.nan
+                result[head:] = standalone
+        if result.shape[1] != df.shape[1]:
+            result = np.repeat(result, df.shape[1], axis=1)
+        return pandas.DataFrame(result, index=df.index, columns=df.columns)
+
+    @classmethod
+    def _get_params(
+        cls, query_compiler: PandasQueryCompiler, fold_axis: int, ewm_kwargs: dict
+    ) -> Optional[dict]:
+        """
+        Get the parameters of the window if it can be computed in parallel.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        fold_axis : int
+        ewm_kwargs : dict
+            The arguments of the window.
+
+        Returns
+        -------
+        dict or None
+            None if the window can't be computed in parallel.
+        """
+        if (
+            Fold.validate_axis(fold_axis) != 0
+            or ewm_kwargs.get("axis", 0) not in (0, "index", "rows")
+            or ewm_kwargs.get("method", "single") != "single"
+            or not all(
+                isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+                for dtype in query_compiler.dtypes
+            )
+        ):
+            return None
+        window_kwargs = {
+            key: value
+            for key, value in ewm_kwargs.items()
+            if key not in ("axis", "method")
+        }
+        times = window_kwargs.get("times", None)
+        # pandas validates the arguments and computes the center of mass
+        window = pandas.Series(
+            (
+                np.broadcast_to(np.float64(0), len(query_compiler.index))
+                if times is not None
+                else []
+            ),
+            dtype="float64",
+        ).ewm(**window_kwargs)
+        com = window._com
+        if com == 0:
+            # every observation resets the window
+            return None
+        params = {
+            "com": com,
+            "decay": np.log1p(1 / com),
+            "base": 1.0 if window.adjust else 1 / (1 + com),
+            "adjust": window.adjust,
+            "ignore_na": window.ignore_na,
+            "min_periods": window.min_periods,
+            "halflife": None,
+            "times": None,
+        }
+        if (
+            not window.adjust
+            and not window.ignore_na
+            and query_compiler.isna().any().to_pandas().any(axis=None)
+        ):
+            # the weights are renormalized at every observation by the decay since
+            # the previous one, which may precede the partition by any number of rows
+            return None
+        if times is not None:
+            params["times"] = pandas.DatetimeIndex(times)
+            params["halflife"] = window.halflife
+            params["unit"] = params["times"].unit
+        return params
+
+    @classmethod
+    def _scan(
+        cls, query_compiler: PandasQueryCompiler, params: dict
+    ) -> PandasQueryCompiler:
+        """
+        Compute the window function over the rows of `query_compiler` in parallel.
+
+        Parameters
+        ----------
+        query_compiler : PandasQueryCompiler
+        params : dict
+            The parameters of the window with the name of the function and the bias.
+
+        Returns
+        -------
+        PandasQueryCompiler
+        """
+        times = params.pop("times")
+        if params["name"] != "mean":
+            # only the mean takes the times into account, the other functions
+            # assume the rows are equally spaced as pandas does
+            params["halflife"] = None
+        frame = query_compiler
+        if params["halflife"] is not None:
+            # every partition gets the times of its rows as the row labels
+            frame = query_compiler.copy()
+            frame.index = times
+        result = Scan.register(cls._carry, cls._combine, cls._fixup)(frame, 0, params)
+        if frame is not query_compiler:
+            result.index = query_compiler.index
+        return result
+
+    @classmethod
+    def build_qc_method(cls, name: str) -> Callable[..., PandasQueryCompiler]:
+        """
+        Build a query compiler method computing the specified exponentially weighted function.
+
+        The carry of a row partition holds the exponentially weighted moments of its columns,
+        the carries are decayed and combined into the moments of the rows preceding every
+        row partition, and the partitions are then computed in parallel. The rows of
+        a partition the preceding rows are negligible at are computed with pandas.
+        Other columns than the numeric ones, the windows along the columns, the "table"
+        method and the numba engine are computed over the full axis instead.
+
+        Parameters
+        ----------
+        name : {"mean", "sum", "var", "std"}
+            The name of the exponentially weighted function.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes the exponentially weighted function.
+        """
+        fold_method = Fold.register(
+            lambda df, ewm_kwargs, *args, **kwargs: pandas.DataFrame(
+                getattr(df.ewm(**ewm_kwargs), name)(*args, **kwargs)
+            ),
+            shape_preserved=True,
+        )
+
+        def method(query_compiler, fold_axis, ewm_kwargs, *args, **kwargs):
+            params = cls._get_params(query_compiler, fold_axis, ewm_kwargs)
+            if (
+                params is None
+                or len(args) > 0
+                or kwargs.get("engine", None) not in (None, "cython")
+                or kwargs.get("engine_kwargs", None) is not None
+            ):
+                return fold_method(
+                    query_compiler, fold_axis, ewm_kwargs, *args, **kwargs
+                )
+            params.update(name=name, bias=kwargs.get("bias", False))
+            return cls._scan(query_compiler, params)
+
+        return method
+
+    @classmethod
+    def build_pairwise_qc_method(cls, name: str) -> Callable[..., PandasQueryCompiler]:
+        """
+        Build a query compiler method computing the specified exponentially weighted function of two columns.
+
+        The function of a single column and the column or another one with the same
+        row labels is computed in parallel like the ``build_qc_method`` functions.
+
+        Parameters
+        ----------
+        name : {"cov", "corr"}
+            The name of the exponentially weighted function.
+
+        Returns
+        -------
+        callable
+            Function that takes query compiler and executes the exponentially weighted function.
+        """
+
+        def fold_function(df, ewm_kwargs, squeeze_self, *args, **kwargs):
+            result = pandas.DataFrame(
+                getattr(
+                    (df.squeeze(axis=1) if squeeze_self else df).ewm(**ewm_kwargs),
+                    name,
+                )(*args, **kwargs)
+            )
+            # the result is renamed after the partitions are combined
+            result.columns = df.columns
+            return result
+
+        fold_method = Fold.register(fold_function, shape_preserved=True)
+
+        def method(
+            query_compiler,
+            fold_axis,
+            ewm_kwargs,
+            squeeze_self,
+            squeeze_other,
+            other=None,
+            pairwise=None,
+            **kwargs,
+        ):
+            def other_to_pandas():
+                # only the fallbacks take the other object, the scan reads its partitions
+                if other is None:
+                    return None
+                other_df = other.to_pandas()
+                return other_df.squeeze(axis=1) if squeeze_other else other_df
+
+            if len(query_compiler.columns) > 1:
+                other_for_pandas = other_to_pandas()
+                # computing the function for each column requires having the other columns,
+                # so we can't parallelize this as a full-column operation
+                return query_compiler.default_to_pandas(
+                    lambda df: getattr(pandas.DataFrame.ewm(df, **ewm_kwargs), name)(
+                        other=other_for_pandas, pairwise=pairwise, **kwargs
+                    )
+                )
+            params = cls._get_params(query_compiler, fold_axis, ewm_kwargs)
+            pair = query_compiler
+            if params is not None and other is not None:
+                if (
+                    squeeze_self
+                    and squeeze_other
+                    and cls._get_params(other, fold_axis, ewm_kwargs) is not None
+                    and query_compiler.index.equals(other.index)
+                ):
+                    pair = query_compiler.concat(1, [other]).repartition(axis=1)
+                    if pair._modin_frame._partitions.shape[1] != 1:
+                        params = None
+                else:
+                    params = None
+            if params is None or not squeeze_self:
+                result = fold_method(
+                    query_compiler,
+                    fold_axis,
+                    ewm_kwargs,
+                    squeeze_self,
+                    other=other_to_pandas(),
+                    pairwise=pairwise,
+                    **kwargs,
+                )
+            else:
+                params.update(name=name, bias=kwargs.get("bias", False))
+                result = cls._scan(pair, params)
+                if pair is not query_compiler:
+                    result = result.getitem_column_array([0], numeric=True)
+            # pandas names the result after the column if the other one has the same name
+            if (
+                other is not None
+                and squeeze_self
+                and squeeze_other
+                and not other.columns.equals(query_compiler.columns)
+            ):
+                result.columns = [MODIN_UNNAMED_SERIES_LABEL]
+            return result
+
+        return method
@@ -23,11 +23,60 @@ make a db connection. It can make and provide a connection whenever the Modin
 driver or a worker wants one.
 """
 
-from typing import Any, Dict, Optional, Sequence
+import datetime
+import decimal
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from modin.config import (
+    SqlConnectionIdleTimeout,
+    SqlConnectionPoolSize,
+    SqlConnectionPrePing,
+)
 
 _PSYCOPG_LIB_NAME = "psycopg2"
 _SQLALCHEMY_LIB_NAME = "sqlalchemy"
 
+# SQLAlchemy engines of the process keyed by the connection arguments, each one
+# holding a pool of open connections, along with the time the engine was last used
+_engines: Dict[Tuple, List[Any]] = {}
+_engines_lock = threading.Lock()
+
+
+def _sql_literal(value: Any) -> Optional[str]:
+    """
+    Render a key value fetched from the database as a SQL literal.
+
+    Parameters
+    ----------
+    value : Any
+        The value to render.
+
+    Returns
+    -------
+    str or None
+        The literal, or None if the value has no portable literal form.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return None
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, (float, np.floating)):
+        return repr(float(value)) if math.isfinite(value) else None
+    if isinstance(value, decimal.Decimal):
+        return str(value) if value.is_finite() else None
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat(sep=" ")
+    elif isinstance(value, datetime.date):
+        value = value.isoformat()
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return None
+
 
 class UnsupportedDatabaseException(Exception):
     """Modin can't create a particular kind of database connection."""
@@ -62,6 +111,10 @@ class ModinDatabaseConnection:
         self.args = args
         self.kwargs = kwargs
         self._dialect_is_microsoft_sql_cache = None
+        # workers get the pool settings of the driver along with the connection
+        self._pool_size = SqlConnectionPoolSize.get()
+        self._idle_timeout = SqlConnectionIdleTimeout.get()
+        self._pre_ping = SqlConnectionPrePing.get()
 
     def _dialect_is_microsoft_sql(self) -> bool:
         """
@@ -78,22 +131,88 @@ class ModinDatabaseConnection:
         if self._dialect_is_microsoft_sql_cache is None:
             self._dialect_is_microsoft_sql_cache = False
             if self.lib == _SQLALCHEMY_LIB_NAME:
-                from sqlalchemy import create_engine
-
-                self._dialect_is_microsoft_sql_cache = create_engine(
-                    *self.args, **self.kwargs
-                ).driver in ("pymssql", "pyodbc")
+                self._dialect_is_microsoft_sql_cache = self._get_engine().driver in (
+                    "pymssql",
+                    "pyodbc",
+                )
 
         return self._dialect_is_microsoft_sql_cache
 
+    def _create_engine(self) -> Any:
+        """
+        Create a SQLAlchemy engine with a bounded pool of connections.
+
+        Returns
+        -------
+        sqlalchemy.engine.Engine
+        """
+        from sqlalchemy import create_engine
+
+        args, kwargs = self.args, self.kwargs
+        if self.lib == _PSYCOPG_LIB_NAME:
+            import psycopg2
+
+            args = ("postgresql+psycopg2://",)
+            kwargs = {"creator": lambda: psycopg2.connect(*self.args, **self.kwargs)}
+        options = {
+            "pool_pre_ping": self._pre_ping,
+            # connections opened before the idle timeout may have been dropped by the server
+            "pool_recycle": self._idle_timeout,
+        }
+        try:
+            return create_engine(
+                *args,
+                **{
+                    **options,
+                    "pool_size": self._pool_size,
+                    "max_overflow": 0,
+                    **kwargs,
+                },
+            )
+        except TypeError:
+            # the pool of the dialect has a fixed size, e.g. for in-memory SQLite
+            return create_engine(*args, **{**options, **kwargs})
+
+    def _get_engine(self) -> Any:
+        """
+        Get the engine of the process for this connection, creating it if needed.
+
+        Engines that weren't used for longer than the idle timeout are disposed
+        of, closing their connections.
+
+        Returns
+        -------
+        sqlalchemy.engine.Engine
+        """
+        key = (
+            self.lib,
+            repr(self.args),
+            repr(sorted(self.kwargs.items())),
+            self._pool_size,
+            self._idle_timeout,
+            self._pre_ping,
+        )
+        now = time.monotonic()
+        with _engines_lock:
+            for other_key, (engine, last_used, idle_timeout) in list(_engines.items()):
+                if now - last_used > idle_timeout:
+                    del _engines[other_key]
+                    # connections in use are closed once they are released
+                    engine.dispose()
+            if key not in _engines:
+                _engines[key] = [self._create_engine(), now, self._idle_timeout]
+            _engines[key][1] = now
+            return _engines[key][0]
+
     def get_connection(self) -> Any:
         """
-        Make the database connection and get it.
+        Take a database connection from the pool of the process and get it.
 
-        For psycopg2, pass all arguments to psycopg2.connect() and return the
-        result of psycopg2.connect(). For sqlalchemy, pass all arguments to
-        sqlalchemy.create_engine() and return the result of calling connect()
-        on the engine.
+        For psycopg2, connections are made by passing all arguments to
+        psycopg2.connect() and a DBAPI connection is returned. For sqlalchemy,
+        connections are made by an engine created by passing all arguments to
+        sqlalchemy.create_engine() and the result of calling connect() on the
+        engine is returned. Closing the connection returns it to the pool.
 
         Returns
         -------
@@ -101,13 +220,15 @@ class ModinDatabaseConnection:
             The open database connection.
         """
         if self.lib == _PSYCOPG_LIB_NAME:
-            import psycopg2
+            try:
+                return self._get_engine().raw_connection()
+            except ImportError:
+                # sqlalchemy is needed to pool the connections
+                import psycopg2
 
-            return psycopg2.connect(*self.args, **self.kwargs)
+                return psycopg2.connect(*self.args, **self.kwargs)
         if self.lib == _SQLALCHEMY_LIB_NAME:
-            from sqlalchemy import create_engine
-
-            return create_engine(*self.args, **self.kwargs).connect()
+            return self._get_engine().connect()
 
         raise UnsupportedDatabaseException("Unsupported database library")
 
@@ -179,3 +300,125 @@ class ModinDatabaseConnection:
             else f"SELECT * FROM ({query}) AS _MODIN_COUNT_QUERY LIMIT "
             + f"{limit} OFFSET {offset}"
         )
+
+    def primary_key_column(self, table: str, connection: Any) -> Optional[str]:
+        """
+        Get the column of a single-column primary key of `table`.
+
+        Parameters
+        ----------
+        table : str
+            The table name, optionally qualified with a schema.
+        connection : Any
+            Open connection made by this object to inspect the table with.
+
+        Returns
+        -------
+        str or None
+            The key column, or None if the table has no single-column primary key.
+        """
+        if self.lib == _PSYCOPG_LIB_NAME:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT a.attname FROM pg_index i JOIN pg_attribute a"
+                    + " ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)"
+                    + " WHERE i.indrelid = %s::regclass AND i.indisprimary",
+                    (table,),
+                )
+                columns = [row[0] for row in cursor.fetchall()]
+        else:
+            from sqlalchemy import inspect
+
+            schema, _, name = table.rpartition(".")
+            columns = inspect(connection).get_pk_constraint(
+                name, schema=schema or None
+            )["constrained_columns"]
+        return columns[0] if len(columns) == 1 else None
+
+    def quote_identifier(self, name: str) -> str:
+        """
+        Quote `name` to be used as an identifier in the SQL dialect of the connection.
+
+        Parameters
+        ----------
+        name : str
+            The identifier to quote, e.g. a column name.
+
+        Returns
+        -------
+        str
+        """
+        try:
+            return self._get_engine().dialect.identifier_preparer.quote(name)
+        except ImportError:
+            # the psycopg2 connections are made without sqlalchemy
+            return '"' + name.replace('"', '""') + '"'
+
+    def key_bounds_query(self, query: str, column: str, num_partitions: int) -> str:
+        """
+        Get a query that splits the non-null values of `column` into equal-sized ranges.
+
+        The query gives the lowest value of every range, in ascending order,
+        so the whole key distribution is fetched with a single scan.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to split.
+        column : str
+            The column to split `query` by.
+        num_partitions : int
+            The number of ranges.
+
+        Returns
+        -------
+        str
+        """
+        column = self.quote_identifier(column)
+        return (
+            "SELECT MIN(_MODIN_KEY) AS _MODIN_BOUND FROM ("
+            + f"SELECT {column} AS _MODIN_KEY, NTILE({num_partitions})"
+            + f" OVER (ORDER BY {column}) AS _MODIN_TILE"
+            + f" FROM ({query}) AS _MODIN_KEYSET_QUERY WHERE {column} IS NOT NULL"
+            + ") AS _MODIN_TILES GROUP BY _MODIN_TILE ORDER BY _MODIN_TILE"
+        )
+
+    def key_range_queries(
+        self, query: str, column: str, bounds: Sequence[Any]
+    ) -> Optional[List[str]]:
+        """
+        Get queries that partition the original `query` by ranges of `column`.
+
+        Partition ``i`` takes the rows with ``bounds[i - 1] <= column < bounds[i]``,
+        the first one also takes the rows where `column` is null.
+
+        Parameters
+        ----------
+        query : str
+            The SQL query to get the partitions of.
+        column : str
+            The column to partition `query` by.
+        bounds : sequence
+            Ascending lower bounds of the ranges, except for the first range.
+
+        Returns
+        -------
+        list of str or None
+            The queries, or None if some bound can't be written as a SQL literal.
+        """
+        literals = [_sql_literal(bound) for bound in bounds]
+        if any(literal is None for literal in literals):
+            return None
+        column = self.quote_identifier(column)
+        predicates = [
+            f"{column} < {upper} OR {column} IS NULL" for upper in literals[:1]
+        ]
+        predicates += [
+            f"{column} >= {lower} AND {column} < {upper}"
+            for lower, upper in zip(literals[:-1], literals[1:])
+        ]
+        predicates += [f"{column} >= {lower}" for lower in literals[-1:]]
+        return [
+            f"SELECT * FROM ({query}) AS _MODIN_KEYSET_QUERY WHERE {predicate}"
+            for predicate in predicates or ["1 = 1"]
+        ]
@@ -11,11 +11,18 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import sys
+import threading
+import time
 import warnings
-from typing import NoReturn, Optional, Set
+from contextlib import contextmanager
+from typing import Dict, Iterator, NoReturn, Optional, Set
 
+import pandas
+
+from modin.config import DefaultToPandasAudit
 from modin.logging import get_logger
-from modin.utils import get_current_execution
+from modin.utils import DefaultToPandasError, get_current_execution
 
 
 class ErrorMessage(object):
@@ -55,6 +62,8 @@ class ErrorMessage(object):
 
     @classmethod
     def default_to_pandas(cls, message: str = "", reason: str = "") -> None:
+        if not FallbackAudit.on_fallback(message or "<unknown operation>", reason):
+            return
         if message != "":
             execution_str = get_current_execution()
             message = (
@@ -125,3 +134,213 @@ class ErrorMessage(object):
             + "To remove this warning, run the following python code before doing dataframe operations:\n"
             + f"{code}"
         )
+
+
+class FallbackAudit(object):
+    """
+    Recorder of the operations defaulting to pandas.
+
+    Fallbacks are recorded per operation and call site unless ``DefaultToPandasAudit``
+    is "disable". The size of the collected frame and the time spent are known for the
+    fallbacks happening in ``track`` blocks only.
+    """
+
+    _lock = threading.Lock()
+    _local = threading.local()
+    _records: Dict[tuple, dict] = {}
+    _reported: Set[tuple] = set()
+
+    @staticmethod
+    def _call_site() -> str:
+        """
+        Get the location of the first frame of the stack outside of Modin.
+
+        Returns
+        -------
+        str
+        """
+        frame = sys._getframe(1)
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.split(".")[0] != "modin" or module.startswith("modin.tests"):
+                code = frame.f_code
+                return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+            frame = frame.f_back
+        return "<unknown>"
+
+    @classmethod
+    def _tracked(cls) -> list:
+        """
+        Get the fallbacks being measured by the current thread.
+
+        Returns
+        -------
+        list of dict
+        """
+        stack = getattr(cls._local, "stack", None)
+        if stack is None:
+            stack = cls._local.stack = []
+        return stack
+
+    @classmethod
+    def _record(cls, key: tuple, elapsed: float, shape: Optional[tuple], nbytes: int):
+        """
+        Add a fallback to the records.
+
+        Parameters
+        ----------
+        key : tuple
+            Operation and call site.
+        elapsed : float
+            Time in seconds spent in the fallback.
+        shape : tuple, optional
+            Shape of the frame collected to the driver.
+        nbytes : int
+            Size of the frame collected to the driver in bytes.
+        """
+        with cls._lock:
+            record = cls._records.setdefault(
+                key,
+                {"count": 0, "shape": None, "max_bytes": 0, "bytes": 0, "time": 0.0},
+            )
+            record["count"] += 1
+            record["bytes"] += nbytes
+            record["time"] += elapsed
+            if shape is not None and nbytes >= record["max_bytes"]:
+                record["max_bytes"] = nbytes
+                record["shape"] = shape
+
+    @classmethod
+    @contextmanager
+    def track(cls) -> Iterator[None]:
+        """
+        Measure the fallback happening in the block of the ``with`` statement.
+
+        Yields
+        ------
+        None
+        """
+        if DefaultToPandasAudit.get() == "disable":
+            yield
+            return
+        stack = cls._tracked()
+        fallback = {"key": None, "shape": None, "bytes": 0}
+        stack.append(fallback)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            if fallback["key"] is not None:
+                cls._record(
+                    fallback["key"],
+                    time.perf_counter() - start,
+                    fallback["shape"],
+                    fallback["bytes"],
+                )
+
+    @classmethod
+    def collected(cls, obj) -> None:
+        """
+        Record the frame collected to the driver by the fallback being measured.
+
+        Parameters
+        ----------
+        obj : pandas.DataFrame or pandas.Series
+            The collected frame.
+        """
+        stack = getattr(cls._local, "stack", None)
+        if not stack or not isinstance(obj, (pandas.DataFrame, pandas.Series)):
+            return
+        nbytes = obj.memory_usage(index=True, deep=False)
+        stack[-1]["shape"] = obj.shape
+        stack[-1]["bytes"] = int(getattr(nbytes, "sum", lambda: nbytes)())
+
+    @classmethod
+    def on_fallback(cls, operation: str, reason: str = "") -> bool:
+        """
+        Handle an operation defaulting to pandas according to ``DefaultToPandasAudit``.
+
+        Parameters
+        ----------
+        operation : str
+            Description of the operation.
+        reason : str, default: ""
+            Reason of the fallback.
+
+        Returns
+        -------
+        bool
+            Whether the fallback has to be warned about as usual.
+        """
+        mode = DefaultToPandasAudit.get()
+        if mode == "disable":
+            return True
+        site = cls._call_site()
+        message = f"{operation} defaulted to pandas at {site}"
+        if reason:
+            message += f"\nReason: {reason}"
+        if mode == "raise":
+            raise DefaultToPandasError(message)
+
+        key = (operation, site)
+        stack = cls._tracked()
+        if stack and stack[-1]["key"] is None:
+            # the size and the time are recorded once the fallback is over
+            stack[-1]["key"] = key
+        else:
+            cls._record(key, 0.0, None, 0)
+        if mode in ("log", "warn"):
+            with cls._lock:
+                first_time = key not in cls._reported
+                cls._reported.add(key)
+            if first_time:
+                if mode == "log":
+                    get_logger().warning(f"Modin Warning: {message}")
+                else:
+                    warnings.warn(message)
+        return False
+
+    @classmethod
+    def report(cls, reset: bool = False) -> pandas.DataFrame:
+        """
+        Get the aggregated records.
+
+        Parameters
+        ----------
+        reset : bool, default: False
+            Whether to clear the records.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        with cls._lock:
+            records = list(cls._records.items())
+            if reset:
+                cls._records = {}
+                cls._reported = set()
+        report = pandas.DataFrame(
+            [
+                {
+                    "operation": operation,
+                    "call_site": site,
+                    "count": record["count"],
+                    "shape": record["shape"],
+                    "max_bytes": record["max_bytes"],
+                    "bytes": record["bytes"],
+                    "time": record["time"],
+                }
+                for (operation, site), record in records
+            ],
+            columns=[
+                "operation",
+                "call_site",
+                "count",
+                "shape",
+                "max_bytes",
+                "bytes",
+                "time",
+            ],
+        )
+        return report.sort_values(["bytes", "time"], ascending=False, ignore_index=True)
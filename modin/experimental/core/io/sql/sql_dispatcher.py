@@ -69,9 +69,10 @@ class ExperimentalSQLDispatcher(SQLDispatcher):
         from modin.experimental.core.io.sql.utils import get_query_info, is_distributed
 
         if not is_distributed(partition_column, lower_bound, upper_bound):
-            message = "Defaulting to Modin core implementation; \
-                'partition_column', 'lower_bound', 'upper_bound' must be different from None"
-            warnings.warn(message)
+            if partition_column is None:
+                message = "Defaulting to Modin core implementation; \
+                    'partition_column', 'lower_bound', 'upper_bound' must be different from None"
+                warnings.warn(message)
             return cls.base_read(
                 sql,
                 con,
@@ -83,6 +84,7 @@ class ExperimentalSQLDispatcher(SQLDispatcher):
                 chunksize=chunksize,
                 dtype_backend=dtype_backend,
                 dtype=dtype,
+                partition_column=partition_column,
             )
         #  starts the distributed alternative
         cols_names, query = get_query_info(sql, con, partition_column)
@@ -46,12 +46,14 @@ def is_distributed(partition_column, lower_bound, upper_bound):
         if upper_bound > lower_bound:
             return True
         raise InvalidArguments("upper_bound must be greater than lower_bound.")
-    elif (partition_column is None) and (lower_bound is None) and (upper_bound is None):
+    elif (lower_bound is None) and (upper_bound is None):
+        # without the bounds the core implementation splits by `partition_column` itself
         return False
     else:
         raise InvalidArguments(
             "Invalid combination of partition_column, lower_bound, upper_bound."
-            + "All these arguments should be passed (distributed) or none of them (standard pandas)."
+            + "All these arguments should be passed (distributed), only partition_column "
+            + "(distributed by the quantiles of partition_column) or none of them."
         )
 
 
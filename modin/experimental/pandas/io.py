@@ -98,7 +98,9 @@ def read_sql(
     dtype : Type name or dict of columns, optional
         Data type for data or columns. E.g. np.float64 or {'a': np.float64, 'b': np.int32, 'c': 'Int64'}. The argument is ignored if a table is passed instead of a query.
     partition_column : str, optional
-        Column used to share the data between the workers (MUST be a INTEGER column).
+        Column used to share the data between the workers (MUST be a INTEGER column
+        if the bounds are passed). Without the bounds the data is split by the quantiles
+        of the column, that can be of any ordered type.
     lower_bound : int, optional
         The minimum value to be requested from the partition_column.
     upper_bound : int, optional
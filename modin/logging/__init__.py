@@ -14,10 +14,12 @@
 from .class_logger import ClassLogger  # noqa: F401
 from .config import get_logger  # noqa: F401
 from .logger_decorator import disable_logging, enable_logging  # noqa: F401
+from .profiler import Profiler  # noqa: F401
 
 __all__ = [
     "ClassLogger",
     "get_logger",
     "enable_logging",
     "disable_logging",
+    "Profiler",
 ]
@@ -26,6 +26,7 @@ from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, overload
 from modin.config import LogMode
 
 from .config import LogLevel, get_logger
+from .profiler import Profiler
 
 _MODIN_LOGGER_NOWRAP = "__modin_logging_nowrap__"
 
@@ -121,11 +122,12 @@ def enable_logging(
 
         assert isinstance(modin_layer, str), "modin_layer is somehow not a string!"
 
-        start_line = f"START::{modin_layer.upper()}::{name or obj.__name__}"
-        stop_line = f"STOP::{modin_layer.upper()}::{name or obj.__name__}"
+        layer = modin_layer.upper()
+        span_name = name or obj.__name__
+        start_line = f"START::{layer}::{span_name}"
+        stop_line = f"STOP::{layer}::{span_name}"
 
-        @wraps(obj)
-        def run_and_log(*args: Tuple, **kwargs: Dict) -> Any:
+        def log_and_run(*args: Tuple, **kwargs: Dict) -> Any:
             """
             Compute function with logging if Modin logging is enabled.
 
@@ -163,6 +165,30 @@ def enable_logging(
                 logger.log(log_level, stop_line)
             return result
 
+        @wraps(obj)
+        def run_and_log(*args: Tuple, **kwargs: Dict) -> Any:
+            """
+            Compute function with logging and profiling if they are enabled.
+
+            Parameters
+            ----------
+            *args : tuple
+                The function arguments.
+            **kwargs : dict
+                The function keyword arguments.
+
+            Returns
+            -------
+            Any
+            """
+            profiler = Profiler.active
+            if profiler is None:
+                if LogMode.get() == "disable":
+                    return obj(*args, **kwargs)
+                return log_and_run(*args, **kwargs)
+            with profiler.span(span_name, layer):
+                return log_and_run(*args, **kwargs)
+
         # make sure we won't decorate multiple times
         return disable_logging(run_and_log)
 
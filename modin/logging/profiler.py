@@ -0,0 +1,574 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module contains ``Profiler`` class.
+
+``Profiler`` records the time spent in the calls of the Modin layers, the algebra
+operators they use and the remote tasks they launch, and exports the records as
+a Chrome trace or a text summary.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# categories of the spans whose names are reported in the enclosing spans
+_NESTED_CATEGORIES = {"OPERATOR": "operators", "PARTITION-MANAGER": "partition_methods"}
+# counters accumulated by every span
+_COUNTERS = ("tasks", "bytes_put", "bytes_materialized", "wait_time")
+# Chrome trace thread ids of the remote task lanes start from this value
+_TASK_LANE_BASE = 1_000_000
+
+
+def _nbytes(obj: Any) -> int:
+    """
+    Estimate the size of an object moved to or from the storage of an engine.
+
+    Parameters
+    ----------
+    obj : object
+        Object to estimate the size of.
+
+    Returns
+    -------
+    int
+        Shallow size of the data in bytes, 0 for the objects of unknown size.
+    """
+    memory_usage = getattr(obj, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(index=True, deep=False)
+        except TypeError:
+            return 0
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sum(_nbytes(item) for item in obj.values())
+    return 0
+
+
+class _Frame:
+    """
+    Span that hasn't finished yet.
+
+    Parameters
+    ----------
+    name : str
+        Name of the span.
+    category : str
+        Category of the span.
+    start : int
+        Start time in nanoseconds.
+    """
+
+    __slots__ = ("name", "category", "start", "counters", "nested")
+
+    def __init__(self, name: str, category: str, start: int):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        self.nested: Dict[str, set] = {}
+
+
+class Profiler:
+    """
+    Recorder of the time spent in Modin operations.
+
+    While a profiler is active, it records a span for every call of a method of
+    the logged Modin layers (see ``ClassLogger``) and for every algebra operator
+    applied. Every span accumulates the number of remote tasks launched in it,
+    the wall time of these tasks, the bytes put to and materialized from the
+    storage of the engine and the time spent blocked waiting for the results.
+
+    The profiler is activated with the ``with`` statement, the records can be
+    exported afterwards with ``to_chrome_trace`` and ``summary``.
+
+    Examples
+    --------
+    >>> with Profiler() as profiler:
+    ...     df.groupby("a").sum()
+    >>> profiler.to_chrome_trace("trace.json")
+    >>> print(profiler.summary())
+    """
+
+    # the profiler recording at the moment
+    active: Optional[Profiler] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._events: List[Dict[str, Any]] = []
+        self._tasks: List[Dict[str, Any]] = []
+        self._start = None
+        self._stop = None
+        self._previous = None
+
+    def __enter__(self) -> Profiler:  # noqa: GL08
+        self._previous = Profiler.active
+        self._start = time.perf_counter_ns()
+        Profiler.active = self
+        return self
+
+    def __exit__(self, *args):  # noqa: GL08
+        self._stop = time.perf_counter_ns()
+        Profiler.active = self._previous
+        self._previous = None
+
+    def _stack(self) -> List[_Frame]:
+        """
+        Get the spans of the current thread that haven't finished yet.
+
+        Returns
+        -------
+        list of _Frame
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _timestamp(self, ns: int) -> float:
+        """
+        Convert a ``time.perf_counter_ns`` value to microseconds since the start.
+
+        Parameters
+        ----------
+        ns : int
+
+        Returns
+        -------
+        float
+        """
+        return (ns - self._start) / 1000
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        """
+        Record the time spent in the block of the ``with`` statement.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+        category : str
+            Category of the span, e.g. the Modin layer.
+
+        Yields
+        ------
+        None
+        """
+        stack = self._stack()
+        nested_key = _NESTED_CATEGORIES.get(category)
+        if nested_key is not None:
+            for frame in stack:
+                frame.nested.setdefault(nested_key, set()).add(name)
+        frame = _Frame(name, category, time.perf_counter_ns())
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            stack.pop()
+            args: Dict[str, Any] = {
+                key: value for key, value in frame.counters.items() if value
+            }
+            for key, names in frame.nested.items():
+                args[key] = sorted(names)
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": self._timestamp(frame.start),
+                "dur": (end - frame.start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+            with self._lock:
+                self._events.append(event)
+
+    def _count(self, counter: str, value) -> None:
+        """
+        Add `value` to a counter of the spans of the current thread.
+
+        Parameters
+        ----------
+        counter : str
+            Name of the counter.
+        value : int or float
+            Value to add.
+        """
+        for frame in self._stack():
+            frame.counters[counter] += value
+
+    def record_task(
+        self, add_done_callback: Optional[Callable[[Callable], Any]] = None
+    ) -> Optional[Callable[..., None]]:
+        """
+        Record a remote task being launched.
+
+        Parameters
+        ----------
+        add_done_callback : callable(callable), optional
+            Function registering a callback to be called once the task completes,
+            like ``add_done_callback`` of the futures. If not specified, the task is
+            considered complete when the returned function is called.
+
+        Returns
+        -------
+        callable or None
+            Function to call once the task completes if `add_done_callback` isn't specified.
+        """
+        stack = self._stack()
+        caller = (stack[-1].category, stack[-1].name) if stack else None
+        self._count("tasks", 1)
+        start = time.perf_counter_ns()
+
+        def on_done(*args):
+            end = time.perf_counter_ns()
+            with self._lock:
+                self._tasks.append({"caller": caller, "start": start, "end": end})
+
+        if add_done_callback is None:
+            return on_done
+        add_done_callback(on_done)
+        return None
+
+    @contextmanager
+    def task(self) -> Iterator[None]:
+        """
+        Record a task executed synchronously in the block of the ``with`` statement.
+
+        Yields
+        ------
+        None
+        """
+        on_done = self.record_task()
+        try:
+            yield
+        finally:
+            on_done()
+
+    def record_put(self, data: Any) -> None:
+        """
+        Record data being put to the storage of the engine.
+
+        Parameters
+        ----------
+        data : object
+            Data put.
+        """
+        self._count("bytes_put", _nbytes(data))
+
+    def record_materialize(self, data: Any, wait_time: float) -> None:
+        """
+        Record data being materialized from the storage of the engine.
+
+        Parameters
+        ----------
+        data : object
+            Data materialized.
+        wait_time : float
+            Time in seconds spent blocked until the data was available.
+        """
+        self._count("bytes_materialized", _nbytes(data))
+        self._count("wait_time", wait_time)
+
+    def record_wait(self, wait_time: float) -> None:
+        """
+        Record the time spent blocked waiting for remote tasks.
+
+        Parameters
+        ----------
+        wait_time : float
+            Time in seconds.
+        """
+        self._count("wait_time", wait_time)
+
+    @contextmanager
+    def waiting(self) -> Iterator[None]:
+        """
+        Record the time spent in the block of the ``with`` statement as waiting.
+
+        Yields
+        ------
+        None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_wait(time.perf_counter() - start)
+
+    def _task_events(self) -> List[Dict[str, Any]]:
+        """
+        Get the Chrome trace events of the remote tasks.
+
+        The tasks are laid out in lanes so that the tasks of a lane don't overlap.
+
+        Returns
+        -------
+        list of dict
+        """
+        pid = os.getpid()
+        lane_ends: List[int] = []
+        events = []
+        with self._lock:
+            tasks = sorted(self._tasks, key=lambda task: task["start"])
+        for task in tasks:
+            for lane, lane_end in enumerate(lane_ends):
+                if lane_end <= task["start"]:
+                    break
+            else:
+                lane = len(lane_ends)
+                lane_ends.append(0)
+            lane_ends[lane] = task["end"]
+            events.append(
+                {
+                    "name": "task",
+                    "cat": "TASK",
+                    "ph": "X",
+                    "ts": self._timestamp(task["start"]),
+                    "dur": (task["end"] - task["start"]) / 1000,
+                    "pid": pid,
+                    "tid": _TASK_LANE_BASE + lane,
+                    "args": {"caller": task["caller"] and task["caller"][1]},
+                }
+            )
+        for lane in range(len(lane_ends)):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": _TASK_LANE_BASE + lane,
+                    "args": {"name": f"remote tasks {lane}"},
+                }
+            )
+        return events
+
+    def to_chrome_trace(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Export the records in the Chrome trace event format.
+
+        The trace can be opened with ``chrome://tracing`` or https://ui.perfetto.dev.
+        The spans of every thread are nested as the calls are, and the remote tasks
+        are shown from their launch till their completion in separate lanes.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path to write the trace to as JSON.
+
+        Returns
+        -------
+        dict
+            The trace.
+        """
+        with self._lock:
+            events = list(self._events)
+        trace = {
+            "traceEvents": events + self._task_events(),
+            "displayTimeUnit": "ms",
+        }
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
+
+    def summary(self, limit: Optional[int] = None) -> str:
+        """
+        Summarize the records as a text table.
+
+        Spans are grouped by category and name and sorted by the total time
+        descending. Time of the nested spans is included in their parents.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Number of rows to show. All rows are shown if not specified.
+
+        Returns
+        -------
+        str
+        """
+        rows: Dict[tuple, Dict[str, float]] = {}
+        with self._lock:
+            events = list(self._events)
+            tasks = list(self._tasks)
+        for event in events:
+            row = rows.setdefault(
+                (event["cat"], event["name"]),
+                dict(calls=0, time=0.0, task_time=0.0, **dict.fromkeys(_COUNTERS, 0)),
+            )
+            row["calls"] += 1
+            row["time"] += event["dur"] / 1000
+            for counter in _COUNTERS:
+                row[counter] += event["args"].get(counter, 0)
+        # wall time of the tasks is attributed to the spans launching them directly
+        for task in tasks:
+            if task["caller"] in rows:
+                rows[task["caller"]]["task_time"] += (task["end"] - task["start"]) / 1e6
+        ordered = sorted(rows.items(), key=lambda item: item[1]["time"], reverse=True)
+        if limit is not None:
+            ordered = ordered[:limit]
+
+        stop = self._stop if self._stop is not None else time.perf_counter_ns()
+        total = (stop - self._start) / 1e6 if self._start is not None else 0.0
+        header = (
+            f"{'category':<18} {'name':<48} {'calls':>7} {'total ms':>11} "
+            + f"{'mean ms':>9} {'tasks':>7} {'task ms':>9} {'wait ms':>9} "
+            + f"{'put MB':>9} {'get MB':>9}"
+        )
+        lines = [
+            f"Profiled {total:.1f} ms, {len(tasks)} remote tasks",
+            header,
+            "-" * len(header),
+        ]
+        for (category, name), row in ordered:
+            lines.append(
+                f"{category:<18.18} {name:<48.48} {row['calls']:>7} "
+                + f"{row['time']:>11.2f} {row['time'] / row['calls']:>9.3f} "
+                + f"{row['tasks']:>7} {row['task_time']:>9.2f} "
+                + f"{row['wait_time'] * 1000:>9.2f} "
+                + f"{row['bytes_put'] / 2**20:>9.2f} "
+                + f"{row['bytes_materialized'] / 2**20:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+def profile_deploy(
+    watch: Optional[Callable[[Any, Callable], Any]] = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Make a function launching a remote task report it to the active profiler.
+
+    Parameters
+    ----------
+    watch : callable(future, callback), optional
+        Function registering a callback to be called once the task returning
+        the future completes. If not specified, the task is considered complete
+        when the decorated function returns.
+
+    Returns
+    -------
+    callable
+        A decorator.
+    """
+
+    def decorator(deploy: Callable) -> Callable:
+        @wraps(deploy)
+        def run(*args, **kwargs):
+            profiler = Profiler.active
+            if profiler is None:
+                return deploy(*args, **kwargs)
+            if watch is None:
+                with profiler.task():
+                    return deploy(*args, **kwargs)
+            result = deploy(*args, **kwargs)
+            # all the results of a task are ready at the same time
+            future = result[0] if isinstance(result, (list, tuple)) else result
+            profiler.record_task(lambda callback: watch(future, callback))
+            return result
+
+        return run
+
+    return decorator
+
+
+def profile_put(put: Callable) -> Callable:
+    """
+    Make a function putting data to the storage of an engine report it to the active profiler.
+
+    Parameters
+    ----------
+    put : callable(cls, data, **kwargs)
+        Function to decorate.
+
+    Returns
+    -------
+    callable
+    """
+
+    @wraps(put)
+    def run(cls, data, *args, **kwargs):
+        profiler = Profiler.active
+        if profiler is not None:
+            profiler.record_put(data)
+        return put(cls, data, *args, **kwargs)
+
+    return run
+
+
+def profile_materialize(materialize: Callable) -> Callable:
+    """
+    Make a function materializing data report it to the active profiler.
+
+    Parameters
+    ----------
+    materialize : callable
+        Function to decorate.
+
+    Returns
+    -------
+    callable
+    """
+
+    @wraps(materialize)
+    def run(*args, **kwargs):
+        profiler = Profiler.active
+        if profiler is None:
+            return materialize(*args, **kwargs)
+        start = time.perf_counter()
+        result = materialize(*args, **kwargs)
+        profiler.record_materialize(result, time.perf_counter() - start)
+        return result
+
+    return run
+
+
+def profile_wait(wait: Callable) -> Callable:
+    """
+    Make a function waiting for remote tasks report the time blocked to the active profiler.
+
+    Parameters
+    ----------
+    wait : callable
+        Function to decorate.
+
+    Returns
+    -------
+    callable
+    """
+
+    @wraps(wait)
+    def run(*args, **kwargs):
+        profiler = Profiler.active
+        if profiler is None:
+            return wait(*args, **kwargs)
+        with profiler.waiting():
+            return wait(*args, **kwargs)
+
+    return run
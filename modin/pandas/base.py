@@ -74,7 +74,7 @@ from pandas.util._validators import (
 )
 
 from modin import pandas as pd
-from modin.error_message import ErrorMessage
+from modin.error_message import ErrorMessage, FallbackAudit
 from modin.logging import ClassLogger, disable_logging
 from modin.pandas.accessor import CachedAccessor, ModinAPI
 from modin.pandas.utils import is_scalar
@@ -91,7 +91,7 @@ if TYPE_CHECKING:
     from .indexing import _iLocIndexer, _LocIndexer
     from .resample import Resampler
     from .series import Series
-    from .window import Expanding, Rolling, Window
+    from .window import Expanding, ExponentialMovingWindow, Rolling, Window
 
 # Similar to pandas, sentinel value to use as kwarg in place of None when None has
 # special meaning and needs to be distinguished from a user explicitly passing None.
@@ -531,70 +531,72 @@ class BasePandasDataset(ClassLogger):
         object
             Result of operation.
         """
-        empty_self_str = "" if not self.empty else " for empty DataFrame"
-        ErrorMessage.default_to_pandas(
-            "`{}.{}`{}".format(
-                type(self).__name__,
-                op if isinstance(op, str) else op.__name__,
-                empty_self_str,
-            ),
-            reason=reason,
-        )
+        with FallbackAudit.track():
+            empty_self_str = "" if not self.empty else " for empty DataFrame"
+            ErrorMessage.default_to_pandas(
+                "`{}.{}`{}".format(
+                    type(self).__name__,
+                    op if isinstance(op, str) else op.__name__,
+                    empty_self_str,
+                ),
+                reason=reason,
+            )
 
-        args = try_cast_to_pandas(args)
-        kwargs = try_cast_to_pandas(kwargs)
-        pandas_obj = self._to_pandas()
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=FutureWarning)
-            if callable(op):
-                result = op(pandas_obj, *args, **kwargs)
-            elif isinstance(op, str):
-                # The inner `getattr` is ensuring that we are treating this object (whether
-                # it is a DataFrame, Series, etc.) as a pandas object. The outer `getattr`
-                # will get the operation (`op`) from the pandas version of the class and run
-                # it on the object after we have converted it to pandas.
-                attr = getattr(self._pandas_class, op)
-                if isinstance(attr, property):
-                    result = getattr(pandas_obj, op)
+            args = try_cast_to_pandas(args)
+            kwargs = try_cast_to_pandas(kwargs)
+            pandas_obj = self._to_pandas()
+            FallbackAudit.collected(pandas_obj)
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=FutureWarning)
+                if callable(op):
+                    result = op(pandas_obj, *args, **kwargs)
+                elif isinstance(op, str):
+                    # The inner `getattr` is ensuring that we are treating this object (whether
+                    # it is a DataFrame, Series, etc.) as a pandas object. The outer `getattr`
+                    # will get the operation (`op`) from the pandas version of the class and run
+                    # it on the object after we have converted it to pandas.
+                    attr = getattr(self._pandas_class, op)
+                    if isinstance(attr, property):
+                        result = getattr(pandas_obj, op)
+                    else:
+                        result = attr(pandas_obj, *args, **kwargs)
                 else:
-                    result = attr(pandas_obj, *args, **kwargs)
-            else:
-                ErrorMessage.catch_bugs_and_request_email(
-                    failure_condition=True,
-                    extra_log="{} is an unsupported operation".format(op),
+                    ErrorMessage.catch_bugs_and_request_email(
+                        failure_condition=True,
+                        extra_log="{} is an unsupported operation".format(op),
+                    )
+            if isinstance(result, pandas.DataFrame):
+                from .dataframe import DataFrame
+
+                return DataFrame(result)
+            elif isinstance(result, pandas.Series):
+                from .series import Series
+
+                return Series(result)
+            # inplace
+            elif result is None:
+                return self._create_or_update_from_compiler(
+                    getattr(pd, type(pandas_obj).__name__)(pandas_obj)._query_compiler,
+                    inplace=True,
                 )
-        if isinstance(result, pandas.DataFrame):
-            from .dataframe import DataFrame
-
-            return DataFrame(result)
-        elif isinstance(result, pandas.Series):
-            from .series import Series
-
-            return Series(result)
-        # inplace
-        elif result is None:
-            return self._create_or_update_from_compiler(
-                getattr(pd, type(pandas_obj).__name__)(pandas_obj)._query_compiler,
-                inplace=True,
-            )
-        else:
-            try:
-                if (
-                    isinstance(result, (list, tuple))
-                    and len(result) == 2
-                    and isinstance(result[0], pandas.DataFrame)
-                ):
-                    # Some operations split the DataFrame into two (e.g. align). We need to wrap
-                    # both of the returned results
-                    if isinstance(result[1], pandas.DataFrame):
-                        second = self.__constructor__(result[1])
+            else:
+                try:
+                    if (
+                        isinstance(result, (list, tuple))
+                        and len(result) == 2
+                        and isinstance(result[0], pandas.DataFrame)
+                    ):
+                        # Some operations split the DataFrame into two (e.g. align). We need to wrap
+                        # both of the returned results
+                        if isinstance(result[1], pandas.DataFrame):
+                            second = self.__constructor__(result[1])
+                        else:
+                            second = result[1]
+                        return self.__constructor__(result[0]), second
                     else:
-                        second = result[1]
-                    return self.__constructor__(result[0]), second
-                else:
+                        return result
+                except TypeError:
                     return result
-            except TypeError:
-                return result
 
     @classmethod
     def _get_axis_number(cls, axis) -> int:
@@ -1625,12 +1627,34 @@ class BasePandasDataset(ClassLogger):
         axis: Axis = lib.no_default,
         times: str | np.ndarray | BasePandasDataset | None = None,
         method: str = "single",
-    ) -> pandas.core.window.ewm.ExponentialMovingWindow:  # noqa: PR01, RT01, D200
+    ) -> ExponentialMovingWindow:  # noqa: PR01, RT01, D200
         """
         Provide exponentially weighted (EW) calculations.
         """
-        return self._default_to_pandas(
-            "ewm",
+        from .window import ExponentialMovingWindow
+
+        if axis is not lib.no_default:
+            axis = self._get_axis_number(axis)
+            name = "ewm"
+            if axis == 1:
+                warnings.warn(
+                    f"Support for axis=1 in {type(self).__name__}.{name} is "
+                    + "deprecated and will be removed in a future version. "
+                    + f"Use obj.T.{name}(...) instead",
+                    FutureWarning,
+                )
+            else:
+                warnings.warn(
+                    f"The 'axis' keyword in {type(self).__name__}.{name} is "
+                    + "deprecated and will be removed in a future version. "
+                    + "Call the method without the axis keyword instead.",
+                    FutureWarning,
+                )
+        else:
+            axis = 0
+
+        return ExponentialMovingWindow(
+            self,
             com=com,
             span=span,
             halflife=halflife,
@@ -2322,7 +2346,10 @@ class BasePandasDataset(ClassLogger):
                     + "pct_change to retain current behavior and silence this warning.",
                     FutureWarning,
                 )
-            fill_method = "pad"
+                fill_method = "pad"
+            else:
+                # padding has no effect without missing values
+                fill_method = None
         if limit is lib.no_default:
             limit = None
 
@@ -3619,7 +3646,7 @@ class BasePandasDataset(ClassLogger):
             FactoryDispatcher,
         )
 
-        FactoryDispatcher.to_sql(
+        return FactoryDispatcher.to_sql(
             new_query_compiler,
             name=name,
             con=con,
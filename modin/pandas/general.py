@@ -179,7 +179,6 @@ def merge_asof(
         raise ValueError(
             "can not merge DataFrame with instance of type {}".format(type(right))
         )
-    ErrorMessage.default_to_pandas("`merge_asof`")
 
     # As of Pandas 1.2 these should raise an error; before that it did
     # something likely random:
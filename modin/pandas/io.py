@@ -111,11 +111,12 @@ def _read(**kwargs):
     modin.pandas.DataFrame
     """
     from modin.core.execution.dispatching.factories.dispatcher import FactoryDispatcher
+    from modin.core.io.text.text_file_reader import TextFileChunkReader
 
     squeeze = kwargs.pop("squeeze", False)
     pd_obj = FactoryDispatcher.read_csv(**kwargs)
     # This happens when `read_csv` returns a TextFileReader object for iterating through
-    if isinstance(pd_obj, TextFileReader):
+    if isinstance(pd_obj, (TextFileReader, TextFileChunkReader)):
         reader = pd_obj.read
         pd_obj.read = lambda *args, **kwargs: ModinObjects.DataFrame(
             query_compiler=reader(*args, **kwargs)
@@ -666,6 +667,7 @@ def read_fwf(
     from pandas.io.parsers.base_parser import parser_defaults
 
     from modin.core.execution.dispatching.factories.dispatcher import FactoryDispatcher
+    from modin.core.io.text.text_file_reader import TextFileChunkReader
 
     _, _, _, kwargs = inspect.getargvalues(inspect.currentframe())
     kwargs.update(kwargs.pop("kwds", {}))
@@ -673,7 +675,7 @@ def read_fwf(
     target_kwargs.update(kwargs)
     pd_obj = FactoryDispatcher.read_fwf(**target_kwargs)
     # When `read_fwf` returns a TextFileReader object for iterating through
-    if isinstance(pd_obj, TextFileReader):
+    if isinstance(pd_obj, (TextFileReader, TextFileChunkReader)):
         reader = pd_obj.read
         pd_obj.read = lambda *args, **kwargs: ModinObjects.DataFrame(
             query_compiler=reader(*args, **kwargs)
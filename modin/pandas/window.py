@@ -11,19 +11,20 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
-"""Implement Window and Rolling public API."""
+"""Implement Window, Rolling, Expanding and ExponentialMovingWindow public API."""
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, Union
 
+import pandas.core.window.ewm
 import pandas.core.window.rolling
 from pandas.core.dtypes.common import is_list_like
 
 from modin.error_message import ErrorMessage
 from modin.logging import ClassLogger
 from modin.pandas.utils import cast_function_modin2pandas
-from modin.utils import _inherit_docstrings
+from modin.utils import _inherit_docstrings, try_cast_to_pandas
 
 if TYPE_CHECKING:
     from modin.core.storage_formats import BaseQueryCompiler
@@ -524,3 +525,136 @@ class Expanding(ClassLogger):
                 **kwargs,
             )
         )
+
+
+@_inherit_docstrings(
+    pandas.core.window.ewm.ExponentialMovingWindow,
+    excluded=[pandas.core.window.ewm.ExponentialMovingWindow.__init__],
+)
+class ExponentialMovingWindow(ClassLogger):
+    def __init__(
+        self,
+        dataframe,
+        com=None,
+        span=None,
+        halflife=None,
+        alpha=None,
+        min_periods=0,
+        adjust=True,
+        ignore_na=False,
+        axis=0,
+        times=None,
+        method="single",
+    ):
+        self._dataframe = dataframe
+        self._query_compiler = dataframe._query_compiler
+        self.ewm_kwargs = {
+            "com": com,
+            "span": span,
+            "halflife": halflife,
+            "alpha": alpha,
+            "min_periods": min_periods,
+            "adjust": adjust,
+            "ignore_na": ignore_na,
+            "axis": axis,
+            "times": try_cast_to_pandas(times),
+            "method": method,
+        }
+        self.axis = axis
+
+    def aggregate(self, func, *args, **kwargs):
+        from .dataframe import DataFrame
+
+        dataframe = DataFrame(
+            query_compiler=self._query_compiler.ewm_aggregate(
+                self.axis, self.ewm_kwargs, func, *args, **kwargs
+            )
+        )
+        if isinstance(self._dataframe, DataFrame):
+            return dataframe
+        elif is_list_like(func):
+            dataframe.columns = dataframe.columns.droplevel()
+            return dataframe
+        else:
+            return dataframe.squeeze()
+
+    agg = aggregate
+
+    def mean(self, numeric_only=False, engine=None, engine_kwargs=None):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_mean(
+                self.axis,
+                self.ewm_kwargs,
+                numeric_only=numeric_only,
+                engine=engine,
+                engine_kwargs=engine_kwargs,
+            )
+        )
+
+    def sum(self, numeric_only=False, engine=None, engine_kwargs=None):
+        if not self.ewm_kwargs["adjust"]:
+            raise NotImplementedError("sum is not implemented with adjust=False")
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_sum(
+                self.axis,
+                self.ewm_kwargs,
+                numeric_only=numeric_only,
+                engine=engine,
+                engine_kwargs=engine_kwargs,
+            )
+        )
+
+    def var(self, bias=False, numeric_only=False):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_var(
+                self.axis, self.ewm_kwargs, bias=bias, numeric_only=numeric_only
+            )
+        )
+
+    def std(self, bias=False, numeric_only=False):
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_std(
+                self.axis, self.ewm_kwargs, bias=bias, numeric_only=numeric_only
+            )
+        )
+
+    def cov(self, other=None, pairwise=None, bias=False, numeric_only=False):
+        from .dataframe import DataFrame
+        from .series import Series
+
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_cov(
+                self.axis,
+                self.ewm_kwargs,
+                squeeze_self=isinstance(self._dataframe, Series),
+                squeeze_other=isinstance(other, Series),
+                other=(
+                    other._query_compiler
+                    if isinstance(other, (Series, DataFrame))
+                    else other
+                ),
+                pairwise=pairwise,
+                bias=bias,
+                numeric_only=numeric_only,
+            )
+        )
+
+    def corr(self, other=None, pairwise=None, numeric_only=False):
+        from .dataframe import DataFrame
+        from .series import Series
+
+        return self._dataframe.__constructor__(
+            query_compiler=self._query_compiler.ewm_corr(
+                self.axis,
+                self.ewm_kwargs,
+                squeeze_self=isinstance(self._dataframe, Series),
+                squeeze_other=isinstance(other, Series),
+                other=(
+                    other._query_compiler
+                    if isinstance(other, (Series, DataFrame))
+                    else other
+                ),
+                pairwise=pairwise,
+                numeric_only=numeric_only,
+            )
+        )
@@ -12,6 +12,21 @@
 # governing permissions and limitations under the License.
 
 from modin.polars.dataframe import DataFrame
+from modin.polars.expr import Expr
+from modin.polars.functions import col
+from modin.polars.functions import len_ as len
+from modin.polars.functions import lit
+from modin.polars.lazyframe import LazyFrame, scan_csv, scan_parquet
 from modin.polars.series import Series
 
-__all__ = ["DataFrame", "Series"]
+__all__ = [
+    "DataFrame",
+    "Expr",
+    "LazyFrame",
+    "Series",
+    "col",
+    "len",
+    "lit",
+    "scan_csv",
+    "scan_parquet",
+]
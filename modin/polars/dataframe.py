@@ -28,6 +28,7 @@ from modin.pandas import DataFrame as ModinPandasDataFrame
 from modin.pandas import Series as ModinPandasSeries
 from modin.pandas.io import from_pandas
 from modin.polars.base import BasePolarsDataset
+from modin.polars.expr import Expr
 
 if TYPE_CHECKING:
     from modin.polars import Series
@@ -1050,12 +1051,19 @@ class DataFrame(BasePolarsDataset):
         raise NotImplementedError("not yet")
 
     def select(self, *exprs, **named_exprs) -> "DataFrame":
-        # TODO: support expressions
-        raise NotImplementedError("not yet")
+        """
+        Select the columns computed by the expressions.
 
-    def select_seq(self, *exprs, **named_exprs) -> "DataFrame":
-        # TODO: support expressions
-        raise NotImplementedError("not yet")
+        Args:
+            exprs: Expressions or column names to select.
+            named_exprs: Expressions to select named by the keys.
+
+        Returns:
+            DataFrame with the selected columns.
+        """
+        return self.lazy().select(*exprs, **named_exprs).collect()
+
+    select_seq = select
 
     def set_sorted(
         self, column: str | Iterable[str], *more_columns: str, descending: bool = False
@@ -1215,12 +1223,19 @@ class DataFrame(BasePolarsDataset):
             )
 
     def with_columns(self, *exprs, **named_exprs) -> "DataFrame":
-        # TODO: support expressions
-        raise NotImplementedError("not yet")
+        """
+        Add the columns computed by the expressions.
 
-    def with_columns_seq(self, *exprs, **named_exprs) -> "DataFrame":
-        # TODO: support expressions
-        raise NotImplementedError("not yet")
+        Args:
+            exprs: Expressions computing the columns.
+            named_exprs: Expressions computing the columns named by the keys.
+
+        Returns:
+            DataFrame with the columns added.
+        """
+        return self.lazy().with_columns(*exprs, **named_exprs).collect()
+
+    with_columns_seq = with_columns
 
     def with_row_index(self, name: str = "index", offset: int = 0) -> "DataFrame":
         """
@@ -1278,7 +1293,25 @@ class DataFrame(BasePolarsDataset):
         Returns:
             Lazy DataFrame.
         """
-        raise NotImplementedError("not yet")
+        from modin.polars.lazyframe import LazyFrame
+        from modin.polars.plan import DataFrameScan
+
+        return LazyFrame(_plan=DataFrameScan(self._query_compiler))
+
+    def filter(self, *predicates, **constraints: Any) -> "DataFrame":
+        """
+        Keep the rows all the predicates hold for.
+
+        Args:
+            predicates: Boolean expressions or Series.
+            constraints: Column names and the values the columns have to be equal to.
+
+        Returns:
+            Filtered DataFrame.
+        """
+        if constraints or any(isinstance(p, Expr) for p in predicates):
+            return self.lazy().filter(*predicates, **constraints).collect()
+        return super().filter(*predicates)
 
     @classmethod
     def deserialize(cls, source) -> "DataFrame":
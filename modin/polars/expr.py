@@ -0,0 +1,720 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses ``Expr`` class, that is an expression over the columns of a frame as polars does."""
+
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING, Any, Hashable, Iterator
+
+import pandas
+from pandas.api.types import is_list_like, is_scalar
+
+from modin.pandas.io import from_pandas
+
+if TYPE_CHECKING:
+    from modin.core.storage_formats.base.query_compiler import BaseQueryCompiler
+
+# name of the binary operation -> (query compiler method, reflected query compiler
+# method, python operator, polars-like representation)
+_BINARY_OPS = {
+    "add": ("add", "radd", operator.add, "+"),
+    "sub": ("sub", "rsub", operator.sub, "-"),
+    "mul": ("mul", "rmul", operator.mul, "*"),
+    "truediv": ("truediv", "rtruediv", operator.truediv, "/"),
+    "floordiv": ("floordiv", "rfloordiv", operator.floordiv, "//"),
+    "mod": ("mod", "rmod", operator.mod, "%"),
+    "pow": ("pow", "rpow", operator.pow, "**"),
+    "eq": ("eq", "eq", operator.eq, "=="),
+    "ne": ("ne", "ne", operator.ne, "!="),
+    "lt": ("lt", "gt", operator.lt, "<"),
+    "le": ("le", "ge", operator.le, "<="),
+    "gt": ("gt", "lt", operator.gt, ">"),
+    "ge": ("ge", "le", operator.ge, ">="),
+    "and": ("__and__", "__rand__", operator.and_, "&"),
+    "or": ("__or__", "__ror__", operator.or_, "|"),
+}
+
+# comparisons with a null give a null, so the filters drop such rows as polars does
+_COMPARISON_OPS = ("eq", "ne", "lt", "le", "gt", "ge")
+
+_UNARY_OPS = {
+    "not": "invert",
+    "neg": "negative",
+    "abs": "abs",
+    "is_null": "isna",
+    "is_not_null": "notna",
+}
+
+# name of the aggregation -> name of the pandas aggregation
+AGGREGATIONS = {
+    "sum": "sum",
+    "mean": "mean",
+    "min": "min",
+    "max": "max",
+    "median": "median",
+    "std": "std",
+    "var": "var",
+    "count": "count",
+    "n_unique": "nunique",
+    "first": "first",
+    "last": "last",
+}
+
+
+def _wrap(value) -> "Expr":
+    """
+    Wrap a value into a literal expression unless it's an expression already.
+
+    Args:
+        value: Value to wrap.
+
+    Returns:
+        Expression.
+    """
+    return value if isinstance(value, Expr) else Expr("lit", value)
+
+
+def _set_name(query_compiler: BaseQueryCompiler, name) -> BaseQueryCompiler:
+    """
+    Rename the only column of the query compiler.
+
+    Args:
+        query_compiler: Single-column query compiler.
+        name: New name of the column.
+
+    Returns:
+        Query compiler with the column renamed.
+    """
+    query_compiler = query_compiler.copy()
+    query_compiler.columns = pandas.Index([name])
+    return query_compiler
+
+
+def _is_null_scalar(value) -> bool:
+    """
+    Check whether the value is a null python scalar.
+
+    Args:
+        value: Evaluated expression, either a query compiler or a python scalar.
+
+    Returns:
+        True if the value is a null scalar.
+    """
+    return is_scalar(value) and pandas.isna(value)
+
+
+def _propagate_nulls(query_compiler: BaseQueryCompiler, *operands) -> BaseQueryCompiler:
+    """
+    Set the result of a comparison to null where any of its operands is null.
+
+    Args:
+        query_compiler: Single-column query compiler with the result of the comparison.
+        *operands: Operands of the comparison, query compilers or python scalars.
+
+    Returns:
+        Single-column query compiler of the nullable boolean type.
+    """
+    name = query_compiler.columns[0]
+    if any(_is_null_scalar(operand) for operand in operands):
+        # a comparison with a null literal is null everywhere
+        is_not_null = query_compiler.isna()
+    else:
+        is_null = None
+        for operand in operands:
+            if hasattr(operand, "to_pandas"):
+                operand_is_null = _set_name(operand.isna(), name)
+                is_null = (
+                    operand_is_null
+                    if is_null is None
+                    else is_null.__or__(operand_is_null)
+                )
+        is_not_null = is_null.invert()
+    # the type is set after the nulls, so the empty results are boolean as well
+    return query_compiler.where(is_not_null, pandas.NA).astype({name: "boolean"})
+
+
+def to_scalar(value) -> Any:
+    """
+    Materialize an evaluated scalar expression.
+
+    Args:
+        value: Evaluated scalar expression, either a 1x1 query compiler or a python scalar.
+
+    Returns:
+        Python scalar.
+    """
+    if hasattr(value, "to_pandas"):
+        return value.to_pandas().iloc[0, 0]
+    return value
+
+
+def scalar_to_query_compiler(value, name) -> BaseQueryCompiler:
+    """
+    Build a single-row query compiler from an evaluated scalar expression.
+
+    Args:
+        value: Evaluated scalar expression, either a 1x1 query compiler or a python scalar.
+        name: Name of the column.
+
+    Returns:
+        Single-row query compiler.
+    """
+    if hasattr(value, "to_pandas"):
+        return _set_name(value.reset_index(drop=True), name)
+    return from_pandas(pandas.DataFrame({name: [value]}))._query_compiler
+
+
+class Expr:
+    """
+    Expression over the columns of a frame.
+
+    Expressions are immutable trees that record an operation and its arguments,
+    they are evaluated against a query compiler when a lazy frame is collected.
+
+    Args:
+        op: Name of the operation.
+        args: Arguments of the operation, either expressions or constants.
+    """
+
+    def __init__(self, op: str, *args) -> None:
+        self._op = op
+        self._args = args
+
+    def __bool__(self):
+        raise TypeError(
+            "the truth value of an Expr is ambiguous, use '&' or '|' "
+            + "to combine expressions instead of 'and' or 'or'"
+        )
+
+    def __repr__(self):
+        op, args = self._op, self._args
+        if op == "col":
+            return f'col("{args[0]}")'
+        if op == "lit":
+            return f"lit({args[0]!r})"
+        if op == "len":
+            return "len()"
+        if op == "alias":
+            return f'{args[0]!r}.alias("{args[1]}")'
+        if op == "binary":
+            return f"({args[1]!r} {_BINARY_OPS[args[0]][3]} {args[2]!r})"
+        if op == "unary":
+            return f"{args[1]!r}.{args[0]}()"
+        if op == "is_in":
+            return f"{args[0]!r}.is_in({list(args[1])!r})"
+        if op == "fill_null":
+            return f"{args[0]!r}.fill_null({args[1]!r})"
+        kwargs = ", ".join(f"{key}={value!r}" for key, value in args[2])
+        return f"{args[1]!r}.{args[0]}({kwargs})"
+
+    def _key(self) -> Hashable:
+        """
+        Get a structural key of the expression.
+
+        Expressions that compute the same values have the same keys.
+
+        Returns:
+            Hashable key.
+        """
+        key = [self._op]
+        for arg in self._args:
+            if isinstance(arg, Expr):
+                key.append(arg._key())
+            else:
+                try:
+                    hash(arg)
+                except TypeError:
+                    arg = repr(arg)
+                key.append((type(arg).__name__, arg))
+        return tuple(key)
+
+    def _children(self) -> list["Expr"]:
+        """
+        Get the direct subexpressions of the expression.
+
+        Returns:
+            List of expressions.
+        """
+        return [arg for arg in self._args if isinstance(arg, Expr)]
+
+    def _iter_subexpressions(self) -> Iterator["Expr"]:
+        """
+        Iterate over the expression and all of its subexpressions.
+
+        Yields:
+            Expressions in the depth-first order.
+        """
+        yield self
+        for child in self._children():
+            yield from child._iter_subexpressions()
+
+    def _root_names(self) -> list[str]:
+        """
+        Get names of the columns the expression reads.
+
+        Returns:
+            List of column names, without duplicates.
+        """
+        names = {}
+        for expr in self._iter_subexpressions():
+            if expr._op == "col":
+                names[expr._args[0]] = None
+        return list(names)
+
+    def _output_name(self) -> str:
+        """
+        Get the name of the column the expression produces.
+
+        Returns:
+            Name of the column.
+        """
+        op, args = self._op, self._args
+        if op == "col":
+            return args[0]
+        if op == "alias":
+            return args[1]
+        if op == "lit":
+            return "literal"
+        if op == "len":
+            return "len"
+        if op == "binary":
+            left, right = args[1:]
+            return (
+                right._output_name()
+                if left._op == "lit" and right._op != "lit"
+                else left._output_name()
+            )
+        return (
+            args[0]._output_name()
+            if op in ("is_in", "fill_null")
+            else args[1]._output_name()
+        )
+
+    def _is_scalar(self) -> bool:
+        """
+        Check whether the expression produces a single value instead of a column.
+
+        Returns:
+            True if the expression is a literal or an aggregation.
+        """
+        if self._op in ("lit", "len", "agg"):
+            return True
+        if self._op == "col":
+            return False
+        return all(child._is_scalar() for child in self._children())
+
+    def _unalias(self) -> "Expr":
+        """
+        Strip the aliases from the top of the expression.
+
+        Returns:
+            Expression without the top-level aliases.
+        """
+        expr = self
+        while expr._op == "alias":
+            expr = expr._args[0]
+        return expr
+
+    def _evaluate(self, query_compiler: BaseQueryCompiler, cache: dict | None = None):
+        """
+        Evaluate the expression against the columns of a query compiler.
+
+        Args:
+            query_compiler: Query compiler to read the columns from.
+            cache: Mapping of the expression keys to the already evaluated subexpressions.
+                The subexpressions whose keys are in the mapping are evaluated only once.
+
+        Returns:
+            Python scalar for literals, single-row query compiler for aggregations,
+            single-column query compiler otherwise.
+        """
+        if cache is not None and self._key() in cache:
+            key = self._key()
+            if cache[key] is None:
+                cache[key] = self._evaluate_impl(query_compiler, cache)
+            return cache[key]
+        return self._evaluate_impl(query_compiler, cache)
+
+    def _evaluate_impl(self, query_compiler, cache):
+        """
+        Evaluate the expression against the columns of a query compiler skipping the cache lookup.
+
+        Args:
+            query_compiler: Query compiler to read the columns from.
+            cache: Mapping of the expression keys to the already evaluated subexpressions.
+
+        Returns:
+            Python scalar for literals, single-row query compiler for aggregations,
+            single-column query compiler otherwise.
+        """
+        op, args = self._op, self._args
+        if op == "col":
+            if args[0] not in query_compiler.columns:
+                import polars
+
+                raise polars.exceptions.ColumnNotFoundError(args[0])
+            return query_compiler.getitem_column_array([args[0]])
+        if op == "lit":
+            return args[0]
+        if op == "len":
+            return len(query_compiler.index)
+        if op == "alias":
+            return args[0]._evaluate(query_compiler, cache)
+        if op == "binary":
+            return self._evaluate_binary(query_compiler, cache)
+
+        value = args[0 if op in ("is_in", "fill_null") else 1]._evaluate(
+            query_compiler, cache
+        )
+        if op == "unary":
+            if not hasattr(value, "to_pandas"):
+                value = from_pandas(pandas.DataFrame([value]))._query_compiler
+            return getattr(value, _UNARY_OPS[args[0]])()
+        if op == "is_in":
+            return value.isin(values=list(args[1]))
+        if op == "fill_null":
+            return value.fillna(
+                value=to_scalar(args[1]._evaluate(query_compiler, cache))
+            )
+        return self._evaluate_aggregation(value)
+
+    def _evaluate_binary(self, query_compiler, cache):
+        """
+        Evaluate the binary operation expression.
+
+        Args:
+            query_compiler: Query compiler to read the columns from.
+            cache: Mapping of the expression keys to the already evaluated subexpressions.
+
+        Returns:
+            Python scalar, single-row or single-column query compiler.
+        """
+        name, left, right = self._args
+        method, reflected_method, python_op, _ = _BINARY_OPS[name]
+        left_value = left._evaluate(query_compiler, cache)
+        right_value = right._evaluate(query_compiler, cache)
+        # scalars are broadcast to the columns
+        if left._is_scalar() and not right._is_scalar():
+            left_value = to_scalar(left_value)
+        elif right._is_scalar() and not left._is_scalar():
+            right_value = to_scalar(right_value)
+
+        left_is_qc = hasattr(left_value, "to_pandas")
+        right_is_qc = hasattr(right_value, "to_pandas")
+        if left_is_qc and right_is_qc:
+            # align the names so the columns are matched with each other
+            left_value = _set_name(left_value, "__expr__")
+            right_value = _set_name(right_value, "__expr__")
+            result = getattr(left_value, method)(right_value)
+        elif left_is_qc:
+            result = getattr(left_value, method)(right_value)
+        elif right_is_qc:
+            result = getattr(right_value, reflected_method)(left_value)
+        else:
+            if name in _COMPARISON_OPS and (
+                _is_null_scalar(left_value) or _is_null_scalar(right_value)
+            ):
+                return None
+            return python_op(left_value, right_value)
+        if name in _COMPARISON_OPS:
+            result = _propagate_nulls(result, left_value, right_value)
+        return result
+
+    def _evaluate_aggregation(self, value):
+        """
+        Evaluate the aggregation expression over the evaluated subexpression.
+
+        Args:
+            value: Evaluated subexpression.
+
+        Returns:
+            Single-row query compiler.
+        """
+        func, _, kwargs = self._args
+        kwargs = dict(kwargs)
+        if not hasattr(value, "to_pandas"):
+            value = from_pandas(pandas.DataFrame([value]))._query_compiler
+        if func in ("first", "last"):
+            num_rows = len(value.index)
+            if num_rows == 0:
+                return from_pandas(
+                    pandas.DataFrame([None], columns=value.columns)
+                )._query_compiler
+            return value.getitem_row_array([0 if func == "first" else num_rows - 1])
+        if func == "n_unique":
+            return value.nunique(axis=0, dropna=False)
+        return getattr(value, AGGREGATIONS[func])(axis=0, **kwargs)
+
+    def _binary(self, name: str, other, reflected: bool = False) -> "Expr":
+        other = _wrap(other)
+        return (
+            Expr("binary", name, other, self)
+            if reflected
+            else Expr("binary", name, self, other)
+        )
+
+    def _aggregation(self, name: str, **kwargs) -> "Expr":
+        return Expr("agg", name, self, tuple(sorted(kwargs.items())))
+
+    def __add__(self, other) -> "Expr":
+        return self._binary("add", other)
+
+    def __radd__(self, other) -> "Expr":
+        return self._binary("add", other, reflected=True)
+
+    def __sub__(self, other) -> "Expr":
+        return self._binary("sub", other)
+
+    def __rsub__(self, other) -> "Expr":
+        return self._binary("sub", other, reflected=True)
+
+    def __mul__(self, other) -> "Expr":
+        return self._binary("mul", other)
+
+    def __rmul__(self, other) -> "Expr":
+        return self._binary("mul", other, reflected=True)
+
+    def __truediv__(self, other) -> "Expr":
+        return self._binary("truediv", other)
+
+    def __rtruediv__(self, other) -> "Expr":
+        return self._binary("truediv", other, reflected=True)
+
+    def __floordiv__(self, other) -> "Expr":
+        return self._binary("floordiv", other)
+
+    def __rfloordiv__(self, other) -> "Expr":
+        return self._binary("floordiv", other, reflected=True)
+
+    def __mod__(self, other) -> "Expr":
+        return self._binary("mod", other)
+
+    def __rmod__(self, other) -> "Expr":
+        return self._binary("mod", other, reflected=True)
+
+    def __pow__(self, other) -> "Expr":
+        return self._binary("pow", other)
+
+    def __rpow__(self, other) -> "Expr":
+        return self._binary("pow", other, reflected=True)
+
+    def __eq__(self, other) -> "Expr":  # type: ignore[override]
+        return self._binary("eq", other)
+
+    def __ne__(self, other) -> "Expr":  # type: ignore[override]
+        return self._binary("ne", other)
+
+    def __lt__(self, other) -> "Expr":
+        return self._binary("lt", other)
+
+    def __le__(self, other) -> "Expr":
+        return self._binary("le", other)
+
+    def __gt__(self, other) -> "Expr":
+        return self._binary("gt", other)
+
+    def __ge__(self, other) -> "Expr":
+        return self._binary("ge", other)
+
+    def __and__(self, other) -> "Expr":
+        return self._binary("and", other)
+
+    def __rand__(self, other) -> "Expr":
+        return self._binary("and", other, reflected=True)
+
+    def __or__(self, other) -> "Expr":
+        return self._binary("or", other)
+
+    def __ror__(self, other) -> "Expr":
+        return self._binary("or", other, reflected=True)
+
+    def __invert__(self) -> "Expr":
+        return Expr("unary", "not", self)
+
+    def __neg__(self) -> "Expr":
+        return Expr("unary", "neg", self)
+
+    def __abs__(self) -> "Expr":
+        return self.abs()
+
+    def alias(self, name: str) -> "Expr":
+        """
+        Rename the output of the expression.
+
+        Args:
+            name: New name.
+
+        Returns:
+            Renamed expression.
+        """
+        return Expr("alias", self, name)
+
+    def abs(self) -> "Expr":
+        """
+        Compute absolute values.
+
+        Returns:
+            Expression of absolute values.
+        """
+        return Expr("unary", "abs", self)
+
+    def is_null(self) -> "Expr":
+        """
+        Check whether the values are null.
+
+        Returns:
+            Boolean expression.
+        """
+        return Expr("unary", "is_null", self)
+
+    def is_not_null(self) -> "Expr":
+        """
+        Check whether the values are not null.
+
+        Returns:
+            Boolean expression.
+        """
+        return Expr("unary", "is_not_null", self)
+
+    def is_in(self, other) -> "Expr":
+        """
+        Check whether the values are contained in the collection.
+
+        Args:
+            other: Collection of values.
+
+        Returns:
+            Boolean expression.
+        """
+        if not is_list_like(other):
+            raise TypeError(f"'is_in' expects a collection, got {type(other)}")
+        return Expr("is_in", self, tuple(other))
+
+    def fill_null(self, value) -> "Expr":
+        """
+        Fill the null values with the given value.
+
+        Args:
+            value: Value to fill the nulls with.
+
+        Returns:
+            Expression with the nulls filled.
+        """
+        return Expr("fill_null", self, _wrap(value))
+
+    def sum(self) -> "Expr":
+        """
+        Aggregate the values to their sum.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("sum")
+
+    def mean(self) -> "Expr":
+        """
+        Aggregate the values to their mean.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("mean")
+
+    def min(self) -> "Expr":
+        """
+        Aggregate the values to their minimum.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("min")
+
+    def max(self) -> "Expr":
+        """
+        Aggregate the values to their maximum.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("max")
+
+    def median(self) -> "Expr":
+        """
+        Aggregate the values to their median.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("median")
+
+    def std(self, ddof: int = 1) -> "Expr":
+        """
+        Aggregate the values to their standard deviation.
+
+        Args:
+            ddof: Delta degrees of freedom.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("std", ddof=ddof)
+
+    def var(self, ddof: int = 1) -> "Expr":
+        """
+        Aggregate the values to their variance.
+
+        Args:
+            ddof: Delta degrees of freedom.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("var", ddof=ddof)
+
+    def count(self) -> "Expr":
+        """
+        Aggregate the values to the number of non-null values.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("count")
+
+    def n_unique(self) -> "Expr":
+        """
+        Aggregate the values to the number of unique values.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("n_unique")
+
+    def first(self) -> "Expr":
+        """
+        Aggregate the values to the first value.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("first")
+
+    def last(self) -> "Expr":
+        """
+        Aggregate the values to the last value.
+
+        Returns:
+            Aggregation expression.
+        """
+        return self._aggregation("last")
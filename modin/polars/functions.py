@@ -0,0 +1,52 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Module houses functions creating expressions as polars does."""
+
+from modin.polars.expr import Expr
+
+
+def col(name: str) -> Expr:
+    """
+    Create an expression reading a column.
+
+    Args:
+        name: Name of the column.
+
+    Returns:
+        Column expression.
+    """
+    return Expr("col", name)
+
+
+def lit(value) -> Expr:
+    """
+    Create a literal expression.
+
+    Args:
+        value: Value of the literal.
+
+    Returns:
+        Literal expression.
+    """
+    return Expr("lit", value)
+
+
+def len_() -> Expr:
+    """
+    Create an expression counting the rows.
+
+    Returns:
+        Expression producing the number of rows (of each group in a group-by context).
+    """
+    return Expr("len")
@@ -29,6 +29,7 @@ class GroupBy:
         **named_by,
     ) -> None:
         self.df = df
+        self._by_args = by
         if len(by) == 1:
             self.by = by[0]
         else:
@@ -42,7 +43,16 @@ class GroupBy:
         self.maintain_order = maintain_order
 
     def agg(self, *aggs, **named_aggs):
-        raise NotImplementedError("not yet")
+        from modin.polars.expr import Expr
+
+        if self.named_by or not all(isinstance(b, (str, Expr)) for b in self._by_args):
+            raise NotImplementedError("not yet")
+        return (
+            self.df.lazy()
+            .group_by(*self._by_args, maintain_order=self.maintain_order)
+            .agg(*aggs, **named_aggs)
+            .collect()
+        )
 
     def all(self):
         raise NotImplementedError("not yet")
@@ -11,12 +11,462 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+"""Module houses ``LazyFrame`` class, that is distributed version of ``polars.LazyFrame``."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from pandas.api.types import is_list_like
+
 from modin.polars.base import BasePolarsDataset
+from modin.polars.expr import Expr
+from modin.polars.functions import col, lit
+from modin.polars.plan import (
+    CsvScan,
+    DataFrameScan,
+    Filter,
+    GroupByAgg,
+    Join,
+    LogicalPlan,
+    ParquetScan,
+    Select,
+    Slice,
+    Sort,
+    WithColumns,
+    optimize,
+)
+
+if TYPE_CHECKING:
+    from modin.core.storage_formats.base.query_compiler import BaseQueryCompiler
+    from modin.polars import DataFrame
+
+
+def _parse_exprs(exprs, named_exprs: dict) -> list[Expr]:
+    """
+    Convert the arguments of a projection into a list of expressions.
+
+    Args:
+        exprs: Expressions, column names or lists of them.
+        named_exprs: Expressions or values to be named by the keys.
+
+    Returns:
+        List of expressions.
+    """
+    result = []
+    for expr in exprs:
+        if isinstance(expr, str):
+            result.append(col(expr))
+        elif isinstance(expr, Expr):
+            result.append(expr)
+        elif is_list_like(expr):
+            result.extend(_parse_exprs(expr, {}))
+        else:
+            result.append(lit(expr))
+    for name, expr in named_exprs.items():
+        result.append((expr if isinstance(expr, Expr) else lit(expr)).alias(name))
+    return result
 
 
 class LazyFrame(BasePolarsDataset):
     """
-    Stub for Lazy Frame implementation.
+    Lazy version of ``DataFrame``.
+
+    The operations on a lazy frame only record a logical plan. The plan is optimized
+    and executed when the frame is collected.
+
+    Args:
+        data: Data to be converted to DataFrame.
+        schema: Schema of the data.
+        _plan: Logical plan of the frame.
+        _query_compiler: Query compiler to scan.
+        **kwargs: Other arguments of the ``DataFrame`` constructor.
+    """
+
+    def __init__(
+        self,
+        data=None,
+        schema=None,
+        *,
+        _plan: LogicalPlan | None = None,
+        _query_compiler: BaseQueryCompiler | None = None,
+        **kwargs,
+    ) -> None:
+        if _plan is None and _query_compiler is not None:
+            _plan = DataFrameScan(_query_compiler)
+        if _plan is None:
+            from modin.polars import DataFrame
+
+            _plan = DataFrameScan(
+                DataFrame(data, schema=schema, **kwargs)._query_compiler
+            )
+        self._plan = _plan
+        # the plan and the query compiler it was collected to
+        self._collected = None
+
+    def __repr__(self):
+        return "naive plan:\n" + self._plan.explain()
+
+    @property
+    def _query_compiler(self) -> BaseQueryCompiler:
+        """
+        Get the query compiler of the collected frame.
+
+        The operations inherited from ``BasePolarsDataset`` are applied to it eagerly,
+        the plan is collected only once for all of them.
+
+        Returns:
+            Query compiler with the result of the plan.
+        """
+        if self._collected is None or self._collected[0] is not self._plan:
+            self._collected = (self._plan, self.collect()._query_compiler)
+        return self._collected[1]
+
+    @_query_compiler.setter
+    def _query_compiler(self, query_compiler: BaseQueryCompiler) -> None:
+        self._plan = DataFrameScan(query_compiler)
+        self._collected = (self._plan, query_compiler)
+
+    def _with_plan(self, plan: LogicalPlan) -> "LazyFrame":
+        return type(self)(_plan=plan)
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Get columns of the LazyFrame.
+
+        Returns:
+            List of columns.
+        """
+        return list(self._plan.columns)
+
+    @property
+    def width(self) -> int:
+        """
+        Get width of the LazyFrame.
+
+        Returns:
+            Number of columns in the LazyFrame.
+        """
+        return len(self.columns)
+
+    def lazy(self) -> "LazyFrame":
+        """
+        Return the LazyFrame itself.
+
+        Returns:
+            The LazyFrame.
+        """
+        return self
+
+    def select(self, *exprs, **named_exprs) -> "LazyFrame":
+        """
+        Select the columns computed by the expressions.
+
+        Args:
+            exprs: Expressions or column names to select.
+            named_exprs: Expressions to select named by the keys.
+
+        Returns:
+            LazyFrame with the selected columns.
+        """
+        return self._with_plan(Select(self._plan, _parse_exprs(exprs, named_exprs)))
+
+    select_seq = select
+
+    def with_columns(self, *exprs, **named_exprs) -> "LazyFrame":
+        """
+        Add the columns computed by the expressions.
+
+        The columns with the same names are replaced.
+
+        Args:
+            exprs: Expressions computing the columns.
+            named_exprs: Expressions computing the columns named by the keys.
+
+        Returns:
+            LazyFrame with the columns added.
+        """
+        return self._with_plan(
+            WithColumns(self._plan, _parse_exprs(exprs, named_exprs))
+        )
+
+    with_columns_seq = with_columns
+
+    def filter(self, *predicates, **constraints) -> "LazyFrame":
+        """
+        Keep the rows all the predicates hold for.
+
+        Args:
+            predicates: Boolean expressions.
+            constraints: Column names and the values the columns have to be equal to.
+
+        Returns:
+            Filtered LazyFrame.
+        """
+        predicates = _parse_exprs(predicates, {}) + [
+            col(name) == value for name, value in constraints.items()
+        ]
+        if len(predicates) == 0:
+            raise TypeError("at least one predicate or constraint must be provided")
+        predicate = predicates[0]
+        for p in predicates[1:]:
+            predicate = predicate & p
+        return self._with_plan(Filter(self._plan, predicate))
+
+    def group_by(self, *by, maintain_order: bool = False, **named_by) -> "LazyGroupBy":
+        """
+        Group the LazyFrame by the given columns.
+
+        Args:
+            by: Columns or expressions to group by.
+            maintain_order: Whether to keep the groups in the order of their appearance.
+            named_by: Expressions to group by named by the keys.
+
+        Returns:
+            LazyGroupBy object.
+        """
+        return LazyGroupBy(
+            self, _parse_exprs(by, named_by), maintain_order=maintain_order
+        )
+
+    def join(
+        self,
+        other: "LazyFrame",
+        on: str | list[str] | None = None,
+        how: str = "inner",
+        *,
+        left_on: str | list[str] | None = None,
+        right_on: str | list[str] | None = None,
+        suffix: str = "_right",
+    ) -> "LazyFrame":
+        """
+        Join the LazyFrame with another LazyFrame.
+
+        Args:
+            other: LazyFrame to join with.
+            on: Columns to join on, present in both frames.
+            how: How to join the frames.
+            left_on: Columns of this frame to join on.
+            right_on: Columns of the other frame to join on.
+            suffix: Suffix of the clashing columns of the other frame.
+
+        Returns:
+            Joined LazyFrame.
+        """
+        if how == "full":
+            how = "outer"
+        if how not in ("inner", "left", "right", "outer"):
+            raise NotImplementedError("not yet")
+        if on is None and (left_on is None or right_on is None):
+            raise ValueError("must specify `on` OR `left_on` and `right_on`")
+
+        def to_list(columns):
+            if columns is None:
+                return None
+            return [columns] if isinstance(columns, str) else list(columns)
+
+        return self._with_plan(
+            Join(
+                self._plan,
+                other.lazy()._plan,
+                how,
+                to_list(on),
+                to_list(left_on),
+                to_list(right_on),
+                suffix,
+            )
+        )
+
+    def sort(
+        self,
+        by,
+        *more_by,
+        descending: bool | Sequence[bool] = False,
+        nulls_last: bool = False,
+        maintain_order: bool = False,
+    ) -> "LazyFrame":
+        """
+        Sort the LazyFrame.
+
+        Args:
+            by: Column or expression to sort by.
+            more_by: Additional columns or expressions to sort by.
+            descending: Whether to sort in descending order, one flag or one per column.
+            nulls_last: Whether to sort null values last.
+            maintain_order: Whether to keep the order of the equal rows.
+
+        Returns:
+            Sorted LazyFrame.
+        """
+        by = _parse_exprs([by, *more_by], {})
+        if isinstance(descending, bool):
+            descending = [descending] * len(by)
+        elif len(descending) != len(by):
+            raise ValueError(
+                f"the length of `descending` ({len(descending)}) does not match "
+                + f"the length of `by` ({len(by)})"
+            )
+        return self._with_plan(
+            Sort(self._plan, by, list(descending), nulls_last, maintain_order)
+        )
+
+    def slice(self, offset: int, length: int | None = None) -> "LazyFrame":
+        """
+        Slice the LazyFrame.
+
+        Args:
+            offset: Offset to start the slice from.
+            length: Length of the slice, None to slice until the end.
+
+        Returns:
+            Sliced LazyFrame.
+        """
+        return self._with_plan(Slice(self._plan, offset, length))
+
+    def head(self, n: int = 5) -> "LazyFrame":
+        """
+        Get the first n rows of the LazyFrame.
+
+        Args:
+            n: Number of rows to get.
+
+        Returns:
+            LazyFrame with the first n rows.
+        """
+        return self.slice(0, n)
+
+    limit = head
+
+    def explain(
+        self,
+        *,
+        optimized: bool = True,
+        predicate_pushdown: bool = True,
+        projection_pushdown: bool = True,
+        comm_subexpr_elim: bool = True,
+    ) -> str:
+        """
+        Describe the logical plan of the LazyFrame.
+
+        Args:
+            optimized: Whether to describe the optimized plan.
+            predicate_pushdown: Whether to push the filters down to the scans.
+            projection_pushdown: Whether to read only the columns that are used.
+            comm_subexpr_elim: Whether to evaluate the common subexpressions only once.
+
+        Returns:
+            Description of the plan.
+        """
+        plan = self._plan
+        if optimized:
+            plan = optimize(
+                plan,
+                predicate_pushdown=predicate_pushdown,
+                projection_pushdown=projection_pushdown,
+                comm_subexpr_elim=comm_subexpr_elim,
+            )
+        return plan.explain()
+
+    def collect(
+        self,
+        *,
+        predicate_pushdown: bool = True,
+        projection_pushdown: bool = True,
+        comm_subexpr_elim: bool = True,
+        no_optimization: bool = False,
+    ) -> "DataFrame":
+        """
+        Optimize the logical plan and execute it.
+
+        Args:
+            predicate_pushdown: Whether to push the filters down to the scans.
+            projection_pushdown: Whether to read only the columns that are used.
+            comm_subexpr_elim: Whether to evaluate the common subexpressions only once.
+            no_optimization: Whether to turn off all the optimizations.
+
+        Returns:
+            DataFrame with the result.
+        """
+        from modin.polars import DataFrame
+
+        plan = self._plan
+        if not no_optimization:
+            plan = optimize(
+                plan,
+                predicate_pushdown=predicate_pushdown,
+                projection_pushdown=projection_pushdown,
+                comm_subexpr_elim=comm_subexpr_elim,
+            )
+        return DataFrame(_query_compiler=plan.lower())
+
+
+class LazyGroupBy:
+    """
+    Groups of a LazyFrame to be aggregated.
+
+    Args:
+        lf: LazyFrame to group.
+        keys: Expressions to group by.
+        maintain_order: Whether to keep the groups in the order of their appearance.
+    """
+
+    def __init__(
+        self, lf: LazyFrame, keys: list[Expr], maintain_order: bool = False
+    ) -> None:
+        self.lf = lf
+        self.keys = keys
+        self.maintain_order = maintain_order
+
+    def agg(self, *aggs, **named_aggs) -> LazyFrame:
+        """
+        Aggregate the groups.
+
+        Args:
+            aggs: Aggregation expressions.
+            named_aggs: Aggregation expressions named by the keys.
+
+        Returns:
+            LazyFrame with a row per group.
+        """
+        return self.lf._with_plan(
+            GroupByAgg(
+                self.lf._plan,
+                self.keys,
+                _parse_exprs(aggs, named_aggs),
+                self.maintain_order,
+            )
+        )
+
+
+def scan_parquet(source, **kwargs) -> LazyFrame:
     """
+    Lazily read a parquet dataset.
 
-    pass
+    Only the columns that are used are read, and the filters over the columns
+    are passed to the reader to skip the row groups that don't match them.
+
+    Args:
+        source: Path to the dataset.
+        **kwargs: Keyword arguments for ``modin.pandas.read_parquet``.
+
+    Returns:
+        LazyFrame reading the dataset.
+    """
+    return LazyFrame(_plan=ParquetScan(source, kwargs))
+
+
+def scan_csv(source, **kwargs) -> LazyFrame:
+    """
+    Lazily read a CSV file.
+
+    Only the columns that are used are read.
+
+    Args:
+        source: Path to the file.
+        **kwargs: Keyword arguments for ``modin.pandas.read_csv``.
+
+    Returns:
+        LazyFrame reading the file.
+    """
+    return LazyFrame(_plan=CsvScan(source, kwargs))
@@ -0,0 +1,1242 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""
+Module houses the logical plan of ``LazyFrame`` and its optimizer.
+
+The plan is a tree of nodes, each node knows the names of the columns it produces
+and how to lower itself to the query compiler calls. Before the plan is lowered,
+it's rewritten by the optimizer that pushes the filters and the column projections
+down to the scans and marks the common subexpressions to be evaluated only once.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Optional
+
+import pandas
+
+from modin.pandas.io import read_csv, read_parquet
+from modin.polars.expr import (
+    AGGREGATIONS,
+    Expr,
+    _set_name,
+    scalar_to_query_compiler,
+    to_scalar,
+)
+
+if TYPE_CHECKING:
+    from modin.core.storage_formats.base.query_compiler import BaseQueryCompiler
+
+
+def _split_conjunction(predicate: Expr) -> list[Expr]:
+    """
+    Split the predicate into the list of predicates combined with `&`.
+
+    Args:
+        predicate: Predicate to split.
+
+    Returns:
+        List of predicates.
+    """
+    if predicate._op == "binary" and predicate._args[0] == "and":
+        return _split_conjunction(predicate._args[1]) + _split_conjunction(
+            predicate._args[2]
+        )
+    return [predicate]
+
+
+def _combine_conjunction(predicates: list[Expr]) -> Optional[Expr]:
+    """
+    Combine the predicates with `&`.
+
+    Args:
+        predicates: Predicates to combine.
+
+    Returns:
+        Combined predicate or None if there are no predicates.
+    """
+    if len(predicates) == 0:
+        return None
+    result = predicates[0]
+    for predicate in predicates[1:]:
+        result = result & predicate
+    return result
+
+
+def _has_aggregation(expr: Expr) -> bool:
+    """
+    Check whether the expression contains an aggregation.
+
+    The rows an aggregation is computed over depend on the filters applied before it,
+    so such an expression can't be reordered with the filters.
+
+    Args:
+        expr: Expression to check.
+
+    Returns:
+        True if the expression contains an aggregation.
+    """
+    return any(e._op in ("agg", "len") for e in expr._iter_subexpressions())
+
+
+def _is_column(expr: Expr) -> bool:
+    """
+    Check whether the expression reads a column as is.
+
+    Args:
+        expr: Expression to check.
+
+    Returns:
+        True if the expression is a bare column.
+    """
+    return expr._op == "col"
+
+
+def _roots(exprs) -> set[str]:
+    """
+    Get the names of the columns the expressions read.
+
+    Args:
+        exprs: Expressions.
+
+    Returns:
+        Set of column names.
+    """
+    return {name for expr in exprs for name in expr._root_names()}
+
+
+def _check_duplicates(names: list[str]) -> None:
+    """
+    Raise an error if the output column names have duplicates.
+
+    Args:
+        names: Names of the output columns.
+    """
+    duplicates = [name for name, count in Counter(names).items() if count > 1]
+    if len(duplicates) > 0:
+        import polars
+
+        raise polars.exceptions.DuplicateError(
+            f"the name '{duplicates[0]}' is duplicate"
+        )
+
+
+def _apply_predicate(
+    query_compiler: BaseQueryCompiler, predicate: Optional[Expr]
+) -> BaseQueryCompiler:
+    """
+    Keep the rows of the query compiler the predicate holds for.
+
+    Args:
+        query_compiler: Query compiler to filter.
+        predicate: Predicate to evaluate against the query compiler.
+
+    Returns:
+        Filtered query compiler.
+    """
+    if predicate is None:
+        return query_compiler
+    mask = predicate._evaluate(query_compiler, {})
+    if predicate._is_scalar():
+        return (
+            query_compiler if to_scalar(mask) else query_compiler.getitem_row_array([])
+        )
+    return query_compiler.getitem_array(mask)
+
+
+def _assign_columns(
+    query_compiler: BaseQueryCompiler, columns: list[tuple[str, Expr, object]]
+) -> BaseQueryCompiler:
+    """
+    Add the evaluated expressions as columns replacing the existing columns of the same name.
+
+    Args:
+        query_compiler: Query compiler to add the columns to.
+        columns: Triples of the column name, the expression and its evaluated value.
+
+    Returns:
+        Query compiler with the columns added.
+    """
+    for name, expr, value in columns:
+        if expr._is_scalar():
+            value = to_scalar(value)
+        elif hasattr(value, "copy"):
+            value = value.copy()
+        if name in query_compiler.columns:
+            loc = query_compiler.columns.get_loc(name)
+            query_compiler = query_compiler.drop(columns=[name])
+        else:
+            loc = len(query_compiler.columns)
+        query_compiler = query_compiler.insert(loc, name, value)
+    return query_compiler
+
+
+class LogicalPlan:
+    """
+    Base class of the logical plan nodes.
+
+    Args:
+        inputs: Nodes the node consumes.
+    """
+
+    def __init__(self, *inputs: "LogicalPlan") -> None:
+        self.inputs = inputs
+        self._columns_cache = None
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Get the names of the columns the node produces.
+
+        Returns:
+            List of column names.
+        """
+        if self._columns_cache is None:
+            self._columns_cache = self._compute_columns()
+        return self._columns_cache
+
+    def _compute_columns(self) -> list[str]:
+        """
+        Compute the names of the columns the node produces.
+
+        Returns:
+            List of column names.
+        """
+        return self.inputs[0].columns
+
+    def with_inputs(self, *inputs: "LogicalPlan") -> "LogicalPlan":
+        """
+        Build a copy of the node consuming the other nodes.
+
+        Args:
+            inputs: New input nodes.
+
+        Returns:
+            New node.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def pushdown_target(self, predicate: Expr) -> Optional[int]:
+        """
+        Get the input the predicate applied to the output of the node can be pushed to.
+
+        Args:
+            predicate: Predicate to push down.
+
+        Returns:
+            Position of the input or None if the predicate can't be pushed down.
+        """
+        return None
+
+    def required_inputs(
+        self, required: Optional[set[str]]
+    ) -> tuple["LogicalPlan", list[Optional[set[str]]]]:
+        """
+        Prune the node to the required output columns.
+
+        Args:
+            required: Names of the output columns consumed by the parent nodes,
+                None if all of them are consumed.
+
+        Returns:
+            The pruned node and the names of the columns it consumes from each input.
+        """
+        return self, [required] * len(self.inputs)
+
+    def eliminate_common_subexpressions(self) -> "LogicalPlan":
+        """
+        Mark the subexpressions that occur in the expressions of the node several times.
+
+        Returns:
+            Node evaluating each of the common subexpressions only once.
+        """
+        return self
+
+    def lower(self) -> BaseQueryCompiler:
+        """
+        Lower the node to the query compiler calls.
+
+        Returns:
+            Query compiler holding the result of the node.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def describe(self) -> str:
+        """
+        Describe the node in one line.
+
+        Returns:
+            Description of the node.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def explain(self, indent: int = 0) -> str:
+        """
+        Describe the node and its inputs.
+
+        Args:
+            indent: Indentation of the node.
+
+        Returns:
+            Description of the plan.
+        """
+        lines = [" " * indent + self.describe()]
+        for node in self.inputs:
+            lines.append(node.explain(indent + 2))
+        return "\n".join(lines)
+
+
+class ScanBase(LogicalPlan):
+    """
+    Base class of the nodes reading the data.
+
+    Args:
+        projection: Names of the columns to read, None to read all of them.
+        predicate: Predicate the read rows are filtered with.
+    """
+
+    def __init__(
+        self, projection: Optional[list[str]] = None, predicate: Optional[Expr] = None
+    ) -> None:
+        super().__init__()
+        self.projection = projection
+        self.predicate = predicate
+
+    def with_scan_options(
+        self,
+        projection: Optional[list[str]] = None,
+        predicate: Optional[Expr] = None,
+    ) -> "ScanBase":
+        """
+        Build a copy of the node with the other scan options.
+
+        Args:
+            projection: Names of the columns to read, None to read all of them.
+            predicate: Predicate the read rows are filtered with.
+
+        Returns:
+            New node.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def schema_columns(self) -> list[str]:
+        """
+        Get the names of all columns of the source.
+
+        Returns:
+            List of column names.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def _compute_columns(self) -> list[str]:
+        return self.schema_columns() if self.projection is None else self.projection
+
+    def columns_to_read(self) -> Optional[list[str]]:
+        """
+        Get the names of the columns to read from the source.
+
+        Returns:
+            Names of the projected columns and the columns the predicate reads,
+            in the order of the source, or None if all the columns are read.
+        """
+        if self.projection is None:
+            return None
+        needed = set(self.projection) | _roots(
+            [self.predicate] if self.predicate is not None else []
+        )
+        return [name for name in self.schema_columns() if name in needed]
+
+    def finalize(self, query_compiler: BaseQueryCompiler) -> BaseQueryCompiler:
+        """
+        Filter and project the read data.
+
+        Args:
+            query_compiler: Read data.
+
+        Returns:
+            Query compiler holding the result of the scan.
+        """
+        query_compiler = _apply_predicate(query_compiler, self.predicate)
+        if self.projection is not None and list(query_compiler.columns) != list(
+            self.projection
+        ):
+            query_compiler = query_compiler.getitem_column_array(self.projection)
+        return query_compiler
+
+    def required_inputs(self, required):
+        if required is None:
+            return self, []
+        projection = [name for name in self.columns if name in required]
+        if len(projection) == 0:
+            # at least one column is required to keep the number of rows
+            projection = self.columns[:1]
+        return self.with_scan_options(projection, self.predicate), []
+
+    def describe_scan(self, name: str) -> str:
+        """
+        Describe the scan options.
+
+        Args:
+            name: Name of the scan.
+
+        Returns:
+            Description of the node.
+        """
+        description = name
+        if self.projection is not None:
+            description += (
+                f"; PROJECT {len(self.projection)}/{len(self.schema_columns())} "
+                + f"COLUMNS {self.projection}"
+            )
+        if self.predicate is not None:
+            description += f"; SELECTION: {self.predicate!r}"
+        return description
+
+
+class DataFrameScan(ScanBase):
+    """
+    Node reading the data of a query compiler.
+
+    Args:
+        query_compiler: Query compiler to read.
+        projection: Names of the columns to read, None to read all of them.
+        predicate: Predicate the read rows are filtered with.
+    """
+
+    def __init__(
+        self, query_compiler: BaseQueryCompiler, projection=None, predicate=None
+    ):
+        super().__init__(projection, predicate)
+        self.query_compiler = query_compiler
+
+    def with_scan_options(self, projection=None, predicate=None):
+        return DataFrameScan(self.query_compiler, projection, predicate)
+
+    def schema_columns(self):
+        return list(self.query_compiler.columns)
+
+    def lower(self):
+        query_compiler = self.query_compiler
+        columns = self.columns_to_read()
+        if columns is not None and columns != self.schema_columns():
+            query_compiler = query_compiler.getitem_column_array(columns)
+        return self.finalize(query_compiler)
+
+    def describe(self):
+        return self.describe_scan("DF SCAN")
+
+
+class ParquetScan(ScanBase):
+    """
+    Node reading a parquet dataset.
+
+    The conjunctions of comparisons of the columns with literals in the predicate
+    are passed to the reader as ``filters``, so the row groups that can't satisfy
+    them are skipped.
+
+    Args:
+        source: Path to the dataset.
+        kwargs: Keyword arguments for ``modin.pandas.read_parquet``.
+        projection: Names of the columns to read, None to read all of them.
+        predicate: Predicate the read rows are filtered with.
+    """
+
+    def __init__(self, source, kwargs: dict, projection=None, predicate=None):
+        super().__init__(projection, predicate)
+        self.source = source
+        self.kwargs = kwargs
+        self._schema_columns = None
+
+    def with_scan_options(self, projection=None, predicate=None):
+        result = ParquetScan(self.source, self.kwargs, projection, predicate)
+        result._schema_columns = self._schema_columns
+        return result
+
+    def schema_columns(self):
+        if self._schema_columns is None:
+            import pyarrow.dataset
+
+            schema = pyarrow.dataset.dataset(
+                self.source,
+                format="parquet",
+                partitioning="hive",
+                filesystem=self.kwargs.get("filesystem", None),
+            ).schema
+            index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+            self._schema_columns = [
+                name for name in schema.names if name not in index_columns
+            ]
+        return self._schema_columns
+
+    def filters(self) -> Optional[list[tuple]]:
+        """
+        Convert the predicate into filters for the parquet reader.
+
+        Returns:
+            List of ``(column, op, value)`` filters or None if nothing can be converted.
+        """
+        if self.predicate is None:
+            return None
+        filters = []
+        for predicate in _split_conjunction(self.predicate):
+            if predicate._op == "is_in" and _is_column(predicate._args[0]):
+                filters.append(
+                    (predicate._args[0]._args[0], "in", list(predicate._args[1]))
+                )
+                continue
+            if predicate._op != "binary":
+                continue
+            op, left, right = predicate._args
+            if op not in _FILTER_OPS or any(
+                arg._op == "lit" and arg._args[0] is None for arg in (left, right)
+            ):
+                continue
+            if _is_column(left) and right._op == "lit":
+                filters.append((left._args[0], _FILTER_OPS[op], right._args[0]))
+            elif _is_column(right) and left._op == "lit":
+                filters.append(
+                    (right._args[0], _FILTER_OPS[_REFLECTED_OPS[op]], left._args[0])
+                )
+        return filters or None
+
+    def lower(self):
+        kwargs = dict(self.kwargs)
+        filters = self.filters()
+        if filters is not None:
+            kwargs["filters"] = filters + list(kwargs.pop("filters", None) or [])
+        query_compiler = read_parquet(
+            self.source, columns=self.columns_to_read(), **kwargs
+        )._query_compiler
+        # the filters are applied by the reader, but the predicate is evaluated
+        # once again, as only a part of it may be converted to the filters
+        return self.finalize(query_compiler)
+
+    def describe(self):
+        return self.describe_scan(f"PARQUET SCAN {self.source}")
+
+
+_FILTER_OPS = {"eq": "==", "ne": "!=", "lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+_REFLECTED_OPS = {
+    "eq": "eq",
+    "ne": "ne",
+    "lt": "gt",
+    "le": "ge",
+    "gt": "lt",
+    "ge": "le",
+}
+
+
+class CsvScan(ScanBase):
+    """
+    Node reading a CSV file.
+
+    Args:
+        source: Path to the file.
+        kwargs: Keyword arguments for ``modin.pandas.read_csv``.
+        projection: Names of the columns to read, None to read all of them.
+        predicate: Predicate the read rows are filtered with.
+    """
+
+    def __init__(self, source, kwargs: dict, projection=None, predicate=None):
+        super().__init__(projection, predicate)
+        self.source = source
+        self.kwargs = kwargs
+        self._schema_columns = None
+
+    def with_scan_options(self, projection=None, predicate=None):
+        result = CsvScan(self.source, self.kwargs, projection, predicate)
+        result._schema_columns = self._schema_columns
+        return result
+
+    def schema_columns(self):
+        if self._schema_columns is None:
+            self._schema_columns = list(
+                pandas.read_csv(self.source, nrows=0, **self.kwargs).columns
+            )
+        return self._schema_columns
+
+    def lower(self):
+        query_compiler = read_csv(
+            self.source, usecols=self.columns_to_read(), **self.kwargs
+        )._query_compiler
+        return self.finalize(query_compiler)
+
+    def describe(self):
+        return self.describe_scan(f"CSV SCAN {self.source}")
+
+
+class ProjectionBase(LogicalPlan):
+    """
+    Base class of the nodes evaluating a list of expressions.
+
+    Args:
+        input: Input node.
+        exprs: Expressions to evaluate.
+        common_subexpressions: Keys of the subexpressions to evaluate only once.
+    """
+
+    def __init__(
+        self,
+        input: LogicalPlan,
+        exprs: list[Expr],
+        common_subexpressions: tuple = (),
+    ) -> None:
+        super().__init__(input)
+        self.exprs = exprs
+        self.common_subexpressions = common_subexpressions
+
+    def with_inputs(self, input):
+        return type(self)(input, self.exprs, self.common_subexpressions)
+
+    def with_exprs(self, exprs: list[Expr]) -> "ProjectionBase":
+        """
+        Build a copy of the node evaluating the other expressions.
+
+        Args:
+            exprs: New expressions.
+
+        Returns:
+            New node.
+        """
+        return type(self)(self.inputs[0], exprs, self.common_subexpressions)
+
+    def eliminate_common_subexpressions(self):
+        counts = Counter(
+            sub._key()
+            for expr in self.exprs
+            for sub in expr._iter_subexpressions()
+            if sub._op not in ("col", "lit", "alias")
+        )
+        common = tuple(key for key, count in counts.items() if count > 1)
+        return type(self)(self.inputs[0], self.exprs, common)
+
+    def evaluate(self, query_compiler: BaseQueryCompiler) -> list:
+        """
+        Evaluate the expressions of the node.
+
+        Args:
+            query_compiler: Query compiler to evaluate the expressions against.
+
+        Returns:
+            List of the evaluated expressions.
+        """
+        cache = {key: None for key in self.common_subexpressions}
+        return [expr._evaluate(query_compiler, cache) for expr in self.exprs]
+
+    def describe_exprs(self, name: str) -> str:
+        """
+        Describe the expressions of the node.
+
+        Args:
+            name: Name of the node.
+
+        Returns:
+            Description of the node.
+        """
+        description = f"{name} {self.exprs}"
+        if self.common_subexpressions:
+            description += f"; CSE: {len(self.common_subexpressions)}"
+        return description
+
+
+class Select(ProjectionBase):
+    """Node producing the columns computed by the expressions."""
+
+    def _compute_columns(self):
+        return [expr._output_name() for expr in self.exprs]
+
+    def pushdown_target(self, predicate):
+        # aggregations would be computed over the filtered rows
+        if any(_has_aggregation(expr) for expr in self.exprs):
+            return None
+        passthrough = {expr._args[0] for expr in self.exprs if _is_column(expr)}
+        return 0 if set(predicate._root_names()) <= passthrough else None
+
+    def required_inputs(self, required):
+        exprs = self.exprs
+        if required is not None:
+            exprs = [expr for expr in exprs if expr._output_name() in required]
+            has_columns = any(not expr._is_scalar() for expr in self.exprs)
+            if has_columns and all(expr._is_scalar() for expr in exprs):
+                # the number of rows depends on whether there are non-scalar outputs
+                exprs.append(next(e for e in self.exprs if not e._is_scalar()))
+            if len(exprs) == 0:
+                exprs = self.exprs[:1]
+            exprs = [expr for expr in self.exprs if any(expr is e for e in exprs)]
+        return self.with_exprs(exprs), [_roots(exprs)]
+
+    def lower(self):
+        _check_duplicates(self.columns)
+        query_compiler = self.inputs[0].lower()
+        values = self.evaluate(query_compiler)
+        names = self.columns
+        if all(expr._is_scalar() for expr in self.exprs):
+            columns = [
+                scalar_to_query_compiler(value, name)
+                for value, name in zip(values, names)
+            ]
+            return columns[0].concat(1, columns[1:]) if len(columns) > 1 else columns[0]
+
+        columns = [
+            _set_name(value, name)
+            for expr, value, name in zip(self.exprs, values, names)
+            if not expr._is_scalar()
+        ]
+        result = columns[0].concat(1, columns[1:]) if len(columns) > 1 else columns[0]
+        # scalars are broadcast to the length of the columns
+        for loc, (expr, value, name) in enumerate(zip(self.exprs, values, names)):
+            if expr._is_scalar():
+                result = result.insert(loc, name, to_scalar(value))
+        return result
+
+    def describe(self):
+        return self.describe_exprs("SELECT")
+
+
+class WithColumns(ProjectionBase):
+    """Node adding the columns computed by the expressions to the input columns."""
+
+    def _compute_columns(self):
+        columns = list(self.inputs[0].columns)
+        for expr in self.exprs:
+            if expr._output_name() not in columns:
+                columns.append(expr._output_name())
+        return columns
+
+    def pushdown_target(self, predicate):
+        if any(_has_aggregation(expr) for expr in self.exprs):
+            return None
+        outputs = {expr._output_name() for expr in self.exprs}
+        return None if set(predicate._root_names()) & outputs else 0
+
+    def required_inputs(self, required):
+        if required is None:
+            return self, [None]
+        exprs = [expr for expr in self.exprs if expr._output_name() in required]
+        outputs = {expr._output_name() for expr in exprs}
+        if len(exprs) == 0:
+            return _Passthrough(self.inputs[0]), [required]
+        return self.with_exprs(exprs), [(required - outputs) | _roots(exprs)]
+
+    def lower(self):
+        _check_duplicates([expr._output_name() for expr in self.exprs])
+        query_compiler = self.inputs[0].lower()
+        values = self.evaluate(query_compiler)
+        return _assign_columns(
+            query_compiler,
+            [
+                (expr._output_name(), expr, value)
+                for expr, value in zip(self.exprs, values)
+            ],
+        )
+
+    def describe(self):
+        return self.describe_exprs("WITH_COLUMNS")
+
+
+class _Passthrough(LogicalPlan):
+    """Marker of a node pruned away by the projection pushdown."""
+
+
+class Filter(LogicalPlan):
+    """
+    Node keeping the rows the predicate holds for.
+
+    Args:
+        input: Input node.
+        predicate: Predicate to filter the rows with.
+    """
+
+    def __init__(self, input: LogicalPlan, predicate: Expr) -> None:
+        super().__init__(input)
+        self.predicate = predicate
+
+    def with_inputs(self, input):
+        return Filter(input, self.predicate)
+
+    def required_inputs(self, required):
+        if required is None:
+            return self, [None]
+        return self, [required | _roots([self.predicate])]
+
+    def lower(self):
+        return _apply_predicate(self.inputs[0].lower(), self.predicate)
+
+    def describe(self):
+        return f"FILTER {self.predicate!r}"
+
+
+class Sort(LogicalPlan):
+    """
+    Node sorting the rows.
+
+    Args:
+        input: Input node.
+        by: Expressions to sort by.
+        descending: Whether to sort in descending order, one flag per expression.
+        nulls_last: Whether to place the nulls last.
+        maintain_order: Whether to keep the order of the equal rows.
+    """
+
+    def __init__(self, input, by, descending, nulls_last, maintain_order) -> None:
+        super().__init__(input)
+        self.by = by
+        self.descending = descending
+        self.nulls_last = nulls_last
+        self.maintain_order = maintain_order
+
+    def with_inputs(self, input):
+        return Sort(
+            input, self.by, self.descending, self.nulls_last, self.maintain_order
+        )
+
+    def pushdown_target(self, predicate):
+        return 0
+
+    def required_inputs(self, required):
+        if required is None:
+            return self, [None]
+        return self, [required | _roots(self.by)]
+
+    def lower(self):
+        query_compiler = self.inputs[0].lower()
+        columns = list(query_compiler.columns)
+        keys = []
+        computed = []
+        for i, expr in enumerate(self.by):
+            if _is_column(expr):
+                keys.append(expr._args[0])
+            else:
+                keys.append(f"__sort_key_{i}__")
+                computed.append((keys[-1], expr, expr._evaluate(query_compiler, {})))
+        query_compiler = _assign_columns(query_compiler, computed)
+        query_compiler = query_compiler.sort_rows_by_column_values(
+            keys,
+            ascending=[not descending for descending in self.descending],
+            na_position="last" if self.nulls_last else "first",
+            kind="stable" if self.maintain_order else "quicksort",
+        )
+        if len(computed) > 0:
+            query_compiler = query_compiler.getitem_column_array(columns)
+        return query_compiler
+
+    def describe(self):
+        return f"SORT BY {self.by}"
+
+
+class Slice(LogicalPlan):
+    """
+    Node taking a slice of the rows.
+
+    Args:
+        input: Input node.
+        offset: Position of the first row.
+        length: Number of rows.
+    """
+
+    def __init__(self, input, offset: int, length: Optional[int]) -> None:
+        super().__init__(input)
+        self.offset = offset
+        self.length = length
+
+    def with_inputs(self, input):
+        return Slice(input, self.offset, self.length)
+
+    def lower(self):
+        query_compiler = self.inputs[0].lower()
+        stop = None if self.length is None else self.offset + self.length
+        return query_compiler.getitem_row_array(
+            pandas.RangeIndex(len(query_compiler.index))[self.offset : stop]
+        )
+
+    def describe(self):
+        return f"SLICE offset={self.offset}, length={self.length}"
+
+
+class GroupByAgg(LogicalPlan):
+    """
+    Node aggregating the groups of rows.
+
+    Args:
+        input: Input node.
+        keys: Expressions to group by.
+        aggs: Aggregation expressions.
+        maintain_order: Whether to keep the groups in the order of their appearance.
+        common_subexpressions: Keys of the subexpressions to evaluate only once.
+    """
+
+    def __init__(
+        self, input, keys, aggs, maintain_order, common_subexpressions=()
+    ) -> None:
+        super().__init__(input)
+        self.keys = keys
+        self.aggs = aggs
+        self.maintain_order = maintain_order
+        self.common_subexpressions = common_subexpressions
+
+    def with_inputs(self, input):
+        return GroupByAgg(
+            input, self.keys, self.aggs, self.maintain_order, self.common_subexpressions
+        )
+
+    def _compute_columns(self):
+        return [expr._output_name() for expr in self.keys + self.aggs]
+
+    def pushdown_target(self, predicate):
+        keys = {expr._args[0] for expr in self.keys if _is_column(expr)}
+        return 0 if set(predicate._root_names()) <= keys else None
+
+    def required_inputs(self, required):
+        aggs = self.aggs
+        if required is not None:
+            aggs = [expr for expr in aggs if expr._output_name() in required]
+        node = GroupByAgg(
+            self.inputs[0],
+            self.keys,
+            aggs,
+            self.maintain_order,
+            self.common_subexpressions,
+        )
+        return node, [_roots(self.keys + aggs)]
+
+    def eliminate_common_subexpressions(self):
+        counts = Counter(
+            sub._key()
+            for expr in self.keys + self.aggs
+            for sub in expr._iter_subexpressions()
+            if sub._op not in ("col", "lit", "alias", "agg", "len")
+        )
+        common = tuple(key for key, count in counts.items() if count > 1)
+        return GroupByAgg(
+            self.inputs[0], self.keys, self.aggs, self.maintain_order, common
+        )
+
+    def lower(self):
+        _check_duplicates(self.columns)
+        query_compiler = self.inputs[0].lower()
+        cache = {key: None for key in self.common_subexpressions}
+
+        # computed keys and aggregation inputs become the columns of the frame
+        computed = []
+        key_names = []
+        for expr in self.keys:
+            name = expr._output_name()
+            if not _is_column(expr):
+                computed.append((name, expr, expr._evaluate(query_compiler, cache)))
+            key_names.append(name)
+
+        agg_columns = {}
+        # kwargs of the aggregation -> {column: [pandas aggregations]}
+        specs = {}
+        outputs = []
+        for expr in self.aggs:
+            agg = expr._unalias()
+            if agg._op == "len":
+                outputs.append(("__size__", "size"))
+                continue
+            if agg._op != "agg" or agg._args[1]._is_scalar():
+                raise NotImplementedError(
+                    "only aggregations of columns are supported in group_by().agg()"
+                )
+            func, inner, kwargs = agg._args
+            if _is_column(inner) and inner._args[0] not in key_names:
+                column = inner._args[0]
+            else:
+                column = agg_columns.get(inner._key(), None)
+                if column is None:
+                    column = f"__agg_input_{len(agg_columns)}__"
+                    agg_columns[inner._key()] = column
+                    computed.append(
+                        (column, inner, inner._evaluate(query_compiler, cache))
+                    )
+            funcs = specs.setdefault(kwargs, {}).setdefault(column, [])
+            if AGGREGATIONS[func] not in funcs:
+                funcs.append(AGGREGATIONS[func])
+            outputs.append((kwargs, (column, AGGREGATIONS[func])))
+        query_compiler = _assign_columns(query_compiler, computed)
+
+        by = query_compiler.getitem_column_array(key_names)
+        groupby_kwargs = dict(sort=not self.maintain_order, as_index=True, dropna=False)
+        results = {}
+        for kwargs, agg_func in specs.items():
+            results[kwargs] = query_compiler.getitem_column_array(
+                key_names + list(agg_func)
+            ).groupby_agg(
+                by=by,
+                agg_func=agg_func,
+                axis=0,
+                groupby_kwargs=groupby_kwargs,
+                agg_args=(),
+                agg_kwargs=dict(kwargs),
+                how="axis_wise",
+                drop=True,
+            )
+        if any(spec == "size" for _, spec in outputs) or len(outputs) == 0:
+            results["size"] = by.groupby_size(
+                by=by,
+                axis=0,
+                groupby_kwargs=groupby_kwargs,
+                agg_args=(),
+                agg_kwargs={},
+                drop=True,
+            )
+
+        columns = []
+        for (kwargs, spec), expr in zip(outputs, self.aggs):
+            if spec == "size":
+                column = results["size"]
+            else:
+                column = results[kwargs].getitem_column_array([spec])
+            columns.append(_set_name(column, expr._output_name()))
+        if len(columns) == 0:
+            # no aggregations, only the unique keys are requested
+            result = results["size"].getitem_column_array([])
+        else:
+            result = (
+                columns[0].concat(1, columns[1:]) if len(columns) > 1 else columns[0]
+            )
+        return result.reset_index(drop=False)
+
+    def describe(self):
+        return f"AGGREGATE {self.aggs} BY {self.keys}"
+
+
+class Join(LogicalPlan):
+    """
+    Node joining two inputs.
+
+    Args:
+        left: Left input.
+        right: Right input.
+        how: Type of the join.
+        on: Names of the columns to join on, present in both inputs.
+        left_on: Names of the columns of the left input to join on.
+        right_on: Names of the columns of the right input to join on.
+        suffix: Suffix of the clashing column names of the right input.
+    """
+
+    def __init__(self, left, right, how, on, left_on, right_on, suffix) -> None:
+        super().__init__(left, right)
+        self.how = how
+        self.on = on
+        self.left_on = left_on
+        self.right_on = right_on
+        self.suffix = suffix
+
+    def with_inputs(self, left, right):
+        return Join(
+            left, right, self.how, self.on, self.left_on, self.right_on, self.suffix
+        )
+
+    @property
+    def left_keys(self) -> list[str]:
+        """
+        Get the names of the columns of the left input to join on.
+
+        Returns:
+            List of column names.
+        """
+        return self.on if self.on is not None else self.left_on
+
+    @property
+    def right_keys(self) -> list[str]:
+        """
+        Get the names of the columns of the right input to join on.
+
+        Returns:
+            List of column names.
+        """
+        return self.on if self.on is not None else self.right_on
+
+    def _merge_kwargs(self) -> dict:
+        return dict(
+            how=self.how,
+            on=self.on,
+            left_on=self.left_on,
+            right_on=self.right_on,
+            suffixes=("", self.suffix),
+        )
+
+    def _compute_columns(self):
+        left, right = self.inputs
+        return list(
+            pandas.DataFrame(columns=left.columns)
+            .merge(pandas.DataFrame(columns=right.columns), **self._merge_kwargs())
+            .columns
+        )
+
+    def _clashing_columns(self) -> set[str]:
+        left, right = self.inputs
+        return (set(left.columns) & set(right.columns)) - set(self.on or [])
+
+    def pushdown_target(self, predicate):
+        left, right = self.inputs
+        roots = set(predicate._root_names())
+        if roots <= set(left.columns) and self.how in ("inner", "left"):
+            return 0
+        if roots <= set(right.columns) - set(left.columns) and self.how in (
+            "inner",
+            "right",
+        ):
+            return 1
+        return None
+
+    def required_inputs(self, required):
+        if required is None:
+            return self, [None, None]
+        left, right = self.inputs
+        clashing = {
+            name
+            for name in self._clashing_columns()
+            if name in required or name + self.suffix in required
+        }
+        left_required = (
+            {name for name in left.columns if name in required}
+            | set(self.left_keys)
+            | clashing
+        )
+        right_required = (
+            {name for name in right.columns if name in required}
+            | set(self.right_keys)
+            | clashing
+        )
+        return self, [left_required, right_required]
+
+    def lower(self):
+        left, right = self.inputs
+        return left.lower().merge(right.lower(), **self._merge_kwargs())
+
+    def describe(self):
+        return (
+            f"{self.how.upper()} JOIN LEFT ON {self.left_keys} "
+            + f"RIGHT ON {self.right_keys}"
+        )
+
+
+def _push_predicates(node: LogicalPlan, predicates: list[Expr]) -> LogicalPlan:
+    """
+    Push the predicates applied to the output of the node as deep as possible.
+
+    Args:
+        node: Root of the plan.
+        predicates: Predicates to apply to the output of the node.
+
+    Returns:
+        New root of the plan.
+    """
+    # the predicates with aggregations depend on the rows filtered before them,
+    # so they are never moved
+    fixed = [p for p in predicates if _has_aggregation(p)]
+    predicates = [p for p in predicates if not _has_aggregation(p)]
+
+    if isinstance(node, Filter):
+        if _has_aggregation(node.predicate):
+            result = node.with_inputs(_push_predicates(node.inputs[0], []))
+            fixed = predicates + fixed
+        else:
+            result = _push_predicates(
+                node.inputs[0], predicates + _split_conjunction(node.predicate)
+            )
+    elif isinstance(node, ScanBase):
+        if node.predicate is not None:
+            predicates = _split_conjunction(node.predicate) + predicates
+        result = node.with_scan_options(
+            node.projection, _combine_conjunction(predicates)
+        )
+    else:
+        pushed = [[] for _ in node.inputs]
+        kept = []
+        for predicate in predicates:
+            target = node.pushdown_target(predicate)
+            if target is None:
+                kept.append(predicate)
+            else:
+                pushed[target].append(predicate)
+        result = node.with_inputs(
+            *[_push_predicates(child, p) for child, p in zip(node.inputs, pushed)]
+        )
+        fixed = kept + fixed
+
+    predicate = _combine_conjunction(fixed)
+    return result if predicate is None else Filter(result, predicate)
+
+
+def _push_projection(node: LogicalPlan, required: Optional[set[str]]) -> LogicalPlan:
+    """
+    Prune the columns that are not required by the parent nodes.
+
+    Args:
+        node: Root of the plan.
+        required: Names of the output columns of the node consumed by the parent nodes,
+            None if all of them are consumed.
+
+    Returns:
+        New root of the plan.
+    """
+    node, inputs_required = node.required_inputs(required)
+    if isinstance(node, _Passthrough):
+        return _push_projection(node.inputs[0], inputs_required[0])
+    if len(node.inputs) == 0:
+        return node
+    return node.with_inputs(
+        *[
+            _push_projection(child, child_required)
+            for child, child_required in zip(node.inputs, inputs_required)
+        ]
+    )
+
+
+def _eliminate_common_subexpressions(node: LogicalPlan) -> LogicalPlan:
+    """
+    Mark the common subexpressions in all nodes of the plan.
+
+    Args:
+        node: Root of the plan.
+
+    Returns:
+        New root of the plan.
+    """
+    if len(node.inputs) > 0:
+        node = node.with_inputs(
+            *[_eliminate_common_subexpressions(child) for child in node.inputs]
+        )
+    return node.eliminate_common_subexpressions()
+
+
+def optimize(
+    plan: LogicalPlan,
+    predicate_pushdown: bool = True,
+    projection_pushdown: bool = True,
+    comm_subexpr_elim: bool = True,
+) -> LogicalPlan:
+    """
+    Optimize the logical plan.
+
+    Args:
+        plan: Root of the plan.
+        predicate_pushdown: Whether to push the filters down to the scans.
+        projection_pushdown: Whether to read only the columns that are used.
+        comm_subexpr_elim: Whether to evaluate the common subexpressions only once.
+
+    Returns:
+        Root of the optimized plan.
+    """
+    if predicate_pushdown:
+        plan = _push_predicates(plan, [])
+    if projection_pushdown:
+        plan = _push_projection(plan, None)
+    if comm_subexpr_elim:
+        plan = _eliminate_common_subexpressions(plan)
+    return plan
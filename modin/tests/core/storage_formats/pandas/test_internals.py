@@ -12,6 +12,8 @@
 # governing permissions and limitations under the License.
 
 import functools
+import os
+import subprocess
 import sys
 import unittest.mock as mock
 
@@ -38,6 +40,7 @@ from modin.core.dataframe.pandas.metadata import (
     LazyProxyCategoricalDtype,
     ModinDtypes,
 )
+from modin.core.dataframe.pandas.partitioning.spill import PartitionSpillManager
 from modin.core.execution.utils import remote_function
 from modin.core.storage_formats import PandasQueryCompiler
 from modin.core.storage_formats.pandas.utils import split_result_of_axis_func_pandas
@@ -1034,6 +1037,33 @@ def test_split_partitions_with_empty_pivots(col_name, ascending):
     assert result[0].equals(df)
 
 
+def test_hash_rows_deterministic_across_processes():
+    """Verify that the rows get the same hashes whatever process hashes them."""
+    script = (
+        "import pandas, datetime;"
+        + "from modin.core.dataframe.pandas.dataframe.utils import ShuffleHashFunctions;"
+        + "df = pandas.DataFrame({'a': ['x', 'yy', b'z', None, 1, 1.0, True,"
+        + " pandas.Timestamp('2020-01-01', tz='UTC'),"
+        + " datetime.datetime(2020, 1, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))]});"
+        + "print(list(ShuffleHashFunctions.hash_rows(df)))"
+    )
+    outputs = [
+        subprocess.run(
+            [sys.executable, "-c", script],
+            env={"PYTHONHASHSEED": seed, "PYTHONPATH": os.pathsep.join(sys.path)},
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for seed in ("1", "2")
+    ]
+    assert outputs[0] == outputs[1]
+    hashes = eval(outputs[0])
+    # equal values of different types get equal hashes
+    assert hashes[4] == hashes[5] == hashes[6]
+    assert hashes[7] == hashes[8]
+
+
 @pytest.mark.parametrize("ascending", [True, False])
 def test_shuffle_partitions_with_empty_pivots(ascending):
     """
@@ -1068,6 +1098,36 @@ def test_shuffle_partitions_with_empty_pivots(ascending):
     assert ref.equals(res)
 
 
+def test_shuffle_functions_salt_hot_keys():
+    """
+    This test verifies that ``ShuffleSortFunctions`` splits the rows of the keys taking more than a partition across extra bins.
+    """
+    df = pandas.DataFrame({"key": [5] * 60 + list(range(10, 50)), "value": range(100)})
+    modin_frame = pd.DataFrame(df)._query_compiler._modin_frame
+
+    shuffle_functions = ShuffleSortFunctions(
+        modin_frame,
+        columns="key",
+        ascending=True,
+        ideal_num_new_partitions=4,
+        salt_hot_keys=True,
+    )
+    num_bins = shuffle_functions.pivot_fn([df[["key"]]])
+
+    # the key takes 60% of the rows, so it gets 3 bins and the rest of the keys get 1 bin
+    assert list(shuffle_functions.hot_keys) == [5]
+    range_bin, bins = shuffle_functions.hot_keys[5]
+    assert range_bin == 0
+    assert list(bins) == [1, 2, 3]
+    assert num_bins == 4
+
+    splits = shuffle_functions.split_fn(df)
+    assert len(splits) == num_bins
+    assert (splits[0]["key"] != 5).all() and len(splits[0]) == 40
+    for i in bins:
+        assert (splits[i]["key"] == 5).all() and len(splits[i]) == 20
+
+
 @pytest.mark.parametrize("ascending", [True, False])
 def test_split_partition_preserve_names(ascending):
     """
@@ -2715,6 +2775,64 @@ def test_map_partitions_joined_by_column():
             ), "Invalid map function result."
 
 
+@pytest.mark.parametrize("with_strings", [False, True])
+def test_spill_partitions(with_strings):
+    data = {f"col{i}": np.arange(2**14) * i for i in range(8)}
+    if with_strings:
+        # such frames are pickled instead of written as Arrow IPC files
+        data["str"] = ["a", "b"] * 2**13
+    pandas_df = pandas.DataFrame(data)
+
+    PartitionSpillManager.reset()
+    with context(SpillMemoryBudget=1):
+        modin_df = pd.DataFrame(pandas_df)
+        results = [modin_df * 2, modin_df.iloc[::2], modin_df.T, modin_df.sum()]
+        assert PartitionSpillManager.memory_usage() <= 2**20
+        assert PartitionSpillManager._spilled_count > 0
+        assert len(os.listdir(PartitionSpillManager._get_spill_dir())) > 0
+
+        df_equals(modin_df, pandas_df)
+        for modin_result, pandas_result in zip(
+            results,
+            [pandas_df * 2, pandas_df.iloc[::2], pandas_df.T, pandas_df.sum()],
+        ):
+            df_equals(modin_result, pandas_result)
+
+        del modin_df, modin_result, results
+        # the files of the destroyed partitions are removed
+        assert PartitionSpillManager.memory_usage() == 0
+        assert len(os.listdir(PartitionSpillManager._get_spill_dir())) == 0
+    PartitionSpillManager.reset()
+
+
+def test_spill_partitions_multi_node(tmp_path):
+    pandas_df = pandas.DataFrame({f"col{i}": np.arange(2**14) * i for i in range(8)})
+    execution_wrapper = (
+        pd.DataFrame(pandas_df)._query_compiler._modin_frame._partitions.flat[0]
+    ).execution_wrapper
+
+    PartitionSpillManager.reset()
+    # the partitions written on one node may be read back on another one
+    with mock.patch.object(
+        execution_wrapper, "num_nodes", return_value=2
+    ), mock.patch.object(PartitionSpillManager, "_num_nodes", None), mock.patch.object(
+        PartitionSpillManager, "_spill_dir", None
+    ), pytest.warns(
+        UserWarning, match="shared by all the nodes"
+    ):
+        with context(SpillMemoryBudget=1):
+            df_equals(pd.DataFrame(pandas_df) * 2, pandas_df * 2)
+            assert PartitionSpillManager._spilled_count == 0
+            with context(SpillDir=str(tmp_path)):
+                modin_df = pd.DataFrame(pandas_df) * 2
+                assert PartitionSpillManager.memory_usage() <= 2**20
+                assert PartitionSpillManager._spilled_count > 0
+                df_equals(modin_df, pandas_df * 2)
+                # the directory of the session is created by the writing tasks
+                assert len(os.listdir(tmp_path)) == 1
+    PartitionSpillManager.reset()
+
+
 def test_fold_operator():
     new_index = list(range(500, 1000))
     new_columns = ["b"]
@@ -65,6 +65,25 @@ def test_from_sql_distributed(tmp_path, make_sql_connection):
     df_equals(modin_df_from_table, pandas_df)
 
 
+@pytest.mark.skipif(
+    Engine.get() not in ("Ray", "Unidist", "Dask"),
+    reason=f"{Engine.get()} does not have experimental API",
+)
+@pytest.mark.parametrize("partition_column", ["col1", "col5"])
+def test_from_sql_distributed_without_bounds(
+    tmp_path, make_sql_connection, partition_column
+):
+    filename = "test_from_sql_distributed_without_bounds.db"
+    table = "test_from_sql_distributed_without_bounds"
+    conn = make_sql_connection(str(tmp_path / filename), table)
+    query = "select * from {0}".format(table)
+
+    pandas_df = pandas.read_sql(query, conn)
+    modin_df = pd.read_sql(query, conn, partition_column=partition_column)
+
+    df_equals(modin_df, pandas_df)
+
+
 @pytest.mark.skipif(
     Engine.get() not in ("Ray", "Unidist", "Dask"),
     reason=f"{Engine.get()} does not have experimental API",
@@ -19,6 +19,7 @@ import pytest
 import modin.numpy as np
 import modin.numpy.linalg as LA
 import modin.pandas as pd
+from modin.config import context
 
 from .utils import assert_scalar_or_array_equal
 
@@ -52,6 +53,17 @@ def test_dot_2d():
     assert_scalar_or_array_equal(modin_result, numpy_result)
 
 
+@pytest.mark.parametrize("shapes", [(100, 30, 50), (1, 30, 1), (30, 1, 20)])
+def test_dot_2d_many_partitions(shapes):
+    n, k, m = shapes
+    x1 = numpy.random.randint(-100, 100, size=(n, k))
+    x2 = numpy.random.randint(-100, 100, size=(k, m))
+    numpy_result = numpy.dot(x1, x2)
+    with context(MinRowPartitionSize=4, MinColumnPartitionSize=3, NPartitions=4):
+        x1, x2 = np.array(x1), np.array(x2)
+        assert_scalar_or_array_equal(x1 @ x2, numpy_result)
+
+
 def test_dot_scalar():
     x1 = numpy.random.randint(-100, 100, size=(100, 3))
     x2 = numpy.random.randint(-100, 100)
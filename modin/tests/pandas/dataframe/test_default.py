@@ -22,7 +22,13 @@ import pytest
 from numpy.testing import assert_array_equal
 
 import modin.pandas as pd
-from modin.config import Engine, NativeDataframeMode, NPartitions, StorageFormat
+from modin.config import (
+    Engine,
+    NativeDataframeMode,
+    NPartitions,
+    StorageFormat,
+    context,
+)
 from modin.pandas.io import to_pandas
 from modin.tests.pandas.utils import (
     axis_keys,
@@ -73,13 +79,11 @@ pytestmark = [
     [
         ("align", lambda df: {"other": df}),
         ("corrwith", lambda df: {"other": df}),
-        ("ewm", lambda df: {"com": 0.5}),
         ("from_dict", lambda df: {"data": None}),
         ("from_records", lambda df: {"data": to_pandas(df)}),
         ("hist", lambda df: {"column": "int_col"}),
         ("interpolate", None),
         ("mask", lambda df: {"cond": df != 0}),
-        ("pct_change", None),
         ("to_xarray", None),
         ("flags", None),
         ("set_flags", lambda df: {"allows_duplicate_labels": False}),
@@ -434,6 +438,49 @@ def test_dot(data):
     df_equals(modin_result, pandas_result)
 
 
+@pytest.mark.parametrize("shapes", [(40, 30, 20), (1, 30, 2), (40, 1, 7)])
+def test_dot_many_partitions(shapes):
+    # the operands are multiplied block-wise, the partitioning of the
+    # contraction axis differs between the left and the right operands
+    n, k, m = shapes
+    rng = np.random.default_rng(seed=0)
+    columns = [f"col{i}" for i in range(k)]
+    left = rng.integers(-10, 10, (n, k))
+    right = rng.random((k, m))
+    with context(MinRowPartitionSize=3, MinColumnPartitionSize=4, NPartitions=4):
+        modin_left, pandas_left = create_test_dfs(left, columns=columns)
+        # the right operand's labels are aligned to the left's columns
+        modin_right, pandas_right = create_test_dfs(right, index=columns[::-1])
+        eval_general(
+            (modin_left, modin_right),
+            (pandas_left, pandas_right),
+            lambda dfs: dfs[0] @ dfs[1],
+        )
+        eval_general(
+            (modin_left, modin_right[0]),
+            (pandas_left, pandas_right[0]),
+            lambda dfs: dfs[0].dot(dfs[1]),
+        )
+        eval_general(
+            (modin_left.iloc[0], modin_right),
+            (pandas_left.iloc[0], pandas_right),
+            lambda dfs: dfs[0] @ dfs[1],
+        )
+
+
+@pytest.mark.parametrize("squeeze_self", [False, True])
+def test_dot_misaligned_labels(squeeze_self):
+    # the query compilers are multiplied block-wise only if their labels match as sets
+    left = pd.DataFrame(np.ones((4, 3)), columns=["a", "b", "c"])
+    right = pd.DataFrame(np.ones((3, 2)), index=["a", "b", "d"])
+    if squeeze_self:
+        left, right = right.iloc[:, 0], left.T
+    with pytest.raises(ValueError, match="matrices are not aligned"):
+        left._query_compiler.dot(
+            right._query_compiler, squeeze_self=squeeze_self, squeeze_other=False
+        )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_matmul(data):
     modin_df = pd.DataFrame(data)
@@ -11,15 +11,24 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import unittest.mock as mock
 import warnings
 
 import matplotlib
 import numpy as np
 import pandas
 import pytest
+from pandas.api.types import is_list_like
 
 import modin.pandas as pd
-from modin.config import Engine, NativeDataframeMode, NPartitions, StorageFormat
+from modin.config import (
+    Engine,
+    NativeDataframeMode,
+    NPartitions,
+    StorageFormat,
+    context,
+)
+from modin.core.storage_formats.pandas.merge import MergeImpl
 from modin.pandas.io import to_pandas
 from modin.tests.pandas.utils import (
     arg_keys,
@@ -38,7 +47,6 @@ from modin.tests.pandas.utils import (
     test_data_keys,
     test_data_values,
 )
-from modin.tests.test_utils import warns_that_defaulting_to_pandas
 
 NPartitions.put(4)
 
@@ -424,6 +432,82 @@ def test_merge_empty(how):
     eval_general(*create_test_dfs(data), lambda df: df.merge(df.iloc[:0], how=how))
 
 
+@pytest.mark.parametrize("how", ["left", "inner", "right"])
+@pytest.mark.parametrize("on", ["key", ["key", "tag"], None])
+@pytest.mark.parametrize("sort", [False, True])
+@pytest.mark.parametrize("indicator", [False, True])
+def test_merge_hash_partitioning(how, on, sort, indicator):
+    # with the zero limit nothing is broadcast, so both frames are hash-partitioned
+    rng = np.random.default_rng(seed=42)
+    left_data = {
+        "key": rng.integers(0, 40, 256).astype(float),
+        "tag": rng.choice(list("abcd"), 256),
+        "value": rng.normal(size=256),
+    }
+    left_data["key"][::13] = np.nan
+    right_data = {
+        "key": rng.integers(0, 60, 128),
+        "tag": rng.choice(list("abce"), 128),
+        "other_value": np.arange(128),
+    }
+    with context(MinRowPartitionSize=8, BroadcastSizeLimit=0):
+        modin_left, pandas_left = create_test_dfs(left_data, index=rng.permutation(256))
+        modin_right, pandas_right = create_test_dfs(right_data)
+        eval_general(
+            (modin_left, modin_right),
+            (pandas_left, pandas_right),
+            lambda dfs: dfs[0].merge(
+                dfs[1], how=how, on=on, sort=sort, indicator=indicator
+            ),
+        )
+
+
+@pytest.mark.parametrize("how", ["left", "inner", "right"])
+def test_merge_hash_partitioning_string_keys(how):
+    # the buckets of the frames are built by different worker processes on
+    # distributed engines, so equal strings have to get equal hashes in all of them
+    rng = np.random.default_rng(seed=42)
+    keys = np.array([f"key_{i}" for i in range(50)], dtype=object)
+    left_data = {"key": rng.choice(keys, 256), "value": rng.normal(size=256)}
+    right_data = {"key": rng.choice(keys[10:], 128), "other_value": np.arange(128)}
+    with context(MinRowPartitionSize=8, BroadcastSizeLimit=0):
+        modin_left, pandas_left = create_test_dfs(left_data)
+        modin_right, pandas_right = create_test_dfs(right_data)
+        with mock.patch.object(
+            MergeImpl,
+            "hash_partitioning_merge",
+            wraps=MergeImpl.hash_partitioning_merge,
+        ) as hash_partitioning_merge:
+            eval_general(
+                (modin_left, modin_right),
+                (pandas_left, pandas_right),
+                lambda dfs: dfs[0].merge(dfs[1], how=how, on="key"),
+            )
+        if StorageFormat.get() == "Pandas":
+            hash_partitioning_merge.assert_called()
+
+
+@pytest.mark.parametrize("how", ["left", "inner", "right"])
+@pytest.mark.parametrize("min_row_partition_size", [1, 8])
+def test_merge_hash_partitioning_small_result(how, min_row_partition_size):
+    # only a few keys match, so the merged buckets are much smaller than the frames
+    left_data = {"key": np.arange(1000), "value": np.arange(1000) % 7}
+    right_data = {
+        "key": np.r_[np.arange(10), np.arange(5000, 7000)],
+        "other_value": np.arange(2010),
+    }
+    with context(
+        MinRowPartitionSize=min_row_partition_size, BroadcastSizeLimit=0, NPartitions=4
+    ):
+        modin_left, pandas_left = create_test_dfs(left_data)
+        modin_right, pandas_right = create_test_dfs(right_data)
+        eval_general(
+            (modin_left, modin_right),
+            (pandas_left, pandas_right),
+            lambda dfs: dfs[0].merge(dfs[1], how=how, on="key"),
+        )
+
+
 def test_merge_with_mi_columns():
     modin_df1, pandas_df1 = create_test_dfs(
         {
@@ -610,11 +694,65 @@ def test_sort_multiindex(sort_remaining):
             setattr(df, index, new_index)
 
     for kwargs in [{"level": 0}, {"axis": 0}, {"axis": 1}]:
-        with warns_that_defaulting_to_pandas():
-            df_equals(
-                modin_df.sort_index(sort_remaining=sort_remaining, **kwargs),
-                pandas_df.sort_index(sort_remaining=sort_remaining, **kwargs),
-            )
+        df_equals(
+            modin_df.sort_index(sort_remaining=sort_remaining, **kwargs),
+            pandas_df.sort_index(sort_remaining=sort_remaining, **kwargs),
+        )
+
+
+@pytest.mark.parametrize("level", [None, "b", [2, 0]])
+@pytest.mark.parametrize("ascending", [True, False, [False, True]])
+@pytest.mark.parametrize("na_position", ["first", "last"])
+@pytest.mark.parametrize("sort_remaining", [True, False])
+def test_sort_multiindex_spanning_row_partitions(
+    level, ascending, na_position, sort_remaining
+):
+    # the rows are range-partitioned by the first level to sort by
+    rng = np.random.default_rng(seed=42)
+    first = rng.integers(0, 12, 256).astype(float)
+    first[::17] = np.nan
+    second = rng.choice(["x", "y", "z", None], 256)
+    third = pandas.date_range("2020-01-01", periods=256, freq="h")[rng.permutation(256)]
+    index = pandas.MultiIndex.from_arrays([first, second, third], names=["a", "b", "c"])
+    data = {"col1": rng.normal(size=256), "col2": np.arange(256)}
+    if is_list_like(ascending) and not is_list_like(level):
+        ascending = ascending[:1] if level is not None else ascending + [True]
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data, index=index)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.sort_index(
+                level=level,
+                ascending=ascending,
+                na_position=na_position,
+                sort_remaining=sort_remaining,
+            ),
+        )
+
+
+@pytest.mark.parametrize("flat", [True, False])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort_index_categorical_level(flat, ascending):
+    # a categorical level is sorted by the order of its categories, not its values
+    rng = np.random.default_rng(seed=42)
+    categorical = pandas.Categorical(
+        rng.choice(["mid", "hi", "lo"], 256), categories=["mid", "hi", "lo"]
+    )
+    if flat:
+        index = pandas.CategoricalIndex(categorical)
+    else:
+        index = pandas.MultiIndex.from_arrays([categorical, rng.permutation(256)])
+    data = {"col1": rng.normal(size=256), "col2": np.arange(256)}
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data, index=index)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.sort_index(level=0, ascending=ascending),
+        )
 
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
@@ -904,6 +1042,28 @@ def test_sort_values_with_sort_key_on_partition_boundary():
     eval_general(modin_df, modin_df._to_pandas(), lambda df: df.sort_values(sort_key))
 
 
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("na_position", ["first", "last"])
+def test_sort_values_range_partitioning_infinite_keys(ascending, na_position):
+    # with most of the keys being '-inf' the sampled pivots are infinite as well
+    rng = np.random.default_rng(seed=42)
+    key = rng.normal(size=1000)
+    key[rng.random(1000) < 0.6] = -np.inf
+    key[rng.random(1000) < 0.05] = np.inf
+    key[rng.random(1000) < 0.05] = np.nan
+    data = {"key": key, "value": np.arange(1000)}
+    with context(MinRowPartitionSize=8, RangePartitioning=True):
+        modin_df, pandas_df = create_test_dfs(data)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.sort_values(
+                ["key", "value"], ascending=ascending, na_position=na_position
+            ),
+        )
+
+
 def test_where():
     columns = list("abcdefghij")
 
@@ -24,6 +24,7 @@ from modin.config import (
     NativeDataframeMode,
     NPartitions,
     StorageFormat,
+    context,
 )
 from modin.core.dataframe.pandas.metadata import LazyProxyCategoricalDtype
 from modin.core.storage_formats.pandas.utils import split_result_of_axis_func_pandas
@@ -1183,6 +1184,37 @@ def test_drop_duplicates_with_repeated_index_values():
     )
 
 
+@pytest.mark.parametrize("keep", ["first", "last", False])
+@pytest.mark.parametrize("subset", [None, ["int"], ["int", "str"]])
+def test_duplicated_many_row_partitions(keep, subset):
+    # the rows are hash-partitioned so the duplicates from different
+    # row partitions have to be found in the same bucket
+    rng = np.random.default_rng(seed=42)
+    data = {
+        "int": rng.integers(0, 10, 256),
+        "float": rng.integers(0, 3, 256) * 0.5,
+        "str": rng.choice(["a", "b", "c"], 256),
+        "obj": pandas.Series(
+            rng.choice([1, 1.0, True, None, np.nan], 256), dtype=object
+        ),
+    }
+    index = rng.permutation(256)
+    with context(MinRowPartitionSize=16):
+        modin_df, pandas_df = create_test_dfs(data, index=index)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.duplicated(subset=subset, keep=keep),
+        )
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.drop_duplicates(subset=subset, keep=keep),
+            comparator=sort_if_range_partitioning,
+        )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 @pytest.mark.parametrize("axis", axis_values, ids=axis_keys)
 @pytest.mark.parametrize("how", ["any", "all"], ids=["any", "all"])
@@ -17,7 +17,8 @@ import pandas
 import pytest
 
 import modin.pandas as pd
-from modin.config import NPartitions
+from modin.config import NPartitions, context
+from modin.core.storage_formats.pandas.quantiles import QuantileImpl
 from modin.tests.pandas.utils import (
     arg_keys,
     axis_keys,
@@ -25,6 +26,7 @@ from modin.tests.pandas.utils import (
     bool_arg_keys,
     bool_arg_values,
     create_test_dfs,
+    default_to_pandas_ignore_string,
     df_equals,
     eval_general,
     int_arg_keys,
@@ -73,6 +75,20 @@ def test_cummin_cummax_int_and_float(axis, method):
     eval_general(*create_test_dfs(data), lambda df: getattr(df, method)(axis=axis))
 
 
+@pytest.mark.parametrize("skipna", [False, True])
+@pytest.mark.parametrize("method", ["cumprod", "cummin", "cummax", "cumsum"])
+def test_cumulative_spans_row_partitions(skipna, method):
+    # the partitions are scanned in parallel from the aggregates of the preceding ones
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    data[::7, 0] = np.nan
+    data[:20, 1] = np.nan
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        modin_df["int"], pandas_df["int"] = np.arange(128) % 5, np.arange(128) % 5
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(modin_df, pandas_df, lambda df: getattr(df, method)(skipna=skipna))
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 @pytest.mark.parametrize(
     "periods", int_arg_values, ids=arg_keys("periods", int_arg_keys)
@@ -84,6 +100,58 @@ def test_diff(axis, periods):
     )
 
 
+@pytest.mark.parametrize("periods", [1, 3, -2, 40, -200])
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("shift", {}),
+        ("shift", {"fill_value": 0}),
+        ("diff", {}),
+        ("pct_change", {}),
+        ("pct_change", {"fill_method": None}),
+    ],
+)
+def test_shift_diff_pct_change_span_row_partitions(periods, method, kwargs):
+    # every partition only gets the boundary rows of its neighbours
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    data[::7, 0] = np.nan
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        modin_df["int"], pandas_df["int"] = np.arange(128) % 5, np.arange(128) % 5
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df, pandas_df, lambda df: getattr(df, method)(periods, **kwargs)
+        )
+
+
+@pytest.mark.parametrize("periods", [1, -1, 3])
+@pytest.mark.parametrize("freq", ["h", "90min", "infer"])
+def test_shift_pct_change_with_freq(periods, freq):
+    rng = np.random.default_rng(seed=42)
+    index = pandas.date_range("2020-01-01", periods=128, freq="h")
+    if freq != "infer":
+        # irregular labels
+        index += pandas.to_timedelta(rng.integers(0, 50, 128), unit="min")
+    data = rng.normal(size=(128, 4))
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data, index=index)
+        eval_general(modin_df, pandas_df, lambda df: df.shift(periods, freq=freq))
+        eval_general(modin_df, pandas_df, lambda df: df.pct_change(periods, freq=freq))
+
+
+@pytest.mark.filterwarnings(default_to_pandas_ignore_string)
+@pytest.mark.parametrize("periods", [[1, 2], [0, -3, 40]])
+@pytest.mark.parametrize("kwargs", [{}, {"suffix": "_shifted"}, {"freq": "h"}])
+def test_shift_list_of_periods(periods, kwargs):
+    index = pandas.date_range("2020-01-01", periods=128, freq="h")
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    with context(MinRowPartitionSize=8):
+        eval_general(
+            *create_test_dfs(data, index=index),
+            lambda df: df.shift(periods, **kwargs),
+        )
+
+
 def test_diff_with_datetime_types():
     pandas_df = pandas.DataFrame(
         [[1, 2.0, 3], [4, 5.0, 6], [7, np.nan, 9], [10, 11.3, 12], [13, 14.5, 15]]
@@ -687,6 +755,82 @@ def test_quantile_7157():
     )
 
 
+def _quantiles_test_data():
+    rng = np.random.default_rng(seed=42)
+    return {
+        "float": rng.normal(size=300),
+        "float_nan": np.where(rng.random(300) < 0.3, np.nan, rng.normal(size=300)),
+        "int": rng.integers(-50, 50, 300),
+        "duplicates": np.repeat([1.5, 2.5, 3.5], [100, 150, 50]),
+        "large_int": rng.integers(2**60, 2**61, 300),
+        "all_nan": np.full(300, np.nan),
+    }
+
+
+@pytest.mark.parametrize(
+    "interpolation", ["linear", "lower", "higher", "midpoint", "nearest"]
+)
+@pytest.mark.parametrize("q", [0.37, [0, 0.01, 0.25, 0.5, 0.999, 1]])
+def test_quantile_spans_row_partitions(interpolation, q):
+    # the partitions only send the values between the bounds found by the sketches
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(_quantiles_test_data())
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.quantile(q, interpolation=interpolation),
+        )
+
+
+@pytest.mark.parametrize("interpolation", ["hazen", "unknown"])
+def test_quantile_spans_row_partitions_other_interpolation(interpolation):
+    # pandas computes the methods not implemented over the row partitions,
+    # and raises for the unknown ones
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(_quantiles_test_data())
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.quantile([0.25, 0.5], interpolation=interpolation),
+            # the message lists the methods of the installed numpy
+            expected_exception=False,
+        )
+        with pytest.raises(ValueError, match="is not a valid method"):
+            QuantileImpl.quantile(
+                modin_df._query_compiler, np.array([0.5]), interpolation
+            )
+
+
+@pytest.mark.parametrize("skipna", [True, False])
+def test_median_describe_span_row_partitions(skipna):
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(_quantiles_test_data())
+        eval_general(modin_df, pandas_df, lambda df: df.median(skipna=skipna))
+        eval_general(
+            modin_df, pandas_df, lambda df: df.describe(percentiles=[0.01, 0.3, 0.99])
+        )
+
+
+@pytest.mark.parametrize("sketch_size", [16, 64])
+def test_approximate_quantile(sketch_size):
+    data = _quantiles_test_data()
+    q = [0, 0.1, 0.25, 0.5, 0.9, 1]
+    with context(MinRowPartitionSize=8, QuantileSketchSize=sketch_size):
+        result = pd.DataFrame(data).quantile(q)._to_pandas()
+    for column in ("float", "int", "duplicates"):
+        values = np.sort(data[column])
+        for quantile, value in zip(q, result[column]):
+            rank = (len(values) - 1) * quantile
+            # the distance from the ranks the value has to the requested one
+            error = max(
+                0,
+                np.searchsorted(values, value, side="left") - np.ceil(rank),
+                np.floor(rank) - np.searchsorted(values, value, side="right"),
+            )
+            assert error <= 2 * len(values) / sketch_size
+
+
 @pytest.mark.parametrize("axis", ["rows", "columns"])
 @pytest.mark.parametrize(
     "na_option", ["keep", "top", "bottom"], ids=["keep", "top", "bottom"]
@@ -738,6 +882,36 @@ def test_rank(axis):
     )
 
 
+@pytest.mark.parametrize("method", ["average", "min", "max", "first", "dense"])
+@pytest.mark.parametrize("na_option", ["keep", "top", "bottom"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("pct", [True, False])
+def test_rank_range_partitioning(method, na_option, ascending, pct):
+    # the ties of every value get to the same range
+    rng = np.random.default_rng(seed=42)
+    data = {
+        "float": rng.normal(size=300),
+        "int": rng.integers(-5, 5, 300),
+        "float_nan": np.where(
+            rng.random(300) < 0.3, np.nan, rng.integers(0, 20, 300).astype(float)
+        ),
+        # mostly infinite keys, so that the sampled pivots are infinite as well
+        "float_inf": rng.choice(
+            [-np.inf, np.inf, np.nan, 0.5, 1.5], size=300, p=[0.5, 0.2, 0.1, 0.1, 0.1]
+        ),
+    }
+    with context(MinRowPartitionSize=8, RangePartitioning=True):
+        modin_df, pandas_df = create_test_dfs(data, index=rng.permutation(300))
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: df.rank(
+                method=method, na_option=na_option, ascending=ascending, pct=pct
+            ),
+        )
+
+
 @pytest.mark.parametrize("axis", ["rows", "columns"])
 @pytest.mark.parametrize("ddof", int_arg_values, ids=arg_keys("ddof", int_arg_keys))
 @pytest.mark.parametrize("method", ["std", "var"])
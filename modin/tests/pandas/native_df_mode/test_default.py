@@ -67,13 +67,11 @@ pytestmark = [
     [
         ("align", lambda df: {"other": df}),
         ("corrwith", lambda df: {"other": df}),
-        ("ewm", lambda df: {"com": 0.5}),
         ("from_dict", lambda df: {"data": None}),
         ("from_records", lambda df: {"data": to_pandas(df)}),
         ("hist", lambda df: {"column": "int_col"}),
         ("interpolate", None),
         ("mask", lambda df: {"cond": df != 0}),
-        ("pct_change", None),
         ("to_xarray", None),
         ("flags", None),
         ("set_flags", lambda df: {"allows_duplicate_labels": False}),
@@ -0,0 +1,201 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import unittest.mock as mock
+
+import numpy as np
+import pandas
+import pytest
+
+import modin.pandas as pd
+from modin.config import NPartitions, context
+from modin.tests.test_utils import warns_that_defaulting_to_pandas
+
+from .utils import (
+    create_test_dfs,
+    create_test_series,
+    df_equals,
+    eval_general,
+    test_data,
+    test_data_keys,
+    test_data_values,
+)
+
+NPartitions.put(4)
+
+
+@pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
+@pytest.mark.parametrize("min_periods", [0, 5])
+@pytest.mark.parametrize("adjust", [True, False])
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("sum", {}),
+        ("mean", {}),
+        ("var", {}),
+        ("var", {"bias": True}),
+        ("std", {}),
+    ],
+)
+def test_dataframe(data, min_periods, adjust, method, kwargs):
+    expected_exception = None
+    if method == "sum" and not adjust:
+        expected_exception = NotImplementedError(
+            "sum is not implemented with adjust=False"
+        )
+    eval_general(
+        *create_test_dfs(data),
+        lambda df: getattr(
+            df.ewm(com=0.5, min_periods=min_periods, adjust=adjust), method
+        )(**kwargs),
+        expected_exception=expected_exception,
+    )
+
+
+@pytest.mark.parametrize("method", ["corr", "cov"])
+def test_dataframe_corr_cov(method):
+    with warns_that_defaulting_to_pandas():
+        eval_general(
+            *create_test_dfs(test_data["float_nan_data"]),
+            lambda df: getattr(df.ewm(alpha=0.3), method)(),
+        )
+
+
+@pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
+def test_dataframe_agg(data):
+    modin_df = pd.DataFrame(data)
+    pandas_df = pandas.DataFrame(data)
+    df_equals(
+        modin_df.ewm(span=10).aggregate(["mean", "std"]),
+        pandas_df.ewm(span=10).aggregate(["mean", "std"]),
+    )
+
+
+@pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
+@pytest.mark.parametrize("ignore_na", [True, False])
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("sum", {}),
+        ("mean", {}),
+        ("var", {}),
+        ("std", {"bias": True}),
+        ("cov", {}),
+        ("corr", {}),
+    ],
+)
+def test_series(data, ignore_na, method, kwargs):
+    eval_general(
+        *create_test_series(data),
+        lambda df: getattr(df.ewm(halflife=6, ignore_na=ignore_na), method)(**kwargs),
+    )
+
+
+@pytest.mark.parametrize("method", ["corr", "cov"])
+def test_series_corr_cov_with_other(method):
+    data = test_data["float_nan_data"]
+    modin_df, pandas_df = create_test_dfs(data)
+    other = list(data)[1]
+    eval_general(
+        modin_df.iloc[:, 0],
+        pandas_df.iloc[:, 0],
+        lambda df, other: getattr(df.ewm(com=2), method)(other=other),
+        other=pandas_df[other],
+        md_extra_kwargs={"other": modin_df[other]},
+    )
+
+
+@pytest.mark.parametrize("min_periods", [0, 10])
+@pytest.mark.parametrize(
+    "ewm_kwargs",
+    [
+        {"com": 0.5},
+        {"alpha": 0.05, "ignore_na": True},
+        {"span": 20, "adjust": False},
+        {"halflife": 3, "adjust": False, "ignore_na": True},
+    ],
+)
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("mean", {}),
+        ("var", {}),
+        ("std", {"bias": True}),
+    ],
+)
+def test_ewm_spans_row_partitions(min_periods, ewm_kwargs, method, kwargs):
+    # the partitions are computed in parallel from the moments of the preceding ones
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    data[::7, 0] = np.nan
+    data[:40, 1] = np.nan
+    data[60:70, 2] = np.nan
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: getattr(df.ewm(min_periods=min_periods, **ewm_kwargs), method)(
+                **kwargs
+            ),
+        )
+
+
+@pytest.mark.parametrize("method", ["corr", "cov"])
+@pytest.mark.parametrize("other", [None, 2])
+def test_ewm_corr_cov_spans_row_partitions(method, other):
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    data[::7, 0] = np.nan
+    data[60:70, 2] = np.nan
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        eval_general(
+            modin_df[0],
+            pandas_df[0],
+            lambda df, other: getattr(df.ewm(alpha=0.2), method)(other),
+            other=None if other is None else pandas_df[other],
+            md_extra_kwargs={"other": None if other is None else modin_df[other]},
+        )
+        if other is not None:
+            # the scan reads the partitions of the other column, it isn't converted to pandas
+            with mock.patch.object(
+                type(modin_df._query_compiler),
+                "to_pandas",
+                side_effect=AssertionError("the other column is converted to pandas"),
+            ):
+                getattr(modin_df[0].ewm(alpha=0.2), method)(modin_df[other])
+
+
+def test_ewm_times():
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    data[::7, 0] = np.nan
+    times = pandas.date_range(
+        "2020-01-01", periods=128, freq="h"
+    ) + pandas.to_timedelta(
+        np.random.default_rng(seed=42).integers(0, 50, 128), unit="min"
+    )
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df, times: df.ewm(halflife="4h", times=times).mean(),
+            times=times,
+        )
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df, times: df.ewm(halflife="4h", times=times).mean(),
+            times=pandas.Series(times),
+            md_extra_kwargs={"times": pd.Series(times)},
+        )
@@ -16,7 +16,7 @@ import pandas
 import pytest
 
 import modin.pandas as pd
-from modin.config import NPartitions
+from modin.config import NPartitions, context
 from modin.tests.test_utils import warns_that_defaulting_to_pandas
 
 from .utils import (
@@ -153,6 +153,35 @@ def test_series_agg(data, min_periods):
     )
 
 
+@pytest.mark.parametrize("min_periods", [0, 1, 30])
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("sum", {}),
+        ("mean", {}),
+        ("var", {}),
+        ("var", {"ddof": 0}),
+        ("std", {"ddof": 2}),
+        ("min", {}),
+        ("max", {}),
+        ("count", {}),
+    ],
+)
+def test_expanding_spans_row_partitions(min_periods, method, kwargs):
+    # the partitions are computed in parallel from the statistics of the preceding ones
+    data = np.random.default_rng(seed=42).normal(size=(128, 4))
+    data[::7, 0] = np.nan
+    data[:40, 1] = np.nan
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: getattr(df.expanding(min_periods), method)(**kwargs),
+        )
+
+
 @pytest.mark.parametrize("method", ["corr", "cov"])
 def test_series_corr_cov_with_self(method):
     mdf, pdf = create_test_series(test_data["float_nan_data"])
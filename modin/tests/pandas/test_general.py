@@ -19,6 +19,7 @@ import pytest
 from numpy.testing import assert_array_equal
 
 import modin.pandas as pd
+from modin.config import context
 from modin.pandas.io import to_pandas
 from modin.pandas.testing import assert_frame_equal
 from modin.tests.test_utils import warns_that_defaulting_to_pandas
@@ -183,21 +184,17 @@ def test_merge_asof(right_index):
         {"a": [1, 2, 3, 6, 7], "right_val": [1, 2, 3, 6, 7]}, index=right_index
     )
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a")
-        assert isinstance(df, pd.DataFrame)
+    df = pd.merge_asof(left, right, on="a")
+    assert isinstance(df, pd.DataFrame)
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a", allow_exact_matches=False)
-        assert isinstance(df, pd.DataFrame)
+    df = pd.merge_asof(left, right, on="a", allow_exact_matches=False)
+    assert isinstance(df, pd.DataFrame)
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a", direction="forward")
-        assert isinstance(df, pd.DataFrame)
+    df = pd.merge_asof(left, right, on="a", direction="forward")
+    assert isinstance(df, pd.DataFrame)
 
-    with warns_that_defaulting_to_pandas():
-        df = pd.merge_asof(left, right, on="a", direction="nearest")
-        assert isinstance(df, pd.DataFrame)
+    df = pd.merge_asof(left, right, on="a", direction="nearest")
+    assert isinstance(df, pd.DataFrame)
 
     left = pd.DataFrame({"left_val": ["a", "b", "c"]}, index=[1, 5, 10])
     right = pd.DataFrame({"right_val": [1, 2, 3, 6, 7]}, index=[1, 2, 3, 6, 7])
@@ -237,7 +234,11 @@ def test_merge_asof_on_variations():
         {"left_index": True, "right_index": True},
     ]:
         pandas_merged = pandas.merge_asof(pandas_left, pandas_right, **on_arguments)
-        with warns_that_defaulting_to_pandas():
+        with (
+            warns_that_defaulting_to_pandas()
+            if "left_index" in on_arguments or "right_index" in on_arguments
+            else contextlib.nullcontext()
+        ):
             modin_merged = pd.merge_asof(modin_left, modin_right, **on_arguments)
         df_equals(pandas_merged, modin_merged)
 
@@ -295,7 +296,7 @@ def test_merge_asof_bad_arguments():
         pandas.merge_asof(
             pandas_left, pandas_right, on="a", by="b", left_by="can't do with by"
         )
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(
             modin_left, modin_right, on="a", by="b", left_by="can't do with by"
         )
@@ -303,7 +304,7 @@ def test_merge_asof_bad_arguments():
         pandas.merge_asof(
             pandas_left, pandas_right, by="b", on="a", right_by="can't do with by"
         )
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(
             modin_left, modin_right, by="b", on="a", right_by="can't do with by"
         )
@@ -311,25 +312,25 @@ def test_merge_asof_bad_arguments():
     # Can't mix on with left_on/right_on
     with pytest.raises(ValueError):
         pandas.merge_asof(pandas_left, pandas_right, on="a", left_on="can't do with by")
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right, on="a", left_on="can't do with by")
     with pytest.raises(ValueError):
         pandas.merge_asof(
             pandas_left, pandas_right, on="a", right_on="can't do with by"
         )
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right, on="a", right_on="can't do with by")
 
     # Can't mix left_index with left_on or on, similarly for right.
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right, on="a", right_index=True)
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(
             modin_left, modin_right, left_on="a", right_on="a", right_index=True
         )
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right, on="a", left_index=True)
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(
             modin_left, modin_right, left_on="a", right_on="a", left_index=True
         )
@@ -337,15 +338,15 @@ def test_merge_asof_bad_arguments():
     # Need both left and right
     with pytest.raises(Exception):  # Pandas bug, didn't validate inputs sufficiently
         pandas.merge_asof(pandas_left, pandas_right, left_on="a")
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right, left_on="a")
     with pytest.raises(Exception):  # Pandas bug, didn't validate inputs sufficiently
         pandas.merge_asof(pandas_left, pandas_right, right_on="a")
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right, right_on="a")
     with pytest.raises(ValueError):
         pandas.merge_asof(pandas_left, pandas_right)
-    with pytest.raises(ValueError), warns_that_defaulting_to_pandas():
+    with pytest.raises(ValueError):
         pd.merge_asof(modin_left, modin_right)
 
 
@@ -384,14 +385,13 @@ def test_merge_asof_merge_options():
     pandas_quotes, pandas_trades = to_pandas(modin_quotes), to_pandas(modin_trades)
 
     # left_by + right_by
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            left_by="ticker",
-            right_by="ticker2",
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        left_by="ticker",
+        right_by="ticker2",
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -406,13 +406,12 @@ def test_merge_asof_merge_options():
     # Just by:
     pandas_trades["ticker"] = pandas_trades["ticker2"]
     modin_trades["ticker"] = modin_trades["ticker2"]
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            by="ticker",
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        by="ticker",
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -424,14 +423,13 @@ def test_merge_asof_merge_options():
     )
 
     # Tolerance
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            by="ticker",
-            tolerance=pd.Timedelta("2ms"),
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        by="ticker",
+        tolerance=pd.Timedelta("2ms"),
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -444,14 +442,13 @@ def test_merge_asof_merge_options():
     )
 
     # Direction
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            by="ticker",
-            direction="forward",
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        by="ticker",
+        direction="forward",
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -464,15 +461,14 @@ def test_merge_asof_merge_options():
     )
 
     # Allow exact matches
-    with warns_that_defaulting_to_pandas():
-        modin_result = pd.merge_asof(
-            modin_quotes,
-            modin_trades,
-            on="time",
-            by="ticker",
-            tolerance=pd.Timedelta("10ms"),
-            allow_exact_matches=False,
-        )
+    modin_result = pd.merge_asof(
+        modin_quotes,
+        modin_trades,
+        on="time",
+        by="ticker",
+        tolerance=pd.Timedelta("10ms"),
+        allow_exact_matches=False,
+    )
     df_equals(
         pandas.merge_asof(
             pandas_quotes,
@@ -486,6 +482,42 @@ def test_merge_asof_merge_options():
     )
 
 
+@pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+@pytest.mark.parametrize("allow_exact_matches", [True, False])
+@pytest.mark.parametrize("by", [None, "by"])
+@pytest.mark.parametrize("tolerance", [None, 3])
+def test_merge_asof_spanning_row_partitions(
+    direction, allow_exact_matches, by, tolerance
+):
+    # the keys repeat across the partitions boundaries and some of the groups
+    # have to be matched from the distant partitions
+    left = {
+        "on": np.arange(200) // 3,
+        "by": [["a", "b", "c"][i % 7 % 3] for i in range(200)],
+        "left_val": np.arange(200),
+    }
+    right = {
+        "on": np.arange(0, 300, 2) // 5,
+        "by": [["a", "b", "d"][i % 11 % 3] for i in range(150)],
+        "right_val": np.arange(150),
+    }
+    with context(NPartitions=4, MinRowPartitionSize=8):
+        modin_left, pandas_left = create_test_dfs(left)
+        modin_right, pandas_right = create_test_dfs(right)
+        assert modin_left._query_compiler._modin_frame._partitions.shape[0] > 1
+        kwargs = {
+            "on": "on",
+            "by": by,
+            "tolerance": tolerance,
+            "allow_exact_matches": allow_exact_matches,
+            "direction": direction,
+        }
+        df_equals(
+            pd.merge_asof(modin_left, modin_right, **kwargs),
+            pandas.merge_asof(pandas_left, pandas_right, **kwargs),
+        )
+
+
 def test_pivot():
     test_df = pd.DataFrame(
         {
@@ -3249,6 +3249,32 @@ def test_reshuffling_groupby_on_strings(modify_config):
     eval_general(md_grp, pd_grp, lambda grp: grp.tail(10))
 
 
+@pytest.mark.parametrize("modify_config", [{RangePartitioning: True}], indirect=True)
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize(
+    "agg", ["sum", "count", "size", "min", "max", "prod", "all", "mean"]
+)
+def test_reshuffling_groupby_on_hot_keys(modify_config, sort, agg):
+    # the two hot keys take more than a partition each, so they're split across
+    # several partitions for the decomposable aggregations
+    keys = np.where(np.arange(400) % 5 < 2, 7, np.where(np.arange(400) % 5 < 4, 3, 0))
+    keys[::7] = np.arange(0, 400, 7) % 50
+    data = {
+        "key": keys,
+        "col1": np.arange(400) % 13,
+        "col2": np.where(np.arange(400) % 11 == 0, np.nan, 1.5),
+    }
+    with context(NPartitions=4, MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            # range-partitioning groupby doesn't keep the order of groups for ``sort=False``
+            lambda df: getattr(df.groupby("key", sort=sort), agg)().sort_index(),
+        )
+
+
 @pytest.mark.parametrize("modify_config", [{RangePartitioning: True}], indirect=True)
 def test_groupby_apply_series_result(modify_config):
     # reproducer from the issue:
@@ -15,11 +15,14 @@ import contextlib
 import csv
 import inspect
 import os
+import pickle
 import sys
+import time
 import unittest.mock as mock
 from collections import defaultdict
 from io import BytesIO, StringIO
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict
 
 import fastparquet
@@ -30,6 +33,7 @@ import pyarrow as pa
 import pyarrow.dataset
 import pytest
 import sqlalchemy as sa
+from fsspec.implementations.local import LocalFileSystem
 from packaging import version
 from pandas._testing import ensure_clean
 from pandas.errors import ParserWarning
@@ -45,7 +49,11 @@ from modin.config import (
     TestDatasetSize,
     TestReadFromPostgres,
     TestReadFromSqlServer,
+    context,
 )
+from modin.core.io import FileMetadataCache, ParquetDispatcher, TextFileDispatcher
+from modin.core.io.column_stores.parquet_dispatcher import PyArrowDataset
+from modin.core.io.sql.sql_dispatcher import _copy_from_stdin
 from modin.db_conn import ModinDatabaseConnection, UnsupportedDatabaseException
 from modin.pandas.io import from_arrow, from_dask, from_map, from_ray, to_pandas
 from modin.tests.test_utils import warns_that_defaulting_to_pandas
@@ -629,6 +637,45 @@ class TestCsv:
 
             df_equals(modin_df, pd_df)
 
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"chunksize": 97},
+            {"chunksize": 300, "nrows": 650},
+            {"chunksize": 100, "index_col": 0},
+            {"chunksize": 50, "skiprows": 3, "header": None},
+            {"iterator": True},
+        ],
+    )
+    def test_read_csv_streaming(self, tmp_path, kwargs):
+        path = str(tmp_path / "data.csv")
+        pandas.DataFrame(
+            {"a": range(1000), "b": [f"x{i}" for i in range(1000)]}
+        ).to_csv(path, index=False)
+
+        # small blocks make the file be read by a lot of tasks
+        with mock.patch.object(
+            TextFileDispatcher, "streaming_block_size", 500
+        ), context(StreamingReadPrefetch=2):
+            modin_reader = pd.read_csv(path, **kwargs)
+            pandas_reader = pandas.read_csv(path, **kwargs)
+            if kwargs.get("iterator"):
+                df_equals(modin_reader.get_chunk(7), pandas_reader.get_chunk(7))
+                df_equals(modin_reader.read(), pandas_reader.read())
+                return
+            modin_chunks = iter(modin_reader)
+            df_equals(next(modin_chunks), next(pandas_reader))
+            # the python engine reads with pandas
+            if Engine.get() != "Python":
+                # only the blocks of the prefetch window are being read ahead
+                assert len(modin_reader._pending) <= 2
+                assert not modin_reader._splits_exhausted
+            modin_chunks = list(modin_chunks)
+            pandas_chunks = list(pandas_reader)
+            assert len(modin_chunks) == len(pandas_chunks)
+            for modin_df, pandas_df in zip(modin_chunks, pandas_chunks):
+                df_equals(modin_df, pandas_df)
+
     @pytest.mark.parametrize("pathlike", [False, True])
     def test_read_csv_encoding_976(self, pathlike):
         file_name = "modin/tests/pandas/data/issue_976.csv"
@@ -1175,6 +1222,24 @@ class TestCsv:
             extension="csv",
         )
 
+    @pytest.mark.parametrize("encoding", [None, "utf-8-sig", "latin-1"])
+    @pytest.mark.skipif(
+        condition=Engine.get() == "Unidist" and os.name == "nt",
+        reason="https://github.com/modin-project/modin/issues/6846",
+    )
+    def test_to_csv_append_spanning_row_partitions(self, tmp_path, encoding):
+        data = {"col1": np.arange(100), "col2": [f"é{i}" for i in range(100)]}
+        with context(NPartitions=4, MinRowPartitionSize=8):
+            modin_df, pandas_df = create_test_dfs(data)
+            assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+
+            modin_file = tmp_path / "modin.csv"
+            pandas_file = tmp_path / "pandas.csv"
+            for mode in ["w", "a"]:
+                modin_df.to_csv(modin_file, mode=mode, encoding=encoding)
+                pandas_df.to_csv(pandas_file, mode=mode, encoding=encoding)
+        assert assert_files_eq(modin_file, pandas_file)
+
     def test_read_csv_within_decorator(self):
         @dummy_decorator()
         def wrapped_read_csv(file, method):
@@ -1501,6 +1566,33 @@ class TestParquet:
             expected_exception=expected_exception,
         )
 
+    @pytest.mark.parametrize(
+        "filters,num_row_groups",
+        [
+            ([("col1", ">=", 950)], 1),
+            ([("col1", "<=", 215), ("col2", ">=", 135)], 2),
+            ([[("col1", "<", 50)], [("col1", "in", [420, 421])]], 2),
+            ([("col1", "!=", 5)], 10),
+            # a single row group is kept to get the schema of the empty result
+            ([("col1", "==", -1)], 1),
+        ],
+    )
+    def test_read_parquet_filters_prune_row_groups(
+        self, engine, tmp_path, filters, num_row_groups
+    ):
+        path = str(tmp_path / "data.parquet")
+        pandas.DataFrame({"col1": np.arange(1000), "col2": np.arange(1000)}).to_parquet(
+            path, row_group_size=100
+        )
+        dataset = ParquetDispatcher.get_dataset(path, engine, {})
+        partition_files = ParquetDispatcher._determine_partitioning(dataset, filters)
+        assert num_row_groups == sum(
+            file.row_group_end - file.row_group_start
+            for part_files in partition_files
+            for file in part_files
+        )
+        eval_io(fn_name="read_parquet", engine=engine, path=path, filters=filters)
+
     @pytest.mark.parametrize("columns", [None, ["col1"]])
     @pytest.mark.parametrize(
         "filters",
@@ -2088,6 +2180,125 @@ class TestParquet:
         # both Modin and pandas read column "b" as a category
         df_equals(test_df, read_df.astype("int64"))
 
+    def test_to_parquet_partition_cols(self, tmp_path, engine):
+        data = {"a": np.arange(1000), "b": np.arange(1000) % 3, "c": np.arange(1000.0)}
+        modin_df, pandas_df = create_test_dfs(data)
+        modin_path, pandas_path = tmp_path / "modin", tmp_path / "pandas"
+        modin_df.to_parquet(modin_path, engine=engine, partition_cols=["b"])
+        pandas_df.to_parquet(pandas_path, engine=engine, partition_cols=["b"])
+        df_equals(
+            pandas.read_parquet(modin_path, engine=engine).sort_values(
+                "a", ignore_index=True
+            ),
+            pandas.read_parquet(pandas_path, engine=engine).sort_values(
+                "a", ignore_index=True
+            ),
+        )
+        # the Python engine uses no custom IO dispatchers and writes with pandas
+        if engine == "pyarrow" and Engine.get() != "Python":
+            # all rows of a key are written by a single task
+            for key in range(3):
+                assert len(os.listdir(modin_path / f"b={key}")) == 1
+            assert (modin_path / "_metadata").exists()
+            assert (modin_path / "_common_metadata").exists()
+
+    @pytest.mark.parametrize(
+        "key, min_row_partition_size",
+        [
+            pytest.param(np.arange(10) % 3, 1, id="small_frame"),
+            pytest.param(np.arange(1000) % 2 == 0, 8, id="bool_key"),
+            pytest.param(
+                np.array(["x", "y z/w", "z"])[np.arange(1000) % 3], 8, id="str_key"
+            ),
+        ],
+    )
+    def test_to_parquet_partition_cols_keys(
+        self, tmp_path, engine, key, min_row_partition_size
+    ):
+        # the writer only runs on the distributed engines, the Python one defaults to pandas
+        data = {"a": key, "b": np.arange(len(key))}
+        with context(MinRowPartitionSize=min_row_partition_size, NPartitions=4):
+            modin_df, pandas_df = create_test_dfs(data)
+            modin_df.to_parquet(tmp_path / "modin", engine=engine, partition_cols=["a"])
+        pandas_df.to_parquet(tmp_path / "pandas", engine=engine, partition_cols=["a"])
+        df_equals(
+            pandas.read_parquet(tmp_path / "modin", engine=engine).sort_values(
+                "b", ignore_index=True
+            ),
+            pandas.read_parquet(tmp_path / "pandas", engine=engine).sort_values(
+                "b", ignore_index=True
+            ),
+        )
+
+    def test_to_parquet_summary_metadata(self, tmp_path, engine):
+        modin_df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000.0)})
+        modin_df.to_parquet(tmp_path / "plain", engine=engine)
+        # plain writes leave only the data files unless the summary is requested
+        assert not (tmp_path / "plain" / "_metadata").exists()
+        assert not (tmp_path / "plain" / "_common_metadata").exists()
+        with context(ParquetWriteSummaryMetadata=True):
+            modin_df.to_parquet(tmp_path / "summary", engine=engine)
+        if engine == "pyarrow" and Engine.get() != "Python":
+            assert (tmp_path / "summary" / "_metadata").exists()
+            assert (tmp_path / "summary" / "_common_metadata").exists()
+            # the summary of a previous write is removed when it's not requested
+            modin_df.to_parquet(tmp_path / "summary", engine=engine)
+            assert not (tmp_path / "summary" / "_metadata").exists()
+        df_equals(pd.read_parquet(tmp_path / "summary", engine=engine), modin_df)
+
+    @pytest.mark.parametrize("stale", [None, "extra_file", "missing_file", "rewritten"])
+    def test_read_parquet_summary_metadata(self, tmp_path, engine, stale):
+        if engine == "fastparquet":
+            pytest.skip("the summary file is only used with pyarrow")
+        pandas_df = pandas.DataFrame({"a": range(1000), "b": np.arange(1000.0)})
+        path = tmp_path / "data"
+        path.mkdir()
+        metadata_collector = []
+        for i in range(2):
+            pandas_df.iloc[i * 500 : (i + 1) * 500].to_parquet(
+                path / f"part-{i}.parquet",
+                index=False,
+                row_group_size=100,
+                metadata_collector=metadata_collector,
+            )
+            metadata_collector[-1].set_file_path(f"part-{i}.parquet")
+        ParquetDispatcher._write_summary_metadata(
+            LocalFileSystem(), str(path), metadata_collector
+        )
+
+        if stale is None:
+            # the footers of the files listed in the summary are not read
+            with mock.patch.object(
+                PyArrowDataset,
+                "_read_row_group_metadata",
+                side_effect=AssertionError("footer read"),
+            ):
+                df_equals(pd.read_parquet(path, engine=engine), pandas_df)
+            return
+
+        if stale == "extra_file":
+            pandas_df.iloc[:10].to_parquet(path / "part-2.parquet", index=False)
+        elif stale == "missing_file":
+            os.remove(path / "part-1.parquet")
+        else:
+            pandas_df.iloc[500:600].to_parquet(path / "part-1.parquet", index=False)
+            summary_mtime = os.path.getmtime(path / "_metadata")
+            os.utime(path / "part-1.parquet", (summary_mtime + 10, summary_mtime + 10))
+        # the summary doesn't describe the files anymore, so their footers are read
+        with mock.patch.object(
+            PyArrowDataset,
+            "_read_row_group_metadata",
+            autospec=True,
+            side_effect=PyArrowDataset._read_row_group_metadata,
+        ) as read_footer:
+            df_equals(
+                pd.read_parquet(path, engine=engine),
+                pandas.read_parquet(path, engine=engine),
+            )
+        # the Python engine uses no custom IO dispatchers and reads with pandas
+        if Engine.get() != "Python":
+            assert read_footer.called
+
     @pytest.mark.parametrize("index", [False, True])
     def test_read_parquet_6855(self, tmp_path, engine, index):
         if engine == "fastparquet":
@@ -2116,6 +2327,66 @@ class TestParquet:
         )
 
 
+@pytest.mark.filterwarnings(default_to_pandas_ignore_string)
+@pytest.mark.parametrize("fn_name", ["read_csv", "read_parquet"])
+def test_read_with_metadata_cache(tmp_path, fn_name):
+    path = str(tmp_path / "data")
+    pandas_df = pandas.DataFrame(
+        {"a": range(1000), "b": [f"x{i}" for i in range(1000)]}
+    )
+    if fn_name == "read_csv":
+        pandas_df.to_csv(path, index=False)
+    else:
+        pandas_df.to_parquet(path, row_group_size=100)
+
+    with context(MetadataCacheDir=str(tmp_path / "cache")):
+        FileMetadataCache.clear()
+        df_equals(getattr(pd, fn_name)(path), pandas_df)
+        df_equals(getattr(pd, fn_name)(path), pandas_df)
+        # the Python engine uses no custom IO dispatchers and reads with pandas
+        if Engine.get() != "Python":
+            assert FileMetadataCache.stats()["hits"] == 1
+
+        # the changed file has to be scanned again
+        pandas_df = pandas_df.iloc[:500]
+        if fn_name == "read_csv":
+            pandas_df.to_csv(path, index=False)
+        else:
+            pandas_df.to_parquet(path, row_group_size=100)
+        os.utime(path, ns=(0, 0))
+        df_equals(getattr(pd, fn_name)(path), pandas_df)
+        if Engine.get() != "Python":
+            assert FileMetadataCache.stats()["hits"] == 1
+        FileMetadataCache.clear()
+
+
+def test_metadata_cache_eviction(tmp_path):
+    files = []
+    for i in range(3):
+        files.append(str(tmp_path / f"file{i}"))
+        with open(files[-1], "w") as f:
+            f.write(str(i))
+
+    with context(MetadataCacheDir=str(tmp_path / "cache"), MetadataCacheSize=1):
+        FileMetadataCache.clear()
+        # a cache of 1 MB fits two of these entries only
+        value = b"0" * 400 * 1024
+        for path in files:
+            FileMetadataCache.put("test", path, value)
+            os.utime(FileMetadataCache._entry_path("test", path, None), ns=(0, 0))
+            # touch the entry of the first file to make it the most recently used one
+            assert FileMetadataCache.get("test", files[0]) == value
+        assert FileMetadataCache.get("test", files[1]) is None
+        assert FileMetadataCache.get("test", files[2]) == value
+        assert FileMetadataCache.stats()["entries"] == 2
+
+        with open(files[0], "a") as f:
+            f.write("changed")
+        assert FileMetadataCache.get("test", files[0]) is None
+        assert FileMetadataCache.stats()["entries"] == 1
+        FileMetadataCache.clear()
+
+
 # Leave this test apart from the test classes, which skip the default to pandas
 # warning check. We want to make sure we are NOT defaulting to pandas for a
 # path relative to user home.
@@ -2672,6 +2943,143 @@ class TestSql:
         with pytest.raises(UnsupportedDatabaseException):
             ModinDatabaseConnection("unsupported_database")
 
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT * FROM {table}",
+            "select * from {table} where col2 > 3",
+            "SELECT id, col2 FROM {table}",
+        ],
+    )
+    def test_read_sql_by_primary_key_ranges(self, tmp_path, query):
+        table = "test_read_sql_by_primary_key_ranges"
+        conn = f"sqlite:///{tmp_path / get_unique_filename(extension='db')}"
+        engine = sa.create_engine(conn)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, col2 INTEGER)")
+            )
+        # insert the keys in descending order and with gaps between them
+        data = pandas.DataFrame({"id": np.arange(0, 300, 3)[::-1], "col2": range(100)})
+        data.to_sql(table, engine, if_exists="append", index=False)
+        query = query.format(table=table)
+
+        with mock.patch.object(
+            ModinDatabaseConnection,
+            "partition_query",
+            side_effect=(
+                AssertionError("keyset partitioning is expected")
+                if "*" in query
+                else ModinDatabaseConnection.partition_query
+            ),
+            autospec=True,
+        ):
+            modin_df = pd.read_sql(query, conn)
+        # the ranges are read in the order of the key
+        pandas_df = pandas.read_sql(query, conn).sort_values("id", ignore_index=True)
+        df_equals(modin_df, pandas_df)
+
+    def test_read_sql_by_quoted_primary_key(self, tmp_path):
+        table = "test_read_sql_by_quoted_primary_key"
+        conn = f"sqlite:///{tmp_path / get_unique_filename(extension='db')}"
+        engine = sa.create_engine(conn)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(
+                    f'CREATE TABLE {table} ("Order Id" INTEGER PRIMARY KEY, col2 INTEGER)'
+                )
+            )
+        data = pandas.DataFrame(
+            {"Order Id": np.arange(0, 300, 3)[::-1], "col2": range(100)}
+        )
+        data.to_sql(table, engine, if_exists="append", index=False)
+        query = f"SELECT * FROM {table}"
+
+        with mock.patch.object(
+            ModinDatabaseConnection,
+            "partition_query",
+            side_effect=AssertionError("keyset partitioning is expected"),
+        ):
+            modin_df = pd.read_sql(query, conn)
+        pandas_df = pandas.read_sql(query, conn).sort_values(
+            "Order Id", ignore_index=True
+        )
+        df_equals(modin_df, pandas_df)
+
+    def test_read_sql_key_bounds_failure(self, tmp_path):
+        table = "test_read_sql_key_bounds_failure"
+        conn = f"sqlite:///{tmp_path / get_unique_filename(extension='db')}"
+        engine = sa.create_engine(conn)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, col2 INTEGER)")
+            )
+        data = pandas.DataFrame({"id": range(100), "col2": range(100)})
+        data.to_sql(table, engine, if_exists="append", index=False)
+        query = f"SELECT * FROM {table}"
+
+        # the partitions are read with ``LIMIT/OFFSET`` if the bounds can't be fetched
+        with mock.patch.object(
+            ModinDatabaseConnection,
+            "key_bounds_query",
+            return_value="SELECT no_such_column FROM no_such_table",
+        ):
+            modin_df = pd.read_sql(query, conn)
+        df_equals(modin_df, pandas.read_sql(query, conn))
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT * FROM {table} WHERE col2 >= 0 ORDER BY col2 DESC",
+            "SELECT * FROM {table} WHERE col2 >= 0 LIMIT 10",
+            "SELECT * FROM {table} LIMIT 10 OFFSET 5",
+        ],
+    )
+    def test_read_sql_with_trailing_clauses(self, tmp_path, query):
+        table = "test_read_sql_with_trailing_clauses"
+        conn = f"sqlite:///{tmp_path / get_unique_filename(extension='db')}"
+        engine = sa.create_engine(conn)
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, col2 INTEGER)")
+            )
+        data = pandas.DataFrame({"id": np.arange(0, 300, 3)[::-1], "col2": range(100)})
+        data.to_sql(table, engine, if_exists="append", index=False)
+        query = query.format(table=table)
+
+        # the order and the limit apply to the whole query, not to the key ranges
+        with mock.patch.object(
+            ModinDatabaseConnection,
+            "key_bounds_query",
+            side_effect=AssertionError("keyset partitioning is not expected"),
+        ):
+            modin_df = pd.read_sql(query, conn)
+        df_equals(modin_df, pandas.read_sql(query, conn))
+
+    def test_modin_database_connection_pool(self, tmp_path, make_sql_connection):
+        table = "test_modin_database_connection_pool"
+        conn = make_sql_connection(
+            tmp_path / get_unique_filename(extension="db"), table
+        )
+        query = f"select * from {table}"
+
+        with context(SqlConnectionIdleTimeout=60):
+            con = ModinDatabaseConnection("sqlalchemy", conn)
+        with con.get_connection() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+
+        # workers unpickle their own copies of the connection, that share the pool
+        df_equals(
+            pd.read_sql(query, pickle.loads(pickle.dumps(con))),
+            pandas.read_sql(query, conn),
+        )
+        with con.get_connection() as connection:
+            assert connection.connection.dbapi_connection is dbapi_connection
+
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            with con.get_connection() as connection:
+                assert connection.connection.dbapi_connection is not dbapi_connection
+
     def test_read_sql_with_chunksize(self, make_sql_connection):
         filename = get_unique_filename(extension="db")
         table = "test_read_sql_with_chunksize"
@@ -2713,6 +3121,81 @@ class TestSql:
 
         assert df_modin_sql.sort_index().equals(df_pandas_sql.sort_index())
 
+    @pytest.mark.parametrize("if_exists", ["fail", "replace", "append"])
+    def test_to_sql_through_staging_table(
+        self, tmp_path, make_sql_connection, if_exists
+    ):
+        table_name = "test_to_sql_through_staging_table"
+        modin_df, pandas_df = create_test_dfs(TEST_DATA)
+        modin_conn = make_sql_connection(tmp_path / f"{table_name}_modin.db")
+        pandas_conn = make_sql_connection(tmp_path / f"{table_name}_pandas.db")
+        # the existing table has the columns in a different order
+        existing = pandas_df.head(3)[pandas_df.columns[::-1]]
+        existing.to_sql(table_name, modin_conn, index=False)
+        existing.to_sql(table_name, pandas_conn, index=False)
+
+        with context(SqlWriteStagingTable=True, SqlWriteBatchSize=7):
+            if if_exists == "fail":
+                with pytest.raises(ValueError, match="already exists"):
+                    modin_df.to_sql(table_name, modin_conn, if_exists=if_exists)
+            else:
+                rows = modin_df.to_sql(
+                    table_name, modin_conn, if_exists=if_exists, index=False
+                )
+                pandas_df.to_sql(
+                    table_name, pandas_conn, if_exists=if_exists, index=False
+                )
+                assert rows == len(modin_df)
+
+        # the staging table is always dropped
+        assert sa.inspect(sa.create_engine(modin_conn)).get_table_names() == [
+            table_name
+        ]
+        # the partitions are written concurrently, so the order of rows isn't kept
+        df_modin_sql, df_pandas_sql = (
+            pandas.read_sql(table_name, conn)
+            .pipe(lambda df: df.sort_values(list(df.columns)))
+            .reset_index(drop=True)
+            for conn in (modin_conn, pandas_conn)
+        )
+        df_equals(df_modin_sql, df_pandas_sql)
+
+    def test_to_sql_copy_from_stdin(self):
+        from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+
+        class Cursor:
+            """Stub of a psycopg2 cursor keeping the data it would copy."""
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def copy_expert(self, sql, file):
+                self.sql, self.data = sql, file.read()
+                self.rowcount = self.data.count("\n")
+
+        cursor = Cursor()
+        conn = SimpleNamespace(
+            dialect=PGDialect_psycopg2(),
+            connection=SimpleNamespace(cursor=lambda: cursor),
+        )
+        table = SimpleNamespace(name="My Table", schema="s")
+        rows = [
+            (1, "tab\there", None),
+            (2, "line\nbreak", b"\x00\xff"),
+            (3, "back\\slash", bytearray(b"ab")),
+        ]
+
+        assert _copy_from_stdin(table, conn, ["a", "b c", "d"], iter(rows)) == 3
+        assert cursor.sql == 'COPY s."My Table" (a, "b c", d) FROM STDIN'
+        assert cursor.data == (
+            "1\ttab\\there\t\\N\n"
+            + "2\tline\\nbreak\t\\\\x00ff\n"
+            + "3\tback\\\\slash\t\\\\x6162\n"
+        )
+
 
 @pytest.mark.filterwarnings(default_to_pandas_ignore_string)
 class TestHtml:
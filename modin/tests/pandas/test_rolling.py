@@ -17,7 +17,7 @@ import pandas._libs.lib as lib
 import pytest
 
 import modin.pandas as pd
-from modin.config import NPartitions
+from modin.config import NPartitions, context
 
 from .utils import (
     create_test_dfs,
@@ -320,6 +320,37 @@ def test_series_dt_index(closed):
     df_equals(modin_rolled.quantile(0.1), pandas_rolled.quantile(0.1))
 
 
+@pytest.mark.parametrize("window", [3, 40, 150, "5h", "50h"])
+@pytest.mark.parametrize("center", [False, True])
+@pytest.mark.parametrize("closed", [None, "both"])
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("count", {}),
+        ("sum", {}),
+        ("std", {"ddof": 0}),
+        ("median", {}),
+        ("apply", {"func": np.sum, "raw": True}),
+    ],
+)
+def test_rolling_window_spans_row_partitions(window, center, closed, method, kwargs):
+    # the windows span several row partitions, so the rows required to compute them
+    # have to be borrowed from the neighbouring partitions
+    index = pandas.date_range("31/12/2000", periods=128, freq="h")
+    data = np.random.default_rng(seed=42).random((128, 4))
+    with context(MinRowPartitionSize=8):
+        modin_df, pandas_df = create_test_dfs(data, index=index)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            modin_df,
+            pandas_df,
+            lambda df: getattr(
+                df.rolling(window, center=center, closed=closed, min_periods=1),
+                method,
+            )(**kwargs),
+        )
+
+
 def test_api_indexer():
     modin_df, pandas_df = create_test_dfs(test_data_values[0])
     indexer = pd.api.indexers.FixedForwardWindowIndexer(window_size=3)
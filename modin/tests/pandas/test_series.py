@@ -30,7 +30,7 @@ from pandas.core.indexing import IndexingError
 from pandas.errors import PerformanceWarning, SpecificationError
 
 import modin.pandas as pd
-from modin.config import Engine, NPartitions, StorageFormat
+from modin.config import Engine, NPartitions, StorageFormat, context
 from modin.pandas.io import to_pandas
 from modin.tests.core.storage_formats.pandas.test_internals import (
     construct_modin_df_by_scheme,
@@ -2031,9 +2031,8 @@ def test_equals_with_nans():
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_ewm(data):
-    modin_series, _ = create_test_series(data)  # noqa: F841
-    with warns_that_defaulting_to_pandas():
-        modin_series.ewm(halflife=6)
+    modin_series, pandas_series = create_test_series(data)
+    df_equals(modin_series.ewm(halflife=6).mean(), pandas_series.ewm(halflife=6).mean())
 
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
@@ -2314,6 +2313,56 @@ def test_isin_with_series():
     )
 
 
+@pytest.mark.parametrize("broadcast_size_limit", [0, 64])
+@pytest.mark.parametrize(
+    "keys, values",
+    [
+        pytest.param(
+            np.arange(300) % 70, np.arange(0, 500, 3, dtype=np.float64), id="numeric"
+        ),
+        pytest.param(
+            np.append(np.arange(299, dtype=np.float64), np.nan),
+            np.append(np.arange(0, 500, 3), [np.nan, -0.0]),
+            id="nan",
+        ),
+        pytest.param(
+            [f"key{i % 70}" for i in range(300)],
+            [f"key{i}" for i in range(0, 500, 3)] + [None],
+            id="strings",
+        ),
+        pytest.param(
+            [i % 70 if i % 2 else f"key{i % 70}" for i in range(300)],
+            np.arange(0, 500, 3),
+            id="mixed",
+        ),
+        pytest.param(
+            pandas.Series(
+                [
+                    [1, 2.0, True, f"key{i % 7}", pandas.Timestamp(i)][i % 5]
+                    for i in range(300)
+                ],
+                dtype=object,
+            ),
+            pandas.Series(
+                [1.0, np.True_, "key3", np.datetime64(10, "ns"), None], dtype=object
+            ),
+            id="mixed_objects",
+        ),
+    ],
+)
+def test_isin_with_series_spanning_row_partitions(broadcast_size_limit, keys, values):
+    # with the zero limit the frames are shuffled by the hashes of the values
+    with context(MinRowPartitionSize=8, BroadcastSizeLimit=broadcast_size_limit):
+        modin_keys, pandas_keys = create_test_series(keys, index=np.arange(300)[::-1])
+        modin_values, pandas_values = create_test_series(values)
+        assert modin_keys._query_compiler._modin_frame._partitions.shape[0] > 1
+        eval_general(
+            (modin_keys, modin_values),
+            (pandas_keys, pandas_values),
+            lambda srs: srs[0].isin(srs[1]),
+        )
+
+
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_isnull(data):
     modin_series, pandas_series = create_test_series(data)
@@ -2681,8 +2730,10 @@ def test_nunique(data, dropna):
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_pct_change(data):
     modin_series, pandas_series = create_test_series(data)
-    with warns_that_defaulting_to_pandas():
-        modin_series.pct_change()
+    df_equals(
+        modin_series.pct_change(fill_method=None),
+        pandas_series.pct_change(fill_method=None),
+    )
 
 
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
@@ -0,0 +1,216 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import unittest.mock as mock
+
+import pandas
+import polars
+import polars.testing
+import pytest
+
+import modin.polars as pl
+from modin.tests.pandas.utils import default_to_pandas_ignore_string
+
+data = {
+    "a": [1, 2, 3, 4, 5, 6],
+    "b": [1.5, None, 3.0, 4.5, 5.0, 6.0],
+    "g": ["x", "y", "x", "y", "z", "x"],
+    "s": ["p", "q", "r", "s", "t", "u"],
+}
+
+
+def assert_frame_equal(modin_df, polars_df, sort_by=None):
+    modin_df = modin_df._to_polars()
+    if sort_by is not None:
+        modin_df, polars_df = modin_df.sort(sort_by), polars_df.sort(sort_by)
+    polars.testing.assert_frame_equal(modin_df, polars_df, check_dtypes=False)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        lambda df, pl: df.filter(pl.col("a") > 2)
+        .with_columns((pl.col("a") * 2).alias("a2"), c=pl.col("a") + pl.col("b"))
+        .select("a", "a2", "c"),
+        lambda df, pl: df.select(
+            "a", (pl.col("a") - pl.col("a").mean()).alias("d"), pl.lit(3).alias("l")
+        ),
+        lambda df, pl: df.select(
+            pl.col("a").sum(), (pl.col("b").max() - pl.col("b").min()).alias("r")
+        ),
+        lambda df, pl: df.with_columns(y=pl.col("a") - pl.col("a").mean()).filter(
+            pl.col("a") > 2
+        ),
+        lambda df, pl: df.filter(pl.col("a") > pl.col("a").mean()).filter(
+            pl.col("g") == "x"
+        ),
+        lambda df, pl: df.filter(pl.col("b").is_null() | pl.col("g").is_in(["z"])),
+        lambda df, pl: df.with_columns(b=pl.col("b").fill_null(0), a=-pl.col("a")),
+        lambda df, pl: df.sort("g", "a", descending=[False, True]),
+        lambda df, pl: df.sort("b", descending=True, nulls_last=True).head(3),
+    ],
+)
+def test_lazy_query(query):
+    modin_result = query(pl.DataFrame(data).lazy(), pl).collect()
+    polars_result = query(polars.DataFrame(data).lazy(), polars).collect()
+    assert_frame_equal(modin_result, polars_result)
+
+
+def test_lazy_group_by():
+    def query(df, pl):
+        return df.group_by("g").agg(
+            pl.col("a").sum(),
+            (pl.col("a") * 2).sum().alias("a2"),
+            pl.col("b").mean().alias("b_mean"),
+            pl.col("a").n_unique().alias("n"),
+            pl.len(),
+        )
+
+    modin_result = query(pl.DataFrame(data).lazy(), pl).collect()
+    polars_result = query(polars.DataFrame(data).lazy(), polars).collect()
+    assert_frame_equal(modin_result, polars_result, sort_by="g")
+
+
+def test_lazy_join_pushdown():
+    other = {"g": ["x", "y"], "w": [10, 20], "a": [0, 0]}
+    query = (
+        pl.DataFrame(data)
+        .lazy()
+        .join(pl.DataFrame(other).lazy(), on="g", how="left")
+        .filter(pl.col("a") > 1)
+        .select("a", "w", "a_right")
+    )
+    plan = query.explain()
+    # the filter reaches the left scan and the unused columns are never read
+    assert "PROJECT 2/4 COLUMNS ['a', 'g']; SELECTION" in plan
+    expected = pandas.DataFrame(data).merge(
+        pandas.DataFrame(other), on="g", how="left", suffixes=("", "_right")
+    )
+    expected = expected[expected["a"] > 1][["a", "w", "a_right"]]
+    assert_frame_equal(query.collect(), polars.from_pandas(expected))
+
+
+def test_lazy_common_subexpression_elimination():
+    query = (
+        pl.DataFrame(data)
+        .lazy()
+        .with_columns(
+            e=(pl.col("a") + pl.col("b")) * 2, f=(pl.col("a") + pl.col("b")) * 3
+        )
+    )
+    assert "CSE: 1" in query.explain()
+    assert "CSE" not in query.explain(comm_subexpr_elim=False)
+    assert_frame_equal(
+        query.collect(),
+        polars.DataFrame(data).with_columns(
+            e=(polars.col("a") + polars.col("b")) * 2,
+            f=(polars.col("a") + polars.col("b")) * 3,
+        ),
+    )
+
+
+# some engines can only read parquet through pandas
+@pytest.mark.filterwarnings(default_to_pandas_ignore_string)
+@pytest.mark.parametrize("file_format", ["parquet", "csv"])
+def test_scan_pushdown(tmp_path, file_format):
+    path = str(tmp_path / f"data.{file_format}")
+    if file_format == "parquet":
+        pandas.DataFrame(data).to_parquet(path, row_group_size=2)
+        lf = pl.scan_parquet(path)
+    else:
+        pandas.DataFrame(data).to_csv(path, index=False)
+        lf = pl.scan_csv(path)
+
+    query = lf.filter(pl.col("a") >= 3).select("g", "b")
+    assert "PROJECT 2/4 COLUMNS ['b', 'g']; SELECTION" in query.explain()
+    assert_frame_equal(
+        query.collect(),
+        polars.DataFrame(data).filter(polars.col("a") >= 3).select("g", "b"),
+    )
+
+
+@pytest.mark.filterwarnings(default_to_pandas_ignore_string)
+@pytest.mark.parametrize("source", ["eager", "lazy", "parquet"])
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        lambda pl: pl.col("k") != 2,
+        lambda pl: ~(pl.col("k") == 2),
+        lambda pl: (pl.col("k") < 2) | (pl.col("v") > 4),
+        lambda pl: pl.col("k") >= pl.col("v"),
+        lambda pl: pl.col("k") == None,  # noqa: E711
+    ],
+)
+def test_filter_null_keys(tmp_path, source, predicate):
+    # a comparison with a null is null, so the row is dropped
+    null_data = {"k": [1, 2, None, 2, 3, None], "v": [1, 2, 3, 4, 5, 6]}
+    if source == "eager":
+        df = pl.DataFrame(null_data)
+    elif source == "lazy":
+        df = pl.LazyFrame(null_data)
+    else:
+        path = str(tmp_path / "data.parquet")
+        pandas.DataFrame(null_data).to_parquet(path, row_group_size=2)
+        df = pl.scan_parquet(path)
+    modin_result = df.filter(predicate(pl))
+    if source != "eager":
+        modin_result = modin_result.collect()
+    assert_frame_equal(
+        modin_result, polars.DataFrame(null_data).filter(predicate(polars))
+    )
+
+
+def test_eager_expressions():
+    df, polars_df = pl.DataFrame(data), polars.DataFrame(data)
+    assert_frame_equal(
+        df.select("a", pl.col("b") * 2), polars_df.select("a", polars.col("b") * 2)
+    )
+    assert_frame_equal(
+        df.filter(pl.col("g") == "x", a=3),
+        polars_df.filter(polars.col("g") == "x", a=3),
+    )
+    assert_frame_equal(
+        df.group_by("g").agg(pl.col("a").max()),
+        polars_df.group_by("g").agg(polars.col("a").max()),
+        sort_by="g",
+    )
+
+
+def test_lazy_frame_dataset_operations():
+    # the operations of ``BasePolarsDataset`` run on the collected frame
+    lf = pl.LazyFrame({"a": data["a"]}).with_columns(b=pl.col("a") * 2)
+    assert isinstance(lf, pl.LazyFrame)
+    result = lf + 1
+    assert isinstance(result, pl.LazyFrame)
+    assert_frame_equal(
+        result.collect(),
+        polars.LazyFrame({"a": data["a"]}).with_columns(b=polars.col("a") * 2).collect()
+        + 1,
+    )
+
+
+def test_lazy_frame_dataset_operations_collect_once():
+    lf = pl.LazyFrame(data).filter(pl.col("a") > 2)
+    with mock.patch.object(
+        pl.LazyFrame, "collect", autospec=True, side_effect=pl.LazyFrame.collect
+    ) as collect:
+        lf + 1
+        lf * 2
+        lf - 1
+    assert collect.call_count == 1
+    # a new plan is collected again
+    lf._plan = lf.select("a")._plan
+    assert_frame_equal(
+        (lf + 1).collect(),
+        polars.LazyFrame(data).filter(polars.col("a") > 2).select("a").collect() + 1,
+    )
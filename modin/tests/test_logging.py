@@ -12,6 +12,7 @@
 # governing permissions and limitations under the License.
 
 import collections
+import json
 import logging
 
 import pytest
@@ -172,3 +173,48 @@ def test_class_inheritance(monkeypatch, get_log_messages):
         "START::CUSTOM::Bar.method2",
         "STOP::CUSTOM::Bar.method2",
     ]
+
+
+def test_profiler(tmp_path):
+    import modin.pandas as pd
+
+    df = pd.DataFrame({"a": [1, 2, 1, 2], "b": [1.0, 2.0, 3.0, 4.0]})
+    with modin.logging.Profiler() as profiler:
+        assert modin.logging.Profiler.active is profiler
+        (df + 1).abs().groupby("a").sum()._to_pandas()
+    assert modin.logging.Profiler.active is None
+    # nothing is recorded once the profiler is exited
+    df.abs()
+
+    trace = profiler.to_chrome_trace(str(tmp_path / "trace.json"))
+    with open(tmp_path / "trace.json") as f:
+        assert json.load(f) == trace
+
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    names = {(span["cat"], span["name"]) for span in spans}
+    assert ("QUERY-COMPILER", "PandasQueryCompiler.add") in names
+    assert ("OPERATOR", "Binary(add)") in names
+    assert ("OPERATOR", "Map(abs)") in names
+    assert ("QUERY-COMPILER", "PandasQueryCompiler.abs") in names
+    assert all(name != "DataFrame.abs" for _, name in names)
+
+    add = next(span for span in spans if span["name"] == "PandasQueryCompiler.add")
+    assert add["args"]["operators"] == ["Binary(add)"]
+    assert any(
+        method.startswith("PandasDataframePartitionManager.")
+        for method in add["args"]["partition_methods"]
+    )
+
+    tasks = [span for span in spans if span["cat"] == "TASK"]
+    assert len(tasks) > 0
+    # the spans of an operator include its tasks
+    op = next(span for span in spans if span["name"] == "GroupByReduce(sum)")
+    assert op["args"]["tasks"] == sum(
+        op["ts"] <= task["ts"] and task["ts"] <= op["ts"] + op["dur"] for task in tasks
+    )
+
+    summary = profiler.summary(limit=5).splitlines()
+    assert summary[0].startswith("Profiled")
+    assert len(summary) == 3 + 5
+    totals = [float(line.split()[3]) for line in summary[3:]]
+    assert totals == sorted(totals, reverse=True)
@@ -13,6 +13,7 @@
 
 import contextlib
 import json
+import warnings
 from textwrap import dedent, indent
 from unittest.mock import Mock, patch
 
@@ -22,7 +23,7 @@ import pytest
 
 import modin.pandas as pd
 import modin.utils
-from modin.config import NativeDataframeMode
+from modin.config import NativeDataframeMode, context
 from modin.error_message import ErrorMessage
 from modin.tests.pandas.utils import create_test_dfs
 
@@ -305,6 +306,36 @@ def test_warns_that_defaulting_to_pandas():
         ErrorMessage.default_to_pandas(message="Function name")
 
 
+@pytest.mark.parametrize("mode", ["record", "log", "warn", "raise"])
+def test_default_to_pandas_audit(mode):
+    df = pd.DataFrame({"a": range(100), "b": [1.0] * 100})
+    nbytes = int(df._to_pandas().memory_usage(deep=False).sum())
+    modin.utils.get_default_to_pandas_report(reset=True)
+
+    with context(DefaultToPandasAudit=mode), warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        if mode == "raise":
+            with pytest.raises(modin.utils.DefaultToPandasError, match="test_utils.py"):
+                df._default_to_pandas(pandas.DataFrame.abs)
+            return
+        for _ in range(2):
+            # the API layer and the query compiler fallbacks
+            df._default_to_pandas(pandas.DataFrame.abs)
+            df._query_compiler.default_to_pandas(pandas.DataFrame.abs)
+        ErrorMessage.default_to_pandas("`read_foo`")
+
+    # a warning per call site at most
+    assert len(w) == (3 if mode == "warn" else 0)
+    report = modin.utils.get_default_to_pandas_report(reset=True)
+    assert len(modin.utils.get_default_to_pandas_report()) == 0
+    assert len(report) == 3
+    assert report["call_site"].str.contains("test_utils.py").all()
+    assert report["count"].tolist() == [2, 2, 1]
+    assert report["shape"].tolist() == [(100, 2), (100, 2), None]
+    assert report["bytes"].tolist() == [2 * nbytes, 2 * nbytes, 0]
+    assert (report["time"][:2] > 0).all()
+
+
 def test_assert_dtypes_equal():
     """Verify that `assert_dtypes_equal` from test utils works correctly (raises an error when it has to)."""
     from modin.tests.pandas.utils import assert_dtypes_equal
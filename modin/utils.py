@@ -941,6 +941,38 @@ class ModinAssumptionError(Exception):
     pass
 
 
+class DefaultToPandasError(Exception):
+    """An exception raised instead of defaulting to pandas when ``DefaultToPandasAudit`` is "raise"."""
+
+    pass
+
+
+def get_default_to_pandas_report(reset: bool = False) -> pandas.DataFrame:
+    """
+    Get the report of the operations that defaulted to pandas.
+
+    The fallbacks are recorded unless ``DefaultToPandasAudit`` is "disable", and they
+    are aggregated by the operation and the call site, the first frame of the stack
+    outside of Modin.
+
+    Parameters
+    ----------
+    reset : bool, default: False
+        Whether to clear the records after getting the report.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The columns are the operation, the call site, the number of fallbacks, the
+        shape and the size in bytes of the largest frame collected to the driver,
+        the total size of the collected frames and the total time in seconds spent in
+        the fallbacks. The rows are sorted by the total size and the time, descending.
+    """
+    from modin.error_message import FallbackAudit
+
+    return FallbackAudit.report(reset=reset)
+
+
 class classproperty:
     """
     Decorator that allows creating read-only class properties.